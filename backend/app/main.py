@@ -133,6 +133,12 @@ async def lifespan(app: FastAPI):
         await SettingsService.init_defaults(db)
     logger.info("Default settings initialized")
 
+    # Cached registry bearer tokens must not outlive the credentials they were
+    # minted with
+    from app.services.registry_client import clear_tokens_on_credential_change
+
+    SettingsService.add_change_listener(clear_tokens_on_credential_change)
+
     # Clean up stuck update history records from previous crashes
     from app.services.update_engine import UpdateEngine
 
@@ -171,10 +177,23 @@ async def lifespan(app: FastAPI):
 
     await recover_interrupted_jobs()
 
+    # Keep the live container state store current: Docker events plus a
+    # periodic listing as a safety net
+    from app.services.container_state import container_states
+    from app.services.docker_events import docker_event_watcher
+
+    docker_event_watcher.start()
+    container_states.start()
+
     # Start background scheduler for automatic update checks
     await scheduler_service.start()
     logger.info("Background scheduler started")
 
+    # Refresh cached Prometheus gauges when updates/checks change the counts
+    from app.services.metrics import db_metrics
+
+    db_metrics.start()
+
     # Warn if authentication is disabled
     async with AsyncSessionLocal() as db:
         auth_mode = await SettingsService.get(db, "auth_mode", default="none")
@@ -212,6 +231,42 @@ async def lifespan(app: FastAPI):
 
     # Shutdown scheduler
     await scheduler_service.stop()
+
+    # Stop following Docker events
+    await docker_event_watcher.stop()
+    await container_states.stop()
+
+    # Stop following the event bus for Prometheus gauges
+    from app.services.metrics import db_metrics
+
+    await db_metrics.stop()
+
+    # Close pooled registry connections
+    from app.services.registry_pool import close_registry_pool
+
+    await close_registry_pool()
+
+    # Close Docker Engine API stats streams
+    from app.services.docker_engine_stats import docker_engine_stats
+
+    await docker_engine_stats.aclose()
+
+    # Close the shared Docker Engine API client
+    from app.services.docker_engine import docker_engine
+
+    await docker_engine.aclose()
+
+    # Persist buffered metrics chunks
+    from sqlalchemy.exc import OperationalError
+
+    from app.services.metrics_chunks import metrics_chunk_store
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await metrics_chunk_store.flush(db, include_open=True)
+    except OperationalError as e:
+        logger.error(f"Failed to write buffered metrics chunks: {e}")
+
     logger.info("Shutting down TideWatch...")
 
 
@@ -0,0 +1,35 @@
+"""Persist registry rate-limit budgets.
+
+Migration: 065
+Description: Adds the ``registry_rate_limit_state`` table holding the last
+rate-limit budget each registry reported (Docker Hub ``ratelimit-remaining``
+/ ``ratelimit-reset``, ``Retry-After`` on 429/503). ``RegistryRateLimiter``
+restores it at the start of every check run so a restart, or a manual check
+right after a scheduled run, does not spend quota the registry already
+reported as gone.
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(db) -> None:
+    """Create registry_rate_limit_state table."""
+    await db.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS registry_rate_limit_state (
+                registry VARCHAR(64) PRIMARY KEY,
+                remaining INTEGER,
+                quota INTEGER,
+                reset_at DATETIME,
+                blocked_until DATETIME,
+                updated_at DATETIME NOT NULL
+            )
+            """
+        )
+    )
+
+
+async def downgrade(db) -> None:
+    """Drop registry_rate_limit_state table."""
+    await db.execute(text("DROP TABLE IF EXISTS registry_rate_limit_state"))
@@ -0,0 +1,29 @@
+"""Add check_fingerprint column to containers table.
+
+Migration: 066
+Description: Adds a nullable check_fingerprint recording the registry state
+             (tag-listing marker + manifest digest of the tracked tag) and the
+             check settings seen at a container's last full update check.
+
+             The incremental check mode probes each image cheaply and runs the
+             full fetch/decide/apply pipeline only for containers whose
+             fingerprint changed. NULL means "no fingerprint yet" — the next
+             incremental run checks the container in full and stamps it.
+             No backfill. Forward-only.
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(db) -> None:
+    """Add check_fingerprint column to containers table (idempotent)."""
+    result = await db.execute(text("PRAGMA table_info(containers)"))
+    columns = {row[1] for row in result.fetchall()}
+
+    if "check_fingerprint" not in columns:
+        await db.execute(text("ALTER TABLE containers ADD COLUMN check_fingerprint VARCHAR"))
+
+
+async def downgrade(db) -> None:  # noqa: ARG001
+    """Remove check_fingerprint column from containers table."""
+    raise NotImplementedError("Downgrade not supported for SQLite ALTER TABLE ADD COLUMN")
@@ -0,0 +1,66 @@
+"""Add metrics_rollup table.
+
+Migration: 067
+Description: Adds ``metrics_rollup`` holding 15-minute, hourly and daily
+aggregates (min/avg/max/p95 for CPU and memory, last value for the byte
+counters) of the raw ``metrics_history`` samples. The scheduler maintains it
+incrementally and the metrics history endpoint reads long periods from it, so
+raw samples only need to be kept for a few days while rollups cover a year.
+Existing raw history is rolled up by the first run; no backfill here.
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(db) -> None:
+    """Create metrics_rollup table and indexes."""
+    await db.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS metrics_rollup (
+                id INTEGER NOT NULL PRIMARY KEY,
+                container_id INTEGER NOT NULL
+                    REFERENCES containers(id) ON DELETE CASCADE,
+                tier VARCHAR(8) NOT NULL,
+                bucket_start DATETIME NOT NULL,
+                samples INTEGER NOT NULL,
+                cpu_percent_min FLOAT NOT NULL,
+                cpu_percent_avg FLOAT NOT NULL,
+                cpu_percent_max FLOAT NOT NULL,
+                cpu_percent_p95 FLOAT NOT NULL,
+                memory_usage_min INTEGER NOT NULL,
+                memory_usage_avg INTEGER NOT NULL,
+                memory_usage_max INTEGER NOT NULL,
+                memory_usage_p95 INTEGER NOT NULL,
+                memory_percent_min FLOAT NOT NULL,
+                memory_percent_avg FLOAT NOT NULL,
+                memory_percent_max FLOAT NOT NULL,
+                memory_percent_p95 FLOAT NOT NULL,
+                memory_limit INTEGER NOT NULL,
+                network_rx INTEGER NOT NULL,
+                network_tx INTEGER NOT NULL,
+                block_read INTEGER NOT NULL,
+                block_write INTEGER NOT NULL,
+                pids_avg FLOAT NOT NULL,
+                pids_max INTEGER NOT NULL
+            )
+            """
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_metrics_rollup_bucket "
+            "ON metrics_rollup(container_id, tier, bucket_start)"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_metrics_rollup_tier_bucket "
+            "ON metrics_rollup(tier, bucket_start)"
+        )
+    )
+
+
+async def downgrade(db) -> None:
+    """Drop metrics_rollup table."""
+    await db.execute(text("DROP TABLE IF EXISTS metrics_rollup"))
@@ -0,0 +1,44 @@
+"""Add metrics_chunks table.
+
+Migration: 068
+Description: Adds ``metrics_chunks``, the compressed alternative to
+``metrics_history`` selected by the ``metrics_storage`` setting. Each row
+packs one container's samples for an hour into a single zlib-compressed blob
+of delta-encoded column arrays instead of one row per sample. Existing
+``metrics_history`` rows are left in place and still read.
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(db) -> None:
+    """Create metrics_chunks table and indexes."""
+    await db.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS metrics_chunks (
+                id INTEGER NOT NULL PRIMARY KEY,
+                container_id INTEGER NOT NULL
+                    REFERENCES containers(id) ON DELETE CASCADE,
+                start_at DATETIME NOT NULL,
+                end_at DATETIME NOT NULL,
+                samples INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )
+            """
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_metrics_chunks_container_start "
+            "ON metrics_chunks(container_id, start_at)"
+        )
+    )
+    await db.execute(
+        text("CREATE INDEX IF NOT EXISTS idx_metrics_chunks_end ON metrics_chunks(end_at)")
+    )
+
+
+async def downgrade(db) -> None:
+    """Drop metrics_chunks table."""
+    await db.execute(text("DROP TABLE IF EXISTS metrics_chunks"))
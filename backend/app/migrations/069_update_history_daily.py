@@ -0,0 +1,77 @@
+"""Add update_history_daily aggregates.
+
+Migration: 069
+Description: Adds ``update_history_daily`` (container update outcomes, CVEs
+fixed and update durations per UTC day) and an expression index on the day
+an ``update_history`` entry is attributed to, so single days can be
+recomputed. Backfills the aggregates from existing history; afterwards the
+app recomputes the days touched by history writes.
+"""
+
+from sqlalchemy import text
+
+_ACTIVITY_DAY = "date(coalesce(completed_at, started_at, created_at))"
+_CVE_COUNT = "coalesce(json_array_length(cves_fixed), 0)"
+_TIMED_SUCCESS = "status = 'success' AND completed_at IS NOT NULL AND started_at IS NOT NULL"
+
+
+async def upgrade(db) -> None:
+    """Create update_history_daily and backfill it."""
+    await db.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS update_history_daily (
+                day VARCHAR(10) NOT NULL PRIMARY KEY,
+                total_updates INTEGER NOT NULL DEFAULT 0,
+                successful_updates INTEGER NOT NULL DEFAULT 0,
+                failed_updates INTEGER NOT NULL DEFAULT 0,
+                rolled_back_updates INTEGER NOT NULL DEFAULT 0,
+                cves_fixed INTEGER NOT NULL DEFAULT 0,
+                updates_with_cves INTEGER NOT NULL DEFAULT 0,
+                duration_seconds_total FLOAT NOT NULL DEFAULT 0,
+                duration_samples INTEGER NOT NULL DEFAULT 0,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_update_history_activity_day "
+            f"ON update_history({_ACTIVITY_DAY})"
+        )
+    )
+    await db.execute(text("DELETE FROM update_history_daily"))
+    await db.execute(
+        text(
+            f"""
+            INSERT INTO update_history_daily (
+                day, total_updates, successful_updates, failed_updates,
+                rolled_back_updates, cves_fixed, updates_with_cves,
+                duration_seconds_total, duration_samples
+            )
+            SELECT
+                {_ACTIVITY_DAY},
+                count(*),
+                sum(CASE WHEN status = 'success' THEN 1 ELSE 0 END),
+                sum(CASE WHEN status = 'failed' THEN 1 ELSE 0 END),
+                sum(CASE WHEN status = 'rolled_back' THEN 1 ELSE 0 END),
+                sum({_CVE_COUNT}),
+                sum(CASE WHEN {_CVE_COUNT} > 0 THEN 1 ELSE 0 END),
+                sum(CASE WHEN {_TIMED_SUCCESS}
+                    THEN (julianday(completed_at) - julianday(started_at)) * 86400
+                    ELSE 0 END),
+                sum(CASE WHEN {_TIMED_SUCCESS} THEN 1 ELSE 0 END)
+            FROM update_history
+            WHERE (event_type = 'update' OR event_type IS NULL)
+              AND {_ACTIVITY_DAY} IS NOT NULL
+            GROUP BY {_ACTIVITY_DAY}
+            """
+        )
+    )
+
+
+async def downgrade(db) -> None:
+    """Drop update_history_daily and its index."""
+    await db.execute(text("DROP INDEX IF EXISTS idx_update_history_activity_day"))
+    await db.execute(text("DROP TABLE IF EXISTS update_history_daily"))
@@ -0,0 +1,44 @@
+"""Add indexes for the keyset-paginated unified history feed.
+
+Migration: 070
+Description: The unified history feed merges ``update_history``,
+``container_restart_log`` and ``sibling_drift_events`` with one ``UNION ALL``
+ordered by event time and pages through it by keyset. Each arm must be
+readable in time order straight from an index: ``update_history.started_at``
+and ``sibling_drift_events.detected_at`` are already indexed; this adds the
+restart log's ``executed_at`` and the per-container variants.
+"""
+
+from sqlalchemy import text
+
+
+async def upgrade(db) -> None:
+    """Create the history feed indexes."""
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_update_history_container_started "
+            "ON update_history(container_id, started_at)"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_restart_log_executed "
+            "ON container_restart_log(executed_at)"
+        )
+    )
+    await db.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_restart_log_container_executed "
+            "ON container_restart_log(container_id, executed_at)"
+        )
+    )
+
+
+async def downgrade(db) -> None:
+    """Drop the history feed indexes."""
+    for index in (
+        "idx_update_history_container_started",
+        "idx_restart_log_executed",
+        "idx_restart_log_container_executed",
+    ):
+        await db.execute(text(f"DROP INDEX IF EXISTS {index}"))
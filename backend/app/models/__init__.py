@@ -6,8 +6,11 @@ from app.models.container import Container
 from app.models.dependency_scan_job import DependencyScanJob
 from app.models.dockerfile_dependency import DockerfileDependency
 from app.models.history import UpdateHistory
+from app.models.history_daily import UpdateHistoryDaily
 from app.models.http_server import HttpServer
+from app.models.metrics_chunk import MetricsChunk
 from app.models.metrics_history import MetricsHistory
+from app.models.metrics_rollup import MetricsRollup
 from app.models.oidc_pending_link import OIDCPendingLink
 from app.models.oidc_state import OIDCState
 from app.models.pending_scan_job import PendingScanJob
@@ -26,9 +29,12 @@ __all__ = [
     "Container",
     "Update",
     "UpdateHistory",
+    "UpdateHistoryDaily",
     "ContainerRestartState",
     "ContainerRestartLog",
     "MetricsHistory",
+    "MetricsRollup",
+    "MetricsChunk",
     "DockerfileDependency",
     "HttpServer",
     "AppDependency",
@@ -86,6 +86,9 @@ class Container(UpdatePolicyMixin, RestartConfigMixin, Base):
         DateTime(timezone=True), nullable=True, index=True
     )  # Indexed for sorting
     last_updated: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    check_fingerprint: Mapped[str | None] = mapped_column(
+        String, nullable=True
+    )  # Registry state + check settings at the last full check (incremental mode)
 
     # Metadata
     labels: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)  # Docker labels from compose
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -14,6 +14,10 @@ class UpdateHistory(Base):
     """Audit trail of all container updates and dependency actions."""
 
     __tablename__ = "update_history"
+    __table_args__ = (
+        # Unified history feed: per-container keyset scans by start time
+        Index("idx_update_history_container_started", "container_id", "started_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     container_id: Mapped[int | None] = mapped_column(
@@ -92,3 +96,11 @@ class UpdateHistory(Base):
 
     def __repr__(self) -> str:
         return f"<UpdateHistory({self.container_name}: {self.from_tag} → {self.to_tag}, {self.status})>"
+
+
+# UTC day an entry is attributed to in analytics; the index lets the daily
+# aggregates (app/services/history_aggregates.py) recompute single days.
+history_activity_day = func.date(
+    func.coalesce(UpdateHistory.completed_at, UpdateHistory.started_at, UpdateHistory.created_at)
+)
+Index("idx_update_history_activity_day", history_activity_day)
@@ -0,0 +1,35 @@
+"""Daily aggregates of container update history for analytics."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class UpdateHistoryDaily(Base):
+    """Container update outcomes for one UTC day.
+
+    Counts only container image updates (``event_type`` "update" or legacy
+    NULL), attributed to ``date(coalesce(completed_at, started_at,
+    created_at))``. Rows are recomputed from ``update_history`` whenever
+    entries of that day change.
+    """
+
+    __tablename__ = "update_history_daily"
+
+    day: Mapped[str] = mapped_column(String(10), primary_key=True)  # YYYY-MM-DD
+    total_updates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    successful_updates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_updates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rolled_back_updates: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cves_fixed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updates_with_cves: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Successful updates with both start and completion time
+    duration_seconds_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    duration_samples: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
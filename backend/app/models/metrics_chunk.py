@@ -0,0 +1,36 @@
+"""Compressed column chunks of container metrics samples."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MetricsChunk(Base):
+    """Raw metrics samples of one container packed into a single blob.
+
+    ``data`` holds every sample collected for the container between
+    ``start_at`` and ``end_at`` (inclusive) as zlib-compressed, delta-encoded
+    column arrays; see ``app.services.metrics_chunks`` for the layout. The
+    same samples would otherwise be ``samples`` rows of ``metrics_history``.
+    """
+
+    __tablename__ = "metrics_chunks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    container_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("containers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    start_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    __table_args__ = (
+        Index("idx_metrics_chunks_container_start", "container_id", "start_at"),
+        Index("idx_metrics_chunks_end", "end_at"),
+    )
@@ -0,0 +1,57 @@
+"""Downsampled container metrics (15-minute, hourly and daily rollups)."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MetricsRollup(Base):
+    """Aggregate of the raw ``metrics_history`` samples in one time bucket.
+
+    ``tier`` names the bucket width ("15m", "1h", "1d"); ``bucket_start`` is
+    the UTC start of the bucket. Gauges (CPU, memory) keep min/avg/max/p95;
+    the cumulative byte counters and the memory limit keep their last value.
+    """
+
+    __tablename__ = "metrics_rollup"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    container_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("containers.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    tier: Mapped[str] = mapped_column(String(8), nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    samples: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    cpu_percent_min: Mapped[float] = mapped_column(Float, nullable=False)
+    cpu_percent_avg: Mapped[float] = mapped_column(Float, nullable=False)
+    cpu_percent_max: Mapped[float] = mapped_column(Float, nullable=False)
+    cpu_percent_p95: Mapped[float] = mapped_column(Float, nullable=False)
+
+    memory_usage_min: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    memory_usage_avg: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    memory_usage_max: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    memory_usage_p95: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+
+    memory_percent_min: Mapped[float] = mapped_column(Float, nullable=False)
+    memory_percent_avg: Mapped[float] = mapped_column(Float, nullable=False)
+    memory_percent_max: Mapped[float] = mapped_column(Float, nullable=False)
+    memory_percent_p95: Mapped[float] = mapped_column(Float, nullable=False)
+
+    memory_limit: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    network_rx: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    network_tx: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    block_read: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    block_write: Mapped[int] = mapped_column(Integer, nullable=False)  # bytes
+    pids_avg: Mapped[float] = mapped_column(Float, nullable=False)
+    pids_max: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("uq_metrics_rollup_bucket", "container_id", "tier", "bucket_start", unique=True),
+        Index("idx_metrics_rollup_tier_bucket", "tier", "bucket_start"),
+    )
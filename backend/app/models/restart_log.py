@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -17,6 +17,11 @@ class ContainerRestartLog(Base):
     """
 
     __tablename__ = "container_restart_log"
+    __table_args__ = (
+        # Unified history feed: keyset scans by time, globally and per container
+        Index("idx_restart_log_executed", "executed_at"),
+        Index("idx_restart_log_container_executed", "container_id", "executed_at"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
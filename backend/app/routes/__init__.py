@@ -10,6 +10,7 @@ from app.routes import (
     containers,
     dependencies,
     events,
+    export,
     history,
     oidc,
     restarts,
@@ -41,6 +42,7 @@ api_router.include_router(webhooks.router, prefix="/webhooks", tags=["webhooks"]
 api_router.include_router(dependencies.router, tags=["dependencies"])
 api_router.include_router(events.router, tags=["events"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
 api_router.include_router(widget.router, tags=["widget"])
 
 __all__ = ["api_router"]
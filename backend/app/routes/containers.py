@@ -5,7 +5,7 @@ import subprocess
 from datetime import UTC
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy import and_, desc, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -797,6 +797,79 @@ async def update_container_update_window(
     }
 
 
+@router.get("/metrics/summary", response_model=None)
+async def get_metrics_summary(
+    response: Response,
+    _admin: dict | None = Depends(require_auth),
+    container_id: list[int] | None = Query(
+        None, description="Containers to include (repeatable; default: all)"
+    ),
+    period: str = Query(default="1h", pattern="^(1h|6h|24h)$"),
+    points: int = Query(30, ge=2, le=120, description="Sparkline buckets"),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any] | Response:
+    """Latest metrics and a sparkline for many containers in one response.
+
+    Replaces one ``/{id}/metrics`` + ``/{id}/metrics/history`` pair per
+    dashboard card. Sparklines end at the last metrics collection, so the
+    response only changes when a cycle stores new samples (or the container
+    set changes); its ``ETag`` lets polling clients revalidate with
+    ``If-None-Match`` and get ``304 Not Modified`` in between.
+
+    Args:
+        container_id: Container IDs to include (all containers when omitted)
+        period: Sparkline span (1h, 6h, 24h)
+        points: Number of sparkline buckets (2-120)
+
+    Returns:
+        Dict with the sparkline bucket timestamps and one entry per container
+    """
+    import hashlib
+    from datetime import datetime, timedelta
+
+    from app.services.metrics_collector import MetricsCollector
+    from app.services.metrics_rollup import MetricsRollupService
+
+    query = select(Container.id, Container.name).order_by(Container.name)
+    if container_id:
+        query = query.where(Container.id.in_(container_id))
+    containers = (await db.execute(query)).all()
+
+    span = {"1h": timedelta(hours=1), "6h": timedelta(hours=6), "24h": timedelta(days=1)}[period]
+    until = MetricsCollector.last_collection_at
+    etag = None
+    if until is not None:
+        fingerprint = "|".join(
+            [until.isoformat(), period, str(points)] + [f"{cid}:{name}" for cid, name in containers]
+        )
+        etag = f'W/"{hashlib.sha256(fingerprint.encode()).hexdigest()[:32]}"'
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in [tag.strip() for tag in if_none_match.split(",")]
+        ):
+            return Response(status_code=304, headers={"ETag": etag})
+    else:
+        # No cycle has run in this process yet; serve fresh data uncached.
+        until = datetime.now(UTC)
+
+    summaries = await MetricsRollupService.summary(
+        db, [cid for cid, _ in containers], span, points, until
+    )
+    width = span / points
+    if etag is not None:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return {
+        "period": period,
+        "until": until.isoformat(),
+        "buckets": [(until - span + width * i).isoformat() for i in range(points)],
+        "containers": [
+            {"container_id": cid, "name": name, **summaries[cid]} for cid, name in containers
+        ],
+    }
+
+
 @router.get("/{container_id}/metrics")
 async def get_container_metrics(
     _admin: dict | None = Depends(require_auth),
@@ -832,64 +905,36 @@ async def get_container_metrics(
 async def get_container_metrics_history(
     _admin: dict | None = Depends(require_auth),
     container: Container = Depends(get_container_or_404),
-    period: str = Query(default="24h", pattern="^(1h|6h|24h|7d|30d)$"),
+    period: str = Query(default="24h", pattern="^(1h|6h|24h|7d|30d|90d|1y)$"),
     db: AsyncSession = Depends(get_db),
 ) -> list[dict[str, Any]]:
     """Get historical metrics for a container.
 
+    Periods up to 24h return raw samples; longer periods are served from the
+    rollup tiers (15-minute for 7d, hourly for 30d/90d, daily for 1y) with
+    bucket averages plus ``*_max``/``*_p95`` fields.
+
     Args:
         container_id: Container ID
-        period: Time period (1h, 6h, 24h, 7d, 30d)
+        period: Time period (1h, 6h, 24h, 7d, 30d, 90d, 1y)
 
     Returns:
         List of historical metrics data points
     """
-    from datetime import datetime, timedelta
+    from datetime import timedelta
 
-    from app.models.metrics_history import MetricsHistory
+    from app.services.metrics_rollup import MetricsRollupService
 
-    # Calculate time range based on period
-    now = datetime.now(UTC)
     period_map = {
         "1h": timedelta(hours=1),
         "6h": timedelta(hours=6),
         "24h": timedelta(days=1),
         "7d": timedelta(days=7),
         "30d": timedelta(days=30),
+        "90d": timedelta(days=90),
+        "1y": timedelta(days=365),
     }
-    start_time = now - period_map[period]
-
-    # Query metrics history
-    from sqlalchemy import and_
-
-    result = await db.execute(
-        select(MetricsHistory)
-        .where(
-            and_(
-                MetricsHistory.container_id == container.id,
-                MetricsHistory.collected_at >= start_time,
-            )
-        )
-        .order_by(MetricsHistory.collected_at)
-    )
-    metrics = result.scalars().all()
-
-    # Convert to list of dicts for JSON response
-    return [
-        {
-            "timestamp": m.collected_at.isoformat() if m.collected_at else None,
-            "cpu_percent": m.cpu_percent,
-            "memory_usage": m.memory_usage,
-            "memory_limit": m.memory_limit,
-            "memory_percent": m.memory_percent,
-            "network_rx": m.network_rx,
-            "network_tx": m.network_tx,
-            "block_read": m.block_read,
-            "block_write": m.block_write,
-            "pids": m.pids,
-        }
-        for m in metrics
-    ]
+    return await MetricsRollupService.history(db, container.id, period_map[period])
 
 
 @router.get("/{container_id}/detect-health-check")
@@ -1047,31 +1092,22 @@ async def get_container_logs(
     """
     from datetime import datetime
 
-    from docker.errors import APIError, DockerException, NotFound
-
-    from app.services.docker_access import make_docker_client, resolve_docker_url
+    from app.services.docker_engine import (
+        DockerEngineError,
+        DockerNotFoundError,
+        docker_engine,
+    )
 
     try:
-        # Connect to Docker
-        docker_url = await resolve_docker_url(db)
-        client = make_docker_client(docker_url, timeout=10)
-
-        # Get running container
-        docker_container = client.containers.get(container.runtime_name)
-
-        # Get logs
-        logs = docker_container.logs(tail=tail, timestamps=False).decode("utf-8")
+        raw = await docker_engine.container_logs(container.runtime_name, tail=tail, db=db)
+        logs = raw.decode("utf-8")
         log_lines = logs.strip().split("\n") if logs else []
 
-        client.close()
-
         return {"logs": log_lines, "timestamp": datetime.now(UTC).isoformat()}
 
-    except NotFound:
+    except DockerNotFoundError:
         raise HTTPException(status_code=404, detail="Container not found in Docker")
-    except APIError as e:
-        safe_error_response(logger, e, "Docker API error", status_code=500)
-    except DockerException as e:
+    except DockerEngineError as e:
         safe_error_response(logger, e, "Docker error", status_code=500)
     except OperationalError as e:
         safe_error_response(logger, e, "Database error", status_code=500)
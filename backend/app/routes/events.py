@@ -3,7 +3,7 @@
 import asyncio
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request
 from fastapi.responses import StreamingResponse
 
 from app.services.auth import require_auth
@@ -16,11 +16,21 @@ router = APIRouter(prefix="/events", tags=["events"])
 async def stream_events(
     request: Request,
     _admin: dict | None = Depends(require_auth),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
 ) -> StreamingResponse:
-    """Server-sent events stream for live update notifications."""
+    """Server-sent events stream for live update notifications.
+
+    Each event carries an SSE ``id``; browsers resend the last one in the
+    ``Last-Event-ID`` header on reconnect, and events published since then
+    (within the bus replay window) are delivered first.
+    """
+    try:
+        resume_from = int(last_event_id) if last_event_id else None
+    except ValueError:
+        resume_from = None
 
     async def event_generator() -> AsyncGenerator[str]:
-        queue = await event_bus.subscribe()
+        subscription = await event_bus.subscribe(last_event_id=resume_from)
         try:
             # Initial ready event for clients
             yield 'data: {"type":"connected"}\n\n'
@@ -29,12 +39,12 @@ async def stream_events(
                 if await request.is_disconnected():
                     break
                 try:
-                    message = await asyncio.wait_for(queue.get(), timeout=15)
-                    yield f"data: {message}\n\n"
+                    event = await asyncio.wait_for(subscription.get_event(), timeout=15)
+                    yield f"id: {event.id}\ndata: {event.payload}\n\n"
                 except TimeoutError:
                     # Heartbeat to keep the connection alive
                     yield "event: ping\ndata: {}\n\n"
         finally:
-            await event_bus.unsubscribe(queue)
+            await event_bus.unsubscribe(subscription)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
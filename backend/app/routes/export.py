@@ -0,0 +1,115 @@
+"""Bulk export endpoints streaming history, restart logs and metrics."""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.services import data_export
+from app.services.auth import require_auth
+
+router = APIRouter()
+
+_FORMAT_QUERY = Query(default="csv", pattern="^(csv|ndjson)$", description="csv or ndjson")
+
+
+def _export_response(
+    name: str, fmt: str, fields: Sequence[str], rows: AsyncIterator[Sequence[Any]]
+) -> StreamingResponse:
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    extension = "csv" if fmt == "csv" else "ndjson"
+    return StreamingResponse(
+        data_export.encode_rows(fields, rows, fmt),
+        media_type=data_export.MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="tidewatch-{name}-{stamp}.{extension}"'
+        },
+    )
+
+
+@router.get("/history")
+async def export_history(
+    _admin: dict | None = Depends(require_auth),
+    container_id: int | None = None,
+    start: datetime | None = Query(None, description="Updates started at or after (ISO format)"),
+    end: datetime | None = Query(None, description="Updates started at or before (ISO format)"),
+    format: str = _FORMAT_QUERY,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream update history as CSV or NDJSON, oldest first.
+
+    Args:
+        container_id: Optional filter by container
+        start: Optional lower bound on ``started_at``
+        end: Optional upper bound on ``started_at``
+        format: Output format (csv, ndjson)
+
+    Returns:
+        Streaming download of every matching history row
+    """
+    return _export_response(
+        "history",
+        format,
+        data_export.history_fields(),
+        data_export.history_rows(db, container_id, start, end),
+    )
+
+
+@router.get("/restarts")
+async def export_restarts(
+    _admin: dict | None = Depends(require_auth),
+    container_id: int | None = None,
+    start: datetime | None = Query(None, description="Restarts executed at or after (ISO format)"),
+    end: datetime | None = Query(None, description="Restarts executed at or before (ISO format)"),
+    format: str = _FORMAT_QUERY,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream restart logs as CSV or NDJSON, oldest first.
+
+    Args:
+        container_id: Optional filter by container
+        start: Optional lower bound on ``executed_at``
+        end: Optional upper bound on ``executed_at``
+        format: Output format (csv, ndjson)
+
+    Returns:
+        Streaming download of every matching restart log row
+    """
+    return _export_response(
+        "restarts",
+        format,
+        data_export.restart_fields(),
+        data_export.restart_rows(db, container_id, start, end),
+    )
+
+
+@router.get("/metrics")
+async def export_metrics(
+    _admin: dict | None = Depends(require_auth),
+    container_id: int | None = None,
+    start: datetime | None = Query(None, description="Samples collected at or after (ISO format)"),
+    end: datetime | None = Query(None, description="Samples collected at or before (ISO format)"),
+    format: str = _FORMAT_QUERY,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream raw container metrics as CSV or NDJSON.
+
+    Args:
+        container_id: Optional filter by container
+        start: Optional lower bound on ``collected_at``
+        end: Optional upper bound on ``collected_at``
+        format: Output format (csv, ndjson)
+
+    Returns:
+        Streaming download of every matching raw sample
+    """
+    return _export_response(
+        "metrics",
+        format,
+        data_export.METRICS_FIELDS,
+        data_export.metrics_rows(db, container_id, start, end),
+    )
@@ -3,7 +3,7 @@
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,14 @@ from app.models.restart_log import ContainerRestartLog
 from app.models.sibling_drift_event import SiblingDriftEvent
 from app.schemas.history import UnifiedHistoryEventSchema, UpdateHistorySchema
 from app.services.auth import require_auth
+from app.services.history_feed import (
+    KIND_RESTART,
+    KIND_UPDATE,
+    HistoryCursor,
+    HistoryFilters,
+    InvalidCursorError,
+    fetch_history_page,
+)
 from app.services.protected_infra import SelfManagedInfraError
 from app.services.update_engine import UpdateEngine
 from app.utils.security import sanitize_log_message
@@ -154,24 +162,39 @@ def transform_drift_to_event(
     )
 
 
+def transform_history_event(kind: str, row: Any) -> UnifiedHistoryEventSchema:
+    """Transform a unified history feed row to the event schema."""
+    if kind == KIND_UPDATE:
+        return transform_update_to_event(row)
+    if kind == KIND_RESTART:
+        return transform_restart_to_event(row)
+    return transform_drift_to_event(row)
+
+
 @router.get("/", response_model=list[UnifiedHistoryEventSchema])
 async def list_history(
+    response: Response,
     _admin: dict | None = Depends(require_auth),
     container_id: int | None = None,
     status: str | None = Query(None, description="Filter by status (success, failed, rolled_back)"),
     start_date: str | None = Query(None, description="Filter by start date (ISO format)"),
     end_date: str | None = Query(None, description="Filter by end date (ISO format)"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: str | None = Query(None, description="Continue after this cursor (X-Next-Cursor)"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (ignored with cursor)"),
     limit: int = Query(50, ge=1, le=500, description="Maximum number of records to return"),
     db: AsyncSession = Depends(get_db),
 ) -> list[UnifiedHistoryEventSchema]:
     """List unified history (updates + restarts + drift) with pagination.
 
+    Events are merged and ordered in SQL; when more events follow, the
+    ``X-Next-Cursor`` response header carries the cursor of the next page.
+
     Args:
         container_id: Optional filter by container (drift excluded when set)
         status: Optional filter by status. Use "detected" for drift-only.
         start_date: Optional filter by start date (ISO format)
         end_date: Optional filter by end date (ISO format)
+        cursor: Cursor from a previous page's ``X-Next-Cursor`` header
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 50, max: 500)
 
@@ -180,96 +203,21 @@ async def list_history(
     """
     from datetime import datetime
 
-    # Fetch more from each table to ensure we have enough after merging
-    fetch_limit = min(limit * 3, 500)
-
-    # Determine which event sources to include based on filters.
-    # Drift events use status="detected" — exclude them when a different
-    # status is requested, and exclude updates/restarts when status="detected".
-    include_drift = not container_id and (status is None or status == "detected")
-    include_updates_restarts = status is None or status != "detected"
-
-    unified_events: list[UnifiedHistoryEventSchema] = []
-
-    if include_updates_restarts:
-        # Query updates - undefer event_type to load it eagerly
-        update_query = (
-            select(UpdateHistory)
-            .options(
-                undefer(UpdateHistory.event_type),
-                undefer(UpdateHistory.dependency_type),
-                undefer(UpdateHistory.dependency_id),
-                undefer(UpdateHistory.dependency_name),
-            )
-            .order_by(UpdateHistory.created_at.desc())
-        )
-        if container_id:
-            update_query = update_query.where(UpdateHistory.container_id == container_id)
-        if status:
-            update_query = update_query.where(UpdateHistory.status == status)
-        if start_date:
-            start_dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            update_query = update_query.where(UpdateHistory.started_at >= start_dt)
-        if end_date:
-            end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            update_query = update_query.where(UpdateHistory.started_at <= end_dt)
-
-        # Exclude dependency events from global history
-        if not container_id:
-            dependency_event_types = {
-                "dependency_update",
-                "dependency_ignore",
-                "dependency_unignore",
-            }
-            update_query = update_query.where(
-                (UpdateHistory.event_type.is_(None))
-                | (~UpdateHistory.event_type.in_(dependency_event_types))
-            )
-
-        update_query = update_query.limit(fetch_limit)
-
-        # Query restarts (only completed ones)
-        restart_query = (
-            select(ContainerRestartLog)
-            .where(ContainerRestartLog.completed_at.isnot(None))
-            .order_by(ContainerRestartLog.created_at.desc())
-        )
-        if container_id:
-            restart_query = restart_query.where(ContainerRestartLog.container_id == container_id)
-        restart_query = restart_query.limit(fetch_limit)
-
-        # Execute queries
-        update_result = await db.execute(update_query)
-        restart_result = await db.execute(restart_query)
-
-        for update in update_result.scalars().all():
-            unified_events.append(transform_update_to_event(update))
-        for restart in restart_result.scalars().all():
-            unified_events.append(transform_restart_to_event(restart))
-
-    # Query sibling drift events (global only — excluded when container_id is set)
-    if include_drift:
-        drift_query = (
-            select(SiblingDriftEvent)
-            .order_by(SiblingDriftEvent.detected_at.desc())
-            .limit(fetch_limit)
-        )
-        if start_date:
-            start_dt = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            drift_query = drift_query.where(SiblingDriftEvent.detected_at >= start_dt)
-        if end_date:
-            end_dt = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            drift_query = drift_query.where(SiblingDriftEvent.detected_at <= end_dt)
-
-        drift_result = await db.execute(drift_query)
-        for drift in drift_result.scalars().all():
-            unified_events.append(transform_drift_to_event(drift))
-
-    # Sort by started_at descending
-    unified_events.sort(key=lambda e: e.started_at or datetime.min, reverse=True)
-
-    # Apply pagination
-    return unified_events[skip : skip + limit]
+    try:
+        position = HistoryCursor.decode(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    filters = HistoryFilters(
+        container_id=container_id,
+        status=status,
+        start=datetime.fromisoformat(start_date.replace("Z", "+00:00")) if start_date else None,
+        end=datetime.fromisoformat(end_date.replace("Z", "+00:00")) if end_date else None,
+    )
+    page = await fetch_history_page(db, filters, limit, cursor=position, offset=skip)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    return [transform_history_event(kind, row) for kind, row in page.events]
 
 
 @router.get("/stats")
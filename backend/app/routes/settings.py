@@ -3,7 +3,6 @@
 import logging
 
 import httpx
-from docker.errors import DockerException
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,7 +13,8 @@ from app.schemas import SettingCategory, SettingSchema, SettingUpdate
 from app.schemas.setting import SENSITIVE_KEYS
 from app.services import SettingsService
 from app.services.auth import require_auth
-from app.services.docker_access import make_docker_client, resolve_docker_url
+from app.services.docker_access import resolve_docker_url
+from app.services.docker_engine import DockerEngineError, docker_engine
 from app.utils.error_handling import safe_error_response
 from app.utils.url_validation import validate_integration_url, validate_smtp_host
 
@@ -201,21 +201,18 @@ async def test_docker_connection(
     try:
         docker_socket = await SettingsService.get(db, "docker_socket") or "unknown"
 
-        # Test connection using Docker SDK
+        # Test connection through the shared Engine API client
         docker_url = await resolve_docker_url(db)
-        client = make_docker_client(docker_url, timeout=10)
 
         # Get version info
-        version_info = client.version()
+        version_info = await docker_engine.version(db)
         version = version_info.get("Version", "unknown")
         api_version = version_info.get("ApiVersion", "unknown")
 
         # Get basic info to verify connection
-        info = client.info()
+        info = await docker_engine.info(db)
         containers = info.get("Containers", 0)
 
-        client.close()
-
         return {
             "success": True,
             "message": f"Connected to Docker Engine v{version}",
@@ -226,7 +223,7 @@ async def test_docker_connection(
                 "containers": containers,
             },
         }
-    except DockerException:
+    except DockerEngineError:
         return {
             "success": False,
             "message": "Failed to connect to Docker",
@@ -2,6 +2,7 @@
 
 import logging
 import secrets
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -211,8 +212,6 @@ def decode_token(token: str) -> dict:
         payload = decoded.claims
 
         # Manually validate expiration (joserfc only validates via JWTClaimsRegistry).
-        import time
-
         if "exp" in payload:
             if payload["exp"] < time.time():
                 logger.error("JWT token has expired")
@@ -224,6 +223,70 @@ def decode_token(token: str) -> dict:
         raise credentials_exception
 
 
+# ============================================================================
+# Identity Cache
+# ============================================================================
+
+# How long a validated token's admin profile is reused without a DB read.
+# Every mutation path below invalidates explicitly; the TTL only bounds
+# staleness from writes made outside this process.
+IDENTITY_CACHE_TTL_SECONDS = 30.0
+IDENTITY_CACHE_MAX_TOKENS = 256
+
+IdentityKey = tuple[str, str, int | float | None]
+
+
+class _IdentityCache:
+    """Admin profiles resolved for recently seen tokens.
+
+    Keyed on the token's ``(sub, username, iat)`` claims (tokens carry no
+    ``jti``). The generation counter keeps a lookup that raced an
+    invalidation from caching the profile it read before the write.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[IdentityKey, tuple[float, dict]] = {}
+        self.generation = 0
+
+    def get(self, key: IdentityKey) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, profile = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return dict(profile)
+
+    def put(self, key: IdentityKey, profile: dict, generation: int) -> None:
+        if generation != self.generation:
+            return
+        if len(self._entries) >= IDENTITY_CACHE_MAX_TOKENS:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + IDENTITY_CACHE_TTL_SECONDS, dict(profile))
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+
+_identity_cache = _IdentityCache()
+
+
+def invalidate_identity_cache() -> None:
+    """Drop cached admin identities (after any admin account write)."""
+    _identity_cache.clear()
+
+
+def clear_identity_on_auth_change(keys: frozenset[str]) -> None:
+    """Settings change listener: drop cached identities when auth mode changes."""
+    if "auth_mode" in keys:
+        _identity_cache.clear()
+
+
+SettingsService.add_change_listener(clear_identity_on_auth_change)
+
+
 # ============================================================================
 # User Model Helpers
 # ============================================================================
@@ -289,6 +352,7 @@ async def update_admin_profile(
     if full_name is not None:
         user.full_name = full_name
     await db.commit()
+    invalidate_identity_cache()
 
 
 async def update_admin_password(db: AsyncSession, new_hash: str) -> None:
@@ -299,6 +363,7 @@ async def update_admin_password(db: AsyncSession, new_hash: str) -> None:
 
     user.password_hash = new_hash
     await db.commit()
+    invalidate_identity_cache()
 
 
 async def update_admin_oidc_link(db: AsyncSession, oidc_subject: str, provider: str) -> str:
@@ -332,12 +397,14 @@ async def update_admin_oidc_link(db: AsyncSession, oidc_subject: str, provider:
         user.oidc_provider = provider
         user.auth_method = "oidc"
         await db.commit()
+        invalidate_identity_cache()
         return "linked"
 
     if stored == incoming:
         # Same identity re-logging in — refresh the provider label only.
         user.oidc_provider = provider
         await db.commit()
+        invalidate_identity_cache()
         return "matched"
 
     # Bound to a different subject — refuse, write nothing. Do not log the raw
@@ -354,6 +421,7 @@ async def update_admin_last_login(db: AsyncSession) -> None:
 
     user.last_login = datetime.now(UTC)
     await db.commit()
+    invalidate_identity_cache()
 
 
 async def create_admin_user(
@@ -385,6 +453,7 @@ async def create_admin_user(
     )
     db.add(user)
     await db.commit()
+    invalidate_identity_cache()
     await db.refresh(user)
     return user
 
@@ -479,11 +548,16 @@ async def get_current_admin(
         logger.error("Invalid token subject: %s", sub)
         raise credentials_exception
 
-    # Get admin profile from User model
-    profile = await get_admin_profile(db)
-    if not profile:
-        logger.error("Admin profile not found")
-        raise credentials_exception
+    # Get admin profile from User model (cached per token)
+    key: IdentityKey = (sub, username, payload.get("iat"))
+    profile = _identity_cache.get(key)
+    if profile is None:
+        generation = _identity_cache.generation
+        profile = await get_admin_profile(db)
+        if not profile:
+            logger.error("Admin profile not found")
+            raise credentials_exception
+        _identity_cache.put(key, profile, generation)
 
     # Verify username matches
     if profile["username"] != username:
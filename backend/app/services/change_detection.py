@@ -0,0 +1,104 @@
+"""Incremental ("changed-images-only") check mode.
+
+A full check runs TagFetcher → UpdateDecisionMaker → UpdateChecker.apply_decision
+for every container. In incremental mode a check run first probes each image
+signature cheaply — the tag-listing marker (a revalidated/ETag'd listing, or
+Docker Hub's newest ``last_updated``) plus the manifest digest of the tracked
+tag — and compares a fingerprint of that probe and the container's check
+settings against ``Container.check_fingerprint`` from its last full check.
+Only containers whose fingerprint changed go through the full pipeline.
+
+A container is always checked in full when it has no fingerprint, when the
+probe is incomplete, or when its last full check is older than the configured
+maximum age (time-dependent decisions such as update windows and vulnerability
+refreshes still run periodically).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from app.services.check_run_context import ImageCheckKey
+
+if TYPE_CHECKING:
+    from app.models.container import Container
+
+
+@dataclass(frozen=True)
+class ImageProbe:
+    """Cheap registry state of one image signature.
+
+    Attributes:
+        listing: Tag-listing marker (None when it could not be read)
+        digest: Manifest digest of the tracked tag (None when unknown)
+    """
+
+    listing: str | None
+    digest: str | None
+
+    @property
+    def complete(self) -> bool:
+        """True when both halves of the probe were read."""
+        return self.listing is not None and self.digest is not None
+
+
+def container_fingerprint(
+    probe: ImageProbe, container: Container, include_prereleases: bool
+) -> str | None:
+    """Fingerprint of registry state plus everything that shapes a decision.
+
+    Computed from the container's current row, so fields that a full check
+    baselines (digest, anchor/digest majors) are folded in as stored.
+
+    Args:
+        probe: Probe of the container's image signature
+        container: Container row
+        include_prereleases: Effective include_prereleases setting
+
+    Returns:
+        Hex fingerprint, or None for an incomplete probe
+    """
+    if not probe.complete:
+        return None
+    key = ImageCheckKey.from_container(container, include_prereleases)
+    payload = {
+        "key": asdict(key),
+        "policy": container.policy,  # type: ignore[attr-defined]
+        "current_digest": container.current_digest,  # type: ignore[attr-defined]
+        "listing": probe.listing,
+        "digest": probe.digest,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def is_unchanged(
+    container: Container,
+    fingerprint: str | None,
+    max_age: timedelta,
+    now: datetime | None = None,
+) -> bool:
+    """True when a container can skip the full check.
+
+    Args:
+        container: Container row
+        fingerprint: Fingerprint from this run's probe (None = incomplete)
+        max_age: Longest time a container may go without a full check
+        now: Current time (defaults to ``datetime.now(UTC)``)
+
+    Returns:
+        Whether the stored fingerprint still matches and is recent enough
+    """
+    stored: str | None = container.check_fingerprint  # type: ignore[attr-defined]
+    if fingerprint is None or stored != fingerprint:
+        return False
+    last_checked: datetime | None = container.last_checked  # type: ignore[attr-defined]
+    if last_checked is None:
+        return False
+    if last_checked.tzinfo is None:
+        last_checked = last_checked.replace(tzinfo=UTC)
+    return (now or datetime.now(UTC)) - last_checked < max_age
@@ -28,12 +28,15 @@ from __future__ import annotations
 import logging
 import platform
 import re
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 from packaging.version import InvalidVersion, Version
 
+from app.services.tiered_cache import TieredCache
+
 if TYPE_CHECKING:
     from app.services.registry_client import RegistryClient
 
@@ -286,43 +289,63 @@ async def resolve_anchor_major(
     return None
 
 
+# Upper bound on cached anchor resolutions (one per registry/image/anchor tag).
+ANCHOR_CACHE_MAX_ENTRIES = 512
+
+
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+
 class AnchorCache:
     """In-process cache for anchor resolutions with a short TTL.
 
     Mutable anchor tags like ``latest`` can change frequently, so this cache
     deliberately uses a 5-minute TTL — shorter than the 15-minute
     `TagCache` used for tag list responses. Keyed on
-    ``(registry, image, anchor_tag)``.
+    ``(registry, image, anchor_tag)``; backed by the tiered cache
+    (``anchor`` namespace) for the LRU bound and single-flight resolution.
     """
 
-    def __init__(self, ttl_minutes: int = 5) -> None:
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._store: dict[tuple[str, str, str], tuple[AnchorResolution, datetime]] = {}
+    def __init__(
+        self,
+        ttl_minutes: int = 5,
+        max_entries: int = ANCHOR_CACHE_MAX_ENTRIES,
+        register: bool = False,
+    ) -> None:
+        self._cache: TieredCache[tuple[str, str, str], AnchorResolution] = TieredCache(
+            "anchor",
+            max_entries=max_entries,
+            ttl=timedelta(minutes=ttl_minutes),
+            clock=_now,
+            register=register,
+        )
 
     def get(self, registry: str, image: str, anchor_tag: str) -> AnchorResolution | None:
-        key = (registry.lower(), image, anchor_tag)
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        resolution, stored_at = entry
-        if datetime.now(UTC) - stored_at > self._ttl:
-            del self._store[key]
-            return None
-        return resolution
+        return self._cache.get((registry.lower(), image, anchor_tag))
 
     def set(self, registry: str, image: str, anchor_tag: str, resolution: AnchorResolution) -> None:
-        key = (registry.lower(), image, anchor_tag)
-        self._store[key] = (resolution, datetime.now(UTC))
+        self._cache.set((registry.lower(), image, anchor_tag), resolution)
+
+    async def get_or_resolve(
+        self,
+        registry: str,
+        image: str,
+        anchor_tag: str,
+        resolve: Callable[[], Awaitable[AnchorResolution | None]],
+    ) -> AnchorResolution | None:
+        """Return a cached resolution or run ``resolve`` once for all concurrent callers."""
+        return await self._cache.get_or_load((registry.lower(), image, anchor_tag), resolve)
 
     def invalidate(self, registry: str, image: str, anchor_tag: str) -> None:
-        self._store.pop((registry.lower(), image, anchor_tag), None)
+        self._cache.invalidate((registry.lower(), image, anchor_tag))
 
     def clear(self) -> None:
-        self._store.clear()
+        self._cache.clear()
 
 
 # Process-global anchor cache. Re-keyed per request via the cache helper above.
-_anchor_cache = AnchorCache(ttl_minutes=5)
+_anchor_cache = AnchorCache(ttl_minutes=5, register=True)
 
 
 def get_anchor_cache() -> AnchorCache:
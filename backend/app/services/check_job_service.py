@@ -11,7 +11,7 @@ Provides concurrent execution of container update checks with:
 import asyncio
 import logging
 import time
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select, update
@@ -20,6 +20,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import AsyncSessionLocal
 from app.models.check_job import CheckJob
 from app.models.container import Container
+from app.services.change_detection import ImageProbe, container_fingerprint, is_unchanged
+from app.services.check_result_writer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL,
+    CheckOutcome,
+    CheckResultWriter,
+    PendingDecision,
+)
 from app.services.check_run_context import CheckRunContext, ImageCheckKey
 from app.services.event_bus import event_bus
 from app.services.notifications.dispatcher import NotificationDispatcher
@@ -27,7 +35,6 @@ from app.services.registry_rate_limiter import RegistryRateLimiter
 from app.services.settings_service import SettingsService
 from app.services.sibling_reconciliation import SiblingDrift, reconcile_siblings
 from app.services.tag_fetcher import TagFetcher
-from app.services.update_checker import UpdateChecker
 from app.services.update_decision_maker import UpdateDecisionMaker
 
 logger = logging.getLogger(__name__)
@@ -223,6 +230,25 @@ class CheckJobService:
                 global_include_prereleases = await SettingsService.get_bool(
                     db, "include_prereleases", default=False
                 )
+                # Incremental mode applies to scheduled runs only; a user-started
+                # check always re-evaluates everything.
+                incremental = str(job.triggered_by) == "scheduler" and (  # type: ignore[attr-defined]
+                    await SettingsService.get_bool(db, "check_incremental_enabled", default=False)
+                )
+                incremental_max_age = timedelta(
+                    hours=await SettingsService.get_int(
+                        db, "check_incremental_max_age_hours", default=24
+                    )
+                )
+                write_batch_size = await SettingsService.get_int(
+                    db, "check_write_batch_size", default=DEFAULT_BATCH_SIZE
+                )
+                write_flush_ms = await SettingsService.get_int(
+                    db, "check_write_flush_ms", default=int(DEFAULT_FLUSH_INTERVAL * 1000)
+                )
+                budget_reserve = await SettingsService.get_int(
+                    db, "registry_budget_reserve", default=0
+                )
 
                 # Get containers to check
                 result = await db.execute(select(Container).where(Container.policy != "disabled"))
@@ -248,8 +274,14 @@ class CheckJobService:
                     )
                     return
 
-                # Initialize rate limiter and run context
-                rate_limiter = RegistryRateLimiter(global_concurrency=concurrency_limit)
+                # Initialize rate limiter and run context. The limiter starts
+                # from the registry budgets persisted by earlier runs.
+                rate_limiter = RegistryRateLimiter(
+                    global_concurrency=concurrency_limit,
+                    sessions=AsyncSessionLocal,
+                    budget_reserve=budget_reserve,
+                )
+                await rate_limiter.load_budgets()
                 run_context = CheckRunContext(job_id=job_id)
 
                 # Build include_prereleases lookup for each container (tri-state)
@@ -296,6 +328,78 @@ class CheckJobService:
                 # Cache total_count as local int for use in workers
                 total_count: int = int(job.total_count)  # type: ignore[attr-defined]
 
+                # Fold a flushed batch of results into the shared counters and
+                # publish one progress event for the whole batch.
+                async def report_batch(outcomes: list[CheckOutcome]) -> None:
+                    nonlocal checked_count, updates_found, errors_count
+
+                    async with progress_lock:
+                        for outcome in outcomes:
+                            checked_count += 1
+                            if outcome.error is not None:
+                                errors_count += 1
+                                run_context.metrics.record_error()
+                                errors.append(
+                                    {
+                                        "container_id": outcome.container_id,
+                                        "container_name": outcome.container_name,
+                                        "error": outcome.error,
+                                    }
+                                )
+                            elif outcome.update_found:
+                                updates_found += 1
+                                updated_container_ids.add(outcome.container_id)
+                                run_context.metrics.record_update_found()
+                                results.append(
+                                    {
+                                        "container_id": outcome.container_id,
+                                        "container_name": outcome.container_name,
+                                        "update_found": True,
+                                        "from_tag": outcome.from_tag,
+                                        "to_tag": outcome.to_tag,
+                                    }
+                                )
+                            else:
+                                result_entry: dict[str, Any] = {
+                                    "container_id": outcome.container_id,
+                                    "container_name": outcome.container_name,
+                                    "update_found": False,
+                                }
+                                if outcome.unchanged:
+                                    result_entry["unchanged"] = True
+                                if outcome.retry_at is not None:
+                                    result_entry["deferred"] = True
+                                    result_entry["retry_at"] = datetime.fromtimestamp(
+                                        outcome.retry_at, UTC
+                                    ).isoformat()
+                                results.append(result_entry)
+
+                    await event_bus.publish(
+                        {
+                            "type": "check-job-progress",
+                            "job_id": job_id,
+                            "status": "running",
+                            "checked_count": checked_count,
+                            "total_count": total_count,
+                            "current_container": outcomes[-1].container_name,
+                            "updates_found": updates_found,
+                            "errors_count": errors_count,
+                            "progress_percent": int((checked_count / total_count) * 100)
+                            if total_count > 0
+                            else 0,
+                        }
+                    )
+
+                # Decisions are written in batches (one transaction per
+                # batch_size containers or flush interval) instead of one
+                # commit per container.
+                writer = CheckResultWriter(
+                    AsyncSessionLocal,
+                    report_batch,
+                    batch_size=write_batch_size,
+                    flush_interval=write_flush_ms / 1000,
+                )
+
                 # Worker function for checking a container group
                 async def check_group(
                     key: ImageCheckKey,
@@ -339,10 +443,53 @@ class CheckJobService:
                                 # so using the representative's anchor is
                                 # consistent with the existing key dedup.
                                 tag_fetcher = TagFetcher(worker_db, rate_limiter, run_context)
+
+                                # Incremental mode: probe the image cheaply and
+                                # skip the full pipeline when neither the
+                                # registry state nor the check settings changed.
+                                probe: ImageProbe | None = None
+                                if incremental:
+                                    probe = await tag_fetcher.probe_image(
+                                        str(fresh_representative.registry),  # type: ignore[attr-defined]
+                                        key.image,
+                                        key.current_tag,
+                                    )
+                                    if all(
+                                        is_unchanged(
+                                            c,
+                                            container_fingerprint(
+                                                probe, c, key.include_prereleases
+                                            ),
+                                            incremental_max_age,
+                                        )
+                                        for c in fresh_containers
+                                    ):
+                                        for container in fresh_containers:
+                                            run_context.metrics.record_unchanged_skip()
+                                            await writer.record_unchanged(
+                                                container.id,  # type: ignore[attr-defined]
+                                                str(container.name),  # type: ignore[attr-defined]
+                                            )
+                                        return
+
                                 fetch_response = await tag_fetcher.fetch_tags_for_container(
                                     fresh_representative
                                 )
 
+                                # The registry's quota is spent: leave the
+                                # containers (and their fingerprints) untouched
+                                # and report when the check can run again.
+                                if fetch_response.deferred_until is not None:
+                                    await worker_db.commit()
+                                    for container in fresh_containers:
+                                        run_context.metrics.record_deferred()
+                                        await writer.record_deferred(
+                                            container.id,  # type: ignore[attr-defined]
+                                            str(container.name),  # type: ignore[attr-defined]
+                                            fetch_response.deferred_until,
+                                        )
+                                    return
+
                                 # Make update decision
                                 decision_maker = UpdateDecisionMaker()
                                 decision = decision_maker.make_decision(
@@ -351,84 +498,26 @@ class CheckJobService:
                                     key.include_prereleases,
                                 )
 
-                                # Apply decision to all containers in group
+                                # Release the worker's transaction (the fetch may
+                                # have written anchor baselines) before handing
+                                # the decision to the batched writer.
+                                await worker_db.commit()
+
+                                # Queue the decision for every container in the
+                                # group; the writer applies it in batches.
                                 for container in fresh_containers:
                                     if cancel_requested:
                                         break
-
-                                    container_name: str = str(container.name)  # type: ignore[attr-defined]
-                                    container_id: int = container.id  # type: ignore[attr-defined]
-
-                                    try:
-                                        update_obj = await UpdateChecker.apply_decision(
-                                            worker_db,
-                                            container,
-                                            decision,
-                                            fetch_response,
-                                        )
-                                        await worker_db.commit()
-
-                                        # Update progress counters (thread-safe with lock)
-                                        async with progress_lock:
-                                            checked_count += 1
-                                            if update_obj:
-                                                updates_found += 1
-                                                updated_container_ids.add(container_id)
-                                                run_context.metrics.record_update_found()
-                                                results.append(
-                                                    {
-                                                        "container_id": container_id,
-                                                        "container_name": container_name,
-                                                        "update_found": True,
-                                                        "from_tag": update_obj.from_tag,
-                                                        "to_tag": update_obj.to_tag,
-                                                    }
-                                                )
-                                            else:
-                                                results.append(
-                                                    {
-                                                        "container_id": container_id,
-                                                        "container_name": container_name,
-                                                        "update_found": False,
-                                                    }
-                                                )
-
-                                        # Publish progress event
-                                        await event_bus.publish(
-                                            {
-                                                "type": "check-job-progress",
-                                                "job_id": job_id,
-                                                "status": "running",
-                                                "checked_count": checked_count,
-                                                "total_count": total_count,
-                                                "current_container": container_name,
-                                                "updates_found": updates_found,
-                                                "errors_count": errors_count,
-                                                "progress_percent": int(
-                                                    (checked_count / total_count) * 100
-                                                )
-                                                if total_count > 0
-                                                else 0,
-                                            }
+                                    await writer.submit(
+                                        PendingDecision(
+                                            container_id=container.id,  # type: ignore[attr-defined]
+                                            container_name=str(container.name),  # type: ignore[attr-defined]
+                                            decision=decision,
+                                            fetch_response=fetch_response,
+                                            probe=probe,
+                                            include_prereleases=key.include_prereleases,
                                         )
-
-                                    except Exception as container_error:
-                                        logger.error(
-                                            f"Error applying decision to {container_name}: "
-                                            f"{container_error}"
-                                        )
-                                        async with progress_lock:
-                                            checked_count += 1
-                                            errors_count += 1
-                                            run_context.metrics.record_error()
-                                            errors.append(
-                                                {
-                                                    "container_id": container_id,
-                                                    "container_name": container_name,
-                                                    "error": str(container_error),
-                                                }
-                                            )
-                                        await worker_db.rollback()
+                                    )
 
                                 # Record metrics
                                 latency = time.monotonic() - start_time
@@ -472,6 +561,7 @@ class CheckJobService:
                 cancel_task = asyncio.create_task(cancellation_monitor())
 
                 # Execute all groups concurrently with bounded parallelism
+                writer.start()
                 try:
                     tasks = [
                         check_group(key, group_containers, semaphore)
@@ -479,6 +569,8 @@ class CheckJobService:
                     ]
                     await asyncio.gather(*tasks, return_exceptions=True)
                 finally:
+                    # Apply whatever decisions are still buffered
+                    await writer.close()
                     cancel_task.cancel()
                     try:
                         await cancel_task
@@ -508,6 +600,9 @@ class CheckJobService:
                     except Exception as reconcile_error:
                         logger.error(f"Sibling reconciliation failed: {reconcile_error}")
 
+                # Persist the registry budgets this run observed
+                await rate_limiter.flush_budgets()
+
                 # Publish SSE events + dispatch notifications for any drift
                 # observed in the reconciliation pass. Done outside the try
                 # block above so a notification failure does not abort the
@@ -614,7 +709,8 @@ class CheckJobService:
 
                 logger.info(
                     f"Check job {job_id} completed: "
-                    f"{checked_count} checked, "
+                    f"{checked_count} checked "
+                    f"({metrics.unchanged_skipped} unchanged, {metrics.deferred} deferred), "
                     f"{updates_found} updates found, "
                     f"{errors_count} errors, "
                     f"deduplicated={metrics.deduplicated_containers}, "
@@ -0,0 +1,275 @@
+"""Batched persistence of check-job decisions.
+
+Check workers fetch tags and make decisions concurrently, but on SQLite every
+commit is an fsync'd transaction contending for the single writer lock.
+Instead of committing once per container, workers hand their decisions to a
+``CheckResultWriter``, which applies them in one transaction per batch — every
+``batch_size`` containers or every ``flush_interval`` seconds, whichever comes
+first. Each container is applied inside its own SAVEPOINT, so a failure rolls
+back only that container. Side effects of a decision (VulnForge and changelog
+lookups, auto-approval, notifications, events) run only after the batch has
+committed, so no network call holds the write lock and nothing is announced
+for a batch that rolled back. The writer reports each flushed batch through a
+callback, which the check job uses to publish one coalesced progress event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from app.models.container import Container
+from app.services.change_detection import ImageProbe, container_fingerprint
+from app.services.update_checker import UpdateChecker
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.services.tag_fetcher import FetchTagsResponse
+    from app.services.update_decision_maker import UpdateDecision
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_FLUSH_INTERVAL = 0.5  # seconds
+
+
+@dataclass
+class PendingDecision:
+    """A decision waiting to be applied to one container.
+
+    Attributes:
+        container_id: Container to apply the decision to
+        container_name: Display name (for error reporting)
+        decision: Decision made for the container's image group
+        fetch_response: Tag fetch result the decision was made from
+        probe: Incremental-mode probe; stamps ``check_fingerprint`` when set
+        include_prereleases: Effective prerelease setting of the group
+    """
+
+    container_id: int
+    container_name: str
+    decision: UpdateDecision
+    fetch_response: FetchTagsResponse
+    probe: ImageProbe | None = None
+    include_prereleases: bool = False
+
+
+@dataclass
+class CheckOutcome:
+    """Result of one container in a flushed batch.
+
+    Attributes:
+        container_id: Container ID
+        container_name: Container display name
+        update_found: Whether an update record was created or found
+        from_tag: Update source tag (when ``update_found``)
+        to_tag: Update target tag (when ``update_found``)
+        error: Error message when applying failed
+        unchanged: Skipped by the incremental mode (nothing was written)
+        retry_at: Epoch seconds the check was deferred to because the
+            registry's rate-limit budget is spent (nothing was written)
+    """
+
+    container_id: int
+    container_name: str
+    update_found: bool = False
+    from_tag: str | None = None
+    to_tag: str | None = None
+    error: str | None = None
+    unchanged: bool = False
+    retry_at: float | None = None
+
+
+class CheckResultWriter:
+    """Applies check decisions in bounded batches on a single session.
+
+    Example:
+        writer = CheckResultWriter(AsyncSessionLocal, on_flush=report)
+        writer.start()
+        await writer.submit(PendingDecision(...))
+        await writer.close()  # applies whatever is still buffered
+    """
+
+    def __init__(
+        self,
+        sessions: Callable[[], Any],
+        on_flush: Callable[[list[CheckOutcome]], Awaitable[None]],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize the writer.
+
+        Args:
+            sessions: Async session factory (e.g. ``AsyncSessionLocal``)
+            on_flush: Called with the outcomes of every flushed batch
+            batch_size: Containers per transaction
+            flush_interval: Longest time (seconds) a decision stays buffered
+        """
+        self._sessions = sessions
+        self._on_flush = on_flush
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._pending: list[PendingDecision | CheckOutcome] = []
+        self._flush_lock = asyncio.Lock()
+        self._ticker: asyncio.Task | None = None  # type: ignore[type-arg]
+
+    def start(self) -> None:
+        """Start the interval flush."""
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(self._tick())
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Interval flush of check results failed: {e}")
+
+    async def submit(self, item: PendingDecision) -> None:
+        """Buffer a decision; flushes when the batch is full."""
+        await self._add(item)
+
+    async def record_unchanged(self, container_id: int, container_name: str) -> None:
+        """Report a container the incremental mode skipped (nothing to write)."""
+        await self._add(CheckOutcome(container_id, container_name, unchanged=True))
+
+    async def record_deferred(
+        self, container_id: int, container_name: str, retry_at: float
+    ) -> None:
+        """Report a container whose check waits for its registry budget (nothing to write)."""
+        await self._add(CheckOutcome(container_id, container_name, retry_at=retry_at))
+
+    async def _add(self, item: PendingDecision | CheckOutcome) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Apply everything buffered in one transaction and report it."""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                outcomes = await self._apply(batch)
+            except Exception as e:
+                logger.error(f"Flushing {len(batch)} check results failed: {e}")
+                outcomes = [
+                    item
+                    if isinstance(item, CheckOutcome)
+                    else CheckOutcome(item.container_id, item.container_name, error=str(e))
+                    for item in batch
+                ]
+            await self._on_flush(outcomes)
+
+    async def close(self) -> None:
+        """Stop the interval flush and apply what is still buffered."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ticker
+            self._ticker = None
+        await self.flush()
+
+    async def _apply(self, batch: list[PendingDecision | CheckOutcome]) -> list[CheckOutcome]:
+        """Apply a batch with per-container savepoints and a single commit."""
+        outcomes = [item for item in batch if isinstance(item, CheckOutcome)]
+        decisions = [item for item in batch if isinstance(item, PendingDecision)]
+        if not decisions:
+            return outcomes
+
+        applied: list[CheckOutcome] = []
+        side_effects: list[tuple[str, list[Callable[[], Awaitable[None]]]]] = []
+        async with self._sessions() as db:
+            result = await db.execute(
+                select(Container).where(Container.id.in_([d.container_id for d in decisions]))
+            )
+            containers = {c.id: c for c in result.scalars().all()}
+
+            for item in decisions:
+                container = containers.get(item.container_id)
+                if container is None:
+                    outcomes.append(
+                        CheckOutcome(
+                            item.container_id, item.container_name, error="Container not found"
+                        )
+                    )
+                    continue
+                effects: list[Callable[[], Awaitable[None]]] = []
+                try:
+                    async with db.begin_nested():
+                        update_obj = await UpdateChecker.apply_decision(
+                            db, container, item.decision, item.fetch_response, after_commit=effects
+                        )
+                        # Stamp the fingerprint after the decision so baselines
+                        # it wrote are folded in; a failed fetch clears it to
+                        # force a full recheck.
+                        if item.probe is not None:
+                            container.check_fingerprint = (  # type: ignore[assignment]
+                                None
+                                if item.fetch_response.error
+                                else container_fingerprint(
+                                    item.probe, container, item.include_prereleases
+                                )
+                            )
+                except Exception as e:
+                    logger.error(f"Error applying decision to {item.container_name}: {e}")
+                    outcomes.append(
+                        CheckOutcome(item.container_id, item.container_name, error=str(e))
+                    )
+                    continue
+                side_effects.append((item.container_name, effects))
+                applied.append(
+                    CheckOutcome(
+                        item.container_id,
+                        item.container_name,
+                        update_found=update_obj is not None,
+                        from_tag=update_obj.from_tag if update_obj else None,
+                        to_tag=update_obj.to_tag if update_obj else None,
+                    )
+                )
+
+            try:
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Committing {len(applied)} check results failed: {e}")
+                await db.rollback()
+                applied = [
+                    CheckOutcome(o.container_id, o.container_name, error=f"Commit failed: {e}")
+                    for o in applied
+                ]
+                side_effects = []
+
+            for container_name, effects in side_effects:
+                await self._run_side_effects(db, container_name, effects)
+
+        logger.debug(f"Flushed {len(applied)} check results in one transaction")
+        return outcomes + applied
+
+    @staticmethod
+    async def _run_side_effects(
+        db: AsyncSession, container_name: str, effects: list[Callable[[], Awaitable[None]]]
+    ) -> None:
+        """Run one container's post-commit side effects in their own transaction.
+
+        The decision itself is already committed, so a failure here is logged
+        and rolled back without touching the container's outcome.
+        """
+        if not effects:
+            return
+        try:
+            for effect in effects:
+                await effect()
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Post-commit side effects for {container_name} failed: {e}")
+            await db.rollback()
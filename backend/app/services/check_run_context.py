@@ -7,17 +7,22 @@ a single update check job.
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from app.services.tiered_cache import TieredCache
+
 if TYPE_CHECKING:
     from app.models.container import Container
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the run-scoped result cache (one entry per unique image signature).
+RUN_CACHE_MAX_ENTRIES = 4096
+RUN_CACHE_TTL = timedelta(hours=6)
+
 
 @dataclass(frozen=True)
 class ImageCheckKey:
@@ -133,6 +138,8 @@ class CheckRunMetrics:
         unique_images: Number of unique image signatures
         updates_found: Updates detected
         errors: Errors encountered
+        unchanged_skipped: Containers skipped by the incremental mode
+        deferred: Containers deferred because their registry budget is spent
         container_latencies: Per-container check latency (seconds)
         registry_calls: Registry API call count per registry
         registry_cache_hits: Run-cache hits per registry
@@ -149,6 +156,8 @@ class CheckRunMetrics:
     unique_images: int = 0
     updates_found: int = 0
     errors: int = 0
+    unchanged_skipped: int = 0
+    deferred: int = 0
 
     # Timing
     container_latencies: list[float] = field(default_factory=list)
@@ -182,6 +191,14 @@ class CheckRunMetrics:
         """Record that an error occurred."""
         self.errors += 1
 
+    def record_unchanged_skip(self) -> None:
+        """Record a container skipped because its image did not change."""
+        self.unchanged_skipped += 1
+
+    def record_deferred(self) -> None:
+        """Record a container deferred until its registry budget returns."""
+        self.deferred += 1
+
     @property
     def duration_seconds(self) -> float | None:
         """Get total run duration in seconds."""
@@ -227,6 +244,8 @@ class CheckRunMetrics:
             "unique_images": self.unique_images,
             "updates_found": self.updates_found,
             "errors": self.errors,
+            "unchanged_skipped": self.unchanged_skipped,
+            "deferred": self.deferred,
             "avg_container_latency": self.avg_container_latency,
             "max_container_latency": self.max_container_latency,
             "cache_hit_rate": self.cache_hit_rate,
@@ -276,8 +295,13 @@ class CheckRunContext:
             job_id: ID of the check job this context belongs to
         """
         self.job_id = job_id
-        self._tag_cache: dict[ImageCheckKey, TagFetchResult] = {}
-        self._lock = asyncio.Lock()
+        # Run-scoped namespace of the tiered cache; the TTL only guards
+        # against a wedged job holding results forever.
+        self._tag_cache: TieredCache[ImageCheckKey, TagFetchResult] = TieredCache(
+            "check_run",
+            max_entries=RUN_CACHE_MAX_ENTRIES,
+            ttl=RUN_CACHE_TTL,
+        )
         self.metrics = CheckRunMetrics()
 
         # Container groups for deduplication
@@ -293,8 +317,7 @@ class CheckRunContext:
         Returns:
             Cached TagFetchResult or None if not cached
         """
-        async with self._lock:
-            return self._tag_cache.get(key)
+        return self._tag_cache.get(key)
 
     async def set_cached_result(self, key: ImageCheckKey, result: TagFetchResult) -> None:
         """Cache tag fetch result for this run.
@@ -303,8 +326,7 @@ class CheckRunContext:
             key: ImageCheckKey to cache
             result: TagFetchResult to store
         """
-        async with self._lock:
-            self._tag_cache[key] = result
+        self._tag_cache.set(key, result)
 
     def group_containers(
         self, containers: list[Container], include_prereleases_lookup: dict[int, bool]
@@ -15,7 +15,7 @@ from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.container import Container
-from app.services.docker_access import make_docker_client, resolve_docker_url
+from app.services.docker_runtime_index import RuntimeContainer, RuntimeIndex, runtime_snapshot
 from app.services.settings_service import SettingsService
 from app.utils.security import sanitize_log_message, sanitize_path
 
@@ -972,73 +972,61 @@ class ComposeParser:
     async def _sync_compose_projects(db: AsyncSession) -> None:
         """Sync compose_project and docker_name from Docker runtime labels.
 
-        Uses label-based filtering (not name lookup) to correctly resolve
+        Uses label-based matching (not name lookup) to correctly resolve
         containers even when multiple services share the same name.
         Always re-resolves so docker_name stays fresh after container recreations.
+        Every row is resolved against one runtime snapshot.
 
         Args:
             db: Database session
         """
         try:
-            docker_url = await resolve_docker_url(db)
-            client = make_docker_client(docker_url)
+            index = await runtime_snapshot.get(db)
         except Exception as e:
             logger.warning(f"Could not connect to Docker for compose project sync: {e}")
             return
 
-        try:
-            result = await db.execute(select(Container))
-            all_containers = result.scalars().all()
+        result = await db.execute(select(Container))
+        all_containers = result.scalars().all()
 
-            for container in all_containers:
-                try:
-                    ComposeParser._resolve_runtime_info(client, container)
-                except Exception as e:
-                    logger.debug(f"Could not resolve runtime info for {container.name}: {e}")
-        finally:
-            client.close()
+        for container in all_containers:
+            try:
+                ComposeParser._resolve_runtime_info(index, container)
+            except Exception as e:
+                logger.debug(f"Could not resolve runtime info for {container.name}: {e}")
 
     @staticmethod
-    def _resolve_runtime_info(client: Any, container: Container) -> None:
+    def _resolve_runtime_info(index: RuntimeIndex, container: Container) -> None:
         """Resolve compose_project and docker_name from Docker runtime labels.
 
-        Two-pass label filter: project-qualified first, service-only fallback.
+        Two-pass label match: project-qualified first, service-only fallback.
         Only accepts unambiguous (single) matches on service-only pass.
         """
-        from docker.errors import DockerException as _DockerException
-
-        svc_label = f"com.docker.compose.service={container.service_name}"
-
-        # Build filter sets: precise first, broad second
-        filter_sets: list[dict[str, list[str]]] = []
+        # Candidate sets: precise first, broad second
+        candidate_sets: list[list[RuntimeContainer]] = []
 
         if container.compose_project:
-            proj_label = f"com.docker.compose.project={container.compose_project}"
-            filter_sets.append({"label": [svc_label, proj_label]})
+            candidate_sets.append(
+                index.by_project_service(container.compose_project, container.service_name)
+            )
         else:
             # Infer project from compose file parent dir (Docker Compose default)
             inferred = Path(container.compose_file).parent.name
             if inferred and inferred != ".":
-                proj_label = f"com.docker.compose.project={inferred}"
-                filter_sets.append({"label": [svc_label, proj_label]})
+                candidate_sets.append(index.by_project_service(inferred, container.service_name))
 
         # Broad fallback: service-only
-        filter_sets.append({"label": [svc_label]})
-
-        for i, filters in enumerate(filter_sets):
-            try:
-                matches = client.containers.list(all=True, filters=filters)
-            except _DockerException:
-                continue
+        candidate_sets.append(index.by_service(container.service_name))
 
+        for i, matches in enumerate(candidate_sets):
             if len(matches) == 1:
                 match = matches[0]
-                docker_name = match.name.lstrip("/")
+                docker_name = match.name
                 if container.docker_name != docker_name:
                     container.docker_name = docker_name
                     logger.debug(f"Set docker_name={docker_name} for {container.name}")
 
-                project = match.labels.get("com.docker.compose.project")
+                project = match.project
                 if project and container.compose_project != project:
                     container.compose_project = project
                     logger.info(f"Set compose_project={project} for {container.name}")
@@ -1047,8 +1035,8 @@ class ComposeParser:
             if len(matches) > 1 and i == 0:
                 # Project-qualified returned multiple — take first
                 match = matches[0]
-                container.docker_name = match.name.lstrip("/")
-                project = match.labels.get("com.docker.compose.project")
+                container.docker_name = match.name
+                project = match.project
                 if project and not container.compose_project:
                     container.compose_project = project
                 return
@@ -2,11 +2,9 @@
 
 import logging
 
-from docker.errors import DockerException, NotFound
-from requests.exceptions import ConnectionError as RequestsConnectionError
-
 from app.services.compose_parser import validate_container_name
-from app.services.docker_access import make_docker_client, resolve_docker_url_sync
+from app.services.container_state import container_states
+from app.services.docker_engine import DockerEngineError
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +13,14 @@ class ContainerMonitorService:
     """Monitor container health, exit codes, and failure states."""
 
     def __init__(self) -> None:
-        """Initialize with Docker client."""
-        self.client = make_docker_client(resolve_docker_url_sync())
-
-    def reconnect(self) -> None:
-        """Reinitialize Docker client (e.g. after proxy restart)."""
-        if self.client:
-            try:
-                self.client.close()
-            except Exception as e:
-                logger.debug("Ignoring error closing old Docker client: %s", e)
-        self.client = make_docker_client(resolve_docker_url_sync())
-        logger.info("Docker client reconnected to %s", resolve_docker_url_sync())
+        """Read from the shared live container state store."""
+        self.states = container_states
 
     async def get_container_state(self, container_name: str) -> dict | None:
-        """Get full container state including exit codes using Docker SDK.
+        """Get full container state including exit codes.
+
+        Running containers are answered from the live state store; stopped
+        ones are inspected (once per state change) for exit detail.
 
         Args:
             container_name: Name of the container
@@ -43,26 +34,14 @@ class ContainerMonitorService:
             return {"error": "Invalid container name", "running": False}
 
         try:
-            container = self.client.containers.get(container_name)
-            container.reload()  # Refresh container data
-
-            state = container.attrs.get("State", {})
+            state = await self.states.get(container_name)
+            if state is not None and not state.running:
+                state = await self.states.get(container_name, detail=True)
+        except DockerEngineError as e:
+            logger.error(f"Docker error getting state for {container_name}: {e}")
+            return {"error": str(e), "running": False}
 
-            return {
-                "status": state.get("Status"),  # running, exited, restarting, paused
-                "running": state.get("Running", False),
-                "paused": state.get("Paused", False),
-                "restarting": state.get("Restarting", False),
-                "oom_killed": state.get("OOMKilled", False),
-                "dead": state.get("Dead", False),
-                "exit_code": state.get("ExitCode"),
-                "error": state.get("Error", ""),
-                "started_at": state.get("StartedAt"),
-                "finished_at": state.get("FinishedAt"),
-                "restart_count": state.get("RestartCount", 0),
-                "health": state.get("Health", {}),
-            }
-        except NotFound:
+        if state is None:
             # `missing` is what separates "removed" from "stopped". Both are
             # running=False, but only a removed container needs `compose up`
             # (compose restart cannot recreate one), and only a removed
@@ -70,12 +49,7 @@ class ContainerMonitorService:
             # tell them apart end up reporting a phantom "exited with code
             # None" forever instead of recovering the container.
             return {"error": "Container not found", "running": False, "missing": True}
-        except (DockerException, RequestsConnectionError) as e:
-            logger.error(f"Docker error getting state for {container_name}: {e}")
-            return {"error": str(e), "running": False}
-        except (ValueError, KeyError, AttributeError) as e:
-            logger.error(f"Invalid container data for {container_name}: {e}")
-            return {"error": str(e), "running": False}
+        return state.as_state_dict()
 
     @staticmethod
     async def should_retry_restart(
@@ -173,7 +147,7 @@ class ContainerMonitorService:
         }
 
     async def check_health_status(self, container_name: str) -> dict:
-        """Check container health status using Docker SDK.
+        """Check container health status from the live container state store.
 
         Args:
             container_name: Name of the container
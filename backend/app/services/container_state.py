@@ -0,0 +1,406 @@
+"""Live, in-process store of container runtime state.
+
+One table answers "is it running, how did it exit, is it healthy, what is its
+restart policy" for the API, metrics, update and restart subsystems. It is fed
+by three sources, cheapest first:
+
+- Docker events (``DockerEventWatcher``): every create/start/die/oom/health/
+  destroy lands here as it happens. While the stream is live, entries are
+  current no matter how old they are.
+- List snapshots (``runtime_snapshot``): one ``/containers/json`` call
+  refreshes every container at once, periodically and whenever a read finds
+  its entry older than the staleness bound with no live event stream.
+- Inspect: only for detail the listing lacks (OOM flag, error, timestamps,
+  restart count and policy, health log), cached until an event changes it.
+
+Subscribers are notified of every state transition, whether it arrived as an
+event or was discovered by a snapshot or inspect.
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.services.docker_engine import DockerEngineError, DockerNotFoundError, docker_engine
+from app.services.docker_runtime_index import RuntimeIndex, runtime_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Listing "Status" text: "Exited (137) 2 minutes ago", "Up 3 hours (healthy)"
+_EXITED_RE = re.compile(r"^Exited \((-?\d+)\)")
+_HEALTH_RE = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
+# States in which Docker reports State.Running as true
+_RUNNING_STATES = frozenset({"running", "paused", "restarting"})
+
+
+@dataclass(slots=True)
+class ContainerRuntimeState:
+    """Last observed runtime state of one container."""
+
+    name: str
+    status: str = ""
+    running: bool = False
+    exit_code: int | None = None
+    oom_killed: bool = False
+    missing: bool = False
+    health: str | None = None
+    # Inspect-only detail, valid while ``inspected_at`` is set
+    error: str = ""
+    started_at: str | None = None
+    finished_at: str | None = None
+    restart_count: int = 0
+    health_detail: dict[str, Any] = field(default_factory=dict)
+    # Survives events until the container is recreated
+    restart_policy: str | None = None
+    updated_at: float = field(default_factory=time.monotonic)
+    inspected_at: float | None = None
+
+    def as_state_dict(self) -> dict[str, Any]:
+        """Shape of ``ContainerMonitorService.get_container_state``."""
+        if self.missing:
+            return {"error": "Container not found", "running": False, "missing": True}
+        health = dict(self.health_detail)
+        if self.health:
+            health["Status"] = self.health
+        return {
+            "status": self.status,
+            "running": self.running,
+            "paused": self.status == "paused",
+            "restarting": self.status == "restarting",
+            "oom_killed": self.oom_killed,
+            "dead": self.status == "dead",
+            "exit_code": self.exit_code,
+            "error": self.error,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "restart_count": self.restart_count,
+            "health": health,
+        }
+
+    def _mark_removed(self, observed_at: float) -> None:
+        self.status = "removed"
+        self.running = False
+        self.missing = True
+        self.restart_policy = None
+        self.inspected_at = None
+        self.updated_at = observed_at
+
+
+def event_action(event: dict[str, Any]) -> tuple[str, str | None]:
+    """Split ``"health_status: healthy"`` style actions into (action, detail)."""
+    action = event.get("Action") or event.get("status") or ""
+    name, _, detail = action.partition(":")
+    return name.strip(), detail.strip() or None
+
+
+StateSubscriber = Callable[[ContainerRuntimeState, str], Awaitable[None]]
+
+
+class ContainerStateStore:
+    """Container runtime states keyed by Docker container name."""
+
+    # Staleness bound for reads while no event stream is live
+    MAX_AGE_SECONDS = 5.0
+    # Background list snapshot period (catches anything events missed)
+    SNAPSHOT_INTERVAL_SECONDS = 60.0
+
+    def __init__(self) -> None:
+        self._states: dict[str, ContainerRuntimeState] = {}
+        self._subscribers: list[StateSubscriber] = []
+        self._snapshot_at: float | None = None
+        self._live_since: float | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None  # type: ignore[type-arg]
+
+    @property
+    def live(self) -> bool:
+        """Whether a Docker event stream is currently feeding the store."""
+        return self._live_since is not None
+
+    def set_live(self, live: bool) -> None:
+        """Mark the event feed as connected or lost."""
+        if live and self._live_since is None:
+            self._live_since = time.monotonic()
+        elif not live:
+            self._live_since = None
+
+    def _fresh(self, observed_at: float | None, max_age: float) -> bool:
+        if observed_at is None or max_age <= 0:
+            return False
+        return self.live or time.monotonic() - observed_at <= max_age
+
+    def _snapshot_fresh(self, max_age: float) -> bool:
+        """Whether the last listing still proves unlisted names do not exist."""
+        if self._snapshot_at is None or max_age <= 0:
+            return False
+        if self._live_since is not None and self._snapshot_at >= self._live_since:
+            return True
+        return time.monotonic() - self._snapshot_at <= max_age
+
+    def subscribe(self, subscriber: StateSubscriber) -> None:
+        """Call ``subscriber(state, action)`` on every transition (idempotent)."""
+        if subscriber not in self._subscribers:
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: StateSubscriber) -> None:
+        """Stop calling ``subscriber``."""
+        with contextlib.suppress(ValueError):
+            self._subscribers.remove(subscriber)
+
+    async def _notify(self, state: ContainerRuntimeState, action: str) -> None:
+        for subscriber in list(self._subscribers):
+            try:
+                await subscriber(state, action)
+            except Exception:
+                logger.exception("Container state subscriber failed for %s %s", action, state.name)
+
+    async def _notify_transition(
+        self,
+        state: ContainerRuntimeState,
+        was_running: bool | None,
+        was_missing: bool | None,
+    ) -> None:
+        """Notify subscribers of a change discovered outside the event stream."""
+        if was_running is None:
+            return
+        if state.running and (not was_running or was_missing):
+            await self._notify(state, "start")
+        elif was_running and not state.running:
+            await self._notify(state, "die")
+
+    def peek(self, name: str) -> ContainerRuntimeState | None:
+        """Last observed state of ``name`` without contacting Docker."""
+        return self._states.get(name.lstrip("/"))
+
+    async def get(
+        self,
+        name: str,
+        max_age: float | None = None,
+        detail: bool = False,
+        db: Any = None,
+    ) -> ContainerRuntimeState | None:
+        """Current state of a container, refreshed only when stale.
+
+        Args:
+            name: Docker container name
+            max_age: Staleness bound in seconds while no event stream is live
+                (default ``MAX_AGE_SECONDS``; 0 forces a refresh)
+            detail: Also require inspect-only fields (exit detail, health log)
+            db: Optional session used to resolve the Docker endpoint
+
+        Returns:
+            The container state, or None if no such container exists
+
+        Raises:
+            DockerEngineError: If Docker is unreachable and a refresh was needed
+        """
+        name = name.lstrip("/")
+        max_age = self.MAX_AGE_SECONDS if max_age is None else max_age
+        entry = self._states.get(name)
+        if entry is None or not self._fresh(entry.updated_at, max_age):
+            if entry is not None or not self._snapshot_fresh(max_age):
+                await self.refresh(max_age=max_age, db=db)
+            entry = self._states.get(name)
+        if entry is None or entry.missing:
+            return None
+        if detail and not self._fresh(entry.inspected_at, max_age):
+            entry = await self.inspect(name, db=db)
+        return entry
+
+    async def restart_policy(self, name: str, db: Any = None) -> str | None:
+        """Restart policy name, inspected once per container lifetime.
+
+        Returns:
+            Policy name (``no`` when unset), or None if no such container exists
+
+        Raises:
+            DockerEngineError: If Docker is unreachable
+        """
+        entry = self._states.get(name.lstrip("/"))
+        if entry is None or entry.missing or entry.restart_policy is None:
+            entry = await self.inspect(name, db=db)
+        return entry.restart_policy if entry is not None else None
+
+    async def apply_event(self, event: dict[str, Any]) -> ContainerRuntimeState | None:
+        """Fold one Engine API container event into the store.
+
+        Returns:
+            The updated state, or None for events that are not about a
+            named container
+        """
+        if event.get("Type", "container") != "container":
+            return None
+        attributes = (event.get("Actor") or {}).get("Attributes") or {}
+        name = (attributes.get("name") or "").lstrip("/")
+        if not name:
+            return None
+        action, detail = event_action(event)
+        now = time.monotonic()
+
+        state = self._states.get(name)
+        if state is None:
+            state = self._states[name] = ContainerRuntimeState(name=name)
+
+        if action in ("create", "start"):
+            state.status = "created" if action == "create" else "running"
+            state.running = action == "start"
+            state.exit_code = None
+            state.oom_killed = False
+            state.missing = False
+            if action == "create":
+                state.restart_policy = None
+        elif action == "die":
+            state.status = "exited"
+            state.running = False
+            try:
+                state.exit_code = int(attributes.get("exitCode", ""))
+            except TypeError, ValueError:
+                state.exit_code = None
+        elif action == "oom":
+            state.oom_killed = True
+        elif action == "destroy":
+            state._mark_removed(now)
+        elif action == "health_status":
+            state.health = detail
+        if action != "health_status":
+            state.inspected_at = None
+        state.updated_at = now
+        await self._notify(state, action)
+        return state
+
+    async def refresh(self, max_age: float = 0.0, db: Any = None) -> None:
+        """Fold a container listing into the store (one call for all containers).
+
+        Concurrent callers share one listing.
+
+        Raises:
+            DockerEngineError: If the Docker daemon is unreachable
+        """
+        async with self._lock:
+            if self._snapshot_fresh(max_age):
+                return
+            index = await runtime_snapshot.get(db, max_age=max_age)
+            await self.apply_snapshot(index)
+
+    async def apply_snapshot(self, index: RuntimeIndex) -> None:
+        """Merge a listing; entries updated by events since it was taken win."""
+        if self._snapshot_at is not None and index.taken_at <= self._snapshot_at:
+            return
+        listed = set()
+        for container in index.containers:
+            listed.add(container.name)
+            state = self._states.get(container.name)
+            if state is None:
+                state = self._states[container.name] = ContainerRuntimeState(name=container.name)
+                was_running = was_missing = None
+            elif state.updated_at > index.taken_at:
+                continue
+            else:
+                was_running, was_missing = state.running, state.missing
+
+            if state.status != container.state:
+                state.inspected_at = None
+            state.status = container.state
+            state.running = container.state in _RUNNING_STATES
+            state.missing = False
+            exited = _EXITED_RE.match(container.status)
+            state.exit_code = int(exited.group(1)) if exited else None
+            health = _HEALTH_RE.search(container.status)
+            state.health = health.group(1).removeprefix("health: ") if health else None
+            state.updated_at = index.taken_at
+            await self._notify_transition(state, was_running, was_missing)
+
+        for name, state in list(self._states.items()):
+            if name in listed or state.missing or state.updated_at > index.taken_at:
+                continue
+            state._mark_removed(index.taken_at)
+            await self._notify(state, "destroy")
+        self._snapshot_at = index.taken_at
+
+    async def inspect(self, name: str, db: Any = None) -> ContainerRuntimeState | None:
+        """Refresh one container, including inspect-only detail.
+
+        Returns:
+            The container state, or None if no such container exists
+
+        Raises:
+            DockerEngineError: If the Docker daemon is unreachable
+        """
+        name = name.lstrip("/")
+        started = time.monotonic()
+        try:
+            attrs = await docker_engine.inspect_container(name, db=db)
+        except DockerNotFoundError:
+            state = self._states.get(name)
+            if state is not None and not state.missing:
+                state._mark_removed(started)
+                await self._notify(state, "destroy")
+            return None
+
+        state = self._states.get(name)
+        if state is None:
+            state = self._states[name] = ContainerRuntimeState(name=name)
+            was_running = was_missing = None
+        else:
+            was_running, was_missing = state.running, state.missing
+        raw = attrs.get("State") or {}
+        health = dict(raw.get("Health") or {})
+        policy = ((attrs.get("HostConfig") or {}).get("RestartPolicy") or {}).get("Name")
+
+        state.status = raw.get("Status", "")
+        state.running = raw.get("Running", False)
+        state.exit_code = None if state.running else raw.get("ExitCode")
+        state.oom_killed = raw.get("OOMKilled", False)
+        state.missing = False
+        state.health = health.pop("Status", None)
+        state.health_detail = health
+        state.error = raw.get("Error", "")
+        state.started_at = raw.get("StartedAt")
+        state.finished_at = raw.get("FinishedAt")
+        state.restart_count = raw.get("RestartCount", 0)
+        state.restart_policy = policy or "no"
+        state.updated_at = state.inspected_at = started
+        await self._notify_transition(state, was_running, was_missing)
+        return state
+
+    def start(self) -> None:
+        """Start the periodic list snapshot."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._snapshot_loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic list snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh(max_age=0)
+            except DockerEngineError as e:
+                logger.debug("Container state snapshot failed: %s", e)
+            await asyncio.sleep(self.SNAPSHOT_INTERVAL_SECONDS)
+
+    def clear(self) -> None:
+        """Forget every container and snapshot (e.g. after switching endpoints)."""
+        self._states.clear()
+        self._snapshot_at = None
+
+    def reset(self) -> None:
+        """Drop all state, subscribers and the live flag (tests)."""
+        self.clear()
+        self._subscribers.clear()
+        self._live_since = None
+
+
+# Singleton instance
+container_states = ContainerStateStore()
@@ -0,0 +1,201 @@
+"""Streaming bulk export of update history, restart logs and metrics.
+
+Rows are read through a server-side cursor (``AsyncSession.stream`` with
+``yield_per``) as plain column tuples, never ORM objects, and serialized in
+batches by an async generator that feeds a ``StreamingResponse``. Memory
+therefore stays at one batch regardless of how much history is exported.
+
+Metrics are exported from ``metrics_history`` and, when chunk storage is or
+was in use, from ``metrics_chunks`` (one decoded chunk at a time) plus the
+samples still buffered in memory.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.history import UpdateHistory
+from app.models.metrics_history import MetricsHistory
+from app.models.restart_log import ContainerRestartLog
+from app.services.metrics_chunks import from_epoch_ms, metrics_chunk_store
+
+EXPORT_FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows fetched per cursor round trip and serialized per yielded body chunk
+BATCH_ROWS = 500
+
+METRICS_FIELDS = (
+    "container_id",
+    "collected_at",
+    "cpu_percent",
+    "memory_usage",
+    "memory_limit",
+    "memory_percent",
+    "network_rx",
+    "network_tx",
+    "block_read",
+    "block_write",
+    "pids",
+)
+
+
+def _json_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+async def encode_rows(
+    fields: Sequence[str], rows: AsyncIterator[Sequence[Any]], fmt: str
+) -> AsyncIterator[str]:
+    """Serialize rows as CSV (with header) or NDJSON, one batch per chunk.
+
+    Args:
+        fields: Column names, in row order
+        rows: Row values
+        fmt: "csv" or "ndjson"
+
+    Yields:
+        Body chunks of up to ``BATCH_ROWS`` rows
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(fields)
+
+    pending = 0
+    async for row in rows:
+        if writer is not None:
+            writer.writerow([_csv_value(value) for value in row])
+        else:
+            record = {name: _json_value(value) for name, value in zip(fields, row, strict=True)}
+            buffer.write(json.dumps(record, separators=(",", ":")))
+            buffer.write("\n")
+        pending += 1
+        if pending >= BATCH_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def _stream_table(
+    db: AsyncSession,
+    columns: Sequence[Column],
+    time_column: Column,
+    container_column: Column,
+    container_id: int | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> AsyncIterator[Sequence[Any]]:
+    query = select(*columns)
+    if container_id is not None:
+        query = query.where(container_column == container_id)
+    if start is not None:
+        query = query.where(time_column >= start)
+    if end is not None:
+        query = query.where(time_column <= end)
+    query = query.order_by(time_column, columns[0]).execution_options(yield_per=BATCH_ROWS)
+
+    result = await db.stream(query)
+    async for row in result:
+        yield tuple(row)
+
+
+def history_fields() -> list[str]:
+    """Exported update history columns."""
+    return [column.name for column in UpdateHistory.__table__.columns]
+
+
+def history_rows(
+    db: AsyncSession,
+    container_id: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> AsyncIterator[Sequence[Any]]:
+    """Update history rows by ``started_at``, oldest first."""
+    table = UpdateHistory.__table__
+    return _stream_table(
+        db,
+        list(table.columns),
+        table.c.started_at,
+        table.c.container_id,
+        container_id,
+        start,
+        end,
+    )
+
+
+def restart_fields() -> list[str]:
+    """Exported restart log columns."""
+    return [column.name for column in ContainerRestartLog.__table__.columns]
+
+
+def restart_rows(
+    db: AsyncSession,
+    container_id: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> AsyncIterator[Sequence[Any]]:
+    """Restart log rows by ``executed_at``, oldest first."""
+    table = ContainerRestartLog.__table__
+    return _stream_table(
+        db,
+        list(table.columns),
+        table.c.executed_at,
+        table.c.container_id,
+        container_id,
+        start,
+        end,
+    )
+
+
+async def metrics_rows(
+    db: AsyncSession,
+    container_id: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> AsyncIterator[Sequence[Any]]:
+    """Raw metrics samples in ``METRICS_FIELDS`` order.
+
+    ``metrics_history`` rows come first (by ``collected_at``), followed by
+    chunk-stored samples chunk by chunk.
+    """
+    table = MetricsHistory.__table__
+    async for row in _stream_table(
+        db,
+        [table.c[name] for name in METRICS_FIELDS],
+        table.c.collected_at,
+        table.c.container_id,
+        container_id,
+        start,
+        end,
+    ):
+        yield row
+
+    # Chunks hold millisecond timestamps and take a half-open window
+    chunk_end = end + timedelta(milliseconds=1) if end is not None else None
+    async for cid, columns in metrics_chunk_store.stream(db, start, chunk_end, container_id):
+        for i, collected_ms in enumerate(columns["collected_at"]):
+            yield (
+                cid,
+                from_epoch_ms(collected_ms),
+                *(columns[name][i] for name in METRICS_FIELDS[2:]),
+            )
@@ -55,27 +55,7 @@ class DependencyManager:
         if not container_names:
             return []
 
-        # Get all containers with their dependencies
-        result = await db.execute(select(Container).where(Container.name.in_(container_names)))
-        containers = {c.name: c for c in result.scalars().all()}
-
-        # Build dependency graph
-        dependencies: dict[str, set[str]] = {}
-
-        for name in container_names:
-            container = containers.get(name)
-            if not container:
-                logger.warning(f"Container {sanitize_log_message(str(name))} not found in database")
-                dependencies[name] = set()
-                continue
-
-            # Parse dependencies (JSON column — already deserialized)
-            deps = set()
-            deps_list = container.dependencies
-            if deps_list and isinstance(deps_list, list):
-                deps = {d for d in deps_list if d in container_names}
-
-            dependencies[name] = deps
+        dependencies = await DependencyManager._build_dependency_graph(db, container_names)
 
         # Check cache first
         cache_key = DependencyManager._generate_cache_key(dependencies)
@@ -109,6 +89,71 @@ class DependencyManager:
             logger.warning("Falling back to original order due to cycle")
             return container_names
 
+    @staticmethod
+    async def get_update_levels(db: AsyncSession, container_names: list[str]) -> list[list[str]]:
+        """Group containers into dependency levels that can be updated in waves.
+
+        Every container in a level depends only on containers in earlier
+        levels, so the members of one level are independent of each other
+        and may be updated concurrently once the previous level is done.
+
+        Args:
+            db: Database session
+            container_names: List of container names to group
+
+        Returns:
+            List of levels, each a sorted list of container names. If the
+            graph has a cycle, every container gets its own level in the
+            original order so updates fall back to running one at a time.
+        """
+        if not container_names:
+            return []
+
+        dependencies = await DependencyManager._build_dependency_graph(db, container_names)
+
+        try:
+            return DependencyManager._topological_levels(dependencies)
+        except ValueError as e:
+            logger.error(f"Dependency error: {sanitize_log_message(str(e))}")
+            logger.warning("Falling back to sequential levels due to cycle")
+            return [[name] for name in container_names]
+
+    @staticmethod
+    async def _build_dependency_graph(
+        db: AsyncSession, container_names: list[str]
+    ) -> dict[str, set[str]]:
+        """Build the dependency graph restricted to the given containers.
+
+        Args:
+            db: Database session
+            container_names: Container names to include
+
+        Returns:
+            Dict mapping each container name to the names it depends on
+        """
+        # Get all containers with their dependencies
+        result = await db.execute(select(Container).where(Container.name.in_(container_names)))
+        containers = {c.name: c for c in result.scalars().all()}
+
+        dependencies: dict[str, set[str]] = {}
+
+        for name in container_names:
+            container = containers.get(name)
+            if not container:
+                logger.warning(f"Container {sanitize_log_message(str(name))} not found in database")
+                dependencies[name] = set()
+                continue
+
+            # Parse dependencies (JSON column — already deserialized)
+            deps = set()
+            deps_list = container.dependencies
+            if deps_list and isinstance(deps_list, list):
+                deps = {d for d in deps_list if d in container_names}
+
+            dependencies[name] = deps
+
+        return dependencies
+
     @staticmethod
     def _topological_sort(dependencies: dict[str, set[str]]) -> list[str]:
         """Perform topological sort on dependency graph.
@@ -155,6 +200,37 @@ class DependencyManager:
 
         return result
 
+    @staticmethod
+    def _topological_levels(dependencies: dict[str, set[str]]) -> list[list[str]]:
+        """Split a dependency graph into levels (Kahn's algorithm, level by level).
+
+        Args:
+            dependencies: Dict mapping container names to their dependencies
+
+        Returns:
+            List of levels; each level holds the nodes whose dependencies are
+            all in earlier levels, sorted for deterministic ordering
+
+        Raises:
+            ValueError: If circular dependencies are detected
+        """
+        remaining = {name: set(deps) for name, deps in dependencies.items()}
+        levels: list[list[str]] = []
+
+        while remaining:
+            level = sorted(name for name, deps in remaining.items() if not deps)
+            if not level:
+                raise ValueError(
+                    f"Circular dependency detected involving: {', '.join(sorted(remaining))}"
+                )
+            levels.append(level)
+            for name in level:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(level)
+
+        return levels
+
     @staticmethod
     async def auto_detect_dependencies(db: AsyncSession, container_name: str) -> list[str]:
         """Auto-detect container dependencies from Docker compose links/depends_on.
@@ -10,6 +10,7 @@ import logging
 import os
 
 import docker
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +58,31 @@ def make_docker_client(base_url: str, timeout: int = 30) -> docker.DockerClient:
     return docker.DockerClient(base_url=base_url, timeout=timeout)
 
 
+def make_engine_http_client(
+    base_url: str, timeout: float = 10.0, limits: httpx.Limits | None = None
+) -> httpx.AsyncClient:
+    """Create an async HTTP client for the Docker Engine API.
+
+    ``unix://`` endpoints are reached over the socket, ``tcp://`` endpoints
+    (socket proxies) over plain HTTP. Reads have no timeout so streaming
+    endpoints (``/containers/{id}/stats?stream=true``) stay open; pass an
+    explicit ``timeout=`` for one-shot requests. ``limits`` overrides
+    httpx's default pool of 100 connections — every open stream holds one.
+    """
+    url = _normalize_url(base_url)
+    client_timeout = httpx.Timeout(timeout, read=None)
+    pool_limits = limits or httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    if url.startswith("unix://"):
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=url[len("unix://") :], limits=pool_limits),
+            base_url="http://docker",
+            timeout=client_timeout,
+        )
+    return httpx.AsyncClient(
+        base_url=f"http://{url[len('tcp://') :]}", timeout=client_timeout, limits=pool_limits
+    )
+
+
 def docker_subprocess_env(base_url: str | None = None) -> dict[str, str]:
     """Build a subprocess environment dict with ``DOCKER_HOST`` set.
 
@@ -0,0 +1,330 @@
+"""Shared async client for the Docker Engine API.
+
+docker-py is synchronous: every ``containers.get``, ``reload``, ``logs`` or
+``exec_run`` made from async code blocks the event loop until the daemon
+answers, so one slow response stalls every SSE stream and API request. This
+client talks to the Engine API over ``httpx`` instead (unix socket or TCP
+socket proxy, resolved through ``docker_access``), keeps one pooled
+connection set per endpoint, and applies a timeout to every call, so Docker
+latency only delays the caller that is waiting for it.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import struct
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from app.services.docker_access import make_engine_http_client, resolve_docker_url
+
+logger = logging.getLogger(__name__)
+
+# Multiplexed stdout/stderr frame header: stream type, 3 padding bytes, size
+_FRAME_HEADER = struct.Struct(">BxxxI")
+
+
+class DockerEngineError(Exception):
+    """Raised when the Docker Engine API is unreachable or rejects a call."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class DockerNotFoundError(DockerEngineError):
+    """Raised when the requested container or exec instance does not exist."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExecResult:
+    """Outcome of ``exec_run``: exit code (None if unknown) and combined output."""
+
+    exit_code: int | None
+    output: bytes
+
+
+def demux_stream(data: bytes) -> bytes:
+    """Join stdout/stderr frames of a multiplexed stream.
+
+    Containers without a TTY send 8-byte framed output; TTY output is raw and
+    returned unchanged (detected by the first header not parsing as a frame).
+    """
+    if len(data) < _FRAME_HEADER.size or data[0] not in (0, 1, 2) or data[1:4] != b"\0\0\0":
+        return data
+    chunks = []
+    offset = 0
+    while offset + _FRAME_HEADER.size <= len(data):
+        stream_type, size = _FRAME_HEADER.unpack_from(data, offset)
+        if stream_type not in (0, 1, 2):
+            return data
+        offset += _FRAME_HEADER.size
+        chunks.append(data[offset : offset + size])
+        offset += size
+    return b"".join(chunks)
+
+
+def _container_path(name: str) -> str:
+    return f"/containers/{quote(name, safe='')}"
+
+
+class DockerEngineClient:
+    """Async Engine API client shared by services and routes.
+
+    One-shot calls and long-lived streams (``docker_engine_stats``) use
+    separate pools on the same endpoint: every open stream holds a
+    connection, so streams get an uncapped pool and can never starve
+    one-shot calls. Both are replaced together when the endpoint changes.
+    """
+
+    REQUEST_TIMEOUT = 10.0
+    EXEC_TIMEOUT = 30.0
+    STREAM_LIMITS = httpx.Limits(max_connections=None, max_keepalive_connections=20)
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._stream_client: httpx.AsyncClient | None = None
+        self._base_url: str | None = None
+        self._lock = asyncio.Lock()
+
+    async def _http(
+        self, db: Any = None, base_url: str | None = None, streaming: bool = False
+    ) -> httpx.AsyncClient:
+        """Return the pooled client for the active endpoint, reconnecting on change.
+
+        Args:
+            db: Optional session used to resolve the Docker endpoint
+            base_url: Explicit endpoint, skipping resolution
+            streaming: Return the uncapped pool meant for long-lived streams
+        """
+        base_url = base_url or await resolve_docker_url(db)
+        client = self._stream_client if streaming else self._client
+        if client is not None and not client.is_closed and base_url == self._base_url:
+            return client
+        async with self._lock:
+            if base_url != self._base_url:
+                stale = [c for c in (self._client, self._stream_client) if c is not None]
+                self._client = self._stream_client = None
+                self._base_url = base_url
+                for old in stale:
+                    with contextlib.suppress(Exception):
+                        await old.aclose()
+            if streaming:
+                if self._stream_client is None or self._stream_client.is_closed:
+                    self._stream_client = make_engine_http_client(
+                        base_url, timeout=self.REQUEST_TIMEOUT, limits=self.STREAM_LIMITS
+                    )
+                return self._stream_client
+            if self._client is None or self._client.is_closed:
+                self._client = make_engine_http_client(base_url, timeout=self.REQUEST_TIMEOUT)
+            return self._client
+
+    async def stream_client(self, db: Any = None, base_url: str | None = None) -> httpx.AsyncClient:
+        """Client for long-lived streaming requests on the active endpoint.
+
+        The returned client is closed (ending its streams) when the endpoint
+        changes; callers compare it against the one their streams use.
+        """
+        return await self._http(db, base_url, streaming=True)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        db: Any = None,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Issue one Engine API call.
+
+        Args:
+            method: HTTP method
+            path: API path (e.g. ``/containers/json``)
+            db: Optional session used to resolve the Docker endpoint
+            base_url: Explicit endpoint, skipping resolution
+            timeout: Per-call timeout in seconds (default ``REQUEST_TIMEOUT``)
+            **kwargs: Passed to ``httpx.AsyncClient.request`` (params, json)
+
+        Raises:
+            DockerNotFoundError: On HTTP 404
+            DockerEngineError: On other error statuses or transport failures
+        """
+        client = await self._http(db, base_url)
+        try:
+            response = await client.request(
+                method, path, timeout=timeout or self.REQUEST_TIMEOUT, **kwargs
+            )
+        except (httpx.HTTPError, OSError) as e:
+            raise DockerEngineError(f"Docker Engine API unreachable: {e}") from e
+        if response.status_code == 404:
+            raise DockerNotFoundError(_error_message(response), status_code=404)
+        if response.status_code >= 400:
+            raise DockerEngineError(_error_message(response), status_code=response.status_code)
+        return response
+
+    async def version(self, db: Any = None) -> dict[str, Any]:
+        """``GET /version``."""
+        return (await self.request("GET", "/version", db=db)).json()
+
+    async def info(self, db: Any = None) -> dict[str, Any]:
+        """``GET /info``."""
+        return (await self.request("GET", "/info", db=db)).json()
+
+    async def list_containers(
+        self,
+        db: Any = None,
+        all: bool = True,
+        timeout: float | None = None,
+        base_url: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """``GET /containers/json`` (one call, no per-container inspect)."""
+        response = await self.request(
+            "GET",
+            "/containers/json",
+            db=db,
+            base_url=base_url,
+            timeout=timeout,
+            params={"all": "1" if all else "0"},
+        )
+        return response.json()
+
+    async def inspect_container(self, name: str, db: Any = None) -> dict[str, Any]:
+        """``GET /containers/{name}/json``.
+
+        Raises:
+            DockerNotFoundError: If the container does not exist
+        """
+        return (await self.request("GET", f"{_container_path(name)}/json", db=db)).json()
+
+    async def container_logs(
+        self,
+        name: str,
+        tail: int | str = "all",
+        timestamps: bool = False,
+        db: Any = None,
+    ) -> bytes:
+        """Combined stdout/stderr logs of a container.
+
+        Raises:
+            DockerNotFoundError: If the container does not exist
+        """
+        response = await self.request(
+            "GET",
+            f"{_container_path(name)}/logs",
+            db=db,
+            params={
+                "stdout": "1",
+                "stderr": "1",
+                "tail": str(tail),
+                "timestamps": "1" if timestamps else "0",
+            },
+        )
+        return demux_stream(response.content)
+
+    async def exec_run(
+        self,
+        name: str,
+        cmd: list[str],
+        db: Any = None,
+        timeout: float | None = None,
+    ) -> ExecResult:
+        """Run a command in a running container and collect its output.
+
+        Raises:
+            DockerNotFoundError: If the container does not exist
+            DockerEngineError: If the exec cannot be created or started
+        """
+        created = await self.request(
+            "POST",
+            f"{_container_path(name)}/exec",
+            db=db,
+            json={"AttachStdout": True, "AttachStderr": True, "Tty": False, "Cmd": cmd},
+        )
+        exec_id = created.json()["Id"]
+        started = await self.request(
+            "POST",
+            f"/exec/{exec_id}/start",
+            db=db,
+            timeout=timeout or self.EXEC_TIMEOUT,
+            json={"Detach": False, "Tty": False},
+        )
+        output = demux_stream(started.content)
+        inspected = (await self.request("GET", f"/exec/{exec_id}/json", db=db)).json()
+        return ExecResult(exit_code=inspected.get("ExitCode"), output=output)
+
+    async def events(
+        self,
+        filters: dict[str, list[str]],
+        since: int | None = None,
+        db: Any = None,
+        on_open: Callable[[], None] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Follow ``GET /events``, yielding each decoded event.
+
+        The stream has no read timeout; it ends only when the daemon or the
+        proxy closes it.
+
+        Args:
+            filters: Engine API event filters (e.g. ``{"type": ["container"]}``)
+            since: Replay events from this Unix timestamp
+            db: Optional session used to resolve the Docker endpoint
+            on_open: Called once the daemon has accepted the subscription
+
+        Raises:
+            DockerEngineError: If the stream cannot be opened or is interrupted
+        """
+        client = await self._http(db)
+        params = {"filters": json.dumps(filters)}
+        if since is not None:
+            params["since"] = str(since)
+        try:
+            async with client.stream(
+                "GET",
+                "/events",
+                params=params,
+                timeout=httpx.Timeout(self.REQUEST_TIMEOUT, read=None),
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    raise DockerEngineError(
+                        _error_message(response), status_code=response.status_code
+                    )
+                if on_open is not None:
+                    on_open()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        logger.debug("Skipping undecodable Docker event: %.200s", line)
+        except (httpx.HTTPError, OSError) as e:
+            raise DockerEngineError(f"Docker event stream interrupted: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close pooled connections, ending any open streams."""
+        for client in (self._client, self._stream_client):
+            if client is not None:
+                with contextlib.suppress(Exception):
+                    await client.aclose()
+        self._client = None
+        self._stream_client = None
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        message = response.json().get("message")
+    except ValueError, AttributeError:
+        message = None
+    return message or f"Docker Engine API returned HTTP {response.status_code}"
+
+
+# Singleton instance
+docker_engine = DockerEngineClient()
@@ -0,0 +1,244 @@
+"""Container metrics from the Docker Engine API stats stream.
+
+``DockerStatsService`` shells out to ``docker ps`` / ``docker stats
+--no-stream`` and parses the CLI's human-formatted sizes back into bytes; one
+vanished container aborts the whole batch. This collector talks to the Engine
+API directly through the shared ``docker_engine`` client's streaming pool and
+keeps one ``GET /containers/{name}/stats?stream=true`` connection open per
+running container. The engine pushes a raw sample about once a second; the
+latest one per container is kept in memory and converted to the same metrics
+dict ``DockerStatsService`` produces, computing CPU% and memory from the raw
+counters the way the docker CLI does.
+
+A collection cycle is then a dict read: no process spawns, and a container
+that stops only ends its own stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.services.docker_engine import DockerEngineClient, DockerEngineError, docker_engine
+
+logger = logging.getLogger(__name__)
+
+
+def _cpu_total(cpu_stats: dict[str, Any]) -> int:
+    return int((cpu_stats.get("cpu_usage") or {}).get("total_usage") or 0)
+
+
+def engine_stats_to_metrics(
+    raw: dict[str, Any], previous: dict[str, Any] | None = None
+) -> dict[str, Any] | None:
+    """Convert one Engine API stats sample to a metrics dict.
+
+    Args:
+        raw: Sample from ``/containers/{name}/stats``
+        previous: Preceding sample of the same stream, used for the CPU delta
+            when the engine sent no ``precpu_stats`` (first streamed frame)
+
+    Returns:
+        Dict with the ``DockerStatsService`` stats keys, or None when there is
+        no earlier CPU reading to compute a percentage against yet
+    """
+    cpu_stats = raw.get("cpu_stats") or {}
+    precpu_stats = raw.get("precpu_stats") or {}
+    if not precpu_stats.get("system_cpu_usage") and previous is not None:
+        precpu_stats = previous.get("cpu_stats") or {}
+    if not precpu_stats.get("system_cpu_usage"):
+        return None
+
+    cpu_delta = _cpu_total(cpu_stats) - _cpu_total(precpu_stats)
+    system_delta = int(cpu_stats.get("system_cpu_usage") or 0) - int(
+        precpu_stats["system_cpu_usage"]
+    )
+    online_cpus = (
+        cpu_stats.get("online_cpus")
+        or len((cpu_stats.get("cpu_usage") or {}).get("percpu_usage") or [])
+        or 1
+    )
+    cpu_percent = 0.0
+    if system_delta > 0 and cpu_delta > 0:
+        cpu_percent = cpu_delta / system_delta * online_cpus * 100.0
+
+    # Same accounting as `docker stats`: page cache that can be reclaimed is
+    # not counted (cgroup v1 total_inactive_file, cgroup v2 inactive_file).
+    memory_stats = raw.get("memory_stats") or {}
+    usage = int(memory_stats.get("usage") or 0)
+    detail = memory_stats.get("stats") or {}
+    inactive = int(detail.get("total_inactive_file", detail.get("inactive_file", 0)) or 0)
+    memory_usage = usage - inactive if inactive < usage else usage
+    memory_limit = int(memory_stats.get("limit") or 0)
+
+    network_rx = network_tx = 0
+    for interface in (raw.get("networks") or {}).values():
+        network_rx += int(interface.get("rx_bytes") or 0)
+        network_tx += int(interface.get("tx_bytes") or 0)
+
+    block_read = block_write = 0
+    for entry in (raw.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []:
+        op = str(entry.get("op", "")).lower()
+        if op == "read":
+            block_read += int(entry.get("value") or 0)
+        elif op == "write":
+            block_write += int(entry.get("value") or 0)
+
+    return {
+        "cpu_percent": round(cpu_percent, 2),
+        "memory_usage": memory_usage,
+        "memory_percent": round(memory_usage / memory_limit * 100.0, 2) if memory_limit else 0.0,
+        "memory_limit": memory_limit,
+        "network_rx": network_rx,
+        "network_tx": network_tx,
+        "block_read": block_read,
+        "block_write": block_write,
+        "pids": int((raw.get("pids_stats") or {}).get("current") or 0),
+    }
+
+
+@dataclass
+class _StatsStream:
+    """Latest sample of one container's stats stream."""
+
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    latest: dict[str, Any] | None = None
+    updated_at: float = 0.0
+    task: asyncio.Task | None = None  # type: ignore[type-arg]
+
+
+class DockerEngineStats:
+    """Persistent Engine API stats streams, one per running container."""
+
+    # The engine's first frame has no CPU baseline; the second arrives ~1s later.
+    FIRST_SAMPLE_TIMEOUT = 5.0
+    # Samples older than this (stream stalled or ended) are not reported.
+    STALE_AFTER = 30.0
+    REQUEST_TIMEOUT = 10.0
+
+    def __init__(self, engine: DockerEngineClient = docker_engine) -> None:
+        self._engine = engine
+        self._client: httpx.AsyncClient | None = None
+        self._streams: dict[str, _StatsStream] = {}
+
+    async def list_running(self, base_url: str) -> set[str] | None:
+        """Return the names of running containers, or None if the API is unreachable."""
+        try:
+            containers = await self._engine.list_containers(
+                all=False, timeout=self.REQUEST_TIMEOUT, base_url=base_url
+            )
+        except (DockerEngineError, ValueError) as e:
+            logger.warning("Docker Engine API container list failed: %s", e)
+            return None
+        return {
+            name.lstrip("/")
+            for container in containers
+            for name in container.get("Names") or []
+            if "/" not in name.lstrip("/")
+        }
+
+    async def sample(self, base_url: str, names: list[str]) -> dict[str, dict[str, Any]]:
+        """Return the latest metrics for each named container.
+
+        Opens streams for containers that have none, closes streams for
+        containers no longer requested, and waits briefly for the first
+        sample of new streams.
+
+        Args:
+            base_url: Docker endpoint (``unix://`` or ``tcp://``)
+            names: Running container names to report
+
+        Returns:
+            Dict mapping container name → metrics dict. Containers without a
+            fresh sample are omitted.
+        """
+        client = await self._engine.stream_client(base_url=base_url)
+        if client is not self._client:
+            # First use, or the endpoint changed and the old pool was closed
+            self._stop_all()
+            self._client = client
+        wanted = set(names)
+        for name in set(self._streams) - wanted:
+            self._stop(name)
+        for name in wanted:
+            stream = self._streams.get(name)
+            if stream is None or stream.task is None or stream.task.done():
+                stream = _StatsStream()
+                stream.task = asyncio.create_task(self._follow(client, name, stream))
+                self._streams[name] = stream
+
+        waiting = [
+            stream.ready.wait() for stream in self._streams.values() if not stream.ready.is_set()
+        ]
+        if waiting:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(asyncio.gather(*waiting), timeout=self.FIRST_SAMPLE_TIMEOUT)
+
+        now = time.monotonic()
+        return {
+            name: dict(stream.latest)
+            for name, stream in self._streams.items()
+            if name in wanted
+            and stream.latest is not None
+            and now - stream.updated_at < self.STALE_AFTER
+        }
+
+    async def _follow(self, client: httpx.AsyncClient, name: str, stream: _StatsStream) -> None:
+        """Read one container's stats stream until it ends or is cancelled."""
+        previous: dict[str, Any] | None = None
+        try:
+            async with client.stream(
+                "GET", f"/containers/{name}/stats", params={"stream": "true"}
+            ) as response:
+                if response.status_code != 200:
+                    logger.debug("Stats stream for %s refused: HTTP %s", name, response.status_code)
+                    return
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    try:
+                        raw = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    metrics = engine_stats_to_metrics(raw, previous)
+                    previous = raw
+                    if metrics is None:
+                        continue
+                    stream.latest = metrics
+                    stream.updated_at = time.monotonic()
+                    stream.ready.set()
+        except (httpx.HTTPError, OSError) as e:
+            logger.debug("Stats stream for %s ended: %s", name, e)
+        finally:
+            # Wake a sample() waiting on a stream that ended without data
+            stream.ready.set()
+
+    def _stop(self, name: str) -> None:
+        stream = self._streams.pop(name, None)
+        if stream is not None and stream.task is not None:
+            stream.task.cancel()
+
+    def _stop_all(self) -> list[asyncio.Task]:  # type: ignore[type-arg]
+        tasks = [stream.task for stream in self._streams.values() if stream.task is not None]
+        self._streams.clear()
+        for task in tasks:
+            task.cancel()
+        return tasks
+
+    async def aclose(self) -> None:
+        """Close every stream; the pool itself belongs to ``docker_engine``."""
+        for task in self._stop_all():
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        self._client = None
+
+
+# Singleton instance
+docker_engine_stats = DockerEngineStats()
@@ -0,0 +1,85 @@
+"""Long-lived consumer of the Docker Engine ``/events`` stream.
+
+``DockerEventWatcher`` follows container lifecycle events and folds each one
+into ``container_states``, whose subscribers react to them (the restart
+scheduler handles ``die``/``destroy`` this way instead of waiting for its
+next poll). While the stream is open the store is marked live; when it
+drops, the watcher reconnects with backoff and resumes from the last event
+time so nothing is missed.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+
+from app.services.container_state import container_states
+from app.services.docker_engine import DockerEngineError, docker_engine
+
+logger = logging.getLogger(__name__)
+
+WATCHED_ACTIONS = ("create", "start", "die", "oom", "health_status", "destroy")
+
+
+class DockerEventWatcher:
+    """Follow container events and feed them to the container state store."""
+
+    RECONNECT_MIN_SECONDS = 1.0
+    RECONNECT_MAX_SECONDS = 30.0
+
+    def __init__(self) -> None:
+        self._task: asyncio.Task | None = None  # type: ignore[type-arg]
+        self._since: int | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the event stream is currently open."""
+        return container_states.live
+
+    def start(self) -> None:
+        """Start following the event stream."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop following the event stream."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        container_states.set_live(False)
+
+    def _on_open(self) -> None:
+        logger.info("Following Docker container events")
+        container_states.set_live(True)
+
+    async def _run(self) -> None:
+        delay = self.RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                # Resume slightly before the last event so a reconnect cannot
+                # skip events that shared its second; replays are idempotent.
+                since = self._since - 1 if self._since is not None else int(time.time())
+                async for event in docker_engine.events(
+                    {"type": ["container"], "event": list(WATCHED_ACTIONS)},
+                    since=since,
+                    on_open=self._on_open,
+                ):
+                    delay = self.RECONNECT_MIN_SECONDS
+                    self._since = event.get("time") or self._since
+                    await container_states.apply_event(event)
+                # The stream ended cleanly (daemon or proxy restart)
+                container_states.set_live(False)
+            except DockerEngineError as e:
+                if self.connected:
+                    logger.warning("Docker event stream lost: %s", e)
+                else:
+                    logger.debug("Docker event stream unavailable: %s", e)
+                container_states.set_live(False)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_SECONDS)
+
+
+# Singleton instance
+docker_event_watcher = DockerEventWatcher()
@@ -0,0 +1,166 @@
+"""In-memory index of the Docker runtime, built from one container listing.
+
+Resolving compose rows against the runtime used to issue one or two
+label-filtered ``containers.list`` calls per row, synchronously on the event
+loop. ``DockerRuntimeSnapshot`` instead lists every container once (the raw
+``/containers/json?all=1`` call through the shared async Engine API client,
+without docker-py's per-container inspect) and indexes the result by compose
+project and service labels so each row resolves with dictionary lookups. Snapshots are reused
+for ``TTL_SECONDS`` by any caller that can tolerate that staleness.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.services.docker_access import resolve_docker_url
+from app.services.docker_engine import docker_engine
+
+logger = logging.getLogger(__name__)
+
+PROJECT_LABEL = "com.docker.compose.project"
+SERVICE_LABEL = "com.docker.compose.service"
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeContainer:
+    """One runtime container as reported by the container listing."""
+
+    id: str
+    name: str
+    image: str = ""
+    state: str = ""
+    status: str = ""
+    labels: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def project(self) -> str | None:
+        """Compose project label, if any."""
+        return self.labels.get(PROJECT_LABEL)
+
+    @property
+    def service(self) -> str | None:
+        """Compose service label, if any."""
+        return self.labels.get(SERVICE_LABEL)
+
+    @classmethod
+    def from_listing(cls, entry: dict[str, Any]) -> RuntimeContainer:
+        """Build from one ``/containers/json`` entry."""
+        names = entry.get("Names") or []
+        return cls(
+            id=entry.get("Id", ""),
+            name=(names[0] if names else "").lstrip("/"),
+            image=entry.get("Image", ""),
+            state=entry.get("State", ""),
+            status=entry.get("Status", ""),
+            labels=dict(entry.get("Labels") or {}),
+        )
+
+
+class RuntimeIndex:
+    """Runtime containers indexed by compose labels and name."""
+
+    def __init__(self, containers: list[RuntimeContainer], taken_at: float | None = None) -> None:
+        self.containers = containers
+        self.taken_at = time.monotonic() if taken_at is None else taken_at
+        self._by_service: dict[str, list[RuntimeContainer]] = defaultdict(list)
+        self._by_project_service: dict[tuple[str, str], list[RuntimeContainer]] = defaultdict(list)
+        self._by_name: dict[str, RuntimeContainer] = {}
+        for container in containers:
+            self._by_name[container.name] = container
+            service = container.service
+            if service is None:
+                continue
+            self._by_service[service].append(container)
+            project = container.project
+            if project is not None:
+                self._by_project_service[(project, service)].append(container)
+
+    def by_service(self, service: str) -> list[RuntimeContainer]:
+        """Containers labelled with ``service`` in any project (listing order)."""
+        return list(self._by_service.get(service, ()))
+
+    def by_project_service(self, project: str, service: str) -> list[RuntimeContainer]:
+        """Containers labelled with both ``project`` and ``service``."""
+        return list(self._by_project_service.get((project, service), ()))
+
+    def by_name(self, name: str) -> RuntimeContainer | None:
+        """Container with this Docker name (without leading slash)."""
+        return self._by_name.get(name.lstrip("/"))
+
+
+async def list_runtime_containers(db: Any = None) -> list[RuntimeContainer]:
+    """List every container with one Engine API call.
+
+    Raises:
+        DockerEngineError: If the Docker daemon is unreachable
+    """
+    listing = await docker_engine.list_containers(db=db)
+    return [RuntimeContainer.from_listing(entry) for entry in listing]
+
+
+class DockerRuntimeSnapshot:
+    """Shared, briefly cached ``RuntimeIndex`` of the configured Docker host."""
+
+    TTL_SECONDS = 5.0
+
+    def __init__(self) -> None:
+        self._index: RuntimeIndex | None = None
+        self._docker_url: str | None = None
+        self._lock = asyncio.Lock()
+
+    def _fresh(self, docker_url: str, max_age: float) -> RuntimeIndex | None:
+        index = self._index
+        if (
+            index is not None
+            and self._docker_url == docker_url
+            and time.monotonic() - index.taken_at < max_age
+        ):
+            return index
+        return None
+
+    async def get(self, db: Any = None, max_age: float | None = None) -> RuntimeIndex:
+        """Return a snapshot no older than ``max_age`` seconds.
+
+        Concurrent callers share one listing.
+
+        Args:
+            db: Optional session used to resolve the Docker endpoint
+            max_age: Maximum snapshot age (default ``TTL_SECONDS``; 0 forces
+                a new listing)
+
+        Raises:
+            DockerEngineError: If the Docker daemon is unreachable
+        """
+        max_age = self.TTL_SECONDS if max_age is None else max_age
+        docker_url = await resolve_docker_url(db)
+        index = self._fresh(docker_url, max_age)
+        if index is not None:
+            return index
+
+        async with self._lock:
+            index = self._fresh(docker_url, max_age)
+            if index is not None:
+                return index
+            started = time.monotonic()
+            containers = await list_runtime_containers(db)
+            index = RuntimeIndex(containers, taken_at=started)
+            self._index = index
+            self._docker_url = docker_url
+            logger.debug(
+                "Docker runtime snapshot: %d containers in %.3fs",
+                len(containers),
+                time.monotonic() - started,
+            )
+            return index
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot (e.g. after recreating containers)."""
+        self._index = None
+
+
+# Singleton instance
+runtime_snapshot = DockerRuntimeSnapshot()
@@ -4,12 +4,13 @@ import asyncio
 import json
 import logging
 
+from app.services.container_state import container_states
 from app.services.docker_access import docker_subprocess_env, resolve_docker_url_sync
+from app.services.docker_engine import DockerEngineError
 
 logger = logging.getLogger(__name__)
 
-# Resolved once at import; reconnect() on ContainerMonitorService
-# covers proxy restarts. For a full runtime-change story, see
+# Resolved once at import. For a full runtime-change story, see
 # docker_access.py docstring.
 _DOCKER_ENV = docker_subprocess_env(resolve_docker_url_sync())
 
@@ -423,6 +424,9 @@ class DockerStatsService:
     async def check_container_running(container_name: str) -> bool:
         """Check if a container is currently running.
 
+        Answered from the live container state store, so repeated checks
+        (dashboard refreshes, metrics sweeps) cost no daemon calls.
+
         Args:
             container_name: Name of the container
 
@@ -430,31 +434,11 @@ class DockerStatsService:
             True if container is running, False otherwise
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                "docker",
-                "inspect",
-                "--format",
-                "{{.State.Running}}",
-                container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=_DOCKER_ENV,
-            )
-
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5.0)
-
-            if process.returncode != 0:
-                return False
-
-            output = stdout.decode().strip()
-            return output.lower() == "true"
-
-        except (OSError, PermissionError) as e:
-            logger.debug(f"Process execution error checking if {container_name} is running: {e}")
-            return False
-        except (UnicodeDecodeError, ValueError, AttributeError) as e:
-            logger.debug(f"Failed to parse container status for {container_name}: {e}")
+            state = await container_states.get(container_name)
+        except DockerEngineError as e:
+            logger.debug(f"Docker error checking if {container_name} is running: {e}")
             return False
+        return state is not None and state.running
 
     @staticmethod
     async def get_container_exit_info(container_name: str) -> dict | None:
@@ -467,41 +451,24 @@ class DockerStatsService:
             Dictionary with exit information or None if error
         """
         try:
-            cmd = ["docker", "inspect", "--format", "{{json .State}}", container_name]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=_DOCKER_ENV,
-            )
-
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
-
-            if process.returncode != 0:
-                return None
-
-            state = json.loads(stdout.decode())
-
-            return {
-                "exit_code": state.get("ExitCode"),
-                "oom_killed": state.get("OOMKilled", False),
-                "error": state.get("Error", ""),
-                "finished_at": state.get("FinishedAt"),
-                "restart_count": state.get("RestartCount", 0),
-                "status": state.get("Status"),
-                "running": state.get("Running", False),
-            }
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse exit info JSON for {container_name}: {e}")
-            return None
-        except (OSError, PermissionError) as e:
-            logger.error(f"Process execution error getting exit info for {container_name}: {e}")
+            state = await container_states.get(container_name, detail=True)
+        except DockerEngineError as e:
+            logger.error(f"Docker error getting exit info for {container_name}: {e}")
             return None
-        except (ValueError, KeyError, AttributeError) as e:
-            logger.error(f"Invalid exit info data for {container_name}: {e}")
+
+        if state is None:
             return None
 
+        return {
+            "exit_code": state.exit_code,
+            "oom_killed": state.oom_killed,
+            "error": state.error,
+            "finished_at": state.finished_at,
+            "restart_count": state.restart_count,
+            "status": state.status,
+            "running": state.running,
+        }
+
     @staticmethod
     async def get_restart_policy(container_name: str) -> str:
         """Get the Docker restart policy for a container.
@@ -514,43 +481,21 @@ class DockerStatsService:
             Returns 'manual' (default) if container not found or error
         """
         try:
-            cmd = [
-                "docker",
-                "inspect",
-                "--format",
-                "{{.HostConfig.RestartPolicy.Name}}",
-                container_name,
-            ]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=_DOCKER_ENV,
-            )
-
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5.0)
-
-            if process.returncode != 0:
-                logger.debug(f"Container {container_name} not found in Docker runtime")
-                return "manual"
-
-            policy = stdout.decode().strip()
-
-            # Docker returns empty string for "no" policy, or the policy name
-            if not policy or policy == "no":
-                return "manual"
-
-            return policy
+            policy = await container_states.restart_policy(container_name)
+        except DockerEngineError as e:
+            logger.debug(f"Docker error getting restart policy for {container_name}: {e}")
+            return "manual"
 
-        except (OSError, PermissionError) as e:
-            logger.debug(
-                f"Process execution error getting restart policy for {container_name}: {e}"
-            )
+        if policy is None:
+            logger.debug(f"Container {container_name} not found in Docker runtime")
             return "manual"
-        except (UnicodeDecodeError, ValueError, AttributeError) as e:
-            logger.debug(f"Failed to parse restart policy for {container_name}: {e}")
+
+        # Docker reports "no" (or nothing) when no policy is set
+        if not policy or policy == "no":
             return "manual"
 
+        return policy
+
 
 # Singleton instance
 docker_stats_service = DockerStatsService()
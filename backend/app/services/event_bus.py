@@ -1,60 +1,146 @@
-"""Simple SSE event bus for broadcasting TideWatch runtime events."""
+"""SSE event bus for broadcasting TideWatch runtime events.
+
+Each published event is serialized once and gets a monotonically increasing
+id. Every subscriber has a bounded buffer: when a consumer falls behind, the
+oldest pending events are dropped instead of growing memory without limit,
+and progress events of the same job coalesce so a slow consumer only sees
+the latest one. The last ``REPLAY_WINDOW`` events are retained, so a client
+reconnecting with ``Last-Event-ID`` receives what it missed.
+
+Ids start from the epoch time in milliseconds, which keeps them increasing
+across restarts: a ``Last-Event-ID`` from a previous process is older than
+every retained event and replays the whole window.
+"""
 
 import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+SUBSCRIBER_BUFFER_SIZE = 256
+REPLAY_WINDOW = 512
+
+# Event type -> field identifying the entity whose pending events coalesce
+COALESCE_FIELDS: dict[str, str] = {
+    "check-job-progress": "job_id",
+    "auto-apply-progress": "run_id",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BusEvent:
+    """A published event: id, type and the serialized JSON payload."""
+
+    id: int
+    type: str | None
+    payload: str
+    coalesce_key: Hashable | None = None
+
+
+class Subscription:
+    """One listener's bounded buffer of pending events."""
+
+    def __init__(self, max_pending: int = SUBSCRIBER_BUFFER_SIZE) -> None:
+        self._max_pending = max_pending
+        # Pending events in id order, keyed by coalesce key (or event id)
+        self._pending: OrderedDict[Hashable, BusEvent] = OrderedDict()
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def push(self, event: BusEvent) -> None:
+        """Queue an event, coalescing and evicting as needed (never blocks)."""
+        key = event.coalesce_key if event.coalesce_key is not None else event.id
+        # A newer event replaces the pending one and moves to the tail
+        self._pending.pop(key, None)
+        self._pending[key] = event
+        if len(self._pending) > self._max_pending:
+            self._pending.popitem(last=False)
+            if self.dropped == 0:
+                logger.warning("Event subscriber is falling behind; dropping oldest events")
+            self.dropped += 1
+        self._ready.set()
+
+    def pending(self) -> int:
+        """Number of events waiting to be read."""
+        return len(self._pending)
+
+    async def get_event(self) -> BusEvent:
+        """Wait for and return the next event."""
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        _, event = self._pending.popitem(last=False)
+        return event
+
+    async def get(self) -> str:
+        """Wait for the next event and return its JSON payload."""
+        return (await self.get_event()).payload
+
 
 class EventBus:
     """Lightweight async pub/sub for server-sent events."""
 
-    def __init__(self) -> None:
-        self._listeners: set[asyncio.Queue[str]] = set()
-        self._lock = asyncio.Lock()
+    def __init__(
+        self,
+        buffer_size: int = SUBSCRIBER_BUFFER_SIZE,
+        replay_window: int = REPLAY_WINDOW,
+    ) -> None:
+        self._listeners: set[Subscription] = set()
+        self._buffer_size = buffer_size
+        self._history: deque[BusEvent] = deque(maxlen=replay_window)
+        self._last_id = time.time_ns() // 1_000_000
+
+    @property
+    def last_event_id(self) -> int:
+        """Id of the most recently published event."""
+        return self._last_id
 
-    async def subscribe(self) -> asyncio.Queue[str]:
-        """Register a new listener and return its queue."""
-        queue: asyncio.Queue[str] = asyncio.Queue()
-        async with self._lock:
-            self._listeners.add(queue)
-        return queue
+    async def subscribe(self, last_event_id: int | None = None) -> Subscription:
+        """Register a new listener and return its subscription.
 
-    async def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        Args:
+            last_event_id: Replay retained events published after this id
+        """
+        subscription = Subscription(self._buffer_size)
+        if last_event_id is not None:
+            for event in self._history:
+                if event.id > last_event_id:
+                    subscription.push(event)
+        self._listeners.add(subscription)
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription) -> None:
         """Remove a listener when the stream disconnects."""
-        async with self._lock:
-            self._listeners.discard(queue)
+        self._listeners.discard(subscription)
 
     async def publish(self, event: dict[str, Any]) -> None:
         """Broadcast an event to all listeners."""
-        if not self._listeners:
-            return
-
+        event_type = event.get("type")
         payload = json.dumps(
             {
                 **event,
                 "timestamp": event.get("timestamp") or datetime.now(UTC).isoformat(),
             }
         )
+        coalesce_field = COALESCE_FIELDS.get(event_type) if event_type else None
+        coalesce_key = (event_type, event.get(coalesce_field)) if coalesce_field else None
 
-        async with self._lock:
-            dead_queues = []
-            # Create a copy of listeners to avoid modification during iteration
-            for queue in list(self._listeners):
-                try:
-                    queue.put_nowait(payload)
-                except asyncio.QueueFull:
-                    logger.warning("Event queue full, removing slow consumer")
-                    dead_queues.append(queue)
-
-            # Remove slow consumers
-            for queue in dead_queues:
-                self._listeners.discard(queue)
+        self._last_id += 1
+        published = BusEvent(
+            id=self._last_id, type=event_type, payload=payload, coalesce_key=coalesce_key
+        )
+        self._history.append(published)
+        for subscription in list(self._listeners):
+            subscription.push(published)
 
 
 event_bus = EventBus()
 
-__all__ = ["event_bus", "EventBus"]
+__all__ = ["event_bus", "BusEvent", "EventBus", "Subscription"]
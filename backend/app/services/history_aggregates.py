@@ -0,0 +1,136 @@
+"""Daily aggregates of update history for the analytics dashboard.
+
+``/analytics/summary`` used to load every ``UpdateHistory`` row of the
+period into Python and run five more aggregate queries over
+``datetime(coalesce(...))``, which no index could serve. It now reads one
+``update_history_daily`` row per day.
+
+A day's row is recomputed from ``update_history`` (one indexed, grouped
+query over that day) rather than patched: history entries change after they
+are written (completion time, rollback), and a recompute is always exact.
+A session listener recomputes the days touched by each flushed
+``UpdateHistory`` change on the flush's own connection, so the aggregates
+commit or roll back together with the history write. Writers that change
+history through bulk SQL call ``recompute_days`` before committing.
+"""
+
+from datetime import UTC, date, datetime
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Connection, and_, case, delete, event, func, insert, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.history import UpdateHistory, history_activity_day
+from app.models.history_daily import UpdateHistoryDaily
+
+_TIMESTAMP_ATTRS = ("completed_at", "started_at", "created_at")
+
+# Only container image updates count (legacy rows have a NULL event_type).
+container_update_filter = or_(
+    UpdateHistory.event_type == "update",
+    UpdateHistory.event_type.is_(None),
+)
+
+_cve_count = func.coalesce(func.json_array_length(UpdateHistory.cves_fixed), 0)
+_duration_seconds = (
+    func.julianday(UpdateHistory.completed_at) - func.julianday(UpdateHistory.started_at)
+) * 86400
+_timed_success = and_(
+    UpdateHistory.status == "success",
+    UpdateHistory.completed_at.isnot(None),
+    UpdateHistory.started_at.isnot(None),
+)
+
+
+def _status_count(status: str) -> Any:
+    return func.sum(case((UpdateHistory.status == status, 1), else_=0))
+
+
+def _utc_day(value: datetime) -> str:
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.date().isoformat()
+
+
+def _touched_days(target: UpdateHistory) -> set[str]:
+    """Days a changed history entry counted (or counts) towards.
+
+    Only already-loaded values are read (no lazy loads inside a flush), so
+    the result may over-approximate; recomputing an extra day is harmless.
+    """
+    state = inspect(target)
+    days: set[str] = set()
+    for name in _TIMESTAMP_ATTRS:
+        history = state.attrs[name].history
+        for value in chain(history.added or (), history.unchanged or (), history.deleted or ()):
+            if isinstance(value, datetime):
+                days.add(_utc_day(value))
+    return days
+
+
+def _recompute(connection: Connection, days: set[str]) -> None:
+    """Rebuild the aggregate rows of ``days`` from ``update_history``."""
+    result = connection.execute(
+        select(
+            history_activity_day.label("day"),
+            func.count().label("total_updates"),
+            _status_count("success").label("successful_updates"),
+            _status_count("failed").label("failed_updates"),
+            _status_count("rolled_back").label("rolled_back_updates"),
+            func.sum(_cve_count).label("cves_fixed"),
+            func.sum(case((_cve_count > 0, 1), else_=0)).label("updates_with_cves"),
+            func.sum(case((_timed_success, _duration_seconds), else_=0.0)).label(
+                "duration_seconds_total"
+            ),
+            func.sum(case((_timed_success, 1), else_=0)).label("duration_samples"),
+        )
+        .where(history_activity_day.in_(days), container_update_filter)
+        .group_by(history_activity_day)
+    )
+    rows = [
+        {key: value if value is not None else 0 for key, value in row.items()}
+        for row in result.mappings()
+    ]
+    connection.execute(delete(UpdateHistoryDaily).where(UpdateHistoryDaily.day.in_(days)))
+    if rows:
+        connection.execute(insert(UpdateHistoryDaily), rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _recompute_history_days(session: Session, _flush_context: Any) -> None:
+    days: set[str] = set()
+    for target in chain(session.new, session.dirty, session.deleted):
+        if isinstance(target, UpdateHistory):
+            days |= _touched_days(target)
+            # Entries without timestamps yet get server-side now()
+            days.add(datetime.now(UTC).date().isoformat())
+    if days:
+        _recompute(session.connection(), days)
+
+
+class HistoryAggregates:
+    """Maintains and reads ``update_history_daily``."""
+
+    @staticmethod
+    async def recompute_days(db: AsyncSession, days: set[str]) -> None:
+        """Rebuild the aggregate rows of ``days`` in the current transaction (no commit).
+
+        Only needed after bulk SQL writes to ``update_history``; ORM changes
+        are picked up on flush.
+        """
+        if not days:
+            return
+        connection = await db.connection()
+        await connection.run_sync(_recompute, days)
+
+    @staticmethod
+    async def daily_rows(db: AsyncSession, since: date) -> list[UpdateHistoryDaily]:
+        """Aggregate rows from ``since`` (inclusive), oldest first."""
+        result = await db.execute(
+            select(UpdateHistoryDaily)
+            .where(UpdateHistoryDaily.day >= since.isoformat())
+            .order_by(UpdateHistoryDaily.day)
+        )
+        return list(result.scalars().all())
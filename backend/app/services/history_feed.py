@@ -0,0 +1,259 @@
+"""Unified history feed: updates, restarts and sibling drift in one ordering.
+
+The three sources are merged in SQL with one ``UNION ALL`` of
+``(ts, kind, id)`` keys ordered by ``ts DESC, kind DESC, id DESC``, and pages
+are cut by keyset on that triple instead of fetching a multiple of the page
+size from every table and sorting in Python. Each arm is read in time order
+from an index and the keyset predicate is applied inside each arm, so a page
+costs the same at any depth; only the page's own rows are then loaded by
+primary key.
+
+``ts`` is the raw stored timestamp text: ``ORDER BY`` compares the stored
+text, so cursors compare it too (timestamps written by ``server_default``
+have no fractional seconds, which a round trip through ``datetime`` would
+add).
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import String, and_, literal, or_, select, type_coerce, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.models.history import UpdateHistory
+from app.models.restart_log import ContainerRestartLog
+from app.models.sibling_drift_event import SiblingDriftEvent
+
+KIND_UPDATE = "update"
+KIND_RESTART = "restart"
+KIND_DRIFT = "sibling_drift"
+
+# Dependency events are only listed in per-container history.
+DEPENDENCY_EVENT_TYPES = frozenset(
+    {"dependency_update", "dependency_ignore", "dependency_unignore"}
+)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a history cursor cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class HistoryCursor:
+    """Position after the last event of a page."""
+
+    ts: str | None
+    kind: str
+    id: int
+
+    def encode(self) -> str:
+        """Opaque URL-safe token."""
+        raw = json.dumps([self.ts, self.kind, self.id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> HistoryCursor:
+        """Parse a token produced by ``encode``.
+
+        Raises:
+            InvalidCursorError: If the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            ts, kind, event_id = json.loads(raw)
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise InvalidCursorError("Invalid history cursor") from e
+        if (
+            (ts is not None and not isinstance(ts, str))
+            or kind not in (KIND_UPDATE, KIND_RESTART, KIND_DRIFT)
+            or not isinstance(event_id, int)
+        ):
+            raise InvalidCursorError("Invalid history cursor")
+        return cls(ts=ts, kind=kind, id=event_id)
+
+
+@dataclass(frozen=True)
+class HistoryFilters:
+    """Filters of the unified history feed.
+
+    Attributes:
+        container_id: Only this container's events (drift excluded)
+        status: Update status filter; "detected" selects drift only
+        start: Updates/drift at or after this time
+        end: Updates/drift at or before this time
+    """
+
+    container_id: int | None = None
+    status: str | None = None
+    start: datetime | None = None
+    end: datetime | None = None
+
+
+@dataclass
+class HistoryPage:
+    """One page of the feed: ``(kind, model)`` pairs in feed order."""
+
+    events: list[tuple[str, Any]]
+    next_cursor: str | None
+
+
+def _after(ts_column: Any, id_column: Any, kind: str, cursor: HistoryCursor) -> list[Any]:
+    """Keyset predicates for one arm: rows ordered after ``cursor``.
+
+    ``kind`` is constant within an arm, so the comparison on it is resolved
+    here and the remaining predicates only touch the arm's indexed columns.
+    NULL timestamps sort last; they get their own ``ts IS NULL`` predicate
+    instead of being OR-ed into the timestamp range, so the arm is split into
+    segments that can each seek its index (an OR across both forces a scan).
+    Columns declared NOT NULL get no NULL segment.
+
+    Returns:
+        One predicate per segment to read (empty when none follows the cursor)
+    """
+    ts = type_coerce(ts_column, String)
+    tail = [ts.is_(None)] if ts_column.nullable else []
+    if cursor.ts is None:
+        if kind > cursor.kind or not tail:
+            return []
+        if kind == cursor.kind:
+            return [and_(ts.is_(None), id_column < cursor.id)]
+        return tail
+    if kind < cursor.kind:
+        earlier = ts <= cursor.ts
+    elif kind == cursor.kind:
+        earlier = and_(ts <= cursor.ts, or_(ts < cursor.ts, id_column < cursor.id))
+    else:
+        earlier = ts < cursor.ts
+    return [earlier, *tail]
+
+
+def _segments(
+    arm: Any, ts_column: Any, id_column: Any, kind: str, cursor: HistoryCursor | None
+) -> list[Any]:
+    """``arm`` as the selects that read the rows after ``cursor``."""
+    if cursor is None:
+        return [arm]
+    return [arm.where(predicate) for predicate in _after(ts_column, id_column, kind, cursor)]
+
+
+def _arms(filters: HistoryFilters, cursor: HistoryCursor | None) -> list[Any]:
+    include_drift = not filters.container_id and filters.status in (None, "detected")
+    include_updates_restarts = filters.status != "detected"
+    arms = []
+
+    if include_updates_restarts:
+        updates = select(
+            type_coerce(UpdateHistory.started_at, String).label("ts"),
+            literal(KIND_UPDATE).label("kind"),
+            UpdateHistory.id.label("id"),
+        )
+        if filters.container_id:
+            updates = updates.where(UpdateHistory.container_id == filters.container_id)
+        else:
+            updates = updates.where(
+                UpdateHistory.event_type.is_(None)
+                | ~UpdateHistory.event_type.in_(DEPENDENCY_EVENT_TYPES)
+            )
+        if filters.status:
+            updates = updates.where(UpdateHistory.status == filters.status)
+        if filters.start:
+            updates = updates.where(UpdateHistory.started_at >= filters.start)
+        if filters.end:
+            updates = updates.where(UpdateHistory.started_at <= filters.end)
+        arms += _segments(updates, UpdateHistory.started_at, UpdateHistory.id, KIND_UPDATE, cursor)
+
+        # Restarts are listed once completed
+        restarts = select(
+            type_coerce(ContainerRestartLog.executed_at, String).label("ts"),
+            literal(KIND_RESTART).label("kind"),
+            ContainerRestartLog.id.label("id"),
+        ).where(ContainerRestartLog.completed_at.isnot(None))
+        if filters.container_id:
+            restarts = restarts.where(ContainerRestartLog.container_id == filters.container_id)
+        arms += _segments(
+            restarts, ContainerRestartLog.executed_at, ContainerRestartLog.id, KIND_RESTART, cursor
+        )
+
+    if include_drift:
+        drift = select(
+            type_coerce(SiblingDriftEvent.detected_at, String).label("ts"),
+            literal(KIND_DRIFT).label("kind"),
+            SiblingDriftEvent.id.label("id"),
+        )
+        if filters.start:
+            drift = drift.where(SiblingDriftEvent.detected_at >= filters.start)
+        if filters.end:
+            drift = drift.where(SiblingDriftEvent.detected_at <= filters.end)
+        arms += _segments(
+            drift, SiblingDriftEvent.detected_at, SiblingDriftEvent.id, KIND_DRIFT, cursor
+        )
+
+    return arms
+
+
+async def _load(db: AsyncSession, kind: str, ids: list[int]) -> dict[int, Any]:
+    if kind == KIND_UPDATE:
+        query = select(UpdateHistory).options(
+            undefer(UpdateHistory.event_type),
+            undefer(UpdateHistory.dependency_type),
+            undefer(UpdateHistory.dependency_id),
+            undefer(UpdateHistory.dependency_name),
+        )
+        model: Any = UpdateHistory
+    elif kind == KIND_RESTART:
+        query, model = select(ContainerRestartLog), ContainerRestartLog
+    else:
+        query, model = select(SiblingDriftEvent), SiblingDriftEvent
+    result = await db.execute(query.where(model.id.in_(ids)))
+    return {row.id: row for row in result.scalars().all()}
+
+
+async def fetch_history_page(
+    db: AsyncSession,
+    filters: HistoryFilters,
+    limit: int,
+    cursor: HistoryCursor | None = None,
+    offset: int = 0,
+) -> HistoryPage:
+    """Fetch one page of the unified history feed.
+
+    Args:
+        db: Database session
+        filters: Feed filters
+        limit: Page size
+        cursor: Continue after this position (keyset; preferred)
+        offset: Rows to skip when no cursor is given (legacy ``skip``)
+
+    Returns:
+        The page's events and the cursor of the next page (None on the last)
+    """
+    arms = _arms(filters, cursor)
+    if not arms:
+        return HistoryPage(events=[], next_cursor=None)
+
+    feed = (arms[0] if len(arms) == 1 else union_all(*arms)).subquery()
+    query = select(feed.c.ts, feed.c.kind, feed.c.id).order_by(
+        feed.c.ts.desc(), feed.c.kind.desc(), feed.c.id.desc()
+    )
+    if cursor is None and offset:
+        query = query.offset(offset)
+    keys = (await db.execute(query.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(keys) > limit:
+        keys = keys[:limit]
+        last = keys[-1]
+        next_cursor = HistoryCursor(ts=last.ts, kind=last.kind, id=last.id).encode()
+
+    by_kind: dict[str, list[int]] = {}
+    for key in keys:
+        by_kind.setdefault(key.kind, []).append(key.id)
+    loaded = {kind: await _load(db, kind, ids) for kind, ids in by_kind.items()}
+
+    events = [(key.kind, loaded[key.kind][key.id]) for key in keys if key.id in loaded[key.kind]]
+    return HistoryPage(events=events, next_cursor=next_cursor)
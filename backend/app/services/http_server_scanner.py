@@ -2,26 +2,41 @@
 
 import logging
 import re
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import httpx
-from docker.errors import APIError, DockerException, NotFound
-from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from app.services.docker_access import make_docker_client, resolve_docker_url_sync
+from app.services.docker_engine import DockerEngineError, DockerNotFoundError, docker_engine
 from app.utils.security import sanitize_log_message
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class _InspectedContainer:
+    """A container as returned by ``GET /containers/{name}/json``."""
+
+    name: str
+    attrs: dict[str, Any]
+
+    @property
+    def status(self) -> str:
+        return (self.attrs.get("State") or {}).get("Status", "")
+
+    @property
+    def labels(self) -> dict[str, str]:
+        return (self.attrs.get("Config") or {}).get("Labels") or {}
+
+
 class HttpServerScanner:
     """Scanner for detecting HTTP servers running in containers."""
 
     def __init__(self):
         self.timeout = httpx.Timeout(5.0)
-        self.docker_client = make_docker_client(resolve_docker_url_sync())
+        self.engine = docker_engine
 
         # Known HTTP servers and their detection methods
         self.server_patterns = {
@@ -118,16 +133,6 @@ class HttpServerScanner:
             "python": "python.*manage.py runserver",
         }
 
-    def reconnect(self) -> None:
-        """Reinitialize Docker client (e.g. after proxy restart)."""
-        if self.docker_client:
-            try:
-                self.docker_client.close()
-            except Exception as e:
-                logger.debug("Ignoring error closing old Docker client: %s", e)
-        self.docker_client = make_docker_client(resolve_docker_url_sync())
-        logger.info("HttpServerScanner Docker client reconnected")
-
     async def scan_container_http_servers(
         self, container_name: str, container_model=None, db=None
     ) -> list[dict[str, Any]]:
@@ -145,7 +150,10 @@ class HttpServerScanner:
         servers = []
 
         try:
-            container = self.docker_client.containers.get(container_name)
+            attrs = await self.engine.inspect_container(container_name)
+            container = _InspectedContainer(
+                name=(attrs.get("Name") or container_name).lstrip("/"), attrs=attrs
+            )
 
             # Method 0: Check container labels (works even when stopped)
             label_servers = await self._detect_from_labels(container)
@@ -217,11 +225,9 @@ class HttpServerScanner:
                     server.get("current_version"), server.get("latest_version")
                 )
 
-        except NotFound:
+        except DockerNotFoundError:
             logger.error(f"Container {container_name} not found")
-        except APIError as e:
-            logger.error(f"Docker API error scanning container {container_name}: {e}")
-        except (DockerException, RequestsConnectionError) as e:
+        except DockerEngineError as e:
             logger.error(f"Docker error scanning container {container_name}: {e}")
         except (ValueError, KeyError, AttributeError) as e:
             logger.error(f"Invalid data scanning container {container_name}: {e}")
@@ -702,7 +708,7 @@ class HttpServerScanner:
             output = None
             for cmd in commands:
                 try:
-                    result = container.exec_run(cmd, demux=False)
+                    result = await self.engine.exec_run(container.name, cmd)
                     if result.exit_code == 0:
                         output = (
                             result.output.decode("utf-8")
@@ -717,9 +723,9 @@ class HttpServerScanner:
             # If ps is not available, try checking /proc
             if not output:
                 try:
-                    result = container.exec_run(
+                    result = await self.engine.exec_run(
+                        container.name,
                         ["sh", "-c", 'cat /proc/*/cmdline 2>/dev/null | tr "\\0" " "'],
-                        demux=False,
                     )
                     if result.exit_code == 0:
                         output = (
@@ -747,9 +753,7 @@ class HttpServerScanner:
                     )
                     logger.info(f"Detected {server_name} from process list in {container.name}")
 
-        except APIError as e:
-            logger.debug(f"Docker API error detecting from processes: {e}")
-        except DockerException as e:
+        except DockerEngineError as e:
             logger.debug(f"Docker error detecting from processes: {e}")
         except (UnicodeDecodeError, ValueError, AttributeError) as e:
             logger.debug(f"Failed to parse process list: {e}")
@@ -764,7 +768,7 @@ class HttpServerScanner:
             for cmd in config["commands"]:
                 try:
                     # Execute version command
-                    result = container.exec_run(cmd.split(), demux=False)
+                    result = await self.engine.exec_run(container.name, cmd.split())
 
                     if result.exit_code == 0:
                         output = (
@@ -788,10 +792,7 @@ class HttpServerScanner:
                             logger.info(f"Detected {server_name} v{version} in {container.name}")
                             break  # Found version, no need to try other commands
 
-                except APIError as e:
-                    logger.debug(f"Docker API error running '{cmd}' for {server_name}: {e}")
-                    continue
-                except DockerException as e:
+                except DockerEngineError as e:
                     logger.debug(f"Docker error running '{cmd}' for {server_name}: {e}")
                     continue
                 except (UnicodeDecodeError, ValueError, AttributeError) as e:
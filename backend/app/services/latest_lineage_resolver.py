@@ -26,10 +26,13 @@ the resolver returns ``None`` and the cap is a no-op for that image.
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from app.services.tiered_cache import TieredCache
+
 if TYPE_CHECKING:
     from app.services.registry_client import RegistryClient
 
@@ -50,36 +53,51 @@ class LineageResolution:
     method: str
 
 
+# Upper bound on cached lineage resolutions (one per registry/image).
+LINEAGE_CACHE_MAX_ENTRIES = 1024
+
+
 class _LineageCache:
     """In-process cache for `:latest` lineage resolutions.
 
     Keyed on ``(registry, image)``. Short TTL so we don't pin a stale cap
-    after upstream cuts a new major release.
+    after upstream cuts a new major release. Backed by the tiered cache
+    (``lineage`` namespace).
     """
 
-    def __init__(self, ttl_minutes: int = 15) -> None:
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._store: dict[tuple[str, str], tuple[LineageResolution, datetime]] = {}
+    def __init__(
+        self,
+        ttl_minutes: int = 15,
+        max_entries: int = LINEAGE_CACHE_MAX_ENTRIES,
+        register: bool = False,
+    ) -> None:
+        self._cache: TieredCache[tuple[str, str], LineageResolution] = TieredCache(
+            "lineage",
+            max_entries=max_entries,
+            ttl=timedelta(minutes=ttl_minutes),
+            register=register,
+        )
 
     def get(self, registry: str, image: str) -> LineageResolution | None:
-        key = (registry.lower(), image)
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        resolution, stored_at = entry
-        if datetime.now(UTC) - stored_at > self._ttl:
-            del self._store[key]
-            return None
-        return resolution
+        return self._cache.get((registry.lower(), image))
 
     def set(self, registry: str, image: str, resolution: LineageResolution) -> None:
-        self._store[(registry.lower(), image)] = (resolution, datetime.now(UTC))
+        self._cache.set((registry.lower(), image), resolution)
+
+    async def get_or_resolve(
+        self,
+        registry: str,
+        image: str,
+        resolve: Callable[[], Awaitable[LineageResolution | None]],
+    ) -> LineageResolution | None:
+        """Return a cached resolution or run ``resolve`` once for all concurrent callers."""
+        return await self._cache.get_or_load((registry.lower(), image), resolve)
 
     def clear(self) -> None:
-        self._store.clear()
+        self._cache.clear()
 
 
-_lineage_cache = _LineageCache()
+_lineage_cache = _LineageCache(register=True)
 
 
 def get_lineage_cache() -> _LineageCache:
@@ -109,24 +127,24 @@ class LatestLineageResolver:
             or ``None`` if no strategy produced a value.
         """
         registry = getattr(self._client, "_registry_name", "")
-        cached = _lineage_cache.get(registry, image)
-        if cached is not None:
-            return cached
+        return await _lineage_cache.get_or_resolve(
+            registry, image, lambda: self._resolve_uncached(image, current_best)
+        )
 
+    async def _resolve_uncached(
+        self, image: str, current_best: str | None
+    ) -> LineageResolution | None:
+        """Run the resolution strategies (cache miss path)."""
         # Strategy 1: label-based.
         major_via_label = await self._resolve_via_labels(image)
         if major_via_label is not None:
-            resolution = LineageResolution(major=major_via_label, method="label")
-            _lineage_cache.set(registry, image, resolution)
-            return resolution
+            return LineageResolution(major=major_via_label, method="label")
 
         # Strategy 2: digest walk against the best candidate.
         if current_best:
             major_via_walk = await self._resolve_via_digest_walk(image, current_best)
             if major_via_walk is not None:
-                resolution = LineageResolution(major=major_via_walk, method="digest_walk")
-                _lineage_cache.set(registry, image, resolution)
-                return resolution
+                return LineageResolution(major=major_via_walk, method="digest_walk")
 
         return None
 
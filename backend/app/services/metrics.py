@@ -1,52 +1,50 @@
-"""Prometheus metrics for TideWatch."""
-
-from datetime import UTC
+"""Prometheus metrics for TideWatch.
+
+Counters and histograms are updated in place by the code they instrument.
+Gauges derived from database state (container, update and history counts)
+come from ``DatabaseMetricsCollector``, which computes all of them with two
+grouped queries and serves the cached result to scrapes until it expires
+(``metrics_scrape_cache_seconds``) or an ``event_bus`` event reports a change
+to the counted rows.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
+    REGISTRY,
     Counter,
     Gauge,
     Histogram,
     Info,
     generate_latest,
 )
-from sqlalchemy import func, select
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import and_, case, func, literal, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.container import Container
 from app.models.history import UpdateHistory
 from app.models.update import Update
+from app.services.event_bus import event_bus
+
+logger = logging.getLogger(__name__)
 
 # Application info
 app_info = Info("tidewatch_app", "TideWatch application information")
 app_info.info({"version": "3.6.0", "name": "TideWatch"})
 
-# Container metrics
-containers_total = Gauge("tidewatch_containers_total", "Total number of containers tracked")
-containers_with_updates = Gauge(
-    "tidewatch_containers_with_updates_available", "Containers with available updates"
-)
-containers_by_policy = Gauge(
-    "tidewatch_containers_by_policy", "Containers grouped by policy", ["policy"]
-)
-containers_by_registry = Gauge(
-    "tidewatch_containers_by_registry", "Containers grouped by registry", ["registry"]
-)
-
 # Update metrics
-updates_pending = Gauge("tidewatch_updates_pending", "Pending updates")
-updates_approved = Gauge("tidewatch_updates_approved", "Approved updates")
-updates_rejected = Gauge("tidewatch_updates_rejected", "Rejected updates")
 updates_applied_total = Counter("tidewatch_updates_applied_total", "Total updates applied")
 updates_failed_total = Counter("tidewatch_updates_failed_total", "Total updates failed")
 
-# Update history metrics
-update_history_success = Gauge("tidewatch_update_history_success", "Successful updates in history")
-update_history_failed = Gauge("tidewatch_update_history_failed", "Failed updates in history")
-update_history_rolled_back = Gauge(
-    "tidewatch_update_history_rolled_back", "Rolled back updates in history"
-)
-
 # Update check metrics
 update_checks_total = Counter("tidewatch_update_checks_total", "Total update checks performed")
 update_check_duration = Histogram(
@@ -63,6 +61,32 @@ registry_cache_hits = Counter(
 registry_cache_misses = Counter(
     "tidewatch_registry_cache_misses_total", "Registry cache misses", ["registry"]
 )
+registry_token_cache_hits = Counter(
+    "tidewatch_registry_token_cache_hits_total", "Registry bearer-token cache hits", ["registry"]
+)
+registry_token_cache_misses = Counter(
+    "tidewatch_registry_token_cache_misses_total",
+    "Registry bearer-token cache misses (token requests issued)",
+    ["registry"],
+)
+registry_tag_revalidations = Counter(
+    "tidewatch_registry_tag_revalidations_total",
+    "Conditional tag-list requests by outcome (not_modified = 304, modified = 200)",
+    ["registry", "result"],
+)
+
+# Tiered cache metrics (app/services/tiered_cache.py), one series per namespace
+cache_requests_total = Counter(
+    "tidewatch_cache_requests_total",
+    "Cache lookups by outcome (hit, miss, l2_hit, coalesced single-flight waits)",
+    ["namespace", "result"],
+)
+cache_evictions_total = Counter(
+    "tidewatch_cache_evictions_total",
+    "Cache evictions by reason (capacity = LRU bound, expired = TTL)",
+    ["namespace", "reason"],
+)
+cache_entries = Gauge("tidewatch_cache_entries", "Entries currently cached", ["namespace"])
 
 # Check job performance metrics
 check_job_duration = Histogram(
@@ -109,92 +133,220 @@ health_check_failure_total = Counter(
 health_check_duration = Histogram(
     "tidewatch_health_check_duration_seconds", "Health check duration", ["container"]
 )
-health_check_failures_24h = Gauge(
-    "tidewatch_health_check_failures_24h", "Health check failures in last 24 hours"
+
+
+# Events after which the database gauges are recomputed on the next scrape.
+# Their payloads do not carry the previous status of the changed rows, so the
+# counts are re-queried rather than patched.
+_INVALIDATING_EVENTS = frozenset(
+    {
+        "update-available",
+        "update-check-complete",
+        "digest_update",
+        "check-job-completed",
+        "update-complete",
+        "rollback-complete",
+    }
 )
 
+_POLICIES = ("auto", "monitor", "disabled")
+_UPDATE_STATUSES = ("pending", "approved", "rejected")
+_HISTORY_STATUSES = ("success", "failed", "rolled_back")
+
+
+@dataclass
+class DatabaseSnapshot:
+    """Database-derived gauge values from one refresh."""
+
+    containers_total: int = 0
+    containers_with_updates: int = 0
+    by_policy: dict[str, int] = field(default_factory=dict)
+    by_registry: dict[str, int] = field(default_factory=dict)
+    updates: dict[str, int] = field(default_factory=dict)
+    history: dict[str, int] = field(default_factory=dict)
+    health_check_failures_24h: int = 0
+
+
+class DatabaseMetricsCollector:
+    """Prometheus collector for gauges computed from database state."""
+
+    # Event-driven refreshes are coalesced to at most one per interval.
+    MIN_REFRESH_INTERVAL = 5.0
+
+    def __init__(self) -> None:
+        self._snapshot = DatabaseSnapshot()
+        self._refreshed_at: float | None = None
+        self._stale = False
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None  # type: ignore[type-arg]
+
+    async def refresh(self, db: AsyncSession) -> DatabaseSnapshot:
+        """Recompute every database gauge with two grouped queries."""
+        snapshot = DatabaseSnapshot(by_policy=dict.fromkeys(_POLICIES, 0))
+
+        result = await db.execute(
+            select(
+                Container.policy,
+                Container.registry,
+                Container.update_available,
+                func.count(Container.id),
+            ).group_by(Container.policy, Container.registry, Container.update_available)
+        )
+        for policy, registry, update_available, count in result.all():
+            snapshot.containers_total += count
+            if update_available:
+                snapshot.containers_with_updates += count
+            snapshot.by_policy[policy] = snapshot.by_policy.get(policy, 0) + count
+            if registry:
+                snapshot.by_registry[registry] = snapshot.by_registry.get(registry, 0) + count
+
+        last_24h = datetime.now(UTC) - timedelta(hours=24)
+        health_failure = and_(
+            UpdateHistory.status == "failed",
+            UpdateHistory.created_at >= last_24h,
+            UpdateHistory.error_message.like("%health%check%"),
+        )
+        result = await db.execute(
+            union_all(
+                select(
+                    literal("update").label("source"),
+                    Update.status,
+                    func.count(Update.id),
+                    literal(0),
+                ).group_by(Update.status),
+                select(
+                    literal("history").label("source"),
+                    UpdateHistory.status,
+                    func.count(UpdateHistory.id),
+                    func.sum(case((health_failure, 1), else_=0)),
+                ).group_by(UpdateHistory.status),
+            )
+        )
+        for source, status, count, health_failures in result.all():
+            target = snapshot.updates if source == "update" else snapshot.history
+            target[status] = count
+            snapshot.health_check_failures_24h += health_failures or 0
+
+        self._snapshot = snapshot
+        self._refreshed_at = time.monotonic()
+        self._stale = False
+        return snapshot
+
+    def _needs_refresh(self, ttl: float) -> bool:
+        if self._refreshed_at is None:
+            return True
+        age = time.monotonic() - self._refreshed_at
+        return age >= ttl or (self._stale and age >= self.MIN_REFRESH_INTERVAL)
+
+    async def ensure_fresh(self, db: AsyncSession, ttl: float) -> None:
+        """Refresh the cached gauges if expired or invalidated by an event.
+
+        Concurrent scrapes share one refresh.
+        """
+        if not self._needs_refresh(ttl):
+            return
+        async with self._lock:
+            if self._needs_refresh(ttl):
+                await self.refresh(db)
+
+    def handle_event(self, event: dict) -> None:
+        """Mark the snapshot stale when an event changes the counted rows."""
+        if event.get("type") in _INVALIDATING_EVENTS:
+            self._stale = True
+
+    async def _consume_events(self) -> None:
+        queue = await event_bus.subscribe()
+        try:
+            while True:
+                payload = await queue.get()
+                try:
+                    self.handle_event(json.loads(payload))
+                except ValueError, AttributeError:
+                    continue
+        finally:
+            await event_bus.unsubscribe(queue)
+
+    def start(self) -> None:
+        """Start following the event bus."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._consume_events())
+
+    async def stop(self) -> None:
+        """Stop following the event bus."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def describe(self) -> list:
+        """No up-front description; families are produced by ``collect``."""
+        return []
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """Yield the cached gauges (called by ``generate_latest``)."""
+        snapshot = self._snapshot
+        yield GaugeMetricFamily(
+            "tidewatch_containers_total",
+            "Total number of containers tracked",
+            value=snapshot.containers_total,
+        )
+        yield GaugeMetricFamily(
+            "tidewatch_containers_with_updates_available",
+            "Containers with available updates",
+            value=snapshot.containers_with_updates,
+        )
+        by_policy = GaugeMetricFamily(
+            "tidewatch_containers_by_policy", "Containers grouped by policy", labels=["policy"]
+        )
+        for policy, count in sorted(snapshot.by_policy.items()):
+            by_policy.add_metric([policy], count)
+        yield by_policy
+        by_registry = GaugeMetricFamily(
+            "tidewatch_containers_by_registry",
+            "Containers grouped by registry",
+            labels=["registry"],
+        )
+        for registry, count in sorted(snapshot.by_registry.items()):
+            by_registry.add_metric([registry], count)
+        yield by_registry
+        for status in _UPDATE_STATUSES:
+            yield GaugeMetricFamily(
+                f"tidewatch_updates_{status}",
+                f"{status.capitalize()} updates",
+                value=snapshot.updates.get(status, 0),
+            )
+        for status, description in zip(
+            _HISTORY_STATUSES,
+            ("Successful updates", "Failed updates", "Rolled back updates"),
+            strict=True,
+        ):
+            yield GaugeMetricFamily(
+                f"tidewatch_update_history_{status}",
+                f"{description} in history",
+                value=snapshot.history.get(status, 0),
+            )
+        yield GaugeMetricFamily(
+            "tidewatch_health_check_failures_24h",
+            "Health check failures in last 24 hours",
+            value=snapshot.health_check_failures_24h,
+        )
+
+
+db_metrics = DatabaseMetricsCollector()
+REGISTRY.register(db_metrics)
+
 
 async def collect_metrics(db: AsyncSession) -> None:
-    """Collect current metrics from database.
+    """Bring the database gauges up to date for a scrape.
 
     Args:
         db: Database session
     """
-    # Container metrics
-    result = await db.execute(select(func.count()).select_from(Container))
-    containers_total.set(result.scalar() or 0)
-
-    result = await db.execute(
-        select(func.count()).select_from(Container).where(Container.update_available)
-    )
-    containers_with_updates.set(result.scalar() or 0)
-
-    # Containers by policy
-    result = await db.execute(
-        select(Container.policy, func.count(Container.id)).group_by(Container.policy)
-    )
-    policy_counts = {policy: 0 for policy in ["auto", "monitor", "disabled"]}
-    for policy, count in result.fetchall():
-        policy_counts[policy] = count
-    for policy, count in policy_counts.items():
-        containers_by_policy.labels(policy=policy).set(count)
-
-    # Containers by registry
-    result = await db.execute(
-        select(Container.registry, func.count(Container.id)).group_by(Container.registry)
-    )
-    registry_counts = {}
-    for registry, count in result.fetchall():
-        if registry:
-            registry_counts[registry] = count
-    for registry, count in registry_counts.items():
-        containers_by_registry.labels(registry=registry).set(count)
-
-    # Update metrics
-    result = await db.execute(
-        select(func.count()).select_from(Update).where(Update.status == "pending")
-    )
-    updates_pending.set(result.scalar() or 0)
-
-    result = await db.execute(
-        select(func.count()).select_from(Update).where(Update.status == "approved")
-    )
-    updates_approved.set(result.scalar() or 0)
-
-    result = await db.execute(
-        select(func.count()).select_from(Update).where(Update.status == "rejected")
-    )
-    updates_rejected.set(result.scalar() or 0)
-
-    # Update history metrics
-    result = await db.execute(
-        select(func.count()).select_from(UpdateHistory).where(UpdateHistory.status == "success")
-    )
-    update_history_success.set(result.scalar() or 0)
-
-    result = await db.execute(
-        select(func.count()).select_from(UpdateHistory).where(UpdateHistory.status == "failed")
-    )
-    update_history_failed.set(result.scalar() or 0)
-
-    result = await db.execute(
-        select(func.count()).select_from(UpdateHistory).where(UpdateHistory.status == "rolled_back")
-    )
-    update_history_rolled_back.set(result.scalar() or 0)
-
-    # Health check failure metrics (last 24 hours)
-    from datetime import datetime, timedelta
-
-    last_24h = datetime.now(UTC) - timedelta(hours=24)
-
-    result = await db.execute(
-        select(func.count())
-        .select_from(UpdateHistory)
-        .where(UpdateHistory.status == "failed")
-        .where(UpdateHistory.created_at >= last_24h)
-        .where(UpdateHistory.error_message.like("%health%check%"))
-    )
-    health_check_failures_24h.set(result.scalar() or 0)
+    from app.services.settings_service import SettingsService
+
+    ttl = await SettingsService.get_int(db, "metrics_scrape_cache_seconds", default=30)
+    await db_metrics.ensure_fresh(db, ttl=max(0, ttl))
 
 
 def get_metrics() -> bytes:
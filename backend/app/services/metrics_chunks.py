@@ -0,0 +1,332 @@
+"""Compressed, column-oriented storage for raw container metrics.
+
+Every ``metrics_history`` row repeats an integer PK, the container FK, a
+timestamp and nine metric columns, and the collector inserts one ORM object
+per container per cycle. With ``metrics_storage`` set to ``chunks`` the
+collector instead appends samples to an in-memory head per container and
+writes each container's hour of samples as one ``metrics_chunks`` row once
+the hour closes (or at shutdown).
+
+Chunk layout (zlib-compressed)::
+
+    <B version> <I count> then, for each column in ``_COLUMNS`` order,
+    ``count`` little-endian values of the column's array typecode
+
+Timestamps (epoch milliseconds) and integer columns are delta-encoded, so
+the steady collection interval and slowly changing counters compress to a
+few bytes each; floats are stored as-is. Decoding yields plain column lists,
+which the history endpoint and the rollup job read directly.
+
+Samples still in the head are served from memory, so reads always see every
+sample collected by this process. A crash loses at most the open hour.
+"""
+
+import logging
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.metrics_chunk import MetricsChunk
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BI")
+
+# (column, array typecode, delta-encoded)
+_COLUMNS: tuple[tuple[str, str, bool], ...] = (
+    ("collected_at", "q", True),
+    ("cpu_percent", "d", False),
+    ("memory_usage", "q", True),
+    ("memory_limit", "q", True),
+    ("memory_percent", "d", False),
+    ("network_rx", "q", True),
+    ("network_tx", "q", True),
+    ("block_read", "q", True),
+    ("block_write", "q", True),
+    ("pids", "q", True),
+)
+
+Columns = dict[str, list[Any]]
+
+
+def to_epoch_ms(value: datetime) -> int:
+    """Epoch milliseconds of a datetime (naive values are UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return int(value.timestamp() * 1000)
+
+
+def from_epoch_ms(value: int) -> datetime:
+    """Naive UTC datetime, matching what SQLite returns for stored timestamps."""
+    return datetime.fromtimestamp(value / 1000, UTC).replace(tzinfo=None)
+
+
+def _empty_columns() -> Columns:
+    return {name: [] for name, _, _ in _COLUMNS}
+
+
+def _deltas(values: list[int]) -> list[int]:
+    return [values[0]] + [b - a for a, b in zip(values, values[1:], strict=False)] if values else []
+
+
+def encode_chunk(columns: Columns) -> bytes:
+    """Pack column lists (``collected_at`` in epoch ms) into a chunk blob."""
+    count = len(columns["collected_at"])
+    parts = [_HEADER.pack(FORMAT_VERSION, count)]
+    for name, typecode, delta in _COLUMNS:
+        values = columns[name]
+        if typecode == "q":
+            values = [int(v) for v in values]
+        packed = array(typecode, _deltas(values) if delta else values)
+        if sys.byteorder == "big":
+            packed.byteswap()
+        parts.append(packed.tobytes())
+    return zlib.compress(b"".join(parts))
+
+
+def decode_chunk(data: bytes) -> Columns:
+    """Unpack a chunk blob into column lists (``collected_at`` in epoch ms).
+
+    Raises:
+        ValueError: If the blob has an unknown format version or is truncated
+    """
+    raw = zlib.decompress(data)
+    version, count = _HEADER.unpack_from(raw)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported metrics chunk version {version}")
+    columns: Columns = {}
+    offset = _HEADER.size
+    for name, typecode, delta in _COLUMNS:
+        values = array(typecode)
+        size = values.itemsize * count
+        if offset + size > len(raw):
+            raise ValueError("Truncated metrics chunk")
+        values.frombytes(raw[offset : offset + size])
+        if sys.byteorder == "big":
+            values.byteswap()
+        offset += size
+        columns[name] = list(accumulate(values)) if delta else values.tolist()
+    return columns
+
+
+def _select(columns: Columns, keep: list[int]) -> Columns:
+    return {name: [values[i] for i in keep] for name, values in columns.items()}
+
+
+class _Head:
+    """Samples of one container's open chunk."""
+
+    __slots__ = ("window", "columns")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.columns = _empty_columns()
+
+
+class MetricsChunkStore:
+    """Buffers samples per container and persists them as hourly chunks."""
+
+    CHUNK_SPAN = timedelta(hours=1)
+
+    def __init__(self) -> None:
+        self._heads: dict[int, _Head] = {}
+        # Chunks whose hour closed but that are not written yet
+        self._closed: list[tuple[int, _Head]] = []
+
+    def append(self, container_id: int, collected_at: datetime, metrics: dict[str, Any]) -> None:
+        """Add one sample to the container's open chunk."""
+        ms = to_epoch_ms(collected_at)
+        span = int(self.CHUNK_SPAN.total_seconds() * 1000)
+        window = ms - ms % span
+        head = self._heads.get(container_id)
+        if head is None or head.window != window:
+            if head is not None:
+                self._closed.append((container_id, head))
+            head = self._heads[container_id] = _Head(window)
+        head.columns["collected_at"].append(ms)
+        for name, _, _ in _COLUMNS[1:]:
+            head.columns[name].append(metrics[name])
+
+    async def flush(self, db: AsyncSession, *, include_open: bool = False) -> int:
+        """Write closed chunks (and open ones when ``include_open``) and commit.
+
+        Samples stay buffered if the write fails, so the next flush retries
+        them.
+
+        Args:
+            db: Database session
+            include_open: Also write the open chunks (used at shutdown)
+
+        Returns:
+            Number of chunk rows written
+        """
+        pending = list(self._closed)
+        if include_open:
+            pending += list(self._heads.items())
+        pending = [(cid, head) for cid, head in pending if head.columns["collected_at"]]
+        if not pending:
+            return 0
+
+        rows = [
+            {
+                "container_id": cid,
+                "start_at": datetime.fromtimestamp(head.columns["collected_at"][0] / 1000, UTC),
+                "end_at": datetime.fromtimestamp(head.columns["collected_at"][-1] / 1000, UTC),
+                "samples": len(head.columns["collected_at"]),
+                "data": encode_chunk(head.columns),
+            }
+            for cid, head in pending
+        ]
+        await db.execute(insert(MetricsChunk), rows)
+        await db.commit()
+
+        written = {id(head) for _, head in pending}
+        self._closed = [(cid, head) for cid, head in self._closed if id(head) not in written]
+        for cid, head in pending:
+            if self._heads.get(cid) is head:
+                del self._heads[cid]
+        logger.debug("Wrote %d metrics chunks", len(rows))
+        return len(rows)
+
+    def _buffered(self, container_id: int | None) -> list[tuple[int, Columns]]:
+        heads = self._closed + list(self._heads.items())
+        return [
+            (cid, head.columns)
+            for cid, head in heads
+            if container_id is None or cid == container_id
+        ]
+
+    async def read(
+        self,
+        db: AsyncSession,
+        start: datetime,
+        end: datetime | None = None,
+        container_id: int | None = None,
+    ) -> dict[int, Columns]:
+        """Samples in ``[start, end)`` as column lists per container.
+
+        Args:
+            db: Database session
+            start: Inclusive lower bound
+            end: Exclusive upper bound (None = no bound)
+            container_id: Restrict to one container
+
+        Returns:
+            Dict mapping container ID → columns ordered by ``collected_at``
+            (epoch ms)
+        """
+        query = select(MetricsChunk.container_id, MetricsChunk.data).where(
+            MetricsChunk.end_at >= start
+        )
+        if end is not None:
+            query = query.where(MetricsChunk.start_at < end)
+        if container_id is not None:
+            query = query.where(MetricsChunk.container_id == container_id)
+        result = await db.execute(query.order_by(MetricsChunk.start_at))
+        chunks = [(cid, decode_chunk(data)) for cid, data in result.all()]
+        chunks += self._buffered(container_id)
+
+        start_ms = to_epoch_ms(start)
+        end_ms = to_epoch_ms(end) if end is not None else None
+        merged: dict[int, Columns] = {}
+        for cid, columns in chunks:
+            keep = [
+                i
+                for i, ms in enumerate(columns["collected_at"])
+                if ms >= start_ms and (end_ms is None or ms < end_ms)
+            ]
+            if not keep:
+                continue
+            target = merged.setdefault(cid, _empty_columns())
+            for name, values in _select(columns, keep).items():
+                target[name].extend(values)
+
+        for cid, columns in merged.items():
+            timestamps = columns["collected_at"]
+            if any(b < a for a, b in zip(timestamps, timestamps[1:], strict=False)):
+                order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+                merged[cid] = _select(columns, order)
+        return merged
+
+    async def stream(
+        self,
+        db: AsyncSession,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        container_id: int | None = None,
+    ) -> AsyncIterator[tuple[int, Columns]]:
+        """Samples in ``[start, end)`` one chunk at a time, for bulk export.
+
+        Unlike ``read`` nothing is merged, so memory stays at one chunk;
+        stored chunks come first (by start time), then buffered samples.
+
+        Yields:
+            ``(container_id, columns)`` per non-empty chunk
+        """
+        query = select(MetricsChunk.container_id, MetricsChunk.data)
+        if start is not None:
+            query = query.where(MetricsChunk.end_at >= start)
+        if end is not None:
+            query = query.where(MetricsChunk.start_at < end)
+        if container_id is not None:
+            query = query.where(MetricsChunk.container_id == container_id)
+        query = query.order_by(MetricsChunk.start_at, MetricsChunk.id)
+
+        start_ms = to_epoch_ms(start) if start is not None else None
+        end_ms = to_epoch_ms(end) if end is not None else None
+
+        def _window(columns: Columns) -> Columns | None:
+            keep = [
+                i
+                for i, ms in enumerate(columns["collected_at"])
+                if (start_ms is None or ms >= start_ms) and (end_ms is None or ms < end_ms)
+            ]
+            return _select(columns, keep) if keep else None
+
+        result = await db.stream(query.execution_options(yield_per=16))
+        async for cid, data in result:
+            columns = _window(decode_chunk(data))
+            if columns is not None:
+                yield cid, columns
+        for cid, buffered in self._buffered(container_id):
+            columns = _window(buffered)
+            if columns is not None:
+                yield cid, columns
+
+    async def oldest(self, db: AsyncSession) -> datetime | None:
+        """Timestamp of the oldest stored or buffered sample."""
+        stored = (await db.execute(select(func.min(MetricsChunk.start_at)))).scalar()
+        candidates = [to_epoch_ms(stored)] if stored is not None else []
+        candidates += [
+            columns["collected_at"][0]
+            for _, columns in self._buffered(None)
+            if columns["collected_at"]
+        ]
+        return from_epoch_ms(min(candidates)) if candidates else None
+
+    async def prune(self, db: AsyncSession, before: datetime) -> int:
+        """Delete chunks whose newest sample is older than ``before`` (no commit).
+
+        Returns:
+            Number of chunk rows deleted
+        """
+        result = await db.execute(delete(MetricsChunk).where(MetricsChunk.end_at < before))
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    def reset(self) -> None:
+        """Drop all buffered samples (tests)."""
+        self._heads.clear()
+        self._closed.clear()
+
+
+# Singleton instance
+metrics_chunk_store = MetricsChunkStore()
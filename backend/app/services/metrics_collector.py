@@ -11,7 +11,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import AsyncSessionLocal
 from app.models.container import Container
 from app.models.metrics_history import MetricsHistory
+from app.services.docker_access import resolve_docker_url
+from app.services.docker_engine_stats import docker_engine_stats
 from app.services.docker_stats import docker_stats_service
+from app.services.metrics_chunks import metrics_chunk_store
 from app.services.settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,10 @@ logger = logging.getLogger(__name__)
 class MetricsCollector:
     """Service for collecting and storing container metrics."""
 
+    # Timestamp of the last cycle that stored samples. The bulk metrics
+    # endpoint anchors its sparklines here and derives its ETag from it.
+    last_collection_at: datetime | None = None
+
     @staticmethod
     async def collect_all_metrics() -> dict:
         """Collect metrics for all containers and store in database.
@@ -27,11 +34,15 @@ class MetricsCollector:
         Three-phase design with batched docker calls:
 
         1. Short DB read — list tracked containers + concurrency setting.
-        2. One ``docker ps`` (~10ms) to find running names, then ONE batched
-           ``docker stats c1 c2 …`` (~2s for 40 containers) instead of N
-           serial or concurrent calls. Falls back to per-container concurrent
-           gather+semaphore on failure.
-        3. Short DB write — bulk insert history rows.
+        2. Read the latest samples of the persistent Engine API stats streams
+           (``docker_engine_stats``; no subprocess). When the Engine API is
+           disabled or unreachable: one ``docker ps`` (~10ms) to find running
+           names, then ONE batched ``docker stats c1 c2 …`` (~2s for 40
+           containers) instead of N serial or concurrent calls. Falls back to
+           per-container concurrent gather+semaphore on failure.
+        3. Short DB write — bulk insert history rows, or with
+           ``metrics_storage=chunks`` append to the in-memory chunk heads and
+           write one compressed row per container whose hour closed.
 
         With 43 containers we measured: serial 91s → gather(4) 22s → batched 2s.
         DB session is never held across the docker calls so the dashboard
@@ -45,51 +56,73 @@ class MetricsCollector:
             result = await db.execute(select(Container))
             rows = [(c.id, c.runtime_name, c.name) for c in result.scalars().all()]
             raw_concurrency = await SettingsService.get_int(db, "metrics_concurrency", default=4)
+            use_engine_api = await SettingsService.get_bool(db, "metrics_engine_api", default=True)
+            docker_url = await resolve_docker_url(db)
+            storage = await SettingsService.get(db, "metrics_storage") or "rows"
         metrics_concurrency = max(1, min(raw_concurrency, 16))
 
         if not rows:
             return {"collected": 0, "skipped": 0, "errors": 0}
 
-        # Phase 2: fetch docker stats. Try the batched fast path first; if
+        # Phase 2: fetch docker stats. Read the Engine API stats streams; if
+        # the API is off or unreachable, try the batched CLI path, and if
         # docker can't list running names (proxy hiccup, daemon hiccup,
         # missing CLI), fall back to per-container gather.
-        results: list[tuple]
-        running_names = await docker_stats_service.list_running_container_names()
-        if running_names is not None:
-            results = await MetricsCollector._batched_phase2(rows, running_names)
-        else:
-            logger.warning("docker ps failed, falling back to per-container concurrent fetch")
-            results = await MetricsCollector._concurrent_phase2(rows, metrics_concurrency)
+        results: list[tuple] | None = None
+        if use_engine_api:
+            results = await MetricsCollector._engine_phase2(rows, docker_url)
+        if results is None:
+            running_names = await docker_stats_service.list_running_container_names()
+            if running_names is not None:
+                results = await MetricsCollector._batched_phase2(rows, running_names)
+            else:
+                logger.warning("docker ps failed, falling back to per-container concurrent fetch")
+                results = await MetricsCollector._concurrent_phase2(rows, metrics_concurrency)
 
         # Phase 3: short-held session — bulk insert + commit
         now = datetime.now(UTC)
-        history_rows = [
-            MetricsHistory(
-                container_id=cid,
-                collected_at=now,
-                cpu_percent=m["cpu_percent"],
-                memory_usage=m["memory_usage"],
-                memory_limit=m["memory_limit"],
-                memory_percent=m["memory_percent"],
-                network_rx=m["network_rx"],
-                network_tx=m["network_tx"],
-                block_read=m["block_read"],
-                block_write=m["block_write"],
-                pids=m["pids"],
-            )
-            for status, cid, _name, m in results
-            if status == "ok" and m is not None
+        samples = [
+            (cid, m) for status, cid, _name, m in results if status == "ok" and m is not None
         ]
 
-        collected = len(history_rows)
+        collected = len(samples)
         skipped = sum(1 for s, *_ in results if s == "skipped")
         errors = sum(1 for s, *_ in results if s == "error")
 
-        if history_rows:
+        if storage == "chunks":
+            for cid, m in samples:
+                metrics_chunk_store.append(cid, now, m)
+            async with AsyncSessionLocal() as db:
+                try:
+                    await metrics_chunk_store.flush(db)
+                except OperationalError as e:
+                    # Samples stay buffered; the next cycle writes them.
+                    logger.error("Database error writing metrics chunks: %s", e)
+                    await db.rollback()
+            if samples:
+                MetricsCollector.last_collection_at = now
+        elif samples:
+            history_rows = [
+                MetricsHistory(
+                    container_id=cid,
+                    collected_at=now,
+                    cpu_percent=m["cpu_percent"],
+                    memory_usage=m["memory_usage"],
+                    memory_limit=m["memory_limit"],
+                    memory_percent=m["memory_percent"],
+                    network_rx=m["network_rx"],
+                    network_tx=m["network_tx"],
+                    block_read=m["block_read"],
+                    block_write=m["block_write"],
+                    pids=m["pids"],
+                )
+                for cid, m in samples
+            ]
             async with AsyncSessionLocal() as db:
                 try:
                     db.add_all(history_rows)
                     await db.commit()
+                    MetricsCollector.last_collection_at = now
                 except OperationalError as e:
                     logger.error("Database error committing metrics: %s", e)
                     await db.rollback()
@@ -104,6 +137,39 @@ class MetricsCollector:
         )
         return {"collected": collected, "skipped": skipped, "errors": errors}
 
+    @staticmethod
+    async def _engine_phase2(rows: list[tuple], docker_url: str) -> list[tuple] | None:
+        """Engine API path: latest sample of each running container's stats stream.
+
+        Returns None when the Engine API cannot list containers, so the
+        caller falls back to the CLI paths. A container without a sample is
+        an error on its own; it never fails the rest of the cycle.
+        """
+        running_names = await docker_engine_stats.list_running(docker_url)
+        if running_names is None:
+            return None
+
+        results: list[tuple] = []
+        to_stat: list[tuple[int, str, str]] = []
+        for cid, runtime, name in rows:
+            if runtime in running_names:
+                to_stat.append((cid, runtime, name))
+            else:
+                logger.debug("Container %s is not running, skipping metrics collection", name)
+                results.append(("skipped", cid, name, None))
+
+        stats_by_name = await docker_engine_stats.sample(
+            docker_url, [runtime for _, runtime, _ in to_stat]
+        )
+        for cid, runtime, name in to_stat:
+            metrics = stats_by_name.get(runtime)
+            if not metrics:
+                logger.warning("No stats sample for %s from the Engine API", name)
+                results.append(("error", cid, name, None))
+            else:
+                results.append(("ok", cid, name, metrics))
+        return results
+
     @staticmethod
     async def _batched_phase2(rows: list[tuple], running_names: set[str]) -> list[tuple]:
         """Batched fast path: filter to running, then ONE docker stats call."""
@@ -198,6 +264,7 @@ class MetricsCollector:
         )
 
         deleted_count: int = cursor_result.rowcount  # type: ignore[assignment]
+        deleted_count += await metrics_chunk_store.prune(db, cutoff_date)
         await db.commit()
 
         if deleted_count > 0:
@@ -0,0 +1,430 @@
+"""Downsampled rollup tiers for container metrics history.
+
+``metrics_history`` holds one raw sample per container per collection. Long
+views used to load every raw point (a 30-day chart was tens of thousands of
+ORM objects), and retention was capped at 30 days to keep the table bounded.
+
+The scheduler now folds raw samples into ``metrics_rollup`` tiers — 15-minute,
+hourly and daily buckets with min/avg/max/p95 for CPU and memory — one closed
+bucket at a time past each tier's watermark, so every run only reads the raw
+rows it has not rolled up yet. History queries pick the coarsest tier that
+still gives a useful number of points for the requested period. Each tier has
+its own retention, so history can reach back a year (daily rollups) while raw
+samples keep their ``metrics_raw_retention_days`` window.
+
+Raw samples are read from ``metrics_history`` and from the compressed
+``metrics_chunks`` store (see ``metrics_chunks``), whichever holds them.
+"""
+
+import logging
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.metrics_history import MetricsHistory
+from app.models.metrics_rollup import MetricsRollup
+from app.services.metrics_chunks import Columns, from_epoch_ms, metrics_chunk_store
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    """One rollup resolution.
+
+    Attributes:
+        name: Tier key stored in ``metrics_rollup.tier``
+        bucket: Bucket width
+        retention: How long buckets of this tier are kept (capped by the
+            ``metrics_retention_days`` setting, which the coarsest tier uses)
+        max_period: Longest history period served from this tier
+    """
+
+    name: str
+    bucket: timedelta
+    retention: timedelta
+    max_period: timedelta
+
+
+ROLLUP_TIERS: tuple[RollupTier, ...] = (
+    RollupTier("15m", timedelta(minutes=15), timedelta(days=30), timedelta(days=7)),
+    RollupTier("1h", timedelta(hours=1), timedelta(days=90), timedelta(days=90)),
+    RollupTier("1d", timedelta(days=1), timedelta(days=365), timedelta(days=3650)),
+)
+
+# Periods up to this long are served from raw samples.
+RAW_MAX_PERIOD = timedelta(days=1)
+
+# Raw rows read per query while catching a tier up.
+_CATCH_UP_WINDOW = timedelta(days=1)
+
+_GAUGES = ("cpu_percent", "memory_usage", "memory_percent")
+_LAST_VALUES = ("memory_limit", "network_rx", "network_tx", "block_read", "block_write")
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes; they are stored as UTC."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def floor_time(value: datetime, bucket: timedelta) -> datetime:
+    """Start of the UTC-aligned bucket containing ``value``."""
+    epoch = _as_utc(value).timestamp()
+    width = bucket.total_seconds()
+    return datetime.fromtimestamp(epoch - epoch % width, UTC)
+
+
+def _p95(ordered: list[float]) -> float:
+    """Nearest-rank 95th percentile of sorted values."""
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def aggregate_samples(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate the raw samples of one container bucket.
+
+    Args:
+        samples: Raw samples ordered by ``collected_at``
+
+    Returns:
+        ``metrics_rollup`` column values (without key columns)
+    """
+    row: dict[str, Any] = {"samples": len(samples)}
+    for gauge in _GAUGES:
+        ordered = sorted(s[gauge] for s in samples)
+        average = sum(ordered) / len(ordered)
+        is_bytes = gauge == "memory_usage"
+        row[f"{gauge}_min"] = ordered[0]
+        row[f"{gauge}_avg"] = round(average) if is_bytes else round(average, 2)
+        row[f"{gauge}_max"] = ordered[-1]
+        row[f"{gauge}_p95"] = _p95(ordered)
+    last = samples[-1]
+    for column in _LAST_VALUES:
+        row[column] = last[column]
+    pids = [s["pids"] for s in samples]
+    row["pids_avg"] = round(sum(pids) / len(pids), 2)
+    row["pids_max"] = max(pids)
+    return row
+
+
+def select_tier(period: timedelta) -> RollupTier | None:
+    """Tier a history period is served from (None = raw samples)."""
+    if period <= RAW_MAX_PERIOD:
+        return None
+    for tier in ROLLUP_TIERS:
+        if period <= tier.max_period:
+            return tier
+    return ROLLUP_TIERS[-1]
+
+
+_RAW_COLUMNS = (
+    MetricsHistory.container_id,
+    MetricsHistory.collected_at,
+    MetricsHistory.cpu_percent,
+    MetricsHistory.memory_usage,
+    MetricsHistory.memory_limit,
+    MetricsHistory.memory_percent,
+    MetricsHistory.network_rx,
+    MetricsHistory.network_tx,
+    MetricsHistory.block_read,
+    MetricsHistory.block_write,
+    MetricsHistory.pids,
+)
+
+
+def _chunk_samples(container_id: int, columns: Columns) -> list[dict[str, Any]]:
+    """Sample dicts (as read from ``metrics_history``) from chunk columns."""
+    names = list(columns)
+    return [
+        {
+            "container_id": container_id,
+            **dict(zip(names, values, strict=True)),
+            "collected_at": from_epoch_ms(values[0]),
+        }
+        for values in zip(*columns.values(), strict=True)
+    ]
+
+
+class MetricsRollupService:
+    """Maintains and queries the metrics rollup tiers."""
+
+    @staticmethod
+    async def rollup(db: AsyncSession, now: datetime | None = None) -> dict[str, int]:
+        """Roll every closed bucket past each tier's watermark.
+
+        Args:
+            db: Database session (committed on success)
+            now: Current time (defaults to ``datetime.now(UTC)``)
+
+        Returns:
+            Dict mapping tier name → rollup rows written
+        """
+        now = now or datetime.now(UTC)
+        written = {}
+        for tier in ROLLUP_TIERS:
+            written[tier.name] = await MetricsRollupService._rollup_tier(db, tier, now)
+        await db.commit()
+        return written
+
+    @staticmethod
+    async def _rollup_tier(db: AsyncSession, tier: RollupTier, now: datetime) -> int:
+        watermark = (
+            await db.execute(
+                select(func.max(MetricsRollup.bucket_start)).where(MetricsRollup.tier == tier.name)
+            )
+        ).scalar()
+        if watermark is not None:
+            start = _as_utc(watermark) + tier.bucket
+        else:
+            oldest_row = (await db.execute(select(func.min(MetricsHistory.collected_at)))).scalar()
+            oldest_chunk = await metrics_chunk_store.oldest(db)
+            candidates = [_as_utc(t) for t in (oldest_row, oldest_chunk) if t is not None]
+            if not candidates:
+                return 0
+            start = floor_time(min(candidates), tier.bucket)
+
+        # Only closed buckets: the current one may still receive samples.
+        end = floor_time(now, tier.bucket)
+        written = 0
+        while start < end:
+            window_end = min(start + max(tier.bucket, _CATCH_UP_WINDOW), end)
+            result = await db.execute(
+                select(*_RAW_COLUMNS)
+                .where(
+                    MetricsHistory.collected_at >= start,
+                    MetricsHistory.collected_at < window_end,
+                )
+                .order_by(MetricsHistory.collected_at)
+            )
+            samples = [dict(sample) for sample in result.mappings()]
+            chunked = await metrics_chunk_store.read(db, start, window_end)
+            for container_id, columns in chunked.items():
+                samples += _chunk_samples(container_id, columns)
+
+            buckets: dict[tuple[int, datetime], list[dict[str, Any]]] = defaultdict(list)
+            for sample in samples:
+                key = (sample["container_id"], floor_time(sample["collected_at"], tier.bucket))
+                buckets[key].append(sample)
+
+            rows = [
+                {
+                    "container_id": container_id,
+                    "tier": tier.name,
+                    "bucket_start": bucket_start,
+                    **aggregate_samples(
+                        sorted(bucket, key=lambda sample: _as_utc(sample["collected_at"]))
+                    ),
+                }
+                for (container_id, bucket_start), bucket in buckets.items()
+            ]
+            if rows:
+                await db.execute(insert(MetricsRollup), rows)
+                written += len(rows)
+            start = window_end
+
+        if written:
+            logger.debug(f"Rolled up {written} {tier.name} metrics buckets")
+        return written
+
+    @staticmethod
+    async def prune(db: AsyncSession, retention_days: int, now: datetime | None = None) -> int:
+        """Delete rollups past their tier's retention.
+
+        Args:
+            db: Database session (committed)
+            retention_days: Days of daily rollups to keep; finer tiers keep
+                their own, shorter retention
+            now: Current time (defaults to ``datetime.now(UTC)``)
+
+        Returns:
+            Number of rollup rows deleted
+        """
+        now = now or datetime.now(UTC)
+        deleted = 0
+        for tier in ROLLUP_TIERS:
+            retention = timedelta(days=retention_days)
+            if tier is not ROLLUP_TIERS[-1]:
+                retention = min(tier.retention, retention)
+            result = await db.execute(
+                delete(MetricsRollup).where(
+                    MetricsRollup.tier == tier.name,
+                    MetricsRollup.bucket_start < now - retention,
+                )
+            )
+            deleted += result.rowcount or 0  # type: ignore[attr-defined]
+        await db.commit()
+        return deleted
+
+    @staticmethod
+    async def history(
+        db: AsyncSession, container_id: int, period: timedelta, now: datetime | None = None
+    ) -> list[dict[str, Any]]:
+        """History points for a container, from the tier matching ``period``.
+
+        Rollup points carry the bucket average under the raw metric names
+        plus ``*_max``/``*_p95`` fields. Samples newer than the last closed
+        bucket are appended raw so the chart reaches the present.
+
+        Args:
+            db: Database session
+            container_id: Container ID
+            period: How far back to read
+            now: Current time (defaults to ``datetime.now(UTC)``)
+
+        Returns:
+            Data points ordered by time
+        """
+        now = now or datetime.now(UTC)
+        start_time = now - period
+        tier = select_tier(period)
+        if tier is None:
+            return await MetricsRollupService._raw_points(db, container_id, start_time)
+
+        result = await db.execute(
+            select(MetricsRollup)
+            .where(
+                MetricsRollup.container_id == container_id,
+                MetricsRollup.tier == tier.name,
+                MetricsRollup.bucket_start >= floor_time(start_time, tier.bucket),
+            )
+            .order_by(MetricsRollup.bucket_start)
+        )
+        buckets = result.scalars().all()
+        if not buckets:
+            # Not rolled up yet (fresh install or upgrade): serve raw samples
+            return await MetricsRollupService._raw_points(db, container_id, start_time)
+
+        points = [
+            {
+                "timestamp": b.bucket_start.isoformat(),
+                "cpu_percent": b.cpu_percent_avg,
+                "cpu_percent_max": b.cpu_percent_max,
+                "cpu_percent_p95": b.cpu_percent_p95,
+                "memory_usage": b.memory_usage_avg,
+                "memory_usage_max": b.memory_usage_max,
+                "memory_usage_p95": b.memory_usage_p95,
+                "memory_limit": b.memory_limit,
+                "memory_percent": b.memory_percent_avg,
+                "memory_percent_max": b.memory_percent_max,
+                "memory_percent_p95": b.memory_percent_p95,
+                "network_rx": b.network_rx,
+                "network_tx": b.network_tx,
+                "block_read": b.block_read,
+                "block_write": b.block_write,
+                "pids": round(b.pids_avg),
+            }
+            for b in buckets
+        ]
+        tail_start = _as_utc(buckets[-1].bucket_start) + tier.bucket
+        return points + await MetricsRollupService._raw_points(db, container_id, tail_start)
+
+    @staticmethod
+    async def summary(
+        db: AsyncSession,
+        container_ids: list[int],
+        period: timedelta,
+        points: int,
+        until: datetime,
+    ) -> dict[int, dict[str, Any]]:
+        """Latest sample and a CPU/memory sparkline for many containers.
+
+        Reads every raw sample of the selected containers in
+        ``(until - period, until]`` with one query (plus the chunk store) and
+        averages them into ``points`` equal-width buckets.
+
+        Args:
+            db: Database session
+            container_ids: Containers to summarize
+            period: Sparkline span (raw retention applies, so at most a day
+                or two is useful)
+            points: Number of sparkline buckets
+            until: End of the sparkline (normally the last collection time)
+
+        Returns:
+            Dict mapping container ID → ``{"latest": point | None,
+            "sparkline": {"cpu_percent": [...], "memory_percent": [...]}}``;
+            empty buckets are None
+        """
+        start = until - period
+        result = await db.execute(
+            select(*_RAW_COLUMNS)
+            .where(
+                MetricsHistory.container_id.in_(container_ids),
+                MetricsHistory.collected_at > start,
+                MetricsHistory.collected_at <= until,
+            )
+            .order_by(MetricsHistory.container_id, MetricsHistory.collected_at)
+        )
+        samples: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for sample in result.mappings():
+            samples[sample["container_id"]].append(dict(sample))
+        wanted = set(container_ids)
+        chunked = await metrics_chunk_store.read(db, start)
+        for container_id, columns in chunked.items():
+            if container_id in wanted:
+                samples[container_id] += _chunk_samples(container_id, columns)
+                samples[container_id].sort(key=lambda sample: _as_utc(sample["collected_at"]))
+
+        start_utc = _as_utc(start)
+        until_utc = _as_utc(until)
+        width = period.total_seconds() / points
+        summaries: dict[int, dict[str, Any]] = {}
+        for container_id in container_ids:
+            sums = {name: [0.0] * points for name in ("cpu_percent", "memory_percent")}
+            counts = [0] * points
+            latest = None
+            for sample in samples.get(container_id, []):
+                collected_at = _as_utc(sample["collected_at"])
+                if not start_utc < collected_at <= until_utc:
+                    continue
+                index = min(int((collected_at - start_utc).total_seconds() / width), points - 1)
+                counts[index] += 1
+                for name, values in sums.items():
+                    values[index] += sample[name]
+                latest = sample
+            if latest is not None:
+                latest = dict(latest)
+                latest.pop("container_id", None)
+                latest = {"timestamp": latest.pop("collected_at").isoformat(), **latest}
+            summaries[container_id] = {
+                "latest": latest,
+                "sparkline": {
+                    name: [
+                        round(total / count, 2) if count else None
+                        for total, count in zip(values, counts, strict=True)
+                    ]
+                    for name, values in sums.items()
+                },
+            }
+        return summaries
+
+    @staticmethod
+    async def _raw_points(
+        db: AsyncSession, container_id: int, start_time: datetime
+    ) -> list[dict[str, Any]]:
+        result = await db.execute(
+            select(*_RAW_COLUMNS[1:])
+            .where(
+                MetricsHistory.container_id == container_id,
+                MetricsHistory.collected_at >= start_time,
+            )
+            .order_by(MetricsHistory.collected_at)
+        )
+        samples = [dict(sample) for sample in result.mappings()]
+        chunked = await metrics_chunk_store.read(db, start_time, container_id=container_id)
+        if container_id in chunked:
+            samples += _chunk_samples(container_id, chunked[container_id])
+            samples.sort(key=lambda sample: _as_utc(sample["collected_at"]))
+
+        points = []
+        for sample in samples:
+            sample.pop("container_id", None)
+            collected_at = sample.pop("collected_at")
+            points.append(
+                {"timestamp": collected_at.isoformat() if collected_at else None, **sample}
+            )
+        return points
@@ -266,8 +266,8 @@ class NotificationDispatcher:
         max_attempts = await SettingsService.get_int(
             self.db, "notification_retry_attempts", default=3
         )
-        base_delay = float(
-            await SettingsService.get(self.db, "notification_retry_delay", default="2.0") or "2.0"
+        base_delay = await SettingsService.get_float(
+            self.db, "notification_retry_delay", default=2.0
         )
 
         # Send to all enabled services
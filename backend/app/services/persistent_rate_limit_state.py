@@ -0,0 +1,103 @@
+"""Persistent registry rate-limit budgets.
+
+Registries report how much quota is left: Docker Hub via
+``ratelimit-remaining`` / ``ratelimit-reset`` (``x-ratelimit-*`` on the Hub
+API), GHCR and others via ``Retry-After`` on 429/503. ``RegistryRateLimiter``
+folds those headers into a per-registry ``RegistryBudget``; this module keeps
+the budgets in ``registry_rate_limit_state`` so a restart, or a manual check
+started right after a scheduled run, begins from the last known quota instead
+of the static defaults.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.registry_rate_limiter import RegistryBudget
+
+logger = logging.getLogger(__name__)
+
+
+def _to_epoch(raw: object) -> float | None:
+    """Convert a stored DATETIME (string or datetime) to epoch seconds."""
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        try:
+            raw = datetime.fromisoformat(raw)
+        except ValueError:
+            return None
+    if not isinstance(raw, datetime):
+        return None
+    if raw.tzinfo is None:
+        raw = raw.replace(tzinfo=UTC)
+    return raw.timestamp()
+
+
+def _to_iso(epoch: float | None) -> str | None:
+    """Convert epoch seconds to the ISO string stored in DATETIME columns."""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch, UTC).isoformat()
+
+
+class PersistentRateLimitState:
+    """Registry budgets backed by ``registry_rate_limit_state``."""
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+
+    async def load_all(self) -> dict[str, RegistryBudget]:
+        """Load every stored budget, keyed by normalized registry name."""
+        result = await self._db.execute(
+            text(
+                "SELECT registry, remaining, quota, reset_at, blocked_until "
+                "FROM registry_rate_limit_state"
+            )
+        )
+        budgets: dict[str, RegistryBudget] = {}
+        for registry, remaining, quota, reset_at, blocked_until in result.fetchall():
+            budgets[registry] = RegistryBudget(
+                remaining=remaining,
+                limit=quota,
+                reset_at=_to_epoch(reset_at),
+                blocked_until=_to_epoch(blocked_until),
+            )
+        return budgets
+
+    async def save_all(self, budgets: dict[str, RegistryBudget]) -> None:
+        """Insert or update the given budgets."""
+        if not budgets:
+            return
+        now = datetime.now(UTC).isoformat()
+        for registry, budget in budgets.items():
+            await self._db.execute(
+                text(
+                    """
+                    INSERT INTO registry_rate_limit_state (
+                        registry, remaining, quota, reset_at, blocked_until, updated_at
+                    ) VALUES (
+                        :registry, :remaining, :quota, :reset_at, :blocked_until, :updated_at
+                    )
+                    ON CONFLICT(registry) DO UPDATE SET
+                        remaining = excluded.remaining,
+                        quota = excluded.quota,
+                        reset_at = excluded.reset_at,
+                        blocked_until = excluded.blocked_until,
+                        updated_at = excluded.updated_at
+                    """
+                ),
+                {
+                    "registry": registry,
+                    "remaining": budget.remaining,
+                    "quota": budget.limit,
+                    "reset_at": _to_iso(budget.reset_at),
+                    "blocked_until": _to_iso(budget.blocked_until),
+                    "updated_at": now,
+                },
+            )
+        await self._db.commit()
@@ -7,19 +7,27 @@ with a 304 carrying no body — effectively a free hit. Docker Hub does not
 honor ETag, so its entries fall through to TTL-based eviction.
 
 The in-process ``TagCache`` (15-min TTL in ``registry_client.py``) remains
-the L1 layer; this module is L2.
+the L1 layer; this module is L2, plugged into the tiered cache through
+``PersistentTagBackend``. Every ``RegistryClient.get_all_tags`` sends the
+stored validators and, on 304, calls ``touch()`` instead of re-parsing the
+listing.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+if TYPE_CHECKING:
+    from app.services.tiered_cache import CacheEntry, TieredCache
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_DOCKERHUB_TTL = timedelta(hours=1)
@@ -144,3 +152,59 @@ class PersistentTagCache:
         await self._db.commit()
         deleted: int = result.rowcount or 0  # type: ignore[assignment]
         return deleted
+
+
+class PersistentTagBackend:
+    """Tiered-cache L2 adapter over ``tag_cache_entries``.
+
+    Keys are the L1 tag-cache keys (``"<registry>:<image>"``). Each operation
+    opens its own short-lived session so cache writes never commit a
+    caller's unit of work.
+    """
+
+    def __init__(self, sessions: Callable[[], Any], cache: TieredCache[str, list[str]]):
+        """Initialize the backend.
+
+        Args:
+            sessions: Async session factory (e.g. ``AsyncSessionLocal``)
+            cache: The L1 cache whose TTL policy stored entries follow
+        """
+        self._sessions = sessions
+        self._cache = cache
+
+    @staticmethod
+    def _split(key: str) -> tuple[str, str]:
+        registry, _, image = key.partition(":")
+        return registry, image
+
+    async def get(self, key: str) -> CacheEntry[list[str]] | None:
+        """Load a stored listing as a cache entry aged from its ``fetched_at``."""
+        registry, image = self._split(key)
+        async with self._sessions() as session:
+            listing = await PersistentTagCache(session).get(registry, image)
+        if listing is None:
+            return None
+        return self._cache.make_entry(
+            listing.tags,
+            etag=listing.etag,
+            last_modified=listing.last_modified,
+            stored_at=listing.fetched_at,
+        )
+
+    async def set(self, key: str, entry: CacheEntry[list[str]]) -> None:
+        """Persist a freshly downloaded listing."""
+        registry, image = self._split(key)
+        async with self._sessions() as session:
+            await PersistentTagCache(session).upsert(
+                registry,
+                image,
+                tags=entry.value,
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+            )
+
+    async def touch(self, key: str) -> None:
+        """Confirm a stored listing is unchanged (304)."""
+        registry, image = self._split(key)
+        async with self._sessions() as session:
+            await PersistentTagCache(session).touch(registry, image)
@@ -1,15 +1,25 @@
 """Registry clients for checking Docker image updates."""
 
+import asyncio
 import logging
 import platform
 import re
 from abc import ABC, abstractmethod
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
 from urllib.parse import SplitResult, urljoin, urlsplit
 
 import httpx
 from packaging.version import InvalidVersion, Version
 
+from app.services.metrics import registry_tag_revalidations
+from app.services.persistent_tag_cache import CachedTagListing, PersistentTagBackend
+from app.services.registry_pool import PooledRegistryHTTPClient, get_registry_pool
+from app.services.registry_rate_limiter import RegistryRateLimiter
+from app.services.registry_token_cache import get_token_cache
+from app.services.tiered_cache import TieredCache
+from app.services.version_index import IndexedTag, fingerprint, get_version_index
 from app.utils.retry import async_retry
 from app.utils.security import sanitize_log_message
 
@@ -43,6 +53,18 @@ def _same_origin(url: str, base_url: str) -> bool:
         return False
 
 
+# Accept header for manifest digest probes: ask for the index/list first so
+# the digest matches what ``docker pull`` resolves for a multi-arch tag.
+MANIFEST_ACCEPT = ", ".join(
+    [
+        "application/vnd.oci.image.index.v1+json",
+        "application/vnd.docker.distribution.manifest.list.v2+json",
+        "application/vnd.oci.image.manifest.v1+json",
+        "application/vnd.docker.distribution.manifest.v2+json",
+    ]
+)
+
+
 class RegistryCheckError(Exception):
     """Raised when a registry check fails due to rate limiting or connection issues.
 
@@ -267,70 +289,66 @@ def _is_continuous_major_jump(
     return not missing
 
 
-# Simple in-memory cache for registry tags with TTL
-class TagCache:
-    """Thread-safe in-memory cache for registry tags with TTL."""
+# Upper bound on cached tag lists; each can hold thousands of tags.
+TAG_CACHE_MAX_ENTRIES = 1024
 
-    def __init__(self, ttl_minutes: int = 15) -> None:
-        """Initialize cache with TTL.
 
-        Args:
-            ttl_minutes: Time-to-live in minutes (default: 15)
-        """
-        self._cache: dict[str, dict] = {}
-        self._ttl = timedelta(minutes=ttl_minutes)
+class TagCache(TieredCache[str, list[str]]):
+    """L1 cache for registry tag lists (``tags`` namespace).
 
-    def get(self, key: str) -> list[str] | None:
-        """Get cached tags if not expired.
+    A size-bounded LRU with TTL. Entries that carry an ``ETag`` /
+    ``Last-Modified`` validator are kept for ``revalidate_hours`` past their
+    TTL so the next fetch can send a conditional request and reuse the tag
+    list on ``304 Not Modified``. L2 is ``tag_cache_entries``.
+    """
 
-        Args:
-            key: Cache key (e.g., "dockerhub:nginx")
+    def __init__(
+        self,
+        ttl_minutes: int = 15,
+        revalidate_hours: int = 24,
+        max_entries: int = TAG_CACHE_MAX_ENTRIES,
+        register: bool = False,
+    ) -> None:
+        """Initialize cache with TTL.
 
-        Returns:
-            List of tags or None if expired/missing
+        Args:
+            ttl_minutes: Time-to-live in minutes (default: 15)
+            revalidate_hours: How long expired entries with validators are
+                retained for conditional revalidation (default: 24)
+            max_entries: LRU bound on cached tag lists
+            register: Report stats under the ``tags`` namespace (the global
+                instance does; ad-hoc instances don't)
         """
-        if key not in self._cache:
-            return None
-
-        entry = self._cache[key]
-        if datetime.now(UTC) > entry["expires_at"]:
-            # Expired, remove it
-            del self._cache[key]
-            return None
-
-        return entry["tags"]
+        super().__init__(
+            "tags",
+            max_entries=max_entries,
+            ttl=timedelta(minutes=ttl_minutes),
+            revalidate_window=timedelta(hours=revalidate_hours),
+            register=register,
+        )
 
-    def set(self, key: str, tags: list[str]) -> None:
-        """Store tags in cache with TTL.
+    def get_validators(self, key: str) -> CachedTagListing | None:
+        """Get an entry (fresh or expired) that carries revalidation validators.
 
         Args:
             key: Cache key
-            tags: List of tags to cache
-        """
-        self._cache[key] = {
-            "tags": tags,
-            "expires_at": datetime.now(UTC) + self._ttl,
-        }
-
-    def clear(self) -> None:
-        """Clear all cached entries."""
-        self._cache.clear()
-
-    def cleanup_expired(self) -> int:
-        """Remove expired entries from cache.
 
         Returns:
-            Number of entries removed
+            Cached listing with ``etag``/``last_modified``, or None
         """
-        now = datetime.now(UTC)
-        expired_keys = [key for key, entry in self._cache.items() if now > entry["expires_at"]]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        entry = self.get_entry(key)
+        if entry is None or not entry.has_validator:
+            return None
+        return CachedTagListing(
+            tags=entry.value,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            fetched_at=entry.expires_at - self.ttl,
+        )
 
 
 # Global tag cache instance (15 minute TTL)
-_tag_cache = TagCache(ttl_minutes=15)
+_tag_cache = TagCache(ttl_minutes=15, register=True)
 
 
 ARCH_SUFFIX_PATTERNS = tuple(
@@ -426,8 +444,12 @@ class RegistryClient(ABC):
         elif token:  # Token-only auth (GitHub PAT, etc.)
             headers["Authorization"] = f"Bearer {token}"
 
-        self.client = httpx.AsyncClient(timeout=30.0, headers=headers, auth=auth if auth else None)
         self._registry_name = self.__class__.__name__.replace("Client", "").lower()
+        # Borrow the process-wide keep-alive pool for this registry instead of
+        # owning a client; credentials ride on the view, not the shared client.
+        self.client = PooledRegistryHTTPClient(
+            get_registry_pool(), self._registry_name, headers=headers, auth=auth
+        )
         # Tracks the best CalVer candidate rejected for a SemVer container during the last
         # get_latest_tag() call. Read by TagFetcher / update_checker after the call to surface
         # the mismatch in the UI (similar to latest_major_tag for scope violations).
@@ -437,6 +459,27 @@ class RegistryClient(ABC):
         # FetchTagsResponse.candidate_majors_seen. Empty when the client did
         # not enumerate candidates (e.g. pure digest path).
         self._last_candidate_majors_seen: set[int] = set()
+        # Session factory for the persistent (L2) tag cache. Set by
+        # RegistryClientFactory when a database is available; None keeps
+        # revalidation purely in-process.
+        self._tag_store_sessions: Callable[[], Any] | None = None
+        # Rate limiter of the check run this client serves. Set by
+        # RegistryClientFactory via attach_rate_limiter; bounds intra-request
+        # fan-out (Docker Hub parallel pagination) and receives every
+        # response's rate-limit headers. None outside check runs.
+        self._rate_limiter: RegistryRateLimiter | None = None
+
+    def attach_rate_limiter(self, rate_limiter: RegistryRateLimiter) -> None:
+        """Pace this client with a check run's limiter and feed it rate-limit headers.
+
+        Args:
+            rate_limiter: Check-run rate limiter
+        """
+        self._rate_limiter = rate_limiter
+        registry = self._registry_name
+        self.client.response_hook = lambda response: rate_limiter.observe_response(
+            registry, response
+        )
 
     def _get_cache_key(self, image: str) -> str:
         """Generate cache key for image.
@@ -449,6 +492,140 @@ class RegistryClient(ABC):
         """
         return f"{self._registry_name}:{image}"
 
+    def _tag_store(self) -> PersistentTagBackend | None:
+        """L2 backend for the tag cache, or None when no database is wired."""
+        if self._tag_store_sessions is None:
+            return None
+        return PersistentTagBackend(self._tag_store_sessions, _tag_cache)
+
+    def _tag_image(self, image: str) -> str:
+        """Normalize an image name before tag listing (registry-specific hook)."""
+        return image
+
+    async def get_all_tags(self, image: str) -> list[str]:
+        """Get all available tags for an image with caching.
+
+        Read-through: L1 (``_tag_cache``), then L2 (``tag_cache_entries``),
+        then the registry via ``_fetch_all_tags``. Concurrent calls for the
+        same image share one fetch.
+
+        Args:
+            image: Image name
+
+        Returns:
+            List of tags
+        """
+        image = self._tag_image(image)
+        cache_key = self._get_cache_key(image)
+        tags = await _tag_cache.get_or_load(
+            cache_key,
+            lambda: self._fetch_all_tags(image, cache_key),
+            l2=self._tag_store(),
+            fill=False,
+        )
+        if tags is None:
+            return []
+        return tags
+
+    @abstractmethod
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Fetch all tags from the registry and cache them (L1 miss path).
+
+        Implementations revalidate against ``_tag_cache.get_validators`` and
+        finish through ``_store_tags`` / ``_confirm_not_modified``; failed or
+        partial listings are returned without being cached.
+
+        Args:
+            image: Normalized image name
+            cache_key: Tag cache key for the image
+
+        Returns:
+            List of tags
+        """
+
+    @staticmethod
+    def _conditional_headers(listing: CachedTagListing | None) -> dict[str, str]:
+        """Build ``If-None-Match`` / ``If-Modified-Since`` headers for a listing."""
+        headers: dict[str, str] = {}
+        if listing is None:
+            return headers
+        if listing.etag:
+            headers["If-None-Match"] = listing.etag
+        if listing.last_modified:
+            headers["If-Modified-Since"] = listing.last_modified
+        return headers
+
+    @staticmethod
+    def _response_validators(response: httpx.Response) -> tuple[str | None, str | None]:
+        """Extract ``(etag, last_modified)`` from a tag-list response."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        return (
+            etag if isinstance(etag, str) else None,
+            last_modified if isinstance(last_modified, str) else None,
+        )
+
+    async def _confirm_not_modified(
+        self, cache_key: str, image: str, listing: CachedTagListing
+    ) -> list[str]:
+        """Handle a 304: refresh L1 and L2 without re-downloading tags.
+
+        Args:
+            cache_key: L1 cache key
+            image: Image name (L2 key)
+            listing: The listing the conditional request was validated against
+
+        Returns:
+            The unchanged tag list
+        """
+        registry_tag_revalidations.labels(registry=self._registry_name, result="not_modified").inc()
+        if not _tag_cache.touch(cache_key):
+            # Entry was evicted while the request was in flight: repopulate L1
+            _tag_cache.set(
+                cache_key, listing.tags, etag=listing.etag, last_modified=listing.last_modified
+            )
+        store = self._tag_store()
+        if store is not None:
+            try:
+                await store.touch(cache_key)
+            except Exception as e:  # noqa: BLE001 — L2 is best-effort
+                logger.debug(f"Persistent tag cache touch failed for {image}: {e}")
+        logger.debug(f"Tag list for {image} not modified ({len(listing.tags)} tags)")
+        return listing.tags
+
+    async def _store_tags(
+        self,
+        cache_key: str,
+        image: str,
+        tags: list[str],
+        etag: str | None = None,
+        last_modified: str | None = None,
+        revalidated: bool = False,
+    ) -> None:
+        """Cache a freshly downloaded tag list in L1 and L2.
+
+        Args:
+            cache_key: L1 cache key
+            image: Image name (L2 key)
+            tags: Tag list
+            etag: ``ETag`` of the listing, if the registry sent one
+            last_modified: ``Last-Modified`` of the listing, if sent
+            revalidated: True when this 200 answered a conditional request
+        """
+        _tag_cache.set(cache_key, tags, etag=etag, last_modified=last_modified)
+        if revalidated:
+            registry_tag_revalidations.labels(registry=self._registry_name, result="modified").inc()
+        store = self._tag_store()
+        if store is not None:
+            try:
+                await store.set(
+                    cache_key,
+                    _tag_cache.make_entry(tags, etag=etag, last_modified=last_modified),
+                )
+            except Exception as e:  # noqa: BLE001 — L2 is best-effort
+                logger.debug(f"Persistent tag cache write failed for {image}: {e}")
+        logger.debug(f"Cached {len(tags)} tags for {image}")
+
     async def __aenter__(self) -> RegistryClient:
         """Async context manager entry."""
         return self
@@ -461,7 +638,7 @@ class RegistryClient(ABC):
         return False
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Release the borrowed HTTP client (pooled connections stay open)."""
         await self.client.aclose()
 
     @async_retry(
@@ -516,29 +693,77 @@ class RegistryClient(ABC):
         pass
 
     @abstractmethod
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all available tags for an image.
+    async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
+        """Get metadata for a specific tag.
 
         Args:
             image: Image name
+            tag: Tag name
 
         Returns:
-            List of tags
+            Metadata dict with digest, created_at, etc.
         """
         pass
 
-    @abstractmethod
-    async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
-        """Get metadata for a specific tag.
+    async def get_manifest_digest(self, image: str, tag: str) -> str | None:
+        """Digest of the manifest a tag currently points at.
+
+        Used by the incremental check mode to detect pushes cheaply. The
+        default reads ``get_tag_metadata``; OCI v2 registries override it
+        with a manifest ``HEAD`` (no body, not counted as a pull).
 
         Args:
             image: Image name
             tag: Tag name
 
         Returns:
-            Metadata dict with digest, created_at, etc.
+            Manifest digest, or None when it could not be determined
         """
-        pass
+        metadata = await self.get_tag_metadata(image, tag)
+        if not metadata:
+            return None
+        return metadata.get("digest")
+
+    async def get_listing_marker(self, image: str) -> str | None:
+        """Value that changes whenever the image's tag listing changes.
+
+        The default fingerprints ``get_all_tags``, which is served from the
+        tag cache or revalidated with ``If-None-Match``, so an unchanged
+        listing costs at most a 304.
+
+        Args:
+            image: Image name
+
+        Returns:
+            Listing marker, or None when the listing could not be read
+        """
+        tags = await self.get_all_tags(image)
+        if not tags:
+            return None
+        return fingerprint(tags)
+
+    async def _head_manifest_digest(
+        self, image: str, tag: str, headers: dict[str, str] | None = None
+    ) -> str | None:
+        """``Docker-Content-Digest`` of a ``HEAD /v2/{image}/manifests/{tag}``.
+
+        Args:
+            image: Image name
+            tag: Tag name
+            headers: Extra request headers (e.g. bearer token)
+
+        Returns:
+            Manifest (index) digest, or None on any failure
+        """
+        url = f"{self.BASE_URL}/v2/{image}/manifests/{tag}"
+        request_headers = {"Accept": MANIFEST_ACCEPT, **(headers or {})}
+        try:
+            response = await self.client.head(url, headers=request_headers)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug(f"Manifest HEAD failed for {image}:{tag}: {e}")
+            return None
+        return response.headers.get("Docker-Content-Digest")
 
     async def get_image_labels(self, image: str, tag: str) -> tuple[dict[str, str], str] | None:
         """Fetch OCI/Docker labels from the image config blob.
@@ -723,6 +948,96 @@ class RegistryClient(ABC):
             # Allow any newer version
             return True
 
+    def _index_tag(self, tag: str, position: int, normalize_ls: bool) -> IndexedTag | None:
+        """Parse one tag for the version index (None for non-version tags)."""
+        key = self._normalize_version(tag)
+        if key is None:
+            return None
+        parsed = self._try_parse_version(tag)
+        return IndexedTag(
+            tag=tag,
+            position=position,
+            key=key,
+            rank=(1, parsed) if parsed is not None else (0, tag),
+            variant=self._extract_variant_suffix(tag, normalize_ls=normalize_ls),
+            arch=self._extract_arch_suffix(tag),
+            calver=_is_calver_tag(tag),
+            prerelease=is_prerelease_tag(tag),
+            windows=self._is_windows_image(tag),
+        )
+
+    def _select_latest_tag(
+        self,
+        tags: list[str],
+        current_tag: str,
+        scope: str,
+        *,
+        normalize_ls: bool,
+        include_prereleases: bool = False,
+        version_track: str | None = None,
+        stable_anchor_major: int | None = None,
+    ) -> str | None:
+        """Pick the best update from a full tag list.
+
+        Same result as filtering ``tags`` by prerelease/variant and running
+        ``_compare_versions`` + ``_is_better_version`` over every candidate,
+        but answered from the cached ``VersionIndex`` for this tag list, so
+        repeated checks of an image (scope + major lookups, many containers
+        on one image) parse its tags once.
+
+        Also records the observed majors (``_last_candidate_majors_seen``)
+        and the best rejected CalVer candidate (``_best_cross_scheme_rejected``).
+
+        Args:
+            tags: Every tag of the image, in registry order
+            current_tag: Current tag
+            scope: Update scope (patch, minor, major)
+            normalize_ls: Normalize LinuxServer ls<N> build counters
+            include_prereleases: Include nightly, dev, alpha, beta, rc tags
+            version_track: Override CalVer detection (None=auto, "semver", "calver")
+            stable_anchor_major: Phase 5 anchor bound
+
+        Returns:
+            Best tag, or None
+        """
+        index = get_version_index(
+            tags,
+            lambda tag, position: self._index_tag(tag, position, normalize_ls),
+            options=normalize_ls,
+        )
+        self._last_candidate_majors_seen = set(index.majors)
+
+        current_key = self._normalize_version(current_tag)
+        if current_key is None:
+            return None
+
+        current_arch = self._extract_arch_suffix(current_tag)
+        if current_arch:
+            arches: tuple[str | None, ...] = (current_arch,)
+        elif HOST_ARCH_CANONICAL:
+            arches = (None, canonical_arch_suffix(HOST_ARCH_CANONICAL))
+        else:
+            arches = (None,)
+
+        selection = index.select(
+            current_key,
+            variant=self._extract_variant_suffix(current_tag, normalize_ls=normalize_ls),
+            arches=arches,
+            current_calver=version_track != "semver" and _is_calver_tag(current_tag),
+            scope=scope,
+            include_prereleases=include_prereleases,
+            force_calver=version_track == "calver",
+            stable_anchor_major=stable_anchor_major,
+        )
+
+        rejected = selection.cross_scheme_rejected
+        if rejected is not None and (
+            self._best_cross_scheme_rejected is None
+            or self._is_better_version(rejected, self._best_cross_scheme_rejected)
+        ):
+            self._best_cross_scheme_rejected = rejected
+        return selection.tag
+
     def _normalize_version(self, version: str) -> tuple[int, int, int, tuple] | None:
         """Normalize version strings for comparison.
 
@@ -1027,45 +1342,149 @@ class DockerHubClient(RegistryClient):
 
     BASE_URL = "https://hub.docker.com/v2"
     uses_tag_cache_for_latest: bool = False
+    # Tags per listing page (Hub's maximum page_size).
+    PAGE_SIZE = 100
+    # Page cap for the semver scan (``_get_semver_update``).
+    SEMVER_SCAN_MAX_PAGES = 5
+    # Upper bound on concurrent page requests; the check run's rate limiter
+    # narrows it to Docker Hub's concurrency budget.
+    MAX_PAGE_CONCURRENCY = 4
+
+    # Read page 1, derive the page count from ``count`` and fetch the rest
+    # concurrently. Off = follow ``next`` links one page at a time.
+    parallel_pagination: bool = True
+    # Stop the semver scan once it has passed the current tag. With
+    # ``ordering=last_updated`` later pages only carry tags last pushed
+    # before the current one, so this trusts releases to be pushed in
+    # version order (opt-in). A newer tag listed after the current one shows
+    # the current tag was re-pushed and keeps the scan going; a re-push
+    # whose newer releases all sit on unfetched pages still ends it early.
+    semver_early_exit: bool = False
+
+    def _tag_image(self, image: str) -> str:
+        """Docker Hub uses "library/" for official images."""
+        if "/" not in image:
+            return f"library/{image}"
+        return image
 
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all tags from Docker Hub with caching.
+    @staticmethod
+    def _page_tags(data: dict) -> list[str]:
+        """Tag names of one listing page."""
+        return [tag_data["name"] for tag_data in data.get("results", [])]
+
+    def _page_concurrency(self) -> int:
+        """Concurrent page requests allowed for one listing."""
+        if self._rate_limiter is None:
+            return self.MAX_PAGE_CONCURRENCY
+        return min(self.MAX_PAGE_CONCURRENCY, self._rate_limiter.fanout_budget(self._registry_name))
+
+    def _remaining_pages(self, data: dict, max_pages: int | None = None) -> range | None:
+        """Page numbers left after page 1, derived from the listing's ``count``.
 
         Args:
-            image: Image name (e.g., "nginx" or "library/nginx")
+            data: Page 1 payload
+            max_pages: Optional cap on the total page count
 
         Returns:
-            List of tag names
+            Pages 2..N, or None when the payload carries no usable ``count``
+            (callers then follow ``next`` links)
         """
-        # Docker Hub uses "library/" for official images
-        if "/" not in image:
-            image = f"library/{image}"
+        if not data.get("next"):
+            return range(0)
+        count = data.get("count")
+        if not isinstance(count, int) or isinstance(count, bool):
+            return None
+        pages = -(-count // self.PAGE_SIZE)
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+        return range(2, pages + 1)
 
-        # Check cache first
-        cache_key = self._get_cache_key(image)
-        cached_tags = _tag_cache.get(cache_key)
-        if cached_tags is not None:
-            logger.debug(f"Cache hit for {image} ({len(cached_tags)} tags)")
-            return cached_tags
+    async def _fetch_pages(self, url: str, pages: range) -> list[dict]:
+        """Fetch listing pages concurrently.
 
-        url = f"{self.BASE_URL}/repositories/{image}/tags"
-        tags = []
+        Concurrency is bounded by ``_page_concurrency``. The caller already
+        holds the run's rate-limit slot for this request, so pages are
+        counted against Docker Hub on the limiter rather than each acquiring
+        a slot of their own.
 
-        try:
-            while url:
-                response = await self.client.get(url)
+        Args:
+            url: Page 1 URL (already carrying a query string)
+            pages: Page numbers to fetch
+
+        Returns:
+            Page payloads in page order
+        """
+        if not pages:
+            return []
+        semaphore = asyncio.Semaphore(self._page_concurrency())
+
+        async def fetch(page: int) -> dict:
+            async with semaphore:
+                response = await self.client.get(f"{url}&page={page}")
                 response.raise_for_status()
-                data = response.json()
+                return response.json()
 
-                for tag_data in data.get("results", []):
-                    tags.append(tag_data["name"])
+        tasks = [asyncio.create_task(fetch(page)) for page in pages]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_requests(self._registry_name, len(tasks))
+        logger.debug(f"Fetched {len(tasks)} Docker Hub tag pages concurrently from {url}")
+        return results
+
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Get all tags from Docker Hub.
+
+        With ``parallel_pagination`` the pages after the first are fetched
+        concurrently once page 1's ``count`` gives the page total.
+
+        Args:
+            image: Image name (e.g., "library/nginx")
+            cache_key: Tag cache key for the image
 
+        Returns:
+            List of tag names
+        """
+        url = f"{self.BASE_URL}/repositories/{image}/tags?page_size={self.PAGE_SIZE}"
+        tags: list[str] = []
+
+        # Conditional request on the first page only: Hub orders tags by
+        # last_updated, so any push changes page 1 and its validator.
+        validators = _tag_cache.get_validators(cache_key)
+
+        try:
+            response = await self.client.get(url, headers=self._conditional_headers(validators))
+            if response.status_code == 304 and validators is not None:
+                return await self._confirm_not_modified(cache_key, image, validators)
+            response.raise_for_status()
+            etag, last_modified = self._response_validators(response)
+            data = response.json()
+            tags.extend(self._page_tags(data))
+
+            remaining = self._remaining_pages(data) if self.parallel_pagination else None
+            if remaining is not None:
+                for page in await self._fetch_pages(url, remaining):
+                    tags.extend(self._page_tags(page))
+                # A push between page requests shifts the listing by one;
+                # drop the duplicate it can produce (page 1's new ETag makes
+                # the next fetch a full one anyway).
+                tags = list(dict.fromkeys(tags))
+            else:
                 # Check for pagination — confine the follow to this registry origin
                 # (the server-provided "next" carries our Basic-auth credentials).
                 next_url = data.get("next")
-                if next_url and not self._is_followable_page_url(next_url):
-                    break
-                url = next_url
+                while next_url and self._is_followable_page_url(next_url):
+                    response = await self.client.get(next_url, headers={})
+                    response.raise_for_status()
+                    data = response.json()
+                    tags.extend(self._page_tags(data))
+                    next_url = data.get("next")
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -1088,8 +1507,14 @@ class DockerHubClient(RegistryClient):
             return []
 
         # Cache the results
-        _tag_cache.set(cache_key, tags)
-        logger.debug(f"Cached {len(tags)} tags for {image}")
+        await self._store_tags(
+            cache_key,
+            image,
+            tags,
+            etag=etag,
+            last_modified=last_modified,
+            revalidated=validators is not None,
+        )
 
         return tags
 
@@ -1198,6 +1623,21 @@ class DockerHubClient(RegistryClient):
             logger.error(f"Invalid metadata checking digest for {image}:{current_tag}: {e}")
             return None
 
+    def _scan_passed_current(self, scanned_tags: list[str], current_tag: str) -> bool:
+        """Whether a last_updated-ordered scan has moved past the current tag.
+
+        True once the current tag was seen, at least one tag is listed after
+        it, and none of those is a newer version. A newer version behind it
+        means the current tag was re-pushed out of version order, so older
+        pages may still hold newer releases.
+        """
+        try:
+            position = scanned_tags.index(current_tag)
+        except ValueError:
+            return False
+        after = scanned_tags[position + 1 :]
+        return bool(after) and not any(self._is_better_version(t, current_tag) for t in after)
+
     async def _get_semver_update(
         self,
         image: str,
@@ -1209,7 +1649,9 @@ class DockerHubClient(RegistryClient):
     ) -> str | None:
         """Get semantic version update with optimized API calls.
 
-        Fetches tags in larger pages and stops early when possible.
+        Scans up to ``SEMVER_SCAN_MAX_PAGES`` pages of 100 tags, fetched
+        concurrently after page 1 (``parallel_pagination``) or serially,
+        stopping after the current tag's page with ``semver_early_exit``.
         """
         if "/" not in image:
             image = f"library/{image}"
@@ -1218,71 +1660,51 @@ class DockerHubClient(RegistryClient):
         # versions on page 1 in nearly all cases and pushes historical orphan
         # tags (e.g. lidarr's `8.1.2135`) onto later pages. `name=` is a
         # substring filter — narrowing by current_tag's track when possible.
-        params = ["ordering=last_updated", "page_size=100"]
+        params = ["ordering=last_updated", f"page_size={self.PAGE_SIZE}"]
         name_substring = self._derive_name_substring(current_tag, scope)
         if name_substring:
             params.append(f"name={name_substring}")
         url = f"{self.BASE_URL}/repositories/{image}/tags?" + "&".join(params)
-        best_tag = None
-        current_version = self._parse_semver(current_tag)
-        normalize_ls = self._is_linuxserver_image(image)
-        current_variant = self._extract_variant_suffix(current_tag, normalize_ls=normalize_ls)
-        # Phase 1 (D9): collect majors observed in the candidate set so the
-        # comparator can reject non-contiguous major jumps.
-        candidate_majors: set[int] = set()
-        # Buffer all candidates so we can apply continuity check after we've
-        # scanned every page (otherwise a missing intermediate major on a
-        # later page would falsely reject a valid jump observed earlier).
-        candidates_for_compare: list[str] = []
-        if current_version is not None:
-            candidate_majors.add(current_version[0])
+        # Buffer every scanned tag so selection (and the Phase 1 continuity
+        # check) sees the full candidate set after the last page — a missing
+        # intermediate major on a later page would otherwise falsely reject a
+        # valid jump observed earlier.
+        scanned_tags: list[str] = []
 
         try:
-            # Fetch up to 500 tags (5 pages) max
-            for _page in range(5):
-                response = await self.client.get(url)
-                response.raise_for_status()
-                data = response.json()
-
-                # Process this page's tags
-                for tag_data in data.get("results", []):
-                    tag_name = tag_data["name"]
-
-                    # Skip "latest" tag explicitly (not a version)
-                    if tag_name.lower() == "latest":
-                        continue
-
-                    parsed = self._parse_semver(tag_name)
-                    # Skip non-semantic tags
-                    if not parsed:
-                        continue
-
-                    # Record observed major for continuity check
-                    candidate_majors.add(parsed[0])
-
-                    # Skip pre-release tags unless explicitly allowed
-                    if not include_prereleases and is_prerelease_tag(tag_name):
-                        continue
-
-                    # Skip candidates on a different variant track.
-                    # For LinuxServer images, ls<N> build counters are normalized so
-                    # counter churn (ls131->ls140) does not block updates.
-                    if current_variant != self._extract_variant_suffix(
-                        tag_name, normalize_ls=normalize_ls
+            response = await self.client.get(url)
+            response.raise_for_status()
+            data = response.json()
+            scanned_tags.extend(self._page_tags(data))
+
+            # Do NOT short-circuit on "older" pages by default —
+            # ordering=last_updated means later pages may carry valid
+            # historical major points we need for the continuity check.
+            remaining = None
+            if self.parallel_pagination and not self.semver_early_exit:
+                remaining = self._remaining_pages(data, self.SEMVER_SCAN_MAX_PAGES)
+            if remaining is not None:
+                for page in await self._fetch_pages(url, remaining):
+                    scanned_tags.extend(self._page_tags(page))
+            else:
+                # Fetch up to 500 tags (5 pages) max
+                for _page in range(self.SEMVER_SCAN_MAX_PAGES - 1):
+                    if self.semver_early_exit and self._scan_passed_current(
+                        scanned_tags, current_tag
                     ):
-                        continue
-
-                    candidates_for_compare.append(tag_name)
-
-                # Check for next page (do NOT short-circuit on "older" pages —
-                # ordering=last_updated means later pages may carry valid
-                # historical major points we need for the continuity check).
-                next_url = data.get("next")
-                if not next_url:
-                    break
-                if not self._is_followable_page_url(next_url):
-                    break
-                url = next_url
+                        logger.debug(
+                            f"Semver scan for {image} passed {current_tag}; skipping older pages"
+                        )
+                        break
+                    next_url = data.get("next")
+                    if not next_url:
+                        break
+                    if not self._is_followable_page_url(next_url):
+                        break
+                    response = await self.client.get(next_url)
+                    response.raise_for_status()
+                    data = response.json()
+                    scanned_tags.extend(self._page_tags(data))
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching tags for {image}: {e.response.status_code}")
@@ -1301,37 +1723,18 @@ class DockerHubClient(RegistryClient):
             logger.error(f"Invalid response data fetching tags for {image}: {e}")
             return None
 
-        # Now apply the comparator against the full scanned candidate set so
-        # the continuity check has every observed major.
-        # Per-tag try/except: a single malformed tag must not abort the loop
-        # (or, worse, take down the worker). Worker was hard-exiting on
-        # jellyfin/jellyfin update checks — bug suspected in the comparator
-        # path on a specific tag shape; isolate it instead of crashing.
-        for tag_name in candidates_for_compare:
-            try:
-                if self._compare_versions(
-                    current_tag,
-                    tag_name,
-                    scope,
-                    version_track,
-                    stable_anchor_major=stable_anchor_major,
-                    available_majors=candidate_majors,
-                ):
-                    if best_tag is None or self._is_better_version(tag_name, best_tag):
-                        best_tag = tag_name
-            except Exception:
-                logger.exception(
-                    "Comparator crashed on %s vs candidate %r (scope=%s, track=%s, anchor=%s)",
-                    image,
-                    tag_name,
-                    scope,
-                    version_track,
-                    stable_anchor_major,
-                )
-                continue
-
-        # Expose observed majors so the caller can pass to FetchTagsResponse.
-        self._last_candidate_majors_seen = set(candidate_majors)
+        best_tag = self._select_latest_tag(
+            scanned_tags,
+            current_tag,
+            scope,
+            normalize_ls=self._is_linuxserver_image(image),
+            include_prereleases=include_prereleases,
+            version_track=version_track,
+            stable_anchor_major=stable_anchor_major,
+        )
+        current_version = self._parse_semver(current_tag)
+        if current_version is not None:
+            self._last_candidate_majors_seen.add(current_version[0])
         return best_tag
 
     @staticmethod
@@ -1365,6 +1768,26 @@ class DockerHubClient(RegistryClient):
             return f"{parts[0]}."
         return None
 
+    async def get_listing_marker(self, image: str) -> str | None:
+        """Most recently pushed tag and its push time.
+
+        One ``page_size=1`` request instead of paginating the full listing:
+        every push to any tag changes the newest ``last_updated`` entry.
+        """
+        image = self._tag_image(image)
+        url = f"{self.BASE_URL}/repositories/{image}/tags?page_size=1&ordering=last_updated"
+        try:
+            response = await self.client.get(url)
+            response.raise_for_status()
+            results = response.json().get("results", [])
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"Docker Hub listing marker failed for {image}: {e}")
+            return None
+        if not results:
+            return None
+        newest = results[0]
+        return f"{newest.get('name')}@{newest.get('last_updated')}"
+
     async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
         """Get tag metadata from Docker Hub."""
         if "/" not in image:
@@ -1419,7 +1842,7 @@ class GHCRClient(RegistryClient):
         super().__init__(username=None, token=None)
 
     async def _get_bearer_token(self, image: str, scope: str = "pull") -> str | None:
-        """Get OAuth2 bearer token for GHCR.
+        """Get OAuth2 bearer token for GHCR, reusing a cached one when fresh.
 
         Args:
             image: Image name (e.g., "user/repo")
@@ -1428,11 +1851,31 @@ class GHCRClient(RegistryClient):
         Returns:
             Bearer token or None
         """
+        return await get_token_cache().get_or_fetch(
+            "ghcr",
+            image,
+            scope,
+            lambda: self._fetch_bearer_token(image, scope),
+            principal=self._username,
+        )
+
+    async def _fetch_bearer_token(
+        self, image: str, scope: str = "pull"
+    ) -> tuple[str, int | None] | None:
+        """Request a new bearer token from the GHCR token endpoint.
+
+        Args:
+            image: Image name (e.g., "user/repo")
+            scope: Access scope (default: pull)
+
+        Returns:
+            ``(token, expires_in)`` or None on failure
+        """
         params = {"scope": f"repository:{image}:{scope}", "service": "ghcr.io"}
 
         try:
-            # Use separate httpx client for token request with Basic Auth
-            # This ensures we don't mix Basic Auth and Bearer token in subsequent requests
+            # Basic Auth is passed per request (never stored on the pooled
+            # client) so it doesn't mix with the Bearer token on API calls.
             auth = None
             if self._username and self._token:
                 auth = httpx.BasicAuth(self._username, self._token)
@@ -1442,18 +1885,20 @@ class GHCRClient(RegistryClient):
             else:
                 logger.info("GHCR: No credentials provided for token request (anonymous)")
 
-            async with httpx.AsyncClient(timeout=30.0) as token_client:
-                response = await token_client.get(self.TOKEN_URL, params=params, auth=auth)
-                response.raise_for_status()
-                data = response.json()
-                token = data.get("token")
-                if token:
-                    logger.info(
-                        f"GHCR: Successfully obtained bearer token for {image} (token length: {len(token)})"
-                    )
-                else:
-                    logger.warning(f"GHCR: Token response did not contain a token for {image}")
-                return token
+            if auth is not None:
+                response = await self.client.get(self.TOKEN_URL, params=params, auth=auth)
+            else:
+                response = await self.client.get(self.TOKEN_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
+            token = data.get("token")
+            if not token:
+                logger.warning(f"GHCR: Token response did not contain a token for {image}")
+                return None
+            logger.info(
+                f"GHCR: Successfully obtained bearer token for {image} (token length: {len(token)})"
+            )
+            return token, data.get("expires_in")
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching GHCR token for {image}: {e.response.status_code}")
             return None
@@ -1467,24 +1912,18 @@ class GHCRClient(RegistryClient):
             logger.error(f"Invalid response fetching GHCR token for {image}: {e}")
             return None
 
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all tags from GHCR with caching.
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Get all tags from GHCR.
 
         GHCR uses Docker Registry V2 API with OAuth2 Bearer tokens.
 
         Args:
             image: Image name (e.g., "user/repo")
+            cache_key: Tag cache key for the image
 
         Returns:
             List of tag names
         """
-        # Check cache first
-        cache_key = self._get_cache_key(image)
-        cached_tags = _tag_cache.get(cache_key)
-        if cached_tags is not None:
-            logger.debug(f"Cache hit for {image} ({len(cached_tags)} tags)")
-            return cached_tags
-
         # Get bearer token
         token = await self._get_bearer_token(image, "pull")
         if not token:
@@ -1493,11 +1932,22 @@ class GHCRClient(RegistryClient):
         tags: list[str] = []
         url = f"{self.BASE_URL}/v2/{image}/tags/list?n=1000"
         headers = {"Authorization": f"Bearer {token}"}
+        validators = _tag_cache.get_validators(cache_key)
+        request_headers = {**headers, **self._conditional_headers(validators)}
+        etag: str | None = None
+        last_modified: str | None = None
+        pages = 0
 
         try:
             while url:
-                response = await self.client.get(url, headers=headers)
+                response = await self.client.get(url, headers=request_headers)
+                if pages == 0 and response.status_code == 304 and validators is not None:
+                    return await self._confirm_not_modified(cache_key, image, validators)
                 response.raise_for_status()
+                if pages == 0:
+                    etag, last_modified = self._response_validators(response)
+                    request_headers = headers
+                pages += 1
                 data = response.json()
                 tags.extend(data.get("tags", []))
 
@@ -1514,13 +1964,25 @@ class GHCRClient(RegistryClient):
                 else:
                     break
 
-            # Cache the results
-            _tag_cache.set(cache_key, tags)
-            logger.debug(f"Cached {len(tags)} tags for {image}")
+            # tags/list is sorted by name, so a page-1 validator does not
+            # cover later pages; only keep validators for single-page lists.
+            if pages > 1:
+                etag = last_modified = None
+            await self._store_tags(
+                cache_key,
+                image,
+                tags,
+                etag=etag,
+                last_modified=last_modified,
+                revalidated=validators is not None,
+            )
 
             return tags
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching GHCR tags for {image}: {e.response.status_code}")
+            if e.response.status_code == 401:
+                # The cached token was rejected; force a fresh one next time.
+                get_token_cache().invalidate("ghcr", image, "pull", principal=self._username)
             raise RegistryCheckError(
                 f"HTTP error fetching GHCR tags for {image}: {e.response.status_code}",
                 status_code=e.response.status_code,
@@ -1574,52 +2036,24 @@ class GHCRClient(RegistryClient):
         if not tags:
             return None
 
-        # Filter out "latest" and non-semantic tags
-        version_tags = [
-            t for t in tags if t.lower() != "latest" and self._parse_semver(t) is not None
-        ]
-
-        # Filter out pre-release tags unless explicitly allowed
-        if not include_prereleases:
-            version_tags = [t for t in version_tags if not is_prerelease_tag(t)]
-
-        # Filter tags to only include those on the same variant track.
-        # For LinuxServer images, ls<N> build counters are normalized so
-        # counter churn (ls131->ls140) does not block updates.
-        normalize_ls = self._is_linuxserver_image(image)
-        current_variant = self._extract_variant_suffix(current_tag, normalize_ls=normalize_ls)
-        version_tags = [
-            tag
-            for tag in version_tags
-            if self._extract_variant_suffix(tag, normalize_ls=normalize_ls) == current_variant
-        ]
-
-        # Phase 1 (D9): collect observed majors across the full tag list
-        # (including filtered-out variants/prereleases) so the comparator can
-        # judge continuity. Otherwise legitimate +2 jumps that skipped a
-        # prerelease-only major would false-reject.
-        candidate_majors: set[int] = set()
-        for raw_tag in tags:
-            parsed = self._parse_semver(raw_tag)
-            if parsed is not None:
-                candidate_majors.add(parsed[0])
-
-        # Find best match
-        best_tag = None
-        for tag in version_tags:
-            if self._compare_versions(
-                current_tag,
-                tag,
-                scope,
-                version_track,
-                stable_anchor_major=stable_anchor_major,
-                available_majors=candidate_majors,
-            ):
-                if best_tag is None or self._is_better_version(tag, best_tag):
-                    best_tag = tag
+        # Filtering (prerelease, variant track, arch, scheme, scope, anchor,
+        # Phase 1 continuity) runs against the cached per-image version index.
+        return self._select_latest_tag(
+            tags,
+            current_tag,
+            scope,
+            normalize_ls=self._is_linuxserver_image(image),
+            include_prereleases=include_prereleases,
+            version_track=version_track,
+            stable_anchor_major=stable_anchor_major,
+        )
 
-        self._last_candidate_majors_seen = set(candidate_majors)
-        return best_tag
+    async def get_manifest_digest(self, image: str, tag: str) -> str | None:
+        """Manifest digest via ``HEAD`` with a pull token."""
+        token = await self._get_bearer_token(image, "pull")
+        if not token:
+            return None
+        return await self._head_manifest_digest(image, tag, {"Authorization": f"Bearer {token}"})
 
     async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
         """Get tag metadata from GHCR."""
@@ -1666,7 +2100,7 @@ class LSCRClient(RegistryClient):
     TOKEN_URL = "https://ghcr.io/token"  # LSCR uses GHCR for authentication
 
     async def _get_bearer_token(self, image: str, scope: str = "pull") -> str | None:
-        """Get OAuth2 bearer token for LSCR.
+        """Get OAuth2 bearer token for LSCR, reusing a cached one when fresh.
 
         Args:
             image: Image name (e.g., "linuxserver/plex")
@@ -1675,6 +2109,22 @@ class LSCRClient(RegistryClient):
         Returns:
             Bearer token or None
         """
+        return await get_token_cache().get_or_fetch(
+            "lscr", image, scope, lambda: self._fetch_bearer_token(image, scope)
+        )
+
+    async def _fetch_bearer_token(
+        self, image: str, scope: str = "pull"
+    ) -> tuple[str, int | None] | None:
+        """Request a new anonymous bearer token for LSCR.
+
+        Args:
+            image: Image name (e.g., "linuxserver/plex")
+            scope: Access scope (default: pull)
+
+        Returns:
+            ``(token, expires_in)`` or None on failure
+        """
         params = {
             "scope": f"repository:{image}:{scope}",
             "service": "ghcr.io",  # LSCR uses GHCR service
@@ -1684,7 +2134,10 @@ class LSCRClient(RegistryClient):
             response = await self.client.get(self.TOKEN_URL, params=params)
             response.raise_for_status()
             data = response.json()
-            return data.get("token")
+            token = data.get("token")
+            if not token:
+                return None
+            return token, data.get("expires_in")
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching LSCR token for {image}: {e.response.status_code}")
             return None
@@ -1698,24 +2151,18 @@ class LSCRClient(RegistryClient):
             logger.error(f"Invalid response fetching LSCR token for {image}: {e}")
             return None
 
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all tags from LSCR with caching.
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Get all tags from LSCR.
 
         LSCR uses Docker Registry V2 API with OAuth2 Bearer tokens.
 
         Args:
             image: Image name (e.g., "linuxserver/plex")
+            cache_key: Tag cache key for the image
 
         Returns:
             List of tag names
         """
-        # Check cache first
-        cache_key = self._get_cache_key(image)
-        cached_tags = _tag_cache.get(cache_key)
-        if cached_tags is not None:
-            logger.debug(f"Cache hit for {image} ({len(cached_tags)} tags)")
-            return cached_tags
-
         # Get bearer token
         token = await self._get_bearer_token(image, "pull")
         if not token:
@@ -1724,11 +2171,22 @@ class LSCRClient(RegistryClient):
         tags: list[str] = []
         url = f"{self.BASE_URL}/v2/{image}/tags/list?n=1000"
         headers = {"Authorization": f"Bearer {token}"}
+        validators = _tag_cache.get_validators(cache_key)
+        request_headers = {**headers, **self._conditional_headers(validators)}
+        etag: str | None = None
+        last_modified: str | None = None
+        pages = 0
 
         try:
             while url:
-                response = await self.client.get(url, headers=headers)
+                response = await self.client.get(url, headers=request_headers)
+                if pages == 0 and response.status_code == 304 and validators is not None:
+                    return await self._confirm_not_modified(cache_key, image, validators)
                 response.raise_for_status()
+                if pages == 0:
+                    etag, last_modified = self._response_validators(response)
+                    request_headers = headers
+                pages += 1
                 data = response.json()
                 tags.extend(data.get("tags", []))
 
@@ -1744,13 +2202,25 @@ class LSCRClient(RegistryClient):
                 else:
                     break
 
-            # Cache the results
-            _tag_cache.set(cache_key, tags)
-            logger.debug(f"Cached {len(tags)} tags for {image}")
+            # tags/list is sorted by name, so a page-1 validator does not
+            # cover later pages; only keep validators for single-page lists.
+            if pages > 1:
+                etag = last_modified = None
+            await self._store_tags(
+                cache_key,
+                image,
+                tags,
+                etag=etag,
+                last_modified=last_modified,
+                revalidated=validators is not None,
+            )
 
             return tags
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching LSCR tags for {image}: {e.response.status_code}")
+            if e.response.status_code == 401:
+                # The cached token was rejected; force a fresh one next time.
+                get_token_cache().invalidate("lscr", image, "pull")
             raise RegistryCheckError(
                 f"HTTP error fetching LSCR tags for {image}: {e.response.status_code}",
                 status_code=e.response.status_code,
@@ -1807,40 +2277,22 @@ class LSCRClient(RegistryClient):
         # All LSCR images are LinuxServer. Normalize ls<N> counters and composite
         # hash+ls<N> suffixes (e.g., f737b826c-ls284) to a stable 'ls' token so
         # build-counter churn does not block updates across releases.
-        current_variant = self._extract_variant_suffix(current_tag, normalize_ls=True)
-        version_tags = []
-        # Phase 1 (D9): collect majors across the entire tag list.
-        candidate_majors: set[int] = set()
-        for t in tags:
-            parsed = self._parse_semver(t)
-            if parsed is not None:
-                candidate_majors.add(parsed[0])
-            # Skip pre-release tags unless explicitly allowed
-            if not include_prereleases and is_prerelease_tag(t):
-                continue
-            # Skip candidates on a different variant track
-            if self._extract_variant_suffix(t, normalize_ls=True) != current_variant:
-                continue
-            # Only include tags that have valid semantic versions
-            if parsed is not None:
-                version_tags.append(t)
-
-        # Find best match
-        best_tag = None
-        for tag in version_tags:
-            if self._compare_versions(
-                current_tag,
-                tag,
-                scope,
-                version_track,
-                stable_anchor_major=stable_anchor_major,
-                available_majors=candidate_majors,
-            ):
-                if best_tag is None or self._is_better_version(tag, best_tag):
-                    best_tag = tag
+        return self._select_latest_tag(
+            tags,
+            current_tag,
+            scope,
+            normalize_ls=True,
+            include_prereleases=include_prereleases,
+            version_track=version_track,
+            stable_anchor_major=stable_anchor_major,
+        )
 
-        self._last_candidate_majors_seen = set(candidate_majors)
-        return best_tag
+    async def get_manifest_digest(self, image: str, tag: str) -> str | None:
+        """Manifest digest via ``HEAD`` with a pull token."""
+        token = await self._get_bearer_token(image, "pull")
+        if not token:
+            return None
+        return await self._head_manifest_digest(image, tag, {"Authorization": f"Bearer {token}"})
 
     async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
         """Get tag metadata from LSCR."""
@@ -1975,35 +2427,39 @@ class GCRClient(RegistryClient):
 
     BASE_URL = "https://gcr.io"
 
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all tags from GCR with caching.
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Get all tags from GCR.
 
         GCR uses Docker Registry V2 API.
 
         Args:
             image: Image name (e.g., "cadvisor/cadvisor")
+            cache_key: Tag cache key for the image
 
         Returns:
             List of tag names
         """
-        # Check cache first
-        cache_key = self._get_cache_key(image)
-        cached_tags = _tag_cache.get(cache_key)
-        if cached_tags is not None:
-            logger.debug(f"Cache hit for {image} ({len(cached_tags)} tags)")
-            return cached_tags
-
         url = f"{self.BASE_URL}/v2/{image}/tags/list"
+        validators = _tag_cache.get_validators(cache_key)
 
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self._conditional_headers(validators))
+            if response.status_code == 304 and validators is not None:
+                return await self._confirm_not_modified(cache_key, image, validators)
             response.raise_for_status()
             data = response.json()
             tags = data.get("tags", [])
+            etag, last_modified = self._response_validators(response)
 
             # Cache the results
-            _tag_cache.set(cache_key, tags)
-            logger.debug(f"Cached {len(tags)} tags for {image}")
+            await self._store_tags(
+                cache_key,
+                image,
+                tags,
+                etag=etag,
+                last_modified=last_modified,
+                revalidated=validators is not None,
+            )
 
             return tags
         except httpx.HTTPStatusError as e:
@@ -2061,49 +2517,21 @@ class GCRClient(RegistryClient):
         if not tags:
             return None
 
-        # Filter out "latest" and non-semantic tags
-        version_tags = [
-            t for t in tags if t.lower() != "latest" and self._parse_semver(t) is not None
-        ]
-
-        # Filter out pre-release tags unless explicitly allowed
-        if not include_prereleases:
-            version_tags = [t for t in version_tags if not is_prerelease_tag(t)]
-
-        # Filter tags to only include those on the same variant track.
-        # For LinuxServer images, ls<N> build counters are normalized so
-        # counter churn (ls131->ls140) does not block updates.
-        normalize_ls = self._is_linuxserver_image(image)
-        current_variant = self._extract_variant_suffix(current_tag, normalize_ls=normalize_ls)
-        version_tags = [
-            tag
-            for tag in version_tags
-            if self._extract_variant_suffix(tag, normalize_ls=normalize_ls) == current_variant
-        ]
-
-        # Phase 1 (D9): collect candidate majors for continuity check
-        candidate_majors: set[int] = set()
-        for raw_tag in tags:
-            parsed = self._parse_semver(raw_tag)
-            if parsed is not None:
-                candidate_majors.add(parsed[0])
-
-        # Find best match
-        best_tag = None
-        for tag in version_tags:
-            if self._compare_versions(
-                current_tag,
-                tag,
-                scope,
-                version_track,
-                stable_anchor_major=stable_anchor_major,
-                available_majors=candidate_majors,
-            ):
-                if best_tag is None or self._is_better_version(tag, best_tag):
-                    best_tag = tag
+        # Filtering (prerelease, variant track, arch, scheme, scope, anchor,
+        # Phase 1 continuity) runs against the cached per-image version index.
+        return self._select_latest_tag(
+            tags,
+            current_tag,
+            scope,
+            normalize_ls=self._is_linuxserver_image(image),
+            include_prereleases=include_prereleases,
+            version_track=version_track,
+            stable_anchor_major=stable_anchor_major,
+        )
 
-        self._last_candidate_majors_seen = set(candidate_majors)
-        return best_tag
+    async def get_manifest_digest(self, image: str, tag: str) -> str | None:
+        """Manifest digest via ``HEAD``."""
+        return await self._head_manifest_digest(image, tag)
 
     async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
         """Get tag metadata from GCR."""
@@ -2138,35 +2566,39 @@ class QuayClient(RegistryClient):
 
     BASE_URL = "https://quay.io"
 
-    async def get_all_tags(self, image: str) -> list[str]:
-        """Get all tags from Quay.io with caching.
+    async def _fetch_all_tags(self, image: str, cache_key: str) -> list[str]:
+        """Get all tags from Quay.io.
 
         Quay uses Docker Registry V2 API.
 
         Args:
             image: Image name (e.g., "prometheus/node-exporter")
+            cache_key: Tag cache key for the image
 
         Returns:
             List of tag names
         """
-        # Check cache first
-        cache_key = self._get_cache_key(image)
-        cached_tags = _tag_cache.get(cache_key)
-        if cached_tags is not None:
-            logger.debug(f"Cache hit for {image} ({len(cached_tags)} tags)")
-            return cached_tags
-
         url = f"{self.BASE_URL}/v2/{image}/tags/list"
+        validators = _tag_cache.get_validators(cache_key)
 
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self._conditional_headers(validators))
+            if response.status_code == 304 and validators is not None:
+                return await self._confirm_not_modified(cache_key, image, validators)
             response.raise_for_status()
             data = response.json()
             tags = data.get("tags", [])
+            etag, last_modified = self._response_validators(response)
 
             # Cache the results
-            _tag_cache.set(cache_key, tags)
-            logger.debug(f"Cached {len(tags)} tags for {image}")
+            await self._store_tags(
+                cache_key,
+                image,
+                tags,
+                etag=etag,
+                last_modified=last_modified,
+                revalidated=validators is not None,
+            )
 
             return tags
         except httpx.HTTPStatusError as e:
@@ -2224,49 +2656,21 @@ class QuayClient(RegistryClient):
         if not tags:
             return None
 
-        # Filter out "latest" and non-semantic tags
-        version_tags = [
-            t for t in tags if t.lower() != "latest" and self._parse_semver(t) is not None
-        ]
-
-        # Filter out pre-release tags unless explicitly allowed
-        if not include_prereleases:
-            version_tags = [t for t in version_tags if not is_prerelease_tag(t)]
-
-        # Filter tags to only include those on the same variant track.
-        # For LinuxServer images, ls<N> build counters are normalized so
-        # counter churn (ls131->ls140) does not block updates.
-        normalize_ls = self._is_linuxserver_image(image)
-        current_variant = self._extract_variant_suffix(current_tag, normalize_ls=normalize_ls)
-        version_tags = [
-            tag
-            for tag in version_tags
-            if self._extract_variant_suffix(tag, normalize_ls=normalize_ls) == current_variant
-        ]
-
-        # Phase 1 (D9): collect candidate majors for continuity check
-        candidate_majors: set[int] = set()
-        for raw_tag in tags:
-            parsed = self._parse_semver(raw_tag)
-            if parsed is not None:
-                candidate_majors.add(parsed[0])
-
-        # Find best match
-        best_tag = None
-        for tag in version_tags:
-            if self._compare_versions(
-                current_tag,
-                tag,
-                scope,
-                version_track,
-                stable_anchor_major=stable_anchor_major,
-                available_majors=candidate_majors,
-            ):
-                if best_tag is None or self._is_better_version(tag, best_tag):
-                    best_tag = tag
+        # Filtering (prerelease, variant track, arch, scheme, scope, anchor,
+        # Phase 1 continuity) runs against the cached per-image version index.
+        return self._select_latest_tag(
+            tags,
+            current_tag,
+            scope,
+            normalize_ls=self._is_linuxserver_image(image),
+            include_prereleases=include_prereleases,
+            version_track=version_track,
+            stable_anchor_major=stable_anchor_major,
+        )
 
-        self._last_candidate_majors_seen = set(candidate_majors)
-        return best_tag
+    async def get_manifest_digest(self, image: str, tag: str) -> str | None:
+        """Manifest digest via ``HEAD``."""
+        return await self._head_manifest_digest(image, tag)
 
     async def get_tag_metadata(self, image: str, tag: str) -> dict | None:
         """Get tag metadata from Quay.io."""
@@ -2300,16 +2704,21 @@ class RegistryClientFactory:
     """Factory for creating registry clients."""
 
     @staticmethod
-    async def get_client(registry: str, db=None) -> RegistryClient:
+    async def get_client(
+        registry: str, db=None, rate_limiter: RegistryRateLimiter | None = None
+    ) -> RegistryClient:
         """Get registry client by name with authentication.
 
         Args:
             registry: Registry name (dockerhub, ghcr, lscr, gcr, quay)
             db: Optional database session for loading credentials
+            rate_limiter: Check-run rate limiter (fan-out bound, rate-limit header feedback)
 
         Returns:
             Registry client instance
         """
+        from app.services.settings_service import SettingsService
+
         registry = registry.lower()
 
         # Map docker.io to dockerhub
@@ -2321,8 +2730,6 @@ class RegistryClientFactory:
         token = None
 
         if db:
-            from app.services.settings_service import SettingsService
-
             if registry == "dockerhub":
                 username = await SettingsService.get(db, "dockerhub_username")
                 token = await SettingsService.get(db, "dockerhub_token")
@@ -2331,15 +2738,47 @@ class RegistryClientFactory:
                 token = await SettingsService.get(db, "ghcr_token")
 
         # Create client with credentials
+        client: RegistryClient
         if registry == "dockerhub":
-            return DockerHubClient(username=username, token=token)
+            client = DockerHubClient(username=username, token=token)
         elif registry == "ghcr":
-            return GHCRClient(username=username, token=token)
+            client = GHCRClient(username=username, token=token)
         elif registry == "lscr":
-            return LSCRClient()
+            client = LSCRClient()
         elif registry == "gcr":
-            return GCRClient()
+            client = GCRClient()
         elif registry == "quay":
-            return QuayClient()
+            client = QuayClient()
         else:
             raise ValueError(f"Unsupported registry: {registry}")
+
+        if db:
+            # Persistent tag cache writes use their own short-lived sessions so
+            # a 304 confirmation never commits the caller's unit of work.
+            from app.database import AsyncSessionLocal
+
+            client._tag_store_sessions = AsyncSessionLocal
+
+            if isinstance(client, DockerHubClient):
+                client.parallel_pagination = await SettingsService.get_bool(
+                    db, "dockerhub_parallel_pagination", default=True
+                )
+                client.semver_early_exit = await SettingsService.get_bool(
+                    db, "dockerhub_semver_early_exit", default=False
+                )
+
+        if rate_limiter is not None:
+            client.attach_rate_limiter(rate_limiter)
+        return client
+
+
+# Settings that change which credentials registry clients authenticate with.
+REGISTRY_CREDENTIAL_SETTINGS = frozenset(
+    {"dockerhub_username", "dockerhub_token", "ghcr_username", "ghcr_token"}
+)
+
+
+def clear_tokens_on_credential_change(keys: frozenset[str]) -> None:
+    """Settings change listener: drop bearer tokens minted with old credentials."""
+    if keys & REGISTRY_CREDENTIAL_SETTINGS:
+        get_token_cache().clear()
@@ -0,0 +1,301 @@
+"""Process-wide HTTP connection pool shared by all registry clients.
+
+Registry clients used to build a fresh ``httpx.AsyncClient`` per tag fetch,
+paying a TCP + TLS handshake against hub.docker.com / ghcr.io / lscr.io for
+every container in a check run. This module keeps one long-lived, keep-alive
+(and, when ``h2`` is installed, HTTP/2 multiplexed) ``httpx.AsyncClient`` per
+registry. Registry clients borrow it through ``PooledRegistryHTTPClient``,
+which carries the per-client credentials and injects them per request so the
+shared client itself never holds auth state.
+
+Pool limits are per registry (``REGISTRY_POOL_LIMITS``) and can be overridden
+with ``TIDEWATCH_REGISTRY_POOL_LIMITS`` (``"dockerhub=4,ghcr=20"`` — the value
+is ``max_connections`` for that registry). The app lifespan closes the pool on
+shutdown via ``close_registry_pool()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RegistryPoolLimits:
+    """Connection pool configuration for one registry.
+
+    Attributes:
+        max_connections: Maximum open connections (HTTP/1.1) to the registry
+        max_keepalive_connections: Idle connections kept warm between requests
+        keepalive_expiry: Seconds an idle connection is kept before closing
+        timeout: Per-request timeout in seconds
+        http2: Negotiate HTTP/2 when the ``h2`` package is available
+    """
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 60.0
+    timeout: float = 30.0
+    http2: bool = True
+
+
+# Docker Hub is heavily rate limited, so a handful of warm connections is
+# plenty; GHCR/LSCR serve the bulk of linuxserver/* traffic and benefit from
+# more parallel streams.
+REGISTRY_POOL_LIMITS: dict[str, RegistryPoolLimits] = {
+    "dockerhub": RegistryPoolLimits(max_connections=6, max_keepalive_connections=4),
+    "ghcr": RegistryPoolLimits(max_connections=20, max_keepalive_connections=10),
+    "lscr": RegistryPoolLimits(max_connections=20, max_keepalive_connections=10),
+    "gcr": RegistryPoolLimits(max_connections=10, max_keepalive_connections=5),
+    "quay": RegistryPoolLimits(max_connections=10, max_keepalive_connections=5),
+}
+
+DEFAULT_POOL_LIMITS = RegistryPoolLimits()
+
+
+def _http2_available() -> bool:
+    """Return True when httpx can negotiate HTTP/2 (``h2`` is installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _env_pool_limits() -> dict[str, RegistryPoolLimits]:
+    """Apply ``TIDEWATCH_REGISTRY_POOL_LIMITS`` overrides to the defaults."""
+    limits = dict(REGISTRY_POOL_LIMITS)
+    raw = os.environ.get("TIDEWATCH_REGISTRY_POOL_LIMITS", "").strip()
+    if not raw:
+        return limits
+    for pair in raw.split(","):
+        registry, _, value = pair.partition("=")
+        registry = registry.strip().lower()
+        try:
+            max_connections = int(value.strip())
+            if not registry or max_connections < 1:
+                raise ValueError(pair)
+        except ValueError:
+            logger.warning("Ignoring invalid TIDEWATCH_REGISTRY_POOL_LIMITS entry %r", pair)
+            continue
+        base = limits.get(registry, DEFAULT_POOL_LIMITS)
+        limits[registry] = replace(
+            base,
+            max_connections=max_connections,
+            max_keepalive_connections=min(base.max_keepalive_connections, max_connections),
+        )
+    return limits
+
+
+class RegistryConnectionPool:
+    """Lazily-created, per-registry ``httpx.AsyncClient`` instances.
+
+    Clients are bound to the event loop that created them; if the running
+    loop changes (tests, or a worker thread running its own loop) a fresh
+    client is created for that registry instead of reusing sockets owned by
+    a dead loop.
+    """
+
+    def __init__(self, limits: dict[str, RegistryPoolLimits] | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            limits: Per-registry limits; defaults to ``REGISTRY_POOL_LIMITS``
+                with ``TIDEWATCH_REGISTRY_POOL_LIMITS`` overrides applied.
+        """
+        self._limits = limits if limits is not None else _env_pool_limits()
+        self._clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop | None]] = {}
+        self._retiring: set[httpx.AsyncClient] = set()
+        self._retire_tasks: set[asyncio.Task[None]] = set()
+        self._http2 = _http2_available()
+
+    def limits_for(self, registry: str) -> RegistryPoolLimits:
+        """Return the effective limits for a registry."""
+        return self._limits.get(registry.lower(), DEFAULT_POOL_LIMITS)
+
+    def configure(self, registry: str, limits: RegistryPoolLimits) -> None:
+        """Replace the limits for a registry.
+
+        The existing client (if any) is dropped from the pool and closed once
+        its request timeout has elapsed, so in-flight requests on it complete
+        normally.
+        """
+        registry = registry.lower()
+        previous = self.limits_for(registry)
+        self._limits[registry] = limits
+        entry = self._clients.pop(registry, None)
+        if entry is not None:
+            self._retire(*entry, grace=previous.timeout)
+
+    def get_client(self, registry: str) -> httpx.AsyncClient:
+        """Borrow the shared client for a registry, creating it on first use."""
+        registry = registry.lower()
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        entry = self._clients.get(registry)
+        if entry is not None:
+            client, owner_loop = entry
+            if not client.is_closed and (owner_loop is None or owner_loop is loop):
+                return client
+            self._retire(client, owner_loop, grace=0.0)
+
+        limits = self.limits_for(registry)
+        use_http2 = limits.http2 and self._http2
+        client = httpx.AsyncClient(
+            timeout=limits.timeout,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=limits.max_connections,
+                max_keepalive_connections=limits.max_keepalive_connections,
+                keepalive_expiry=limits.keepalive_expiry,
+            ),
+        )
+        self._clients[registry] = (client, loop)
+        logger.debug(
+            "Created pooled HTTP client for %s (max_connections=%d, http2=%s)",
+            registry,
+            limits.max_connections,
+            use_http2,
+        )
+        return client
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return a summary of the open pooled clients (for diagnostics)."""
+        return {
+            registry: {
+                "max_connections": self.limits_for(registry).max_connections,
+                "http2": self.limits_for(registry).http2 and self._http2,
+                "closed": client.is_closed,
+            }
+            for registry, (client, _loop) in self._clients.items()
+        }
+
+    def _retire(
+        self,
+        client: httpx.AsyncClient,
+        owner_loop: asyncio.AbstractEventLoop | None,
+        grace: float,
+    ) -> None:
+        """Schedule the close of a client that was dropped from the pool.
+
+        The close runs on the loop that owns the client's connections, after
+        ``grace`` seconds. A client whose loop is not running (a finished
+        test or worker loop) is kept until ``aclose()``; one whose loop is
+        already closed is skipped, its sockets went down with that loop.
+        """
+        if client.is_closed:
+            return
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        loop = owner_loop or running
+        if loop is None or loop.is_closed():
+            return
+
+        self._retiring.add(client)
+        if loop is running:
+            task = loop.create_task(self._close_retired(client, grace))
+            self._retire_tasks.add(task)
+            task.add_done_callback(self._retire_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_retired(client, grace), loop)
+
+    async def _close_retired(self, client: httpx.AsyncClient, grace: float) -> None:
+        if grace > 0:
+            await asyncio.sleep(grace)
+        self._retiring.discard(client)
+        await self._close_client(client)
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as exc:  # noqa: BLE001 — closing must not raise
+            logger.debug("Error closing pooled registry client: %s", exc)
+
+    async def aclose(self) -> None:
+        """Close every pooled client, including retired ones. Safe to call more than once."""
+        clients = [client for client, _loop in self._clients.values()]
+        clients.extend(self._retiring)
+        self._clients.clear()
+        self._retiring.clear()
+        for task in list(self._retire_tasks):
+            task.cancel()
+        for client in clients:
+            await self._close_client(client)
+
+
+class PooledRegistryHTTPClient:
+    """Per-registry-client view over a pooled ``httpx.AsyncClient``.
+
+    Holds the credentials a ``RegistryClient`` was constructed with and
+    merges them into each request, so clients with different credentials
+    can share one connection pool. ``aclose()`` is a no-op: the pool owns
+    the underlying connections. ``response_hook``, when set, sees every
+    response before the caller does (rate-limit header feedback).
+    """
+
+    def __init__(
+        self,
+        pool: RegistryConnectionPool,
+        registry: str,
+        headers: dict[str, str] | None = None,
+        auth: tuple[str, str] | None = None,
+    ) -> None:
+        self._pool = pool
+        self._registry = registry
+        self.headers = httpx.Headers(headers or {})
+        self.auth = auth
+        self.is_closed = False
+        self.response_hook: Callable[[httpx.Response], None] | None = None
+
+    def _merge(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        headers = httpx.Headers(self.headers)
+        if kwargs.get("headers"):
+            headers.update(kwargs["headers"])
+        kwargs["headers"] = headers
+        if self.auth is not None and "auth" not in kwargs:
+            kwargs["auth"] = self.auth
+        return kwargs
+
+    def _observe(self, response: httpx.Response) -> httpx.Response:
+        if self.response_hook is not None:
+            self.response_hook(response)
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a GET over the shared pool with this client's credentials."""
+        client = self._pool.get_client(self._registry)
+        return self._observe(await client.get(url, **self._merge(kwargs)))
+
+    async def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Issue a HEAD over the shared pool with this client's credentials."""
+        client = self._pool.get_client(self._registry)
+        return self._observe(await client.head(url, **self._merge(kwargs)))
+
+    async def aclose(self) -> None:
+        """Release the borrowed client (connections stay in the pool)."""
+        self.is_closed = True
+
+
+# Process-global pool shared by every registry client.
+_registry_pool = RegistryConnectionPool()
+
+
+def get_registry_pool() -> RegistryConnectionPool:
+    """Access the process-global registry connection pool."""
+    return _registry_pool
+
+
+async def close_registry_pool() -> None:
+    """Close all pooled registry connections (app shutdown)."""
+    await _registry_pool.aclose()
@@ -2,13 +2,24 @@
 
 Provides bounded concurrency and sliding window rate limiting per container
 registry to avoid throttling from Docker Hub, GHCR, LSCR, etc.
+
+On top of the static limits, the limiter adapts to what registries report:
+rate-limit headers (``ratelimit-remaining`` / ``ratelimit-reset``,
+``Retry-After``) update a per-registry ``RegistryBudget`` that gates
+``acquire``. Budgets are persisted in ``registry_rate_limit_state`` when the
+limiter is given a session factory.
 """
 
 import asyncio
 import logging
+import re
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +111,92 @@ class RateLimitState:
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
 
+@dataclass
+class RegistryBudget:
+    """Quota a registry last reported for this client.
+
+    Times are wall-clock epoch seconds so budgets survive restarts.
+
+    Attributes:
+        remaining: Requests left in the current window (None = unknown)
+        limit: Window size in requests, when reported
+        reset_at: When ``remaining`` is replenished
+        blocked_until: No requests before this time (``Retry-After`` / 429)
+    """
+
+    remaining: int | None = None
+    limit: int | None = None
+    reset_at: float | None = None
+    blocked_until: float | None = None
+
+
+class RegistryBudgetExhaustedError(Exception):
+    """Raised by ``acquire`` when a registry's reported quota is spent.
+
+    Raised instead of waiting when the quota only comes back after
+    ``max_budget_wait``, so the request is skipped rather than sent into a 429.
+    """
+
+    def __init__(self, registry: str, retry_at: float):
+        """Initialize the exception.
+
+        Args:
+            registry: Normalized registry name
+            retry_at: Epoch seconds at which the quota is expected back
+        """
+        self.registry = registry
+        self.retry_at = retry_at
+        retry = datetime.fromtimestamp(retry_at, UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+        super().__init__(f"{registry} rate-limit budget exhausted until {retry}")
+
+
+# Seconds to pause a registry after a 429 that carried no Retry-After
+DEFAULT_RETRY_AFTER = 60.0
+
+# "76;w=21600" → 76 (Docker Hub registry), plain "76" (Hub API x-ratelimit-*)
+_RATELIMIT_VALUE_RE = re.compile(r"^\s*(\d+)")
+_RATELIMIT_WINDOW_RE = re.compile(r"w=(\d+)")
+
+
+def _header(headers: Mapping[str, str], *names: str) -> str | None:
+    """First present header among ``names``."""
+    for name in names:
+        value = headers.get(name)
+        if value:
+            return value
+    return None
+
+
+def _parse_count(value: str | None) -> int | None:
+    """Leading integer of a rate-limit header value."""
+    if value is None:
+        return None
+    match = _RATELIMIT_VALUE_RE.match(value)
+    return int(match.group(1)) if match else None
+
+
+def _parse_reset(value: str | None, now: float) -> float | None:
+    """Reset header as epoch seconds (accepts epoch or delta seconds)."""
+    seconds = _parse_count(value)
+    if seconds is None:
+        return None
+    # Epoch timestamps are far larger than any plausible window length.
+    return float(seconds) if seconds > 1_000_000_000 else now + seconds
+
+
+def _parse_retry_after(value: str | None, now: float) -> float | None:
+    """Retry-After (delta seconds or HTTP-date) as epoch seconds."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return now + int(value)
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except TypeError, ValueError:
+        return None
+
+
 class RegistryRateLimiter:
     """Manages rate limiting across all registries.
 
@@ -107,6 +204,7 @@ class RegistryRateLimiter:
     - Global concurrency limit across all registries
     - Per-registry concurrency limits
     - Per-registry sliding window rate limiting
+    - Per-registry quota budgets fed by registry rate-limit headers
 
     Example:
         limiter = RegistryRateLimiter(global_concurrency=5)
@@ -115,16 +213,35 @@ class RegistryRateLimiter:
             pass
     """
 
-    def __init__(self, global_concurrency: int = 5):
+    # Longest acquire() will sleep for a spent budget before giving up
+    MAX_BUDGET_WAIT = 60.0
+    # Minimum seconds between opportunistic budget writes from release()
+    PERSIST_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        global_concurrency: int = 5,
+        sessions: Callable[[], Any] | None = None,
+        budget_reserve: int = 0,
+    ):
         """Initialize rate limiter.
 
         Args:
             global_concurrency: Maximum concurrent requests across all registries
+            sessions: Optional async session factory for persisting budgets
+            budget_reserve: Requests to leave unspent in each reported budget
         """
         self._global_semaphore = asyncio.Semaphore(global_concurrency)
         self._registry_states: dict[str, RateLimitState] = {}
         self._lock = asyncio.Lock()
 
+        # Reported quota per registry (see observe_response)
+        self._budgets: dict[str, RegistryBudget] = {}
+        self._budget_reserve = max(0, budget_reserve)
+        self._sessions = sessions
+        self._budgets_dirty = False
+        self._last_persist = time.monotonic()
+
         # Metrics tracking
         self._wait_count: dict[str, int] = {}
         self._total_requests: dict[str, int] = {}
@@ -220,11 +337,13 @@ class RegistryRateLimiter:
         limits = REGISTRY_RATE_LIMITS.get(registry_type, DEFAULT_RATE_LIMITS)
         normalized = self._normalize_registry_name(registry)
 
+        # Phase 0: Honor the quota the registry reported. Short waits are
+        # slept off; a quota that only returns later fails fast.
+        total_wait = await self._wait_for_budget(normalized)
+
         # Track total requests
         self._total_requests[normalized] = self._total_requests.get(normalized, 0) + 1
 
-        total_wait = 0.0
-
         # Phase 1: Wait for rate-limit window BEFORE acquiring semaphores.
         # This ensures no global/per-registry slots are held during sleep.
         while True:
@@ -265,6 +384,7 @@ class RegistryRateLimiter:
                 if len(state.request_times) < limits.requests_per_minute:
                     # Window is clear — record this request and proceed
                     state.request_times.append(time.monotonic())
+                    self._spend_budget(normalized, 1)
                     break
 
                 # Window exceeded after acquiring (race condition) — must retry
@@ -299,6 +419,194 @@ class RegistryRateLimiter:
         state = await self._get_registry_state(registry)
         state.semaphore.release()
         self._global_semaphore.release()
+        if (
+            self._budgets_dirty
+            and self._sessions is not None
+            and time.monotonic() - self._last_persist >= self.PERSIST_INTERVAL
+        ):
+            await self.flush_budgets()
+
+    async def _wait_for_budget(self, normalized: str) -> float:
+        """Sleep until the registry's reported budget allows a request.
+
+        Args:
+            normalized: Normalized registry name
+
+        Returns:
+            Seconds slept
+
+        Raises:
+            RegistryBudgetExhaustedError: The budget returns after ``MAX_BUDGET_WAIT``
+        """
+        waited = 0.0
+        while True:
+            retry_at = self._budget_retry_at(normalized)
+            if retry_at is None:
+                return waited
+            wait_needed = retry_at - time.time()
+            if wait_needed <= 0:
+                continue
+            if wait_needed > self.MAX_BUDGET_WAIT:
+                raise RegistryBudgetExhaustedError(normalized, retry_at)
+            logger.info(f"Rate-limit budget for {normalized} spent; waiting {wait_needed:.1f}s")
+            self._wait_count[normalized] = self._wait_count.get(normalized, 0) + 1
+            await asyncio.sleep(wait_needed)
+            waited += wait_needed
+
+    def _budget_retry_at(self, normalized: str) -> float | None:
+        """Epoch seconds before which no request may be sent, or None.
+
+        Expired blocks and windows are cleared as a side effect.
+        """
+        budget = self._budgets.get(normalized)
+        if budget is None:
+            return None
+        now = time.time()
+        if budget.blocked_until is not None:
+            if budget.blocked_until > now:
+                return budget.blocked_until
+            budget.blocked_until = None
+        if budget.reset_at is not None and budget.reset_at <= now:
+            # Window rolled over; the quota is unknown until the next response.
+            budget.remaining = None
+            budget.reset_at = None
+        if (
+            budget.remaining is not None
+            and budget.reset_at is not None
+            and budget.remaining <= self._budget_reserve
+        ):
+            return budget.reset_at
+        return None
+
+    def _spend_budget(self, normalized: str, count: int) -> None:
+        """Count requests against a known budget until headers refresh it."""
+        budget = self._budgets.get(normalized)
+        if budget is not None and budget.remaining is not None:
+            budget.remaining = max(0, budget.remaining - count)
+
+    def observe_response(self, registry: str, response: Any) -> None:
+        """Fold a registry response's rate-limit headers into its budget.
+
+        Reads ``ratelimit-remaining`` / ``ratelimit-limit`` / ``ratelimit-reset``
+        (and their ``x-`` variants) and, on 429/503, ``Retry-After``.
+
+        Args:
+            registry: Registry name
+            response: ``httpx.Response`` (anything with ``status_code``/``headers``)
+        """
+        normalized = self._normalize_registry_name(registry)
+        headers = response.headers
+        now = time.time()
+
+        remaining_raw = _header(headers, "ratelimit-remaining", "x-ratelimit-remaining")
+        remaining = _parse_count(remaining_raw)
+        retry_after = None
+        if response.status_code in (429, 503):
+            retry_after = _parse_retry_after(headers.get("retry-after"), now)
+            if retry_after is None and response.status_code == 429:
+                retry_after = now + DEFAULT_RETRY_AFTER
+        if remaining is None and retry_after is None:
+            return
+
+        budget = self._budgets.setdefault(normalized, RegistryBudget())
+        if remaining is not None:
+            budget.remaining = remaining
+            budget.limit = _parse_count(_header(headers, "ratelimit-limit", "x-ratelimit-limit"))
+            reset_at = _parse_reset(_header(headers, "ratelimit-reset", "x-ratelimit-reset"), now)
+            if reset_at is None and remaining_raw is not None:
+                # Docker Hub's registry only reports the window ("w=21600").
+                window = _RATELIMIT_WINDOW_RE.search(remaining_raw)
+                reset_at = now + int(window.group(1)) if window else None
+            budget.reset_at = reset_at
+        if retry_after is not None:
+            budget.blocked_until = max(budget.blocked_until or 0.0, retry_after)
+            logger.warning(
+                f"{normalized} returned {response.status_code}; pausing requests for "
+                f"{max(0.0, retry_after - now):.0f}s"
+            )
+        self._budgets_dirty = True
+
+    def budgets(self) -> dict[str, RegistryBudget]:
+        """Current budget per registry (copies)."""
+        return {
+            registry: RegistryBudget(
+                remaining=budget.remaining,
+                limit=budget.limit,
+                reset_at=budget.reset_at,
+                blocked_until=budget.blocked_until,
+            )
+            for registry, budget in self._budgets.items()
+        }
+
+    def restore_budgets(self, budgets: dict[str, RegistryBudget]) -> None:
+        """Seed budgets (e.g. from the database). Expired ones are dropped."""
+        now = time.time()
+        for registry, budget in budgets.items():
+            active_block = budget.blocked_until is not None and budget.blocked_until > now
+            active_window = budget.reset_at is not None and budget.reset_at > now
+            if active_block or active_window:
+                self._budgets[self._normalize_registry_name(registry)] = budget
+
+    async def load_budgets(self) -> None:
+        """Restore persisted budgets. No-op without a session factory."""
+        if self._sessions is None:
+            return
+        from app.services.persistent_rate_limit_state import PersistentRateLimitState
+
+        try:
+            async with self._sessions() as session:
+                self.restore_budgets(await PersistentRateLimitState(session).load_all())
+        except Exception as e:
+            logger.warning(f"Could not load persisted registry rate-limit budgets: {e}")
+
+    async def flush_budgets(self) -> None:
+        """Persist budgets changed since the last flush. Best effort."""
+        if self._sessions is None or not self._budgets_dirty:
+            return
+        from app.services.persistent_rate_limit_state import PersistentRateLimitState
+
+        self._budgets_dirty = False
+        self._last_persist = time.monotonic()
+        try:
+            async with self._sessions() as session:
+                await PersistentRateLimitState(session).save_all(self.budgets())
+        except Exception as e:
+            self._budgets_dirty = True
+            logger.warning(f"Could not persist registry rate-limit budgets: {e}")
+
+    def fanout_budget(self, registry: str) -> int:
+        """Number of requests one caller may keep in flight inside its slot.
+
+        Used for intra-request fan-out (e.g. fetching Docker Hub tag pages
+        concurrently) while already holding a slot from ``acquire``. The
+        fan-out never acquires further slots — that could deadlock against
+        its own held slot — so it is bounded by the registry's concurrency
+        limit instead, and by the requests left in its reported budget.
+
+        Args:
+            registry: Registry name
+
+        Returns:
+            Maximum concurrent sub-requests (at least 1)
+        """
+        limits = REGISTRY_RATE_LIMITS.get(self._get_registry_type(registry), DEFAULT_RATE_LIMITS)
+        budget = self._budgets.get(self._normalize_registry_name(registry))
+        if budget is not None and budget.remaining is not None:
+            return max(1, min(limits.concurrent_limit, budget.remaining - self._budget_reserve))
+        return max(1, limits.concurrent_limit)
+
+    def record_requests(self, registry: str, count: int) -> None:
+        """Count sub-requests issued under an already-acquired slot.
+
+        Args:
+            registry: Registry name
+            count: Number of additional requests made
+        """
+        if count <= 0:
+            return
+        normalized = self._normalize_registry_name(registry)
+        self._total_requests[normalized] = self._total_requests.get(normalized, 0) + count
+        self._spend_budget(normalized, count)
 
     def get_metrics(self) -> dict[str, dict[str, int]]:
         """Get rate limiter metrics.
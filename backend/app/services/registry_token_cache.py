@@ -0,0 +1,166 @@
+"""Bearer-token cache for OCI registry auth scopes.
+
+GHCR and LSCR hand out short-lived bearer tokens per repository scope
+(``repository:<name>:pull``). Fetching one before every manifest or tag-list
+request doubles the request count and burns anonymous rate limit, so tokens
+are cached in-process keyed by ``(registry, repository, scope, principal)``.
+
+Entries honor the token endpoint's ``expires_in`` (Docker token spec default:
+60s when omitted) and are refreshed ahead of expiry. Refreshes are
+single-flight per key: concurrent checks of the same image wait on one token
+request instead of each issuing their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from app.services.metrics import registry_token_cache_hits, registry_token_cache_misses
+
+logger = logging.getLogger(__name__)
+
+# Token spec: "If omitted, a default of 60 seconds should be assumed."
+DEFAULT_TOKEN_LIFETIME_SECONDS = 60
+# Refresh this many seconds before expiry (capped at half the lifetime so a
+# 60s token is still reused for ~30s).
+REFRESH_AHEAD_SECONDS = 30.0
+
+TokenKey = tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class CachedToken:
+    """A bearer token plus its monotonic refresh/expiry deadlines."""
+
+    token: str
+    expires_at: float
+    refresh_at: float
+
+    def is_valid(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.refresh_at
+
+
+class RegistryTokenCache:
+    """In-process cache of registry bearer tokens with single-flight refresh."""
+
+    def __init__(self, refresh_ahead_seconds: float = REFRESH_AHEAD_SECONDS) -> None:
+        self._refresh_ahead = refresh_ahead_seconds
+        self._tokens: dict[TokenKey, CachedToken] = {}
+        # Single-flight locks exist only while a refresh is in progress or
+        # queued; the user count lets the last one out drop the lock.
+        self._locks: dict[TokenKey, asyncio.Lock] = {}
+        self._lock_users: dict[TokenKey, int] = {}
+
+    @staticmethod
+    def _key(registry: str, repository: str, scope: str, principal: str | None) -> TokenKey:
+        return (registry.lower(), repository, scope, principal or "")
+
+    def _entry(self, token: str, expires_in: int | float | None) -> CachedToken:
+        lifetime = float(expires_in) if expires_in else float(DEFAULT_TOKEN_LIFETIME_SECONDS)
+        now = time.monotonic()
+        ahead = min(self._refresh_ahead, lifetime / 2)
+        return CachedToken(
+            token=token, expires_at=now + lifetime, refresh_at=now + lifetime - ahead
+        )
+
+    async def get_or_fetch(
+        self,
+        registry: str,
+        repository: str,
+        scope: str,
+        fetch: Callable[[], Awaitable[tuple[str, int | float | None] | None]],
+        principal: str | None = None,
+    ) -> str | None:
+        """Return a cached token, fetching (once) if missing or near expiry.
+
+        Args:
+            registry: Registry name (e.g. ``ghcr``, ``lscr``)
+            repository: Repository path (e.g. ``linuxserver/plex``)
+            scope: Action scope (e.g. ``pull``)
+            fetch: Coroutine factory returning ``(token, expires_in)`` or None
+            principal: Credential identity the token was issued to (username),
+                so anonymous and PAT-exchanged tokens never mix
+
+        Returns:
+            Bearer token, or None when the token endpoint gave nothing and no
+            still-valid cached token exists.
+        """
+        key = self._key(registry, repository, scope, principal)
+        label = key[0]
+        cached = self._tokens.get(key)
+        if cached is not None and cached.is_fresh(time.monotonic()):
+            registry_token_cache_hits.labels(registry=label).inc()
+            return cached.token
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                return await self._refresh(key, fetch)
+        finally:
+            remaining = self._lock_users.pop(key) - 1
+            if remaining:
+                self._lock_users[key] = remaining
+            elif self._locks.get(key) is lock:
+                del self._locks[key]
+
+    async def _refresh(
+        self,
+        key: TokenKey,
+        fetch: Callable[[], Awaitable[tuple[str, int | float | None] | None]],
+    ) -> str | None:
+        """Fetch a token for *key* while holding its single-flight lock."""
+        label = key[0]
+        # Another waiter may have refreshed while we queued on the lock.
+        cached = self._tokens.get(key)
+        now = time.monotonic()
+        if cached is not None and cached.is_fresh(now):
+            registry_token_cache_hits.labels(registry=label).inc()
+            return cached.token
+
+        registry_token_cache_misses.labels(registry=label).inc()
+        result = await fetch()
+        if result is None:
+            # Refresh failed — keep serving the old token until it expires.
+            if cached is not None and cached.is_valid(time.monotonic()):
+                logger.debug("Token refresh failed for %s; reusing unexpired token", key[:3])
+                return cached.token
+            self._tokens.pop(key, None)
+            return None
+
+        token, expires_in = result
+        self._tokens[key] = self._entry(token, expires_in)
+        return token
+
+    def invalidate(
+        self,
+        registry: str,
+        repository: str,
+        scope: str = "pull",
+        principal: str | None = None,
+    ) -> None:
+        """Drop a token (e.g. after the registry answered 401 with it)."""
+        self._tokens.pop(self._key(registry, repository, scope, principal), None)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        self._tokens.clear()
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+
+# Process-global token cache shared by all registry clients.
+_token_cache = RegistryTokenCache()
+
+
+def get_token_cache() -> RegistryTokenCache:
+    """Access the process-global registry token cache."""
+    return _token_cache
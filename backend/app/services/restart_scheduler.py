@@ -1,12 +1,13 @@
 """Restart scheduler service for monitoring and scheduling container restarts."""
 
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from docker.errors import DockerException
 from requests.exceptions import ConnectionError as RequestsConnectionError
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,7 @@ from app.database import AsyncSessionLocal
 from app.models import Container
 from app.models.restart_state import ContainerRestartState
 from app.services.container_monitor import container_monitor
+from app.services.container_state import ContainerRuntimeState, container_states
 from app.services.event_bus import event_bus
 from app.services.protected_infra import SelfManagedInfraError, is_self_managed_infrastructure
 from app.services.restart_service import restart_service
@@ -21,9 +23,21 @@ from app.services.settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
 
+# Docker events that can leave an auto-restart container down
+RESTART_TRIGGER_ACTIONS = frozenset({"die", "destroy"})
+
+# Wait this long after a trigger event before deciding, so a restart by
+# Docker's own restart policy or a compose recreate can land first
+EVENT_SETTLE_SECONDS = 2.0
+
 
 class RestartSchedulerService:
-    """Manages intelligent container restart scheduling with APScheduler."""
+    """Manages intelligent container restart scheduling with APScheduler.
+
+    Docker events drive restart decisions as they happen; the full polling
+    sweep runs as a reconciliation safety net, at the regular monitor
+    interval only while the event stream is unavailable.
+    """
 
     def __init__(self, scheduler: AsyncIOScheduler) -> None:
         """Initialize restart scheduler.
@@ -32,6 +46,9 @@ class RestartSchedulerService:
             scheduler: APScheduler instance
         """
         self.scheduler = scheduler
+        self._events_enabled = False
+        self._reconcile_interval = 300
+        self._last_sweep = 0.0
 
     async def start_monitoring(self, db: AsyncSession):
         """Start the restart monitoring system.
@@ -48,10 +65,21 @@ class RestartSchedulerService:
 
         # Get monitor interval
         interval = await SettingsService.get_int(db, "restart_monitor_interval", default=30)
+        self._events_enabled = await SettingsService.get_bool(
+            db, "restart_monitor_events_enabled", default=True
+        )
+        self._reconcile_interval = await SettingsService.get_int(
+            db, "restart_monitor_reconcile_interval", default=300
+        )
+
+        if self._events_enabled:
+            container_states.subscribe(self._on_container_event)
+        else:
+            container_states.unsubscribe(self._on_container_event)
 
-        # Add monitoring loop job
+        # Add monitoring loop job (a reconciliation sweep while events flow)
         self.scheduler.add_job(
-            self._monitor_loop,
+            self._poll_tick,
             "interval",
             seconds=interval,
             id="restart_monitor",
@@ -72,7 +100,68 @@ class RestartSchedulerService:
             max_instances=1,
         )
 
-        logger.info(f"Restart monitoring started (interval: {interval}s)")
+        if self._events_enabled:
+            logger.info(
+                f"Restart monitoring started (Docker events, reconcile every "
+                f"{self._reconcile_interval}s, fallback poll {interval}s)"
+            )
+        else:
+            logger.info(f"Restart monitoring started (interval: {interval}s)")
+
+    def stop_monitoring(self) -> None:
+        """Stop reacting to Docker events (jobs go with the APScheduler)."""
+        container_states.unsubscribe(self._on_container_event)
+
+    async def _poll_tick(self):
+        """Run the full sweep unless events are flowing and it ran recently."""
+        if (
+            self._events_enabled
+            and container_states.live
+            and time.monotonic() - self._last_sweep < self._reconcile_interval
+        ):
+            return
+        self._last_sweep = time.monotonic()
+        await self._monitor_loop()
+
+    async def _on_container_event(self, state: ContainerRuntimeState, action: str) -> None:
+        """Queue a restart decision for a container that just died or vanished."""
+        if action not in RESTART_TRIGGER_ACTIONS:
+            return
+        self.scheduler.add_job(
+            self._handle_container_event,
+            "date",
+            run_date=datetime.now(UTC) + timedelta(seconds=EVENT_SETTLE_SECONDS),
+            args=[state.name],
+            id=f"restart_event_{state.name}",
+            replace_existing=True,
+            misfire_grace_time=60,
+        )
+
+    async def _handle_container_event(self, runtime_name: str):
+        """Decide on a restart from the event-fed state, without an inspect call.
+
+        Args:
+            runtime_name: Docker container name from the event
+        """
+        state = container_states.peek(runtime_name)
+        if state is None:
+            return
+        async with AsyncSessionLocal() as db:
+            try:
+                result = await db.execute(
+                    select(Container).where(
+                        Container.auto_restart_enabled,
+                        or_(Container.docker_name == runtime_name, Container.name == runtime_name),
+                    )
+                )
+                for container in result.scalars().all():
+                    if container.runtime_name != runtime_name:
+                        continue
+                    await self._check_and_schedule_restart(
+                        db, container, container_state=state.as_state_dict()
+                    )
+            except OperationalError as e:
+                logger.error(f"Database error handling Docker event for {runtime_name}: {e}")
 
     async def _monitor_loop(self):
         """Check for failed containers and schedule restarts."""
@@ -96,12 +185,19 @@ class RestartSchedulerService:
             except (DockerException, RequestsConnectionError) as e:
                 logger.error(f"Docker connection error in restart monitor loop: {e}")
 
-    async def _check_and_schedule_restart(self, db: AsyncSession, container: Container):
+    async def _check_and_schedule_restart(
+        self,
+        db: AsyncSession,
+        container: Container,
+        container_state: dict | None = None,
+    ):
         """Check if container needs restart and schedule if needed.
 
         Args:
             db: Database session
             container: Container to check
+            container_state: State already observed from a Docker event;
+                inspected from the Engine API when omitted
         """
         try:
             # Filter self-managed infrastructure out here rather than letting the
@@ -139,7 +235,10 @@ class RestartSchedulerService:
                 return
 
             # Check container status (use runtime name for Docker API)
-            container_state = await container_monitor.get_container_state(container.runtime_name)
+            if container_state is None:
+                container_state = await container_monitor.get_container_state(
+                    container.runtime_name
+                )
 
             if not container_state:
                 logger.warning(f"Could not get state for {container.name}")
@@ -1,7 +1,10 @@
 """Background scheduler service for automatic update checks."""
 
+import asyncio
 import logging
 from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -14,6 +17,9 @@ from app.database import AsyncSessionLocal
 from app.services.check_job_service import CheckJobService
 from app.services.settings_service import SettingsService
 
+if TYPE_CHECKING:
+    from app.models.container import Container
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +56,7 @@ class SchedulerService:
         self._enabled: bool = True
         self._last_check: datetime | None = None  # Track last successful check
         self.restart_scheduler = None  # Will be initialized when scheduler starts
+        self._project_locks: dict[str, asyncio.Lock] = {}  # Compose project -> apply mutex
 
     async def start(self) -> None:
         """Start the background scheduler.
@@ -137,6 +144,17 @@ class SchedulerService:
                 max_instances=1,  # Prevent overlapping runs
             )
 
+            # Add metrics rollup job (every 15 minutes, offset from collection
+            # at minute 2,7,… so a rollup never races an insert batch)
+            self.scheduler.add_job(
+                self._run_metrics_rollup,
+                CronTrigger.from_crontab("4-59/15 * * * *"),
+                id="metrics_rollup",
+                name="Container Metrics Rollup",
+                replace_existing=True,
+                max_instances=1,
+            )
+
             # Add metrics cleanup job (runs daily at 3 AM)
             self.scheduler.add_job(
                 self._run_metrics_cleanup,
@@ -243,6 +261,9 @@ class SchedulerService:
 
         Shuts down the APScheduler gracefully.
         """
+        if self.restart_scheduler:
+            self.restart_scheduler.stop_monitoring()
+
         if self.scheduler:
             try:
                 import asyncio
@@ -356,7 +377,8 @@ class SchedulerService:
 
         This job runs periodically to apply updates that have been
         auto-approved by the update checker, respecting update windows
-        and dependency ordering.
+        and dependency ordering. Updates in the same dependency level are
+        independent and applied concurrently (see ``_apply_update_waves``).
         """
         logger.info("Starting auto-apply job")
         start_time = datetime.now()
@@ -392,7 +414,6 @@ class SchedulerService:
                 from app.models.container import Container
                 from app.models.update import Update
                 from app.services.dependency_manager import DependencyManager
-                from app.services.update_engine import UpdateEngine
                 from app.services.update_window import UpdateWindow
 
                 now = datetime.now(UTC)
@@ -425,6 +446,7 @@ class SchedulerService:
 
                 # Filter by update windows
                 eligible_updates = []
+                project_keys: dict[int, str] = {}
                 for update, container in updates_with_containers:
                     # Check update window
                     if container.update_window:
@@ -436,6 +458,7 @@ class SchedulerService:
                             continue
 
                     eligible_updates.append(update)
+                    project_keys[update.id] = self._project_key(container)
 
                 if not eligible_updates:
                     logger.debug("No eligible updates after window filtering")
@@ -451,71 +474,43 @@ class SchedulerService:
                     logger.info(f"Rate limiting to {max_concurrent} updates per run")
                     eligible_updates = eligible_updates[:max_concurrent]
 
+                parallelism = max(
+                    1, await SettingsService.get_int(db, "auto_update_parallelism", default=1)
+                )
+
                 # Get container names for dependency ordering
                 container_names = [u.container_name for u in eligible_updates]
 
-                # Order by dependencies
+                # Group into dependency levels; each level only depends on
+                # earlier ones, so its members can be applied concurrently
                 try:
-                    ordered_names = await DependencyManager.get_update_order(db, container_names)
-                    # Reorder updates based on dependency order
+                    levels = await DependencyManager.get_update_levels(db, container_names)
                     update_map = {u.container_name: u for u in eligible_updates}
-                    ordered_updates = [update_map[name] for name in ordered_names]
+                    waves = [[update_map[name] for name in level] for level in levels]
                 except (ValueError, KeyError) as e:
                     logger.error(
-                        f"Dependency ordering failed (invalid data): {e}, using original order"
+                        f"Dependency ordering failed (invalid data): {e}, applying sequentially"
                     )
-                    ordered_updates = eligible_updates
+                    waves = [[u] for u in eligible_updates]
                 except OperationalError as e:
                     logger.error(
-                        f"Database error during dependency ordering: {e}, using original order"
+                        f"Database error during dependency ordering: {e}, applying sequentially"
                     )
-                    ordered_updates = eligible_updates
+                    waves = [[u] for u in eligible_updates]
 
                 logger.info(
-                    f"Found {len(ordered_updates)} eligible updates to apply "
-                    f"(ordered by dependencies)"
+                    f"Found {len(eligible_updates)} eligible updates to apply in "
+                    f"{len(waves)} dependency levels (parallelism {parallelism})"
                 )
 
-                applied = 0
-                failed = 0
-
-                # Apply each update sequentially (safer than parallel)
-                for update in ordered_updates:
-                    try:
-                        retry_info = ""
-                        if update.status == "pending_retry":
-                            retry_info = f" (retry {update.retry_count + 1}/{update.max_retries})"
-
-                        logger.info(
-                            f"Auto-applying update {update.id} for {update.container_name}: "
-                            f"{update.from_tag} -> {update.to_tag}{retry_info}"
-                        )
-
-                        result = await UpdateEngine.apply_update(
-                            db, update.id, triggered_by="scheduler"
-                        )
+            # Applying can take minutes per update (pull + health check), so
+            # the planning session is released first; every apply opens its own.
+            applied, failed = await self._apply_update_waves(waves, project_keys, parallelism)
 
-                        if result["success"]:
-                            applied += 1
-                            logger.info(f"Successfully auto-applied update {update.id}")
-                        else:
-                            failed += 1
-                            logger.error(
-                                f"Failed to auto-apply update {update.id}: {result.get('message')}"
-                            )
-
-                    except OperationalError as e:
-                        failed += 1
-                        logger.error(f"Database error auto-applying update {update.id}: {e}")
-                    except (ValueError, KeyError) as e:
-                        failed += 1
-                        logger.error(f"Invalid data auto-applying update {update.id}: {e}")
-
-                duration = (datetime.now() - start_time).total_seconds()
-                logger.info(
-                    f"Auto-apply job completed in {duration:.2f}s: "
-                    f"{applied} applied, {failed} failed"
-                )
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.info(
+                f"Auto-apply job completed in {duration:.2f}s: {applied} applied, {failed} failed"
+            )
 
         except OperationalError as e:
             duration = (datetime.now() - start_time).total_seconds()
@@ -529,6 +524,144 @@ class SchedulerService:
             duration = (datetime.now() - start_time).total_seconds()
             logger.error(f"Invalid data during auto-apply job after {duration:.2f}s: {e}")
 
+    async def _apply_update_waves(
+        self, waves: list[list], project_keys: dict[int, str], parallelism: int
+    ) -> tuple[int, int]:
+        """Apply dependency levels in order, updating each level concurrently.
+
+        A level starts only after every update of the previous one finished.
+        Within a level at most ``parallelism`` updates run at once, and
+        updates of the same compose project never overlap because they edit
+        the same compose files and share one ``docker compose`` project.
+        An update that raises counts as failed without cancelling its
+        siblings or later levels. Aggregate progress is published as
+        ``auto-apply-*`` events.
+
+        Args:
+            waves: Dependency levels of Update rows
+            project_keys: Update ID -> compose project key
+            parallelism: Maximum concurrent updates within a level
+
+        Returns:
+            Tuple of (applied, failed) counts
+        """
+        from app.services.event_bus import event_bus
+
+        total = sum(len(wave) for wave in waves)
+        run_id = int(datetime.now(UTC).timestamp() * 1000)
+        semaphore = asyncio.Semaphore(parallelism)
+        counts = {"applied": 0, "failed": 0}
+
+        await event_bus.publish(
+            {
+                "type": "auto-apply-started",
+                "run_id": run_id,
+                "total_count": total,
+                "level_count": len(waves),
+                "parallelism": parallelism,
+            }
+        )
+
+        async def apply(update, level: int) -> None:
+            key = project_keys.get(update.id) or f"update:{update.id}"
+            try:
+                # Project lock first so a waiting update does not hold a slot
+                async with self._project_lock(key):
+                    async with semaphore:
+                        success = await self._apply_auto_update(update)
+            except Exception as e:
+                logger.error(f"Unexpected error auto-applying update {update.id}: {e}")
+                success = False
+            counts["applied" if success else "failed"] += 1
+            await event_bus.publish(
+                {
+                    "type": "auto-apply-progress",
+                    "run_id": run_id,
+                    "container_name": update.container_name,
+                    "success": success,
+                    "level": level,
+                    "level_count": len(waves),
+                    "completed_count": counts["applied"] + counts["failed"],
+                    "total_count": total,
+                    "applied": counts["applied"],
+                    "failed": counts["failed"],
+                }
+            )
+
+        for level, wave in enumerate(waves, start=1):
+            if len(wave) > 1:
+                logger.info(
+                    f"Applying dependency level {level}/{len(waves)}: "
+                    f"{', '.join(u.container_name for u in wave)}"
+                )
+            await asyncio.gather(*(apply(update, level) for update in wave))
+
+        await event_bus.publish(
+            {
+                "type": "auto-apply-completed",
+                "run_id": run_id,
+                "total_count": total,
+                "applied": counts["applied"],
+                "failed": counts["failed"],
+            }
+        )
+        return counts["applied"], counts["failed"]
+
+    @staticmethod
+    def _project_key(container: Container) -> str:
+        """Key of the compose project an update applies to.
+
+        Falls back to the compose file's directory (Docker Compose's default
+        project name) and then to the container itself.
+        """
+        if container.compose_project:
+            return container.compose_project
+        if container.compose_file:
+            directory = Path(container.compose_file).parent.name
+            if directory:
+                return directory
+        return f"container:{container.name}"
+
+    def _project_lock(self, key: str) -> asyncio.Lock:
+        """Get the mutex serializing updates of one compose project."""
+        return self._project_locks.setdefault(key, asyncio.Lock())
+
+    async def _apply_auto_update(self, update) -> bool:
+        """Apply one auto-approved update in its own database session.
+
+        Args:
+            update: Update row to apply
+
+        Returns:
+            True if the update was applied successfully
+        """
+        from app.services.update_engine import UpdateEngine
+
+        try:
+            retry_info = ""
+            if update.status == "pending_retry":
+                retry_info = f" (retry {update.retry_count + 1}/{update.max_retries})"
+
+            logger.info(
+                f"Auto-applying update {update.id} for {update.container_name}: "
+                f"{update.from_tag} -> {update.to_tag}{retry_info}"
+            )
+
+            async with AsyncSessionLocal() as db:
+                result = await UpdateEngine.apply_update(db, update.id, triggered_by="scheduler")
+
+            if result["success"]:
+                logger.info(f"Successfully auto-applied update {update.id}")
+                return True
+            logger.error(f"Failed to auto-apply update {update.id}: {result.get('message')}")
+            return False
+
+        except OperationalError as e:
+            logger.error(f"Database error auto-applying update {update.id}: {e}")
+        except (ValueError, KeyError) as e:
+            logger.error(f"Invalid data auto-applying update {update.id}: {e}")
+        return False
+
     async def _run_metrics_collection(self):
         """Run metrics collection job.
 
@@ -561,10 +694,33 @@ class SchedulerService:
             duration = (datetime.now() - start_time).total_seconds()
             logger.error(f"Invalid metrics data after {duration:.2f}s: {e}")
 
+    async def _run_metrics_rollup(self):
+        """Run metrics rollup job.
+
+        Folds closed raw-sample buckets into the 15m/1h/1d rollup tiers.
+        """
+        start_time = datetime.now()
+
+        try:
+            async with AsyncSessionLocal() as db:
+                from app.services.metrics_rollup import MetricsRollupService
+
+                written = await MetricsRollupService.rollup(db)
+
+                duration = (datetime.now() - start_time).total_seconds()
+                logger.debug(f"Metrics rollup completed in {duration:.2f}s: {written}")
+        except OperationalError as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Database error during metrics rollup after {duration:.2f}s: {e}")
+        except (ImportError, AttributeError) as e:
+            duration = (datetime.now() - start_time).total_seconds()
+            logger.error(f"Failed to import metrics rollup after {duration:.2f}s: {e}")
+
     async def _run_metrics_cleanup(self):
         """Run metrics cleanup job.
 
-        Removes old metrics data (older than 30 days).
+        Rolls up any pending buckets first, then removes raw samples and
+        rollups past their retention.
         """
         logger.info("Starting metrics cleanup")
         start_time = datetime.now()
@@ -572,8 +728,20 @@ class SchedulerService:
         try:
             async with AsyncSessionLocal() as db:
                 from app.services.metrics_collector import metrics_collector
+                from app.services.metrics_rollup import MetricsRollupService
+
+                raw_days = await SettingsService.get_int(
+                    db, "metrics_raw_retention_days", default=30
+                )
+                retention_days = await SettingsService.get_int(
+                    db, "metrics_retention_days", default=365
+                )
+                # Raw samples must outlive the daily bucket they roll into
+                raw_days = max(2, raw_days)
 
-                deleted = await metrics_collector.cleanup_old_metrics(db, days=30)
+                await MetricsRollupService.rollup(db)
+                deleted = await metrics_collector.cleanup_old_metrics(db, days=raw_days)
+                deleted += await MetricsRollupService.prune(db, max(raw_days, retention_days))
 
                 duration = (datetime.now() - start_time).total_seconds()
                 logger.info(
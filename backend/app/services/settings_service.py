@@ -1,8 +1,17 @@
-"""Settings service for database-first configuration."""
+"""Settings service for database-first configuration.
+
+Reads go through an in-process snapshot of every setting (decrypted), loaded
+with one query on first use and dropped whenever a setting is written through
+``SettingsService.set`` or ``init_defaults``. Hot paths (auth on every request,
+credentials per registry client, per-container check settings) therefore cost
+a dict lookup instead of a SQLite round trip and a decrypt. Code that keeps
+derived state can subscribe with ``add_change_listener``.
+"""
 
 import logging
 import os
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy import select
@@ -77,6 +86,14 @@ class SettingsService:
             "category": "system",
             "description": "Docker socket path or DOCKER_HOST URL",
         },
+        "metrics_scrape_cache_seconds": {
+            "value": "30",
+            "category": "system",
+            "description": (
+                "Seconds the database-derived Prometheus gauges are cached between /metrics "
+                "scrapes (update and check events refresh them sooner)"
+            ),
+        },
         "docker_compose_command": {
             "value": "docker compose",
             "category": "paths",
@@ -103,6 +120,14 @@ class SettingsService:
             "category": "scheduling",
             "description": "Maximum number of updates to auto-apply per run (rate limiting)",
         },
+        "auto_update_parallelism": {
+            "value": "1",
+            "category": "scheduling",
+            "description": (
+                "Maximum auto-applied updates running at once within a dependency level "
+                "(1 applies them one at a time)"
+            ),
+        },
         "cve_delta_block_threshold": {
             "value": "50",
             "category": "scheduling",
@@ -122,6 +147,40 @@ class SettingsService:
             "category": "scheduling",
             "description": "Enable container deduplication (check shared images once)",
         },
+        "check_incremental_enabled": {
+            "value": "false",
+            "category": "scheduling",
+            "description": (
+                "Scheduled checks only re-evaluate images whose tag listing or digest "
+                "changed since their last full check"
+            ),
+        },
+        "check_incremental_max_age_hours": {
+            "value": "24",
+            "category": "scheduling",
+            "description": "Hours after which incremental mode re-checks an unchanged image in full",
+        },
+        "check_write_batch_size": {
+            "value": "25",
+            "category": "scheduling",
+            "description": "Containers whose check results are written in one database transaction",
+        },
+        "check_write_flush_ms": {
+            "value": "500",
+            "category": "scheduling",
+            "description": (
+                "Longest time (ms) a check result waits before its batch is written "
+                "and progress is reported"
+            ),
+        },
+        "registry_budget_reserve": {
+            "value": "0",
+            "category": "scheduling",
+            "description": (
+                "Registry requests to leave unspent in each reported rate-limit budget; "
+                "checks that would dip into the reserve are deferred until it resets"
+            ),
+        },
         "metrics_concurrency": {
             "value": "4",
             "category": "scheduling",
@@ -131,6 +190,35 @@ class SettingsService:
                 "Tune down if you see 'database is locked' or socket-proxy connection errors."
             ),
         },
+        "metrics_raw_retention_days": {
+            "value": "30",
+            "category": "scheduling",
+            "description": "Days of raw (per-collection) container metrics to keep",
+        },
+        "metrics_retention_days": {
+            "value": "365",
+            "category": "scheduling",
+            "description": (
+                "Days of downsampled metrics history to keep (daily rollups; "
+                "15-minute and hourly rollups are kept for 30 and 90 days)"
+            ),
+        },
+        "metrics_storage": {
+            "value": "rows",
+            "category": "scheduling",
+            "description": (
+                "Raw metrics storage: rows (one metrics_history row per sample) or chunks "
+                "(one compressed row per container per hour)"
+            ),
+        },
+        "metrics_engine_api": {
+            "value": "true",
+            "category": "scheduling",
+            "description": (
+                "Collect container metrics from persistent Docker Engine API stats streams "
+                "instead of running docker stats"
+            ),
+        },
         # Update reliability
         "update_retry_max_attempts": {
             "value": "3",
@@ -180,6 +268,23 @@ class SettingsService:
             "description": "Docker Hub access token (optional, encrypted)",
             "encrypted": True,
         },
+        "dockerhub_parallel_pagination": {
+            "value": "true",
+            "category": "registries",
+            "description": (
+                "Fetch Docker Hub tag pages concurrently once the page count is known "
+                "(bounded by the Docker Hub rate-limit concurrency)"
+            ),
+        },
+        "dockerhub_semver_early_exit": {
+            "value": "false",
+            "category": "registries",
+            "description": (
+                "Stop scanning Docker Hub tag pages once the current tag has been passed "
+                "(assumes releases are pushed in version order; a re-pushed old tag whose "
+                "newer releases are all on later pages can hide them)"
+            ),
+        },
         "ghcr_username": {
             "value": "",
             "category": "registries",
@@ -528,6 +633,16 @@ class SettingsService:
             "category": "restart",
             "description": "Container monitoring interval in seconds",
         },
+        "restart_monitor_events_enabled": {
+            "value": "true",
+            "category": "restart",
+            "description": "React to Docker container events instead of relying on polling alone",
+        },
+        "restart_monitor_reconcile_interval": {
+            "value": "300",
+            "category": "restart",
+            "description": "Full reconciliation sweep interval in seconds while Docker events are flowing",
+        },
         "restart_default_strategy": {
             "value": "exponential",
             "category": "restart",
@@ -623,6 +738,13 @@ class SettingsService:
         {"admin_password_hash", "oidc_client_secret", "encryption_key"}
     )
 
+    # Decrypted values of every stored setting (None until first read). The
+    # generation counter keeps a load that raced a write from installing
+    # values read before that write.
+    _snapshot: ClassVar[dict[str, str | None] | None] = None
+    _generation: ClassVar[int] = 0
+    _listeners: ClassVar[list[Callable[[frozenset[str]], None]]] = []
+
     @classmethod
     def sensitive_keys(cls) -> frozenset[str]:
         """Return the full set of setting keys that must be masked in responses.
@@ -684,27 +806,70 @@ class SettingsService:
                 db.add(setting)
 
         await db.commit()
+        SettingsService.invalidate_cache()
+        SettingsService._notify_change(frozenset(SettingsService.DEFAULTS))
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop the settings snapshot; the next read reloads it."""
+        cls._generation += 1
+        cls._snapshot = None
+
+    @classmethod
+    def add_change_listener(cls, listener: Callable[[frozenset[str]], None]) -> None:
+        """Call ``listener`` with the changed keys after every settings write.
+
+        Registering the same listener twice has no effect.
+        """
+        if listener not in cls._listeners:
+            cls._listeners.append(listener)
+
+    @classmethod
+    def _notify_change(cls, keys: frozenset[str]) -> None:
+        for listener in list(cls._listeners):
+            try:
+                listener(keys)
+            except Exception as e:
+                logger.error(f"Settings change listener failed: {sanitize_log_message(str(e))}")
+
+    @classmethod
+    async def _load_snapshot(cls, db: AsyncSession) -> dict[str, str | None]:
+        """Return the settings snapshot, loading it with one query if needed."""
+        snapshot = cls._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        generation = cls._generation
+        result = await db.execute(select(Setting))
+        snapshot = {str(setting.key): cls._decode(setting) for setting in result.scalars().all()}
+        if generation == cls._generation:
+            cls._snapshot = snapshot
+        return snapshot
 
     @classmethod
     async def get(cls, db: AsyncSession, key: str, default: str | None = None) -> str | None:
         """Get setting value by key.
 
-        Automatically decrypts encrypted settings if encryption is configured.
+        Served from the in-process snapshot; encrypted settings are decrypted
+        once when the snapshot is loaded.
 
         Args:
-            db: Database session
+            db: Database session (used only to load the snapshot)
             key: Setting key
             default: Default value if setting not found
 
         Returns:
             Decrypted setting value or default
         """
-        result = await db.execute(select(Setting).where(Setting.key == key))
-        setting = result.scalar_one_or_none()
-
-        if not setting:
+        snapshot = await cls._load_snapshot(db)
+        if key not in snapshot:
             return default
+        return snapshot[key]
 
+    @staticmethod
+    def _decode(setting: Setting) -> str | None:
+        """Return a setting's plaintext value (None if decryption fails)."""
+        key = setting.key
         # If setting is marked as encrypted and encryption is configured, decrypt it
         if setting.encrypted and is_encryption_configured():
             try:
@@ -746,6 +911,17 @@ class SettingsService:
         except ValueError:
             return default
 
+    @staticmethod
+    async def get_float(db: AsyncSession, key: str, default: float = 0.0) -> float:
+        """Get setting as float."""
+        value = await SettingsService.get(db, key)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            return default
+
     @classmethod
     async def set(cls, db: AsyncSession, key: str, value: str) -> Setting:
         """Set setting value.
@@ -809,6 +985,8 @@ class SettingsService:
             db.add(setting)
 
         await db.commit()
+        cls.invalidate_cache()
+        cls._notify_change(frozenset({key}))
         await db.refresh(setting)
         return setting
 
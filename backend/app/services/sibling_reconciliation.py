@@ -196,7 +196,12 @@ async def reconcile_siblings(
                 )
                 fetch_response = None
 
-            if fetch_response is not None and not fetch_response.error:
+            if fetch_response is not None and fetch_response.deferred_until is not None:
+                logger.info(
+                    "Sibling reconciliation deferred for image %s: registry budget spent",
+                    image,
+                )
+            elif fetch_response is not None and not fetch_response.error:
                 recon_attempted = True
                 decision_maker = UpdateDecisionMaker()
                 decision = decision_maker.make_decision(
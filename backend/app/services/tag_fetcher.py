@@ -13,13 +13,18 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.change_detection import ImageProbe
 from app.services.check_run_context import (
     CheckRunContext,
     ImageCheckKey,
     TagFetchResult,
 )
 from app.services.registry_client import RegistryClientFactory, is_non_semver_tag
-from app.services.registry_rate_limiter import RateLimitedRequest, RegistryRateLimiter
+from app.services.registry_rate_limiter import (
+    RateLimitedRequest,
+    RegistryBudgetExhaustedError,
+    RegistryRateLimiter,
+)
 from app.services.settings_service import SettingsService
 
 if TYPE_CHECKING:
@@ -72,6 +77,8 @@ class FetchTagsResponse:
         cache_hit: Whether result came from run-scoped cache
         fetch_duration_ms: Time taken to fetch (including rate limit waits)
         error: Error message if fetch failed
+        deferred_until: Epoch seconds the registry's rate-limit budget returns,
+            when the fetch was skipped because that budget is spent
         anchor_decision: Phase 5/6 stable-channel anchor state machine result
             for the per-container fetch path. ``None`` for the cache-hit
             and key-only paths where no anchor resolution was attempted.
@@ -85,6 +92,7 @@ class FetchTagsResponse:
     fetch_duration_ms: float
     calver_blocked_tag: str | None = None
     error: str | None = None
+    deferred_until: float | None = None
     anchor_decision: Any | None = None  # AnchorDecision; Any to avoid import cycle
     # Resolved upstream major of the *current* (mutable) tag's digest. Used
     # by the decision maker to detect cross-major drift on digest-tracked
@@ -218,7 +226,9 @@ class TagFetcher:
         response: FetchTagsResponse | None = None
         try:
             async with RateLimitedRequest(self._rate_limiter, request.registry):
-                client = await RegistryClientFactory.get_client(request.registry, self._db)
+                client = await RegistryClientFactory.get_client(
+                    request.registry, self._db, rate_limiter=self._rate_limiter
+                )
 
                 try:
                     is_non_semver = is_non_semver_tag(request.current_tag)
@@ -406,6 +416,20 @@ class TagFetcher:
                 finally:
                     await client.close()
 
+        except RegistryBudgetExhaustedError as e:
+            # Not a failure: the registry is out of quota, so the check is
+            # deferred until it comes back instead of burning a 429.
+            duration_ms = (time.monotonic() - start_time) * 1000
+            logger.info(f"Deferred tag fetch for {request.image}:{request.current_tag}: {e}")
+            response = FetchTagsResponse(
+                latest_tag=None,
+                latest_major_tag=None,
+                all_tags=[],
+                metadata=None,
+                cache_hit=False,
+                fetch_duration_ms=duration_ms,
+                deferred_until=e.retry_at,
+            )
         except Exception as e:
             duration_ms = (time.monotonic() - start_time) * 1000
             logger.error(f"Error fetching tags for {request.image}:{request.current_tag}: {e}")
@@ -426,6 +450,38 @@ class TagFetcher:
             )
         return response
 
+    async def probe_image(self, registry: str, image: str, tag: str) -> ImageProbe:
+        """Read the cheap change markers for an image (incremental check mode).
+
+        Fetches the tag-listing marker and the tracked tag's manifest digest
+        under one rate-limit slot. Failures yield an incomplete probe, which
+        sends the image through the full check.
+
+        Args:
+            registry: Registry name
+            image: Image name
+            tag: Tracked tag
+
+        Returns:
+            ImageProbe (fields are None when they could not be read)
+        """
+        probe = ImageProbe(listing=None, digest=None)
+        try:
+            async with RateLimitedRequest(self._rate_limiter, registry):
+                client = await RegistryClientFactory.get_client(
+                    registry, self._db, rate_limiter=self._rate_limiter
+                )
+                try:
+                    probe = ImageProbe(
+                        listing=await client.get_listing_marker(image),
+                        digest=await client.get_manifest_digest(image, tag),
+                    )
+                finally:
+                    await client.close()
+        except Exception as e:
+            logger.warning(f"Change probe failed for {image}:{tag}: {e}")
+        return probe
+
     async def fetch_tags_for_container(self, container: Container) -> FetchTagsResponse:
         """Convenience method to fetch tags for a container.
 
@@ -517,19 +573,17 @@ class TagFetcher:
         fresh: AnchorResolution | None = None
 
         if anchor_tag:
-            cache = get_anchor_cache()
-            cached = cache.get(registry, image, anchor_tag)
-            if cached is not None:
-                fresh = cached
-            else:
+
+            async def _resolve() -> AnchorResolution | None:
                 client = await RegistryClientFactory.get_client(registry, self._db)
                 try:
-                    fresh = await resolve_anchor_major(client, image, anchor_tag)
-                    if fresh is not None:
-                        cache.set(registry, image, anchor_tag, fresh)
+                    return await resolve_anchor_major(client, image, anchor_tag)
                 finally:
                     await client.close()
 
+            # Single-flight: containers sharing an anchor resolve it once.
+            fresh = await get_anchor_cache().get_or_resolve(registry, image, anchor_tag, _resolve)
+
         decision = decide_anchor_bound(accepted_anchor_major=accepted, fresh=fresh)
 
         # First-resolution baseline persistence (codex finding #2):
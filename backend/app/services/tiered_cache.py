@@ -0,0 +1,380 @@
+"""Unified two-tier cache for registry lookups.
+
+One caching subsystem backs every in-process registry cache (tag lists,
+stable-channel anchors, ``:latest`` lineage, per-run check results):
+
+* **L1** — a size-bounded LRU with TTL. Entries carrying HTTP validators
+  (``ETag`` / ``Last-Modified``) are retained past their TTL, within the
+  LRU bound, so the next fetch can revalidate with a conditional request.
+* **L2** — an optional async backend (``tag_cache_entries`` via
+  ``PersistentTagBackend`` for tag lists) consulted on an L1 miss before the
+  loader runs. L2 entries are promoted into L1, fresh or stale.
+* **Single-flight** — ``get_or_load`` coalesces concurrent misses for the same
+  key onto one loader call, so a check run with many containers on the same
+  image never stampedes the registry.
+
+Every cache registers under a namespace; hit/miss/eviction counters and the
+current entry count are exported on ``/metrics`` per namespace.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+
+from app.services.metrics import cache_entries, cache_evictions_total, cache_requests_total
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass
+class CacheEntry[V]:
+    """One cached value plus its freshness deadlines and validators.
+
+    Attributes:
+        value: Cached value
+        expires_at: End of the fresh period (``get`` hits until then)
+        retain_until: Stale entries with validators are kept until then so
+            they can be revalidated; equals ``expires_at`` otherwise
+        etag: HTTP ``ETag`` the value was served with, if any
+        last_modified: HTTP ``Last-Modified`` the value was served with, if any
+    """
+
+    value: V
+    expires_at: datetime
+    retain_until: datetime
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def has_validator(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass
+class CacheStats:
+    """Per-namespace counters (mirrors the Prometheus series)."""
+
+    hits: int = 0
+    misses: int = 0
+    l2_hits: int = 0
+    coalesced: int = 0
+    evictions: dict[str, int] = field(default_factory=dict)
+
+
+class CacheBackend(Protocol):
+    """L2 store consulted on an L1 miss."""
+
+    async def get(self, key: Any) -> CacheEntry | None:
+        """Return the stored entry (fresh or stale), or None."""
+        ...
+
+    async def set(self, key: Any, entry: CacheEntry) -> None:
+        """Persist a freshly loaded entry."""
+        ...
+
+
+class TieredCache[K: Hashable, V]:
+    """Size-bounded LRU + TTL L1 with optional L2 read-through."""
+
+    def __init__(
+        self,
+        namespace: str,
+        *,
+        max_entries: int,
+        ttl: timedelta,
+        revalidate_window: timedelta = timedelta(0),
+        clock: Callable[[], datetime] = _utcnow,
+        register: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            namespace: Stats/metrics label (e.g. ``"tags"``)
+            max_entries: LRU bound; the least recently used entry is evicted
+                when a new key would exceed it
+            ttl: Fresh lifetime of an entry
+            revalidate_window: How long past ``ttl`` entries with validators
+                are retained for conditional revalidation
+            clock: Time source (overridable for tests)
+            register: Add to the process-wide namespace registry
+        """
+        self.namespace = namespace
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl
+        self._revalidate_window = revalidate_window
+        self._clock = clock
+        self._cache: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[V | None]] = {}
+        self.stats = CacheStats()
+        if register:
+            _registry[namespace] = self
+
+    @property
+    def ttl(self) -> timedelta:
+        return self._ttl
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache
+
+    # -- bookkeeping -------------------------------------------------------
+
+    def _count(self, result: str) -> None:
+        if result == "hit":
+            self.stats.hits += 1
+        elif result == "miss":
+            self.stats.misses += 1
+        elif result == "l2_hit":
+            self.stats.l2_hits += 1
+        elif result == "coalesced":
+            self.stats.coalesced += 1
+        cache_requests_total.labels(namespace=self.namespace, result=result).inc()
+
+    def _evict(self, key: K, reason: str) -> None:
+        del self._cache[key]
+        self.stats.evictions[reason] = self.stats.evictions.get(reason, 0) + 1
+        cache_evictions_total.labels(namespace=self.namespace, reason=reason).inc()
+
+    def _update_size(self) -> None:
+        cache_entries.labels(namespace=self.namespace).set(len(self._cache))
+
+    def _put(self, key: K, entry: CacheEntry[V]) -> None:
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            oldest = next(iter(self._cache))
+            self._evict(oldest, "capacity")
+        self._update_size()
+
+    def _retained(self, entry: CacheEntry[V], now: datetime) -> bool:
+        return entry.has_validator and now <= entry.retain_until
+
+    def make_entry(
+        self,
+        value: V,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        stored_at: datetime | None = None,
+    ) -> CacheEntry[V]:
+        """Build an entry whose deadlines follow this cache's TTL policy."""
+        stored_at = stored_at or self._clock()
+        expires_at = stored_at + self._ttl
+        retain_until = (
+            expires_at + self._revalidate_window if (etag or last_modified) else expires_at
+        )
+        return CacheEntry(
+            value=value,
+            expires_at=expires_at,
+            retain_until=retain_until,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    # -- L1 API ------------------------------------------------------------
+
+    def get(self, key: K) -> V | None:
+        """Return a fresh value, or None if missing/expired.
+
+        Expired entries are dropped unless they carry validators and are
+        still inside the revalidation window.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._count("miss")
+            return None
+        now = self._clock()
+        if now > entry.expires_at:
+            if not self._retained(entry, now):
+                self._evict(key, "expired")
+                self._update_size()
+            self._count("miss")
+            return None
+        self._cache.move_to_end(key)
+        self._count("hit")
+        return entry.value
+
+    def get_entry(self, key: K) -> CacheEntry[V] | None:
+        """Return the entry (fresh or retained-stale) without counting a lookup."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        now = self._clock()
+        if now > entry.expires_at and not self._retained(entry, now):
+            return None
+        return entry
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a value with a fresh TTL (and optional HTTP validators)."""
+        self._put(key, self.make_entry(value, etag=etag, last_modified=last_modified))
+
+    def touch(self, key: K) -> bool:
+        """Restart the TTL of an entry confirmed unchanged (e.g. HTTP 304).
+
+        Returns:
+            True if the entry existed and was refreshed
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return False
+        refreshed = self.make_entry(entry.value, etag=entry.etag, last_modified=entry.last_modified)
+        self._put(key, refreshed)
+        return True
+
+    def invalidate(self, key: K) -> None:
+        """Drop one entry."""
+        if self._cache.pop(key, None) is not None:
+            self._update_size()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._cache.clear()
+        self._update_size()
+
+    def cleanup_expired(self) -> int:
+        """Remove entries past their TTL (and past retention, if any).
+
+        Returns:
+            Number of entries removed
+        """
+        now = self._clock()
+        expired = [
+            key
+            for key, entry in self._cache.items()
+            if now > entry.expires_at and not self._retained(entry, now)
+        ]
+        for key in expired:
+            self._evict(key, "expired")
+        if expired:
+            self._update_size()
+        return len(expired)
+
+    # -- read-through ------------------------------------------------------
+
+    async def get_or_load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[V | None]],
+        *,
+        l2: CacheBackend | None = None,
+        fill: bool = True,
+    ) -> V | None:
+        """Read-through lookup: L1, then L2, then ``loader`` (single-flight).
+
+        Concurrent callers for the same key share one L2 read and one loader
+        call. L2 entries are promoted into L1 even when stale so the loader
+        can revalidate against their validators.
+
+        Args:
+            key: Cache key
+            loader: Coroutine factory producing the value (None = not cacheable)
+            l2: Optional L2 backend for this lookup
+            fill: Store the loader's result in L1/L2. Pass False when the
+                loader caches for itself (e.g. to attach HTTP validators or
+                to skip caching partial results).
+
+        Returns:
+            Cached or loaded value, or None
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._count("coalesced")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leader was cancelled, not us: take over the load.
+                return await self.get_or_load(key, loader, l2=l2, fill=fill)
+
+        future: asyncio.Future[V | None] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._load(key, loader, l2, fill)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved: with no waiters the exception is re-raised below.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _load(
+        self,
+        key: K,
+        loader: Callable[[], Awaitable[V | None]],
+        l2: CacheBackend | None,
+        fill: bool,
+    ) -> V | None:
+        if l2 is not None:
+            try:
+                stored = await l2.get(key)
+            except Exception as exc:  # noqa: BLE001 — L2 is best-effort
+                logger.debug("L2 lookup failed for %s:%s: %s", self.namespace, key, exc)
+                stored = None
+            if stored is not None:
+                self._put(key, stored)
+                if self._clock() <= stored.expires_at:
+                    self._count("l2_hit")
+                    return stored.value
+
+        value = await loader()
+        if value is not None and fill:
+            entry = self.make_entry(value)
+            self._put(key, entry)
+            if l2 is not None:
+                try:
+                    await l2.set(key, entry)
+                except Exception as exc:  # noqa: BLE001 — L2 is best-effort
+                    logger.debug("L2 write failed for %s:%s: %s", self.namespace, key, exc)
+        return value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return current stats for diagnostics."""
+        return {
+            "entries": len(self._cache),
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl.total_seconds(),
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "l2_hits": self.stats.l2_hits,
+            "coalesced": self.stats.coalesced,
+            "evictions": dict(self.stats.evictions),
+        }
+
+
+# Namespace -> most recently constructed cache for that namespace.
+_registry: dict[str, TieredCache] = {}
+
+
+def get_cache_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every registered cache namespace."""
+    return {namespace: cache.snapshot() for namespace, cache in sorted(_registry.items())}
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 
 # TYPE_CHECKING import for UpdateDecision to avoid circular import
@@ -861,6 +862,7 @@ class UpdateChecker:
         container: Container,
         decision: UpdateDecision,
         fetch_response: FetchTagsResponse,
+        after_commit: list[Callable[[], Awaitable[None]]] | None = None,
     ) -> Update | None:
         """Apply a pre-computed update decision to a container.
 
@@ -875,6 +877,11 @@ class UpdateChecker:
             container: Container to apply decision to
             decision: Pre-computed UpdateDecision from UpdateDecisionMaker
             fetch_response: FetchTagsResponse containing tag data
+            after_commit: When given, side effects (changelog and VulnForge
+                lookups, auto-approval, notifications, events) are appended
+                here instead of run, for the caller to await once its
+                transaction has committed. They write to ``db`` and need
+                their own commit.
 
         Returns:
             Update object if update available, None otherwise
@@ -960,19 +967,21 @@ class UpdateChecker:
             else:
                 await UpdateChecker._clear_pending_updates(db, container.id)
 
-            # Refresh VulnForge baseline even without updates
-            if container.vulnforge_enabled:
-                await UpdateChecker._refresh_vulnforge_baseline(db, container)
+            async def report_no_update() -> None:
+                # Refresh VulnForge baseline even without updates
+                if container.vulnforge_enabled:
+                    await UpdateChecker._refresh_vulnforge_baseline(db, container)
 
-            await event_bus.publish(
-                {
-                    "type": "update-check-complete",
-                    "status": "no_update",
-                    "container_id": container.id,
-                    "container_name": container.name,
-                }
-            )
+                await event_bus.publish(
+                    {
+                        "type": "update-check-complete",
+                        "status": "no_update",
+                        "container_id": container.id,
+                        "container_name": container.name,
+                    }
+                )
 
+            await UpdateChecker._run_or_defer(report_no_update, after_commit)
             return None
 
         # Update available!
@@ -1013,17 +1022,20 @@ class UpdateChecker:
                     }
                 )
             logger.info(f"Update already exists for {container.name}")
-            await event_bus.publish(
-                {
-                    "type": "update-available",
-                    "container_id": container.id,
-                    "container_name": container.name,
-                    "from_tag": container.current_tag,
-                    "to_tag": latest_tag,
-                    "reason_type": existing_update.reason_type,
-                    "status": existing_update.status,
-                }
-            )
+            event = {
+                "type": "update-available",
+                "container_id": container.id,
+                "container_name": container.name,
+                "from_tag": container.current_tag,
+                "to_tag": latest_tag,
+                "reason_type": existing_update.reason_type,
+                "status": existing_update.status,
+            }
+
+            async def report_existing() -> None:
+                await event_bus.publish(event)
+
+            await UpdateChecker._run_or_defer(report_existing, after_commit)
             return existing_update
 
         # Prepare update record fields
@@ -1086,7 +1098,10 @@ class UpdateChecker:
                 f"Duplicate update detected for {container.name} "
                 f"({container.current_tag} -> {latest_tag}), using existing"
             )
-            await db.rollback()
+            # The savepoint already undid the INSERT; drop the pending row instead
+            # of rolling back the caller's (possibly batched) transaction.
+            if update in db:
+                db.expunge(update)
             result = await db.execute(
                 select(Update).where(
                     Update.container_id == container.id,
@@ -1100,67 +1115,80 @@ class UpdateChecker:
                 return existing_update
             raise ie
 
-        # Changelog enrichment (skip for digest updates)
-        if not is_digest_update:
-            release_source = container.release_source
-            detected_source = None
-            if not release_source:
-                detected_source = ComposeParser.extract_release_source(container.image)
-                if detected_source:
-                    logger.info(
-                        f"Auto-detected release source for {container.name}: {detected_source}"
-                    )
-                    release_source = detected_source
-
-            if release_source:
-                github_token = await SettingsService.get(
-                    db, "ghcr_token"
-                ) or await SettingsService.get(db, "github_token")
-                fetcher = ChangelogFetcher(github_token=github_token)
-                changelog = await fetcher.fetch(release_source, container.image, latest_tag)
-                if changelog:
-                    classified_type, summary = ChangelogClassifier.classify(changelog.raw_text)
-                    if classified_type != "unknown":
-                        update.reason_type = classified_type
-                    if summary:
-                        update.reason_summary = summary
-                    update.changelog = changelog.raw_text
-                    if changelog.url:
-                        update.changelog_url = changelog.url
-                    if detected_source:
-                        from sqlalchemy import update as sql_update
+        logger.info(f"Created update record for {container.name}")
 
-                        await db.execute(
-                            sql_update(Container)
-                            .where(Container.id == container.id)
-                            .values(release_source=detected_source)
+        async def enrich_and_notify() -> None:
+            # Changelog enrichment (skip for digest updates)
+            if not is_digest_update:
+                release_source = container.release_source
+                detected_source = None
+                if not release_source:
+                    detected_source = ComposeParser.extract_release_source(container.image)
+                    if detected_source:
+                        logger.info(
+                            f"Auto-detected release source for {container.name}: {detected_source}"
                         )
+                        release_source = detected_source
+
+                if release_source:
+                    github_token = await SettingsService.get(
+                        db, "ghcr_token"
+                    ) or await SettingsService.get(db, "github_token")
+                    fetcher = ChangelogFetcher(github_token=github_token)
+                    changelog = await fetcher.fetch(release_source, container.image, latest_tag)
+                    if changelog:
+                        classified_type, summary = ChangelogClassifier.classify(changelog.raw_text)
+                        if classified_type != "unknown":
+                            update.reason_type = classified_type
+                        if summary:
+                            update.reason_summary = summary
+                        update.changelog = changelog.raw_text
+                        if changelog.url:
+                            update.changelog_url = changelog.url
+                        if detected_source:
+                            from sqlalchemy import update as sql_update
+
+                            await db.execute(
+                                sql_update(Container)
+                                .where(Container.id == container.id)
+                                .values(release_source=detected_source)
+                            )
 
-        # VulnForge enrichment
-        if container.vulnforge_enabled and not is_digest_update:
-            await UpdateChecker._enrich_with_vulnforge(db, update, container)
-        elif container.vulnforge_enabled and is_digest_update:
-            await UpdateChecker._refresh_vulnforge_baseline(db, container)
-
-        # Auto-approval + notifications (shared logic with check_container)
-        await UpdateChecker._process_auto_approval_and_notify(db, update, container)
+            # VulnForge enrichment
+            if container.vulnforge_enabled and not is_digest_update:
+                await UpdateChecker._enrich_with_vulnforge(db, update, container)
+            elif container.vulnforge_enabled and is_digest_update:
+                await UpdateChecker._refresh_vulnforge_baseline(db, container)
 
-        logger.info(f"Created update record for {container.name}")
+            # Auto-approval + notifications (shared logic with check_container)
+            await UpdateChecker._process_auto_approval_and_notify(db, update, container)
 
-        await event_bus.publish(
-            {
-                "type": "update-available",
-                "container_id": container.id,
-                "container_name": container.name,
-                "from_tag": update.from_tag,
-                "to_tag": update.to_tag,
-                "reason_type": update.reason_type,
-                "status": update.status,
-            }
-        )
+            await event_bus.publish(
+                {
+                    "type": "update-available",
+                    "container_id": container.id,
+                    "container_name": container.name,
+                    "from_tag": update.from_tag,
+                    "to_tag": update.to_tag,
+                    "reason_type": update.reason_type,
+                    "status": update.status,
+                }
+            )
 
+        await UpdateChecker._run_or_defer(enrich_and_notify, after_commit)
         return update
 
+    @staticmethod
+    async def _run_or_defer(
+        effect: Callable[[], Awaitable[None]],
+        after_commit: list[Callable[[], Awaitable[None]]] | None,
+    ) -> None:
+        """Run a side effect now, or queue it for after the caller's commit."""
+        if after_commit is None:
+            await effect()
+        else:
+            after_commit.append(effect)
+
     @staticmethod
     async def _create_scope_violation_update(
         db: AsyncSession,
@@ -1231,7 +1259,8 @@ class UpdateChecker:
             )
         except IntegrityError:
             logger.debug(f"Scope-violation update already exists for {container.name}")
-            await db.rollback()
+            if scope_update in db:
+                db.expunge(scope_update)
 
     @staticmethod
     async def get_pending_updates(db: AsyncSession) -> list[Update]:
@@ -18,13 +18,16 @@ from app.models.container import Container
 from app.models.history import UpdateHistory
 from app.models.update import Update
 from app.services.compose_parser import ComposeParser
+from app.services.container_state import container_states
 from app.services.docker_access import (
     docker_subprocess_env,
     make_docker_client,
     resolve_docker_url,
-    resolve_docker_url_sync,
 )
+from app.services.docker_engine import DockerEngineError
+from app.services.docker_runtime_index import runtime_snapshot
 from app.services.event_bus import event_bus
+from app.services.history_aggregates import HistoryAggregates
 from app.services.registry_client import RegistryClientFactory
 from app.services.settings_service import SettingsService
 from app.utils.security import sanitize_log_message
@@ -125,7 +128,10 @@ class UpdateEngine:
         from sqlalchemy import text
 
         result = await db.execute(
-            text("SELECT id FROM update_history WHERE status = :status"),
+            text(
+                "SELECT id, date(coalesce(completed_at, started_at, created_at)) "
+                "FROM update_history WHERE status = :status"
+            ),
             {"status": "in_progress"},
         )
         stuck_records = result.fetchall()
@@ -148,6 +154,10 @@ class UpdateEngine:
                     "old_status": "in_progress",
                 },
             )
+            # Bulk SQL bypasses the flush hook that maintains the daily aggregates
+            days = {row[1] for row in stuck_records if row[1]}
+            days.add(datetime.now(UTC).date().isoformat())
+            await HistoryAggregates.recompute_days(db, days)
             await db.commit()
             logger.info(f"Cleaned up {count} stuck update history records")
             return count
@@ -220,14 +230,10 @@ class UpdateEngine:
         try:
             from app.services.compose_parser import ComposeParser
 
-            docker_url = await resolve_docker_url(db)
-            client = make_docker_client(docker_url)
-            try:
-                ComposeParser._resolve_runtime_info(client, container)
-                if container.compose_project or container.docker_name:
-                    await db.commit()
-            finally:
-                client.close()
+            index = await runtime_snapshot.get(db)
+            ComposeParser._resolve_runtime_info(index, container)
+            if container.compose_project or container.docker_name:
+                await db.commit()
         except Exception as e:
             logger.debug(f"Could not get compose_project for {container.name}: {e}")
 
@@ -1646,7 +1652,7 @@ class UpdateEngine:
 
     @staticmethod
     async def _check_container_runtime(container: Container) -> dict:
-        """Check container status via docker inspect instead of HTTP."""
+        """Check container status from the live container state store instead of HTTP."""
         inspect_targets: list[str] = []
         resolved_name = await UpdateEngine._resolve_container_runtime_name(container)
         if resolved_name:
@@ -1664,62 +1670,37 @@ class UpdateEngine:
                 continue
 
             try:
-                # Use async subprocess to avoid blocking
-                process = await asyncio.create_subprocess_exec(
-                    "docker",
-                    "inspect",
-                    "--format",
-                    "{{.State.Status}}",
-                    target,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=docker_subprocess_env(resolve_docker_url_sync()),
-                )
-
-                try:
-                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                        process.communicate(), timeout=10
-                    )
-                    stdout = stdout_bytes.decode("utf-8").strip() if stdout_bytes else ""
-
-                    if process.returncode == 0:
-                        status = stdout
-                        if status == "running":
-                            logger.info(
-                                f"Container {target} is running (docker inspect health check)"
-                            )
-                            return {
-                                "success": True,
-                                "method": "docker_inspect",
-                                "container": target,
-                            }
-
-                        logger.warning(f"Container {target} status: {status}")
-                        return {
-                            "success": False,
-                            "error": f"Container status: {status}",
-                            "container": target,
-                            # "running" means the main process is alive, so a
-                            # slow-but-healthy app still reports running. These
-                            # states mean the process died — the new image won't
-                            # stay up, so the caller can fail fast and roll back.
-                            "fatal": status in ("restarting", "exited", "dead"),
-                        }
+                state = await container_states.get(target)
+            except DockerEngineError as e:
+                last_error = f"Docker Engine API error: {str(e)}"
+                logger.error(f"Failed to inspect container {target}: {e}")
+                continue
 
-                    stderr = stderr_bytes.decode("utf-8").strip() if stderr_bytes else ""
-                    last_error = stderr or "Failed to inspect container"
-                    logger.error(f"Failed to inspect container {target}: {stderr}")
+            if state is None:
+                last_error = f"No such container: {target}"
+                logger.error(f"Failed to inspect container {target}: not found")
+                continue
 
-                except TimeoutError:
-                    last_error = "Container inspection timed out"
-                    logger.error(f"Timeout inspecting container {target}")
+            status = state.status
+            if status == "running":
+                logger.info(f"Container {target} is running (docker inspect health check)")
+                return {
+                    "success": True,
+                    "method": "docker_inspect",
+                    "container": target,
+                }
 
-            except subprocess.CalledProcessError as e:
-                last_error = f"Docker command failed: {str(e)}"
-                logger.error(f"Docker inspect command failed for {target}: {e}")
-            except (ValueError, KeyError, json.JSONDecodeError) as e:
-                last_error = f"Invalid Docker response: {str(e)}"
-                logger.error(f"Failed to parse Docker inspect output for {target}: {e}")
+            logger.warning(f"Container {target} status: {status}")
+            return {
+                "success": False,
+                "error": f"Container status: {status}",
+                "container": target,
+                # "running" means the main process is alive, so a
+                # slow-but-healthy app still reports running. These
+                # states mean the process died — the new image won't
+                # stay up, so the caller can fail fast and roll back.
+                "fatal": status in ("restarting", "exited", "dead"),
+            }
 
         return {
             "success": False,
@@ -1729,71 +1710,25 @@ class UpdateEngine:
 
     @staticmethod
     async def _resolve_container_runtime_name(container: Container) -> str | None:
-        """Attempt to resolve the actual Docker container name for a compose service."""
-        try:
-            base_filters = [
-                "--filter",
-                f"label=com.docker.compose.service={container.service_name}",
-            ]
-
-            filter_sets = [base_filters]
+        """Attempt to resolve the actual Docker container name for a compose service.
 
-            if container.compose_file:
-                project_name = Path(container.compose_file).parent.name
-                project_filters = base_filters + [
-                    "--filter",
-                    f"label=com.docker.compose.project={project_name}",
-                ]
-                filter_sets.insert(0, project_filters)
-
-            for filters in filter_sets:
-                cmd = ["docker", "ps", "--all", "--format", "{{.Names}}", *filters]
-
-                # Use async subprocess to avoid blocking
-                try:
-                    process = await asyncio.create_subprocess_exec(
-                        *cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        env=docker_subprocess_env(resolve_docker_url_sync()),
-                    )
-
-                    stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                        process.communicate(), timeout=10
-                    )
-
-                    if process.returncode != 0:
-                        stderr = stderr_bytes.decode("utf-8") if stderr_bytes else ""
-                        logger.debug(
-                            f"docker ps failed for service {container.service_name}: {stderr}"
-                        )
-                        continue
-
-                    stdout = stdout_bytes.decode("utf-8") if stdout_bytes else ""
-                    names = [line.strip() for line in stdout.splitlines() if line.strip()]
-                    if names:
-                        return names[0]
-
-                except TimeoutError:
-                    logger.debug(f"Timeout resolving container name for {container.service_name}")
-                    continue
+        Reads the shared runtime snapshot (one container listing) instead of
+        running ``docker ps`` with label filters.
+        """
+        try:
+            index = await runtime_snapshot.get()
+        except DockerEngineError as e:
+            logger.debug(f"Docker error resolving container name for {container.name}: {e}")
+            return None
 
-        except subprocess.CalledProcessError as e:
-            logger.debug(
-                f"Docker command failed resolving container name for {container.name}: {e}"
-            )
-        except FileNotFoundError as e:
-            # `docker` binary missing — happens in stripped-down test images
-            # and in some minimal containers. Treat as "couldn't resolve".
-            logger.debug(
-                f"docker CLI not available resolving container name for {container.name}: {e}"
-            )
-        except (ValueError, KeyError, json.JSONDecodeError) as e:
-            logger.debug(
-                f"Invalid Docker response resolving container name for {container.name}: {e}"
-            )
+        if container.compose_file:
+            project_name = Path(container.compose_file).parent.name
+            matches = index.by_project_service(project_name, container.service_name)
+            if matches:
+                return matches[0].name
 
-        return None
+        matches = index.by_service(container.service_name)
+        return matches[0].name if matches else None
 
     @staticmethod
     async def _fetch_latest_digest(container: Container, db: AsyncSession) -> str | None:
@@ -0,0 +1,296 @@
+"""Pre-parsed per-image version index.
+
+Selecting an update used to run ``_compare_versions`` against every tag of an
+image — normalizing, CalVer-classifying and arch/Windows-checking each one —
+and to repeat that for every ``get_latest_tag`` / ``get_latest_major_tag``
+call on the same image. For linuxserver/* images with thousands of tags that
+loop dominated a check run's CPU time.
+
+``VersionIndex`` parses a tag list once into ``IndexedTag`` records grouped
+into buckets by ``(variant, arch, calver)`` and sorted by normalized version.
+A scope query then becomes a pair of bisects per bucket (above the current
+version, below the scope / anchor / continuity bound) plus a scan of the few
+candidates in between. Indexes are cached by a fingerprint of the tag list,
+so an unchanged listing is never re-parsed.
+
+The selection rules mirror ``RegistryClient._compare_versions`` and
+``_is_better_version`` exactly; ``tests/test_version_index.py`` checks the two
+paths against each other.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from app.services.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+VERSION_INDEX_MAX_ENTRIES = 256
+VERSION_INDEX_TTL = timedelta(hours=6)
+
+# (variant, arch, calver)
+BucketKey = tuple[str | None, str | None, bool]
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedTag:
+    """One version tag, parsed once.
+
+    Attributes:
+        tag: Raw tag
+        position: Index in the source tag list (ties go to the earlier tag)
+        key: Normalized ``(major, minor, patch, extra)`` used for range checks
+        rank: Preference order among candidates (mirrors ``_is_better_version``)
+        variant: Variant suffix (LinuxServer counters normalized if requested)
+        arch: Canonical architecture marker, if any
+        calver: CalVer-structured tag
+        prerelease: Prerelease tag (alpha/beta/rc/nightly/...)
+        windows: Windows image tag (never a candidate on Linux hosts)
+    """
+
+    tag: str
+    position: int
+    key: tuple
+    rank: tuple
+    variant: str | None
+    arch: str | None
+    calver: bool
+    prerelease: bool
+    windows: bool
+
+    @property
+    def major(self) -> int:
+        return self.key[0]
+
+    def preference(self) -> tuple:
+        return (self.rank, -self.position)
+
+
+def _best(tags: Iterable[IndexedTag]) -> IndexedTag | None:
+    return max(tags, key=IndexedTag.preference, default=None)
+
+
+@dataclass(slots=True)
+class _SortedRun:
+    """Tags of one bucket sorted by normalized version, with a parallel key list."""
+
+    tags: list[IndexedTag] = field(default_factory=list)
+    keys: list[tuple] = field(default_factory=list)
+    best: IndexedTag | None = None
+
+    def seal(self) -> None:
+        self.tags.sort(key=lambda t: (t.key, t.position))
+        self.keys = [t.key for t in self.tags]
+        self.best = _best(self.tags)
+
+    def between(self, lower: tuple, upper: tuple | None) -> Sequence[IndexedTag]:
+        """Tags with ``lower < key`` and, when bounded, ``key < upper``."""
+        lo = bisect_right(self.keys, lower)
+        hi = len(self.keys) if upper is None else bisect_left(self.keys, upper, lo)
+        return self.tags[lo:hi]
+
+
+@dataclass(slots=True)
+class _Bucket:
+    all: _SortedRun = field(default_factory=_SortedRun)
+    stable: _SortedRun = field(default_factory=_SortedRun)
+
+    def run(self, include_prereleases: bool) -> _SortedRun:
+        return self.all if include_prereleases else self.stable
+
+
+@dataclass(frozen=True, slots=True)
+class Selection:
+    """Result of a scope query.
+
+    Attributes:
+        tag: Best valid update, or None
+        cross_scheme_rejected: Best CalVer candidate rejected for a SemVer
+            current tag (drives the "CalVer build blocked" badge)
+    """
+
+    tag: str | None
+    cross_scheme_rejected: str | None = None
+
+
+class VersionIndex:
+    """Sorted, bucketed view of an image's version tags."""
+
+    def __init__(self, tags: Sequence[IndexedTag]) -> None:
+        self.size = len(tags)
+        # Phase 1 (D9): majors of every parseable tag, prereleases, Windows
+        # and other variants included, for the continuity check.
+        self.majors: frozenset[int] = frozenset(t.major for t in tags)
+        self._buckets: dict[BucketKey, _Bucket] = {}
+        for t in tags:
+            if t.windows:
+                continue
+            bucket = self._buckets.setdefault((t.variant, t.arch, t.calver), _Bucket())
+            bucket.all.tags.append(t)
+            if not t.prerelease:
+                bucket.stable.tags.append(t)
+        for bucket in self._buckets.values():
+            bucket.all.seal()
+            bucket.stable.seal()
+
+    @classmethod
+    def build(
+        cls,
+        tags: Sequence[str],
+        describe: Callable[[str, int], IndexedTag | None],
+    ) -> VersionIndex:
+        """Parse a tag list.
+
+        Args:
+            tags: Raw tag list in registry order
+            describe: Parses one tag (and its list position); None for tags
+                that are not versions
+
+        Returns:
+            The index
+        """
+        parsed: list[IndexedTag] = []
+        for position, tag in enumerate(tags):
+            # A single malformed tag must not abort the whole selection.
+            try:
+                entry = describe(tag, position)
+            except Exception:
+                logger.exception("Failed to index tag %r", tag)
+                continue
+            if entry is not None:
+                parsed.append(entry)
+        return cls(parsed)
+
+    def _next_missing_major(self, major: int) -> int:
+        candidate = major + 1
+        while candidate in self.majors:
+            candidate += 1
+        return candidate
+
+    def select(
+        self,
+        current_key: tuple,
+        *,
+        variant: str | None,
+        arches: Iterable[str | None],
+        current_calver: bool,
+        scope: str,
+        include_prereleases: bool = False,
+        force_calver: bool = False,
+        stable_anchor_major: int | None = None,
+        check_continuity: bool = True,
+    ) -> Selection:
+        """Find the best update for a current version.
+
+        Args:
+            current_key: Normalized current version
+            variant: Current tag's variant track
+            arches: Acceptable candidate arch markers (None = unmarked)
+            current_calver: Effective CalVer classification of the current tag
+            scope: ``patch``, ``minor`` or anything else for ``major``
+            include_prereleases: Consider prerelease tags
+            force_calver: ``version_track == "calver"``; every candidate is
+                treated as CalVer
+            stable_anchor_major: Phase 5 anchor bound
+            check_continuity: Apply the Phase 1 continuity rule (callers that
+                did not enumerate the tag list pass False)
+
+        Returns:
+            The selected tag and the best cross-scheme rejection
+        """
+        major, minor = current_key[0], current_key[1]
+        upper_major: int | None = None
+        if stable_anchor_major is not None:
+            upper_major = stable_anchor_major
+        if check_continuity and not current_calver and not force_calver:
+            # Every major between current and candidate must be observed,
+            # so candidates stop just past the first missing major.
+            gap = self._next_missing_major(major)
+            upper_major = gap if upper_major is None else min(upper_major, gap)
+
+        if scope == "patch":
+            upper: tuple | None = (major, minor + 1)
+        elif scope == "minor":
+            upper = (major + 1,)
+        else:
+            upper = None
+        if upper_major is not None and (upper is None or (upper_major + 1,) < upper):
+            upper = (upper_major + 1,)
+
+        if force_calver:
+            flags: tuple[bool, ...] = (False, True)
+        else:
+            flags = (current_calver,)
+
+        arches = tuple(dict.fromkeys(arches))
+        matches: list[IndexedTag] = []
+        rejected: list[IndexedTag] = []
+        for arch in arches:
+            for calver in flags:
+                bucket = self._buckets.get((variant, arch, calver))
+                if bucket is not None:
+                    matches.extend(bucket.run(include_prereleases).between(current_key, upper))
+            if not force_calver and not current_calver:
+                bucket = self._buckets.get((variant, arch, True))
+                if bucket is not None:
+                    best = bucket.run(include_prereleases).best
+                    if best is not None:
+                        rejected.append(best)
+
+        best_match = _best(matches)
+        best_rejected = _best(rejected)
+        return Selection(
+            tag=best_match.tag if best_match else None,
+            cross_scheme_rejected=best_rejected.tag if best_rejected else None,
+        )
+
+
+def fingerprint(tags: Sequence[str]) -> str:
+    """Stable digest of a tag list (order-sensitive: ties follow list order)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for tag in tags:
+        digest.update(tag.encode("utf-8", "surrogatepass"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+# Process-global index cache keyed by (fingerprint, parse options).
+_index_cache: TieredCache[tuple[str, Any], VersionIndex] = TieredCache(
+    "version_index", max_entries=VERSION_INDEX_MAX_ENTRIES, ttl=VERSION_INDEX_TTL
+)
+
+
+def get_version_index(
+    tags: Sequence[str],
+    describe: Callable[[str, int], IndexedTag | None],
+    options: Any = None,
+) -> VersionIndex:
+    """Return the cached index for a tag list, building it on first use.
+
+    Args:
+        tags: Raw tag list
+        describe: Tag parser (see ``VersionIndex.build``)
+        options: Hashable parse options that change ``describe``'s output
+            (e.g. LinuxServer variant normalization)
+
+    Returns:
+        The index
+    """
+    key = (fingerprint(tags), options)
+    index = _index_cache.get(key)
+    if index is None:
+        index = VersionIndex.build(tags, describe)
+        _index_cache.set(key, index)
+    return index
+
+
+def get_version_index_cache() -> TieredCache[tuple[str, Any], VersionIndex]:
+    """Access the process-global version index cache."""
+    return _index_cache
@@ -23,7 +23,11 @@ os.environ["TIDEWATCH_TESTING"] = "true"
 
 from app.database import Base
 from app.models import *  # noqa: F403 - Import all models to ensure they're registered
-from app.services.auth import create_access_token, hash_password
+from app.services.auth import create_access_token, hash_password, invalidate_identity_cache
+from app.services.container_state import container_states
+from app.services.docker_runtime_index import runtime_snapshot
+from app.services.metrics_chunks import metrics_chunk_store
+from app.services.registry_token_cache import get_token_cache
 from app.services.settings_service import SettingsService
 
 
@@ -35,6 +39,48 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_settings_snapshot():
+    """Each test gets a fresh database, so drop the cached settings snapshot."""
+    SettingsService.invalidate_cache()
+    yield
+    SettingsService.invalidate_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_identity_cache():
+    """Admin identities cached for one test's tokens must not satisfy the next."""
+    invalidate_identity_cache()
+    yield
+    invalidate_identity_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics_chunk_store():
+    """Drop metrics samples buffered in the chunk store between tests."""
+    metrics_chunk_store.reset()
+    yield
+    metrics_chunk_store.reset()
+
+
+@pytest.fixture(autouse=True)
+def _reset_container_states():
+    """Container states observed in one test must not answer the next."""
+    container_states.reset()
+    runtime_snapshot.invalidate()
+    yield
+    container_states.reset()
+    runtime_snapshot.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry_token_cache():
+    """Keep cached registry bearer tokens from leaking between tests."""
+    get_token_cache().clear()
+    yield
+    get_token_cache().clear()
+
+
 @pytest.fixture(scope="function")
 async def db_engine():
     """Create a test database engine."""
@@ -7,9 +7,12 @@ Tests analytics and dashboard statistics endpoints:
 from datetime import UTC, datetime, timedelta
 
 from fastapi import status
+from sqlalchemy import select
 
 from app.models.container import Container
 from app.models.history import UpdateHistory
+from app.models.history_daily import UpdateHistoryDaily
+from app.services.update_engine import UpdateEngine
 
 
 class TestAnalyticsSummaryEndpoint:
@@ -336,3 +339,134 @@ class TestAnalyticsSummaryEndpoint:
             point = frequency[0]
             assert "date" in point
             assert "count" in point
+
+    async def test_summary_reflects_history_changes(self, authenticated_client, db):
+        """Daily aggregates follow status changes of existing history entries."""
+        container = Container(
+            name="rollback-test",
+            image="nginx",
+            current_tag="1.21",
+            registry="docker.io",
+            compose_file="/compose/test.yml",
+            service_name="nginx",
+        )
+        db.add(container)
+        await db.commit()
+        await db.refresh(container)
+
+        history = UpdateHistory(
+            container_id=container.id,
+            container_name=container.name,
+            from_tag="1.20",
+            to_tag="1.21",
+            status="success",
+            started_at=datetime.now(UTC) - timedelta(seconds=60),
+            completed_at=datetime.now(UTC),
+            cves_fixed=["CVE-2024-0001"],
+        )
+        db.add(history)
+        await db.commit()
+
+        first = (await authenticated_client.get("/api/v1/analytics/summary")).json()
+        assert first["successful_updates"] == 1
+        assert first["updates_with_cves"] == 1
+        assert 59 <= first["avg_update_duration_seconds"] <= 61
+
+        history.status = "rolled_back"
+        await db.commit()
+
+        second = (await authenticated_client.get("/api/v1/analytics/summary")).json()
+        assert second["total_updates"] == 1
+        assert second["successful_updates"] == 0
+        assert second["update_frequency"] == []
+
+    async def test_summary_longer_period(self, authenticated_client, db):
+        """period_days widens the window to older daily aggregates."""
+        container = Container(
+            name="old-update",
+            image="nginx",
+            current_tag="1.21",
+            registry="docker.io",
+            compose_file="/compose/test.yml",
+            service_name="nginx",
+        )
+        db.add(container)
+        await db.commit()
+        await db.refresh(container)
+
+        completed = datetime.now(UTC) - timedelta(days=200)
+        db.add(
+            UpdateHistory(
+                container_id=container.id,
+                container_name=container.name,
+                from_tag="1.20",
+                to_tag="1.21",
+                status="success",
+                started_at=completed,
+                completed_at=completed,
+                created_at=completed,
+            )
+        )
+        await db.commit()
+
+        default = (await authenticated_client.get("/api/v1/analytics/summary")).json()
+        year = (await authenticated_client.get("/api/v1/analytics/summary?period_days=365")).json()
+
+        assert default["total_updates"] == 0
+        assert year["period_days"] == 365
+        assert year["total_updates"] == 1
+        assert year["update_frequency"] == [{"date": completed.date().isoformat(), "count": 1}]
+
+
+class TestDailyAggregateMaintenance:
+    """update_history_daily is written with the history change, not on read."""
+
+    async def _daily(self, db) -> dict[str, UpdateHistoryDaily]:
+        result = await db.execute(
+            select(UpdateHistoryDaily).execution_options(populate_existing=True)
+        )
+        return {row.day: row for row in result.scalars().all()}
+
+    async def test_aggregate_commits_with_history_write(self, db):
+        completed = datetime.now(UTC) - timedelta(days=3)
+        db.add(
+            UpdateHistory(
+                container_name="agg",
+                from_tag="1.0",
+                to_tag="1.1",
+                status="success",
+                completed_at=completed,
+            )
+        )
+        await db.commit()
+
+        day = (await self._daily(db))[completed.date().isoformat()]
+        assert day.total_updates == 1
+        assert day.successful_updates == 1
+
+    async def test_aggregate_rolls_back_with_history_write(self, db):
+        db.add(UpdateHistory(container_name="agg", from_tag="1.0", to_tag="1.1", status="success"))
+        await db.flush()
+        await db.rollback()
+
+        assert await self._daily(db) == {}
+
+    async def test_recovered_stuck_records_move_between_days(self, db):
+        started = datetime.now(UTC) - timedelta(days=2)
+        db.add(
+            UpdateHistory(
+                container_name="stuck",
+                from_tag="1.0",
+                to_tag="1.1",
+                status="in_progress",
+                started_at=started,
+            )
+        )
+        await db.commit()
+        assert started.date().isoformat() in await self._daily(db)
+
+        assert await UpdateEngine.recover_stuck_records(db) == 1
+
+        daily = await self._daily(db)
+        assert started.date().isoformat() not in daily
+        assert daily[datetime.now(UTC).date().isoformat()].failed_updates == 1
@@ -1041,3 +1041,92 @@ class TestRestartSelfManagedGuard:
             response = await authenticated_client.post(f"/api/v1/containers/{container.id}/restart")
 
         assert response.status_code == 200
+
+
+class TestMetricsSummary:
+    """GET /api/v1/containers/metrics/summary — bulk dashboard metrics."""
+
+    @pytest.fixture
+    async def collected(self, db, make_container, monkeypatch):
+        """Two containers, one with samples, and a recorded collection cycle."""
+        from datetime import datetime, timedelta
+
+        from app.models.metrics_history import MetricsHistory
+        from app.services.metrics_collector import MetricsCollector
+
+        alpha = make_container(name="alpha")
+        beta = make_container(name="beta")
+        db.add_all([alpha, beta])
+        await db.commit()
+
+        until = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+        for minutes, cpu in ((45, 10.0), (52, 20.0), (58, 40.0)):
+            db.add(
+                MetricsHistory(
+                    container_id=alpha.id,
+                    collected_at=until - timedelta(hours=1) + timedelta(minutes=minutes),
+                    cpu_percent=cpu,
+                    memory_usage=100,
+                    memory_limit=1000,
+                    memory_percent=10.0,
+                    network_rx=0,
+                    network_tx=0,
+                    block_read=0,
+                    block_write=0,
+                    pids=3,
+                )
+            )
+        await db.commit()
+        monkeypatch.setattr(MetricsCollector, "last_collection_at", until)
+        return alpha, beta
+
+    async def test_returns_latest_and_sparkline(self, authenticated_client, collected):
+        alpha, beta = collected
+
+        response = await authenticated_client.get(
+            "/api/v1/containers/metrics/summary", params={"points": 6}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["buckets"]) == 6
+        by_name = {c["name"]: c for c in body["containers"]}
+        assert by_name["alpha"]["latest"]["cpu_percent"] == 40.0
+        # 10-minute buckets: 11:45 alone, then 11:52 and 11:58 averaged
+        assert by_name["alpha"]["sparkline"]["cpu_percent"][-2:] == [10.0, 30.0]
+        assert by_name["alpha"]["sparkline"]["cpu_percent"][0] is None
+        assert by_name["beta"]["latest"] is None
+
+    async def test_filters_by_container_id(self, authenticated_client, collected):
+        _alpha, beta = collected
+
+        response = await authenticated_client.get(
+            "/api/v1/containers/metrics/summary", params={"container_id": beta.id}
+        )
+
+        assert [c["name"] for c in response.json()["containers"]] == ["beta"]
+
+    async def test_etag_revalidation(self, authenticated_client, collected, monkeypatch):
+        from datetime import timedelta
+
+        from app.services.metrics_collector import MetricsCollector
+
+        first = await authenticated_client.get("/api/v1/containers/metrics/summary")
+        etag = first.headers["ETag"]
+
+        cached = await authenticated_client.get(
+            "/api/v1/containers/metrics/summary", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+
+        # A new collection cycle changes the representation
+        collected_at = MetricsCollector.last_collection_at
+        assert collected_at is not None
+        monkeypatch.setattr(
+            MetricsCollector, "last_collection_at", collected_at + timedelta(minutes=5)
+        )
+        fresh = await authenticated_client.get(
+            "/api/v1/containers/metrics/summary", headers={"If-None-Match": etag}
+        )
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] != etag
@@ -258,3 +258,101 @@ class TestEventStreamEndpoint:
 
         # Cleanup
         await test_bus.unsubscribe(queue)
+
+    async def test_event_ids_increase(self, authenticated_client):
+        """Every published event gets a larger id than the previous one."""
+        from app.services.event_bus import EventBus
+
+        test_bus = EventBus()
+        subscription = await test_bus.subscribe()
+
+        await test_bus.publish({"type": "event1"})
+        await test_bus.publish({"type": "event2"})
+
+        first = await subscription.get_event()
+        second = await subscription.get_event()
+        assert second.id > first.id
+        assert test_bus.last_event_id == second.id
+
+    async def test_slow_consumer_buffer_is_bounded(self, authenticated_client):
+        """A consumer that falls behind keeps only the newest events."""
+        from app.services.event_bus import EventBus
+
+        test_bus = EventBus(buffer_size=3)
+        subscription = await test_bus.subscribe()
+
+        for i in range(5):
+            await test_bus.publish({"type": "test", "n": i})
+
+        assert subscription.pending() == 3
+        assert subscription.dropped == 2
+        received = [json.loads(await subscription.get())["n"] for _ in range(3)]
+        assert received == [2, 3, 4]
+        assert subscription in test_bus._listeners
+
+    async def test_progress_events_coalesce_per_job(self, authenticated_client):
+        """Pending progress events of one job collapse to the latest."""
+        from app.services.event_bus import EventBus
+
+        test_bus = EventBus()
+        subscription = await test_bus.subscribe()
+
+        await test_bus.publish({"type": "check-job-progress", "job_id": 1, "checked_count": 1})
+        await test_bus.publish({"type": "check-job-progress", "job_id": 2, "checked_count": 1})
+        await test_bus.publish({"type": "check-job-progress", "job_id": 1, "checked_count": 2})
+        await test_bus.publish({"type": "check-job-complete", "job_id": 1})
+
+        received = [json.loads(await subscription.get()) for _ in range(3)]
+        assert [(e["type"], e["job_id"], e.get("checked_count")) for e in received] == [
+            ("check-job-progress", 2, 1),
+            ("check-job-progress", 1, 2),
+            ("check-job-complete", 1, None),
+        ]
+        assert subscription.pending() == 0
+
+    async def test_subscribe_replays_after_last_event_id(self, authenticated_client):
+        """Reconnecting subscribers receive events published since their last id."""
+        from app.services.event_bus import EventBus
+
+        test_bus = EventBus()
+        first = await test_bus.subscribe()
+        for i in range(4):
+            await test_bus.publish({"type": "test", "n": i})
+        seen = [await first.get_event() for _ in range(2)]
+        await test_bus.unsubscribe(first)
+
+        resumed = await test_bus.subscribe(last_event_id=seen[-1].id)
+
+        assert [json.loads(await resumed.get())["n"] for _ in range(2)] == [2, 3]
+        assert resumed.pending() == 0
+
+    async def test_stream_honors_last_event_id(self, authenticated_client):
+        """The SSE stream sends event ids and resumes from Last-Event-ID."""
+        from app.services.event_bus import EventBus
+
+        test_bus = EventBus()
+        await test_bus.publish({"type": "missed", "n": 1})
+        resume_id = test_bus.last_event_id
+        await test_bus.publish({"type": "missed", "n": 2})
+
+        with (
+            patch("app.routes.events.event_bus", test_bus),
+            patch(
+                "app.routes.events.Request.is_disconnected",
+                new_callable=AsyncMock,
+                side_effect=[False, True],
+            ),
+        ):
+            async with authenticated_client.stream(
+                "GET",
+                "/api/v1/events/stream",
+                headers={"Last-Event-ID": str(resume_id)},
+                timeout=2.0,
+            ) as response:
+                assert response.status_code == status.HTTP_200_OK
+                lines = [line async for line in response.aiter_lines()]
+
+        assert lines[0] == 'data: {"type":"connected"}'
+        assert lines[2] == f"id: {test_bus.last_event_id}"
+        assert json.loads(lines[3].removeprefix("data: "))["n"] == 2
+        assert len(test_bus._listeners) == 0
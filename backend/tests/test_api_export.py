@@ -0,0 +1,164 @@
+"""Tests for bulk export API (app/routes/export.py).
+
+Tests streaming export endpoints:
+- GET /api/v1/export/history - Update history as CSV/NDJSON
+- GET /api/v1/export/restarts - Restart logs as CSV/NDJSON
+- GET /api/v1/export/metrics - Raw metrics (rows and chunks)
+"""
+
+import csv
+import io
+import json
+from datetime import UTC, datetime, timedelta
+
+from fastapi import status
+
+START = datetime(2026, 10, 1, 12, 0, tzinfo=UTC)
+
+
+def metrics_sample(i: int) -> dict:
+    """Collector-shaped metrics dict for sample ``i``."""
+    return {
+        "cpu_percent": float(i),
+        "memory_usage": 100 + i,
+        "memory_limit": 1000,
+        "memory_percent": 10.0,
+        "network_rx": 0,
+        "network_tx": 0,
+        "block_read": 0,
+        "block_write": 0,
+        "pids": 3,
+    }
+
+
+class TestExportHistory:
+    """Test suite for GET /api/v1/export/history."""
+
+    async def _seed(self, db, make_container, count):
+        from app.models.history import UpdateHistory
+
+        container = make_container(name="web", image="nginx:1.20", current_tag="1.20")
+        other = make_container(name="db", image="postgres:16", current_tag="16")
+        db.add_all([container, other])
+        await db.commit()
+        for i in range(count):
+            db.add(
+                UpdateHistory(
+                    container_id=container.id if i % 2 == 0 else other.id,
+                    container_name=container.name if i % 2 == 0 else other.name,
+                    from_tag=f"1.{i}",
+                    to_tag=f"1.{i + 1}",
+                    status="success",
+                    started_at=START + timedelta(hours=i),
+                )
+            )
+        await db.commit()
+        return container
+
+    async def test_csv_streams_all_rows_in_batches(self, authenticated_client, db, make_container):
+        """Every row is exported, oldest first, across several body batches."""
+        from app.services import data_export
+
+        await self._seed(db, make_container, 7)
+        original = data_export.BATCH_ROWS
+        data_export.BATCH_ROWS = 2
+        try:
+            response = await authenticated_client.get("/api/v1/export/history")
+        finally:
+            data_export.BATCH_ROWS = original
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [row["to_tag"] for row in rows] == [f"1.{i + 1}" for i in range(7)]
+        assert "event_type" in rows[0]
+
+    async def test_ndjson_filters_container_and_range(
+        self, authenticated_client, db, make_container
+    ):
+        """Container and date filters apply; NDJSON has one object per line."""
+        container = await self._seed(db, make_container, 7)
+
+        response = await authenticated_client.get(
+            "/api/v1/export/history",
+            params={
+                "format": "ndjson",
+                "container_id": container.id,
+                "start": (START + timedelta(hours=1)).isoformat(),
+                "end": (START + timedelta(hours=4)).isoformat(),
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["to_tag"] for r in records] == ["1.3", "1.5"]
+        assert all(r["container_id"] == container.id for r in records)
+
+    async def test_invalid_format_rejected(self, authenticated_client):
+        """Unknown formats are rejected."""
+        response = await authenticated_client.get("/api/v1/export/history?format=xml")
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    async def test_requires_auth(self, client, db):
+        """Test requires authentication."""
+        from app.services.settings_service import SettingsService
+
+        await SettingsService.set(db, "auth_mode", "local")
+        await db.commit()
+
+        response = await client.get("/api/v1/export/history")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestExportRestarts:
+    """Test suite for GET /api/v1/export/restarts."""
+
+    async def test_empty_csv_has_header(self, authenticated_client, db):
+        """An empty export still carries the CSV header."""
+        response = await authenticated_client.get("/api/v1/export/restarts")
+
+        assert response.status_code == status.HTTP_200_OK
+        header = next(csv.reader(io.StringIO(response.text)))
+        assert "executed_at" in header
+        assert "trigger_reason" in header
+
+
+class TestExportMetrics:
+    """Test suite for GET /api/v1/export/metrics."""
+
+    async def test_exports_rows_and_chunks(self, authenticated_client, db, make_container):
+        """Samples stored as rows, as chunks and still buffered are all exported."""
+        from app.models.metrics_history import MetricsHistory
+        from app.services.metrics_chunks import metrics_chunk_store
+
+        container = make_container(name="web", image="nginx:1.20", current_tag="1.20")
+        db.add(container)
+        await db.commit()
+
+        for i in range(3):
+            db.add(
+                MetricsHistory(
+                    container_id=container.id,
+                    collected_at=START + timedelta(minutes=5 * i),
+                    **metrics_sample(i),
+                )
+            )
+        await db.commit()
+        # One closed (flushed) hour, then samples still buffered in the open hour
+        for i in range(3, 16):
+            metrics_chunk_store.append(
+                container.id, START + timedelta(minutes=5 * i), metrics_sample(i)
+            )
+        await metrics_chunk_store.flush(db)
+
+        response = await authenticated_client.get(
+            "/api/v1/export/metrics",
+            params={"format": "ndjson", "end": (START + timedelta(minutes=75)).isoformat()},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["cpu_percent"] for r in records] == [float(i) for i in range(16)]
+        assert all(r["container_id"] == container.id for r in records)
@@ -303,6 +303,146 @@ class TestGetHistoryEndpoint:
                 )
                 assert current >= next_item
 
+    async def test_get_history_cursor_pagination(self, authenticated_client, db, make_container):
+        """Cursor pages cover every event once, across kinds and timestamp ties."""
+        import json
+
+        from app.models.history import UpdateHistory
+        from app.models.sibling_drift_event import SiblingDriftEvent
+
+        container = make_container(name="test-container", image="nginx:1.20", current_tag="1.20")
+        db.add(container)
+        await db.commit()
+        await db.refresh(container)
+
+        base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        for i in range(7):
+            # Pairs of updates share a timestamp
+            db.add(
+                UpdateHistory(
+                    container_id=container.id,
+                    container_name=container.name,
+                    from_tag=f"1.{i}",
+                    to_tag=f"1.{i + 1}",
+                    status="success",
+                    started_at=base - timedelta(minutes=i // 2),
+                )
+            )
+        for i in range(3):
+            # Drift ties with updates
+            db.add(
+                SiblingDriftEvent(
+                    compose_file="/compose.yml",
+                    registry="docker.io",
+                    image="nginx",
+                    sibling_names=json.dumps(["a", "b"]),
+                    dominant_tag="1.20",
+                    per_container_tags=json.dumps({"a": "1.20", "b": "1.19"}),
+                    detected_at=base - timedelta(minutes=i),
+                )
+            )
+        await db.commit()
+
+        full = await authenticated_client.get("/api/v1/history?limit=500")
+        assert full.status_code == status.HTTP_200_OK
+        assert "X-Next-Cursor" not in full.headers
+        expected = [(e["event_type"], e["id"]) for e in full.json()]
+        assert len(expected) == 10
+
+        seen = []
+        url = "/api/v1/history?limit=3"
+        while True:
+            response = await authenticated_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            seen += [(e["event_type"], e["id"]) for e in response.json()]
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            url = f"/api/v1/history?limit=3&cursor={next_cursor}"
+
+        assert seen == expected
+        started = [
+            datetime.fromisoformat(e["started_at"].replace("Z", "+00:00")) for e in full.json()
+        ]
+        assert started == sorted(started, reverse=True)
+
+        # skip still works without a cursor
+        response = await authenticated_client.get("/api/v1/history?skip=4&limit=3")
+        assert [(e["event_type"], e["id"]) for e in response.json()] == expected[4:7]
+
+    async def test_get_history_cursor_pages_through_null_timestamps(
+        self, authenticated_client, db, make_container
+    ):
+        """Entries without a start time form the tail of the feed and page by id."""
+        from sqlalchemy import update
+
+        from app.models.history import UpdateHistory
+
+        container = make_container(name="test-container", image="nginx:1.20", current_tag="1.20")
+        db.add(container)
+        await db.commit()
+        await db.refresh(container)
+
+        base = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        for i in range(5):
+            db.add(
+                UpdateHistory(
+                    container_id=container.id,
+                    container_name=container.name,
+                    from_tag=f"1.{i}",
+                    to_tag=f"1.{i + 1}",
+                    status="success",
+                    started_at=base - timedelta(minutes=i),
+                )
+            )
+        await db.commit()
+        # started_at has a server default, so NULLs only come from older rows
+        await db.execute(
+            update(UpdateHistory)
+            .where(UpdateHistory.from_tag.in_(["1.1", "1.3"]))
+            .values(started_at=None)
+        )
+        await db.commit()
+
+        full = await authenticated_client.get("/api/v1/history?limit=500")
+        expected = [e["id"] for e in full.json()]
+        assert [e["from_tag"] for e in full.json()] == ["1.0", "1.2", "1.4", "1.3", "1.1"]
+
+        seen = []
+        url = "/api/v1/history?limit=2"
+        while True:
+            response = await authenticated_client.get(url)
+            seen += [e["id"] for e in response.json()]
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if not next_cursor:
+                break
+            url = f"/api/v1/history?limit=2&cursor={next_cursor}"
+
+        assert seen == expected
+
+    async def test_cursor_page_seeks_every_arm(self, db):
+        """Each arm of a cursor page reads its index by range, never a full scan."""
+        from sqlalchemy import select, text, union_all
+
+        from app.services.history_feed import HistoryCursor, HistoryFilters, _arms
+
+        for cursor in (
+            HistoryCursor(ts="2026-01-01 12:00:00", kind="restart", id=5),
+            HistoryCursor(ts=None, kind="update", id=5),
+        ):
+            feed = union_all(*_arms(HistoryFilters(), cursor)).subquery()
+            query = select(feed.c.ts, feed.c.kind, feed.c.id).order_by(
+                feed.c.ts.desc(), feed.c.kind.desc(), feed.c.id.desc()
+            )
+            sql = str(query.compile(db.bind, compile_kwargs={"literal_binds": True}))
+            plan = [row[3] for row in (await db.execute(text(f"EXPLAIN QUERY PLAN {sql}"))).all()]
+            assert not [step for step in plan if step.startswith("SCAN")], plan
+
+    async def test_get_history_invalid_cursor(self, authenticated_client, db):
+        """A malformed cursor is rejected."""
+        response = await authenticated_client.get("/api/v1/history?cursor=not-a-cursor")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     async def test_get_history_requires_auth(self, client, db):
         """Test requires authentication."""
         from app.services.settings_service import SettingsService
@@ -673,3 +673,62 @@ class TestAuthMode:
         mode = await get_auth_mode(mock_db)
 
         assert mode == "none"
+
+
+class TestIdentityCache:
+    """Test suite for the per-token admin identity cache."""
+
+    async def _setup_admin(self, db):
+        from app.services.auth import create_admin_user
+        from app.services.settings_service import SettingsService
+
+        await SettingsService.set(db, "auth_mode", "local")
+        await create_admin_user(db, "admin", "admin@example.com", hash_password("password"))
+        return create_access_token({"sub": "admin", "username": "admin"})
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_profile_lookup(self, db):
+        """A validated token's profile is reused without another DB read."""
+        from unittest.mock import MagicMock
+
+        from app.services.auth import get_current_admin
+
+        token = await self._setup_admin(db)
+        with patch("app.services.auth.get_admin_profile", wraps=get_admin_profile) as lookup:
+            first = await get_current_admin(MagicMock(), db, token)
+            second = await get_current_admin(MagicMock(), db, token)
+
+        assert first == second
+        assert first["email"] == "admin@example.com"
+        assert lookup.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_profile_update_invalidates(self, db):
+        """Profile writes are visible on the next request."""
+        from unittest.mock import MagicMock
+
+        from app.services.auth import get_current_admin
+
+        token = await self._setup_admin(db)
+        await get_current_admin(MagicMock(), db, token)
+
+        await update_admin_profile(db, email="new@example.com")
+        profile = await get_current_admin(MagicMock(), db, token)
+
+        assert profile["email"] == "new@example.com"
+
+    @pytest.mark.asyncio
+    async def test_auth_mode_change_invalidates(self, db):
+        """Changing auth_mode drops cached identities."""
+        from unittest.mock import MagicMock
+
+        from app.services.auth import get_current_admin
+        from app.services.settings_service import SettingsService
+
+        token = await self._setup_admin(db)
+        with patch("app.services.auth.get_admin_profile", wraps=get_admin_profile) as lookup:
+            await get_current_admin(MagicMock(), db, token)
+            await SettingsService.set(db, "auth_mode", "oidc")
+            await get_current_admin(MagicMock(), db, token)
+
+        assert lookup.await_count == 2
@@ -0,0 +1,106 @@
+"""Tests for the incremental check mode (app/services/change_detection.py).
+
+Tests the skip decision for unchanged images:
+- Fingerprints follow registry state and check settings
+- Incomplete probes, missing fingerprints and stale checks force a full check
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from app.models.container import Container
+from app.services.change_detection import ImageProbe, container_fingerprint, is_unchanged
+
+PROBE = ImageProbe(listing="1.2.4@2026-10-01T00:00:00Z", digest="sha256:aaa")
+MAX_AGE = timedelta(hours=24)
+
+
+def make_container(**overrides) -> Container:
+    """Create an unsaved Container with sensible defaults."""
+    defaults = {
+        "id": 1,
+        "name": "app",
+        "image": "nginx",
+        "current_tag": "1.2.3",
+        "current_digest": None,
+        "registry": "docker.io",
+        "compose_file": "/compose/app.yml",
+        "service_name": "app",
+        "scope": "patch",
+        "policy": "monitor",
+        "include_prereleases": None,
+        "last_checked": datetime.now(UTC) - timedelta(hours=1),
+    }
+    defaults.update(overrides)
+    return Container(**defaults)
+
+
+class TestContainerFingerprint:
+    """Fingerprint inputs."""
+
+    def test_stable_for_same_state(self):
+        container = make_container()
+        assert container_fingerprint(PROBE, container, False) == container_fingerprint(
+            PROBE, make_container(), False
+        )
+
+    def test_changes_with_registry_state(self):
+        container = make_container()
+        base = container_fingerprint(PROBE, container, False)
+
+        pushed = ImageProbe(listing="1.2.5@2026-10-02T00:00:00Z", digest="sha256:aaa")
+        rebuilt = ImageProbe(listing=PROBE.listing, digest="sha256:bbb")
+        assert container_fingerprint(pushed, container, False) != base
+        assert container_fingerprint(rebuilt, container, False) != base
+
+    def test_changes_with_check_settings(self):
+        base = container_fingerprint(PROBE, make_container(), False)
+
+        assert container_fingerprint(PROBE, make_container(scope="minor"), False) != base
+        assert container_fingerprint(PROBE, make_container(policy="auto"), False) != base
+        assert container_fingerprint(PROBE, make_container(), True) != base
+
+    def test_incomplete_probe_has_no_fingerprint(self):
+        container = make_container()
+        assert container_fingerprint(ImageProbe(None, "sha256:aaa"), container, False) is None
+        assert container_fingerprint(ImageProbe(PROBE.listing, None), container, False) is None
+
+
+class TestIsUnchanged:
+    """Skip decision."""
+
+    def test_matching_recent_fingerprint_is_skipped(self):
+        container = make_container()
+        fingerprint = container_fingerprint(PROBE, container, False)
+        container.check_fingerprint = fingerprint
+
+        assert is_unchanged(container, fingerprint, MAX_AGE) is True
+
+    def test_first_check_is_not_skipped(self):
+        container = make_container(check_fingerprint=None)
+        fingerprint = container_fingerprint(PROBE, container, False)
+
+        assert is_unchanged(container, fingerprint, MAX_AGE) is False
+
+    def test_changed_or_incomplete_probe_is_not_skipped(self):
+        container = make_container(check_fingerprint="stale")
+
+        assert (
+            is_unchanged(container, container_fingerprint(PROBE, container, False), MAX_AGE)
+            is False
+        )
+        assert is_unchanged(container, None, MAX_AGE) is False
+
+    def test_old_full_check_is_not_skipped(self):
+        container = make_container(last_checked=datetime.now(UTC) - timedelta(hours=25))
+        fingerprint = container_fingerprint(PROBE, container, False)
+        container.check_fingerprint = fingerprint
+
+        assert is_unchanged(container, fingerprint, MAX_AGE) is False
+
+    def test_naive_last_checked_is_treated_as_utc(self):
+        naive = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+        container = make_container(last_checked=naive)
+        fingerprint = container_fingerprint(PROBE, container, False)
+        container.check_fingerprint = fingerprint
+
+        assert is_unchanged(container, fingerprint, MAX_AGE) is True
@@ -0,0 +1,259 @@
+"""Tests for batched check-job writes (app/services/check_result_writer.py).
+
+Tests how CheckResultWriter persists decisions:
+- One flush (and one progress callback) per full batch
+- Interval and close() flushes for partial batches
+- Per-container error isolation inside a batch
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.models.container import Container
+from app.services.change_detection import ImageProbe
+from app.services.check_result_writer import CheckOutcome, CheckResultWriter, PendingDecision
+
+APPLY_DECISION = "app.services.check_result_writer.UpdateChecker.apply_decision"
+
+
+@dataclass
+class FakeFetchResponse:
+    """Minimal stand-in for FetchTagsResponse."""
+
+    latest_tag: str | None = "1.2.4"
+    all_tags: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+async def make_containers(db, count: int) -> list[Container]:
+    """Insert ``count`` containers and return them."""
+    containers = [
+        Container(
+            name=f"app-{i}",
+            image="nginx",
+            current_tag="1.2.3",
+            registry="docker.io",
+            compose_file="/compose/app.yml",
+            service_name=f"app-{i}",
+            policy="monitor",
+            scope="patch",
+        )
+        for i in range(count)
+    ]
+    db.add_all(containers)
+    await db.commit()
+    return containers
+
+
+def pending(container: Container, **overrides) -> PendingDecision:
+    """Build a PendingDecision for a container."""
+    values = {
+        "container_id": container.id,
+        "container_name": container.name,
+        "decision": MagicMock(),
+        "fetch_response": FakeFetchResponse(),
+    }
+    values.update(overrides)
+    return PendingDecision(**values)
+
+
+def flushed(on_flush: AsyncMock) -> list[CheckOutcome]:
+    """Outcomes passed to the most recent on_flush call."""
+    assert on_flush.await_args is not None
+    return on_flush.await_args.args[0]
+
+
+class TestBatching:
+    """Flush cadence and progress coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_once(self, db, mock_async_session_local):
+        containers = await make_containers(db, 3)
+        batches: list[list[CheckOutcome]] = []
+
+        async def on_flush(outcomes):
+            batches.append(outcomes)
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush, batch_size=3)
+        with patch(APPLY_DECISION, new=AsyncMock(return_value=None)) as apply_mock:
+            for container in containers[:2]:
+                await writer.submit(pending(container))
+            assert batches == []
+
+            await writer.submit(pending(containers[2]))
+
+        assert apply_mock.await_count == 3
+        assert len(batches) == 1
+        assert [o.container_name for o in batches[0]] == ["app-0", "app-1", "app-2"]
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_partial_batch(self, db, mock_async_session_local):
+        containers = await make_containers(db, 2)
+        on_flush = AsyncMock()
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush, batch_size=10)
+        update = MagicMock(from_tag="1.2.3", to_tag="1.2.4")
+        with patch(APPLY_DECISION, new=AsyncMock(side_effect=[update, None])):
+            for container in containers:
+                await writer.submit(pending(container))
+            await writer.record_unchanged(99, "skipped")
+            await writer.close()
+
+        on_flush.assert_awaited_once()
+        outcomes = {o.container_name: o for o in flushed(on_flush)}
+        assert outcomes["app-0"].update_found is True
+        assert outcomes["app-0"].to_tag == "1.2.4"
+        assert outcomes["app-1"].update_found is False
+        assert outcomes["skipped"].unchanged is True
+
+    @pytest.mark.asyncio
+    async def test_interval_flushes_without_full_batch(self, db, mock_async_session_local):
+        containers = await make_containers(db, 1)
+        on_flush = AsyncMock()
+
+        writer = CheckResultWriter(
+            mock_async_session_local, on_flush, batch_size=10, flush_interval=0.01
+        )
+        writer.start()
+        with patch(APPLY_DECISION, new=AsyncMock(return_value=None)):
+            await writer.submit(pending(containers[0]))
+            await asyncio.sleep(0.05)
+            on_flush.assert_awaited_once()
+            await writer.close()
+
+        # Nothing left to flush on close.
+        on_flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deferred_container_is_reported_without_writing(
+        self, db, mock_async_session_local
+    ):
+        containers = await make_containers(db, 1)
+        containers[0].check_fingerprint = "fp"
+        await db.commit()
+        on_flush = AsyncMock()
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush)
+        with patch(APPLY_DECISION, new=AsyncMock()) as apply_mock:
+            await writer.record_deferred(containers[0].id, "app-0", retry_at=1234.0)
+            await writer.close()
+
+        apply_mock.assert_not_awaited()
+        (outcome,) = flushed(on_flush)
+        assert outcome.retry_at == 1234.0
+        assert outcome.error is None
+        await db.refresh(containers[0])
+        assert containers[0].check_fingerprint == "fp"
+
+
+class TestErrorIsolation:
+    """A failing container does not discard its batch."""
+
+    @pytest.mark.asyncio
+    async def test_failure_only_affects_its_container(self, db, mock_async_session_local):
+        containers = await make_containers(db, 3)
+        on_flush = AsyncMock()
+
+        async def apply(session, container, decision, fetch_response, after_commit=None):
+            container.latest_tag = fetch_response.latest_tag
+            if container.name == "app-1":
+                raise RuntimeError("boom")
+            return None
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush, batch_size=3)
+        probe = ImageProbe(listing="marker", digest="sha256:aaa")
+        with patch(APPLY_DECISION, new=AsyncMock(side_effect=apply)):
+            for container in containers:
+                await writer.submit(pending(container, probe=probe))
+
+        outcomes = {o.container_name: o for o in flushed(on_flush)}
+        assert outcomes["app-1"].error == "boom"
+        assert outcomes["app-0"].error is None
+        assert outcomes["app-2"].error is None
+
+        for container in containers:
+            await db.refresh(container)
+        by_name = {c.name: c for c in containers}
+        # The failed container's savepoint was rolled back; the others committed.
+        assert by_name["app-0"].latest_tag == "1.2.4"
+        assert by_name["app-0"].check_fingerprint is not None
+        assert by_name["app-1"].latest_tag is None
+        assert by_name["app-1"].check_fingerprint is None
+        assert by_name["app-2"].latest_tag == "1.2.4"
+
+    @pytest.mark.asyncio
+    async def test_missing_container_is_reported(self, db, mock_async_session_local):
+        on_flush = AsyncMock()
+        writer = CheckResultWriter(mock_async_session_local, on_flush)
+
+        with patch(APPLY_DECISION, new=AsyncMock()) as apply_mock:
+            await writer.submit(pending(Container(id=12345, name="gone")))
+            await writer.close()
+
+        apply_mock.assert_not_awaited()
+        (outcome,) = flushed(on_flush)
+        assert outcome.error == "Container not found"
+
+
+class TestSideEffects:
+    """Decision side effects wait for the batch commit."""
+
+    @pytest.mark.asyncio
+    async def test_side_effects_run_after_commit(self, db, mock_async_session_local):
+        containers = await make_containers(db, 2)
+        on_flush = AsyncMock()
+        seen: dict[str, str | None] = {}
+
+        async def apply(session, container, decision, fetch_response, after_commit=None):
+            container.latest_tag = fetch_response.latest_tag
+            name = container.name
+
+            async def effect():
+                # Runs on a fresh read of the row: only committed state is visible.
+                async with mock_async_session_local() as reader:
+                    row = await reader.get(Container, container.id)
+                    seen[name] = row.latest_tag if row else None
+
+            assert after_commit is not None
+            after_commit.append(effect)
+            if name == "app-1":
+                raise RuntimeError("boom")
+            return None
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush, batch_size=2)
+        with patch(APPLY_DECISION, new=AsyncMock(side_effect=apply)):
+            for container in containers:
+                await writer.submit(pending(container))
+
+        assert seen == {"app-0": "1.2.4"}
+        outcomes = {o.container_name: o for o in flushed(on_flush)}
+        assert outcomes["app-0"].error is None
+        assert outcomes["app-1"].error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_failed_side_effect_keeps_committed_decision(self, db, mock_async_session_local):
+        containers = await make_containers(db, 1)
+        on_flush = AsyncMock()
+
+        async def apply(session, container, decision, fetch_response, after_commit=None):
+            container.latest_tag = fetch_response.latest_tag
+
+            async def effect():
+                raise RuntimeError("vulnforge down")
+
+            assert after_commit is not None
+            after_commit.append(effect)
+            return None
+
+        writer = CheckResultWriter(mock_async_session_local, on_flush)
+        with patch(APPLY_DECISION, new=AsyncMock(side_effect=apply)):
+            await writer.submit(pending(containers[0]))
+            await writer.close()
+
+        (outcome,) = flushed(on_flush)
+        assert outcome.error is None
+        await db.refresh(containers[0])
+        assert containers[0].latest_tag == "1.2.4"
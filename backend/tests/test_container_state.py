@@ -0,0 +1,265 @@
+"""Tests for the live container state store (app/services/container_state.py).
+
+Tests:
+- Folding Docker events into container states
+- Serving reads without daemon calls while fresh or live
+- One listing refresh for many stale reads
+- Transitions discovered by snapshots and inspect
+- Subscriber notification
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.container_state import ContainerStateStore
+from app.services.docker_engine import DockerNotFoundError
+from app.services.docker_runtime_index import RuntimeContainer, RuntimeIndex
+
+
+def container_event(action: str, name: str = "web", **attributes) -> dict:
+    """Engine API container event for ``name``."""
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": "abc123", "Attributes": {"name": name, **attributes}},
+    }
+
+
+def listing(*containers: tuple[str, str, str]) -> RuntimeIndex:
+    """RuntimeIndex from (name, state, status text) tuples."""
+    return RuntimeIndex(
+        [
+            RuntimeContainer(id=name, name=name, state=state, status=status)
+            for name, state, status in containers
+        ]
+    )
+
+
+def inspect_attrs(running: bool, exit_code: int = 0, policy: str = "unless-stopped") -> dict:
+    """Inspect payload for a container."""
+    return {
+        "State": {
+            "Status": "running" if running else "exited",
+            "Running": running,
+            "ExitCode": exit_code,
+            "OOMKilled": False,
+            "Error": "",
+            "FinishedAt": "2026-10-16T10:00:00Z",
+            "RestartCount": 2,
+        },
+        "HostConfig": {"RestartPolicy": {"Name": policy}},
+    }
+
+
+class TestApplyEvent:
+    """Event folding."""
+
+    @pytest.mark.asyncio
+    async def test_oom_then_die(self):
+        store = ContainerStateStore()
+
+        await store.apply_event(container_event("start"))
+        await store.apply_event(container_event("oom"))
+        state = await store.apply_event(container_event("die", exitCode="137"))
+
+        assert state is not None
+        assert state.running is False
+        assert state.oom_killed is True
+        assert state.exit_code == 137
+
+    @pytest.mark.asyncio
+    async def test_start_clears_previous_failure(self):
+        store = ContainerStateStore()
+
+        await store.apply_event(container_event("die", exitCode="1"))
+        await store.apply_event(container_event("start"))
+
+        state = store.peek("web")
+        assert state is not None
+        assert state.running is True
+        assert state.exit_code is None
+
+    @pytest.mark.asyncio
+    async def test_destroyed_container_reads_as_absent_without_daemon_call(self):
+        store = ContainerStateStore()
+        await store.apply_event(container_event("destroy"))
+
+        with patch("app.services.container_state.runtime_snapshot.get") as snapshot:
+            assert await store.get("web") is None
+
+        snapshot.assert_not_called()
+        state = store.peek("web")
+        assert state is not None
+        assert state.as_state_dict()["missing"] is True
+
+    @pytest.mark.asyncio
+    async def test_health_status_detail(self):
+        store = ContainerStateStore()
+
+        await store.apply_event(container_event("health_status: unhealthy"))
+
+        state = store.peek("web")
+        assert state is not None
+        assert state.health == "unhealthy"
+
+    @pytest.mark.asyncio
+    async def test_ignores_unnamed_and_non_container_events(self):
+        store = ContainerStateStore()
+
+        assert await store.apply_event({"Type": "network", "Action": "connect"}) is None
+        assert await store.apply_event({"Type": "container", "Action": "die", "Actor": {}}) is None
+
+
+class TestReads:
+    """Staleness bounds and refresh sources."""
+
+    @pytest.mark.asyncio
+    async def test_many_stale_reads_share_one_listing(self):
+        store = ContainerStateStore()
+        index = listing(
+            ("web", "running", "Up 3 hours (healthy)"),
+            ("db", "exited", "Exited (137) 2 minutes ago"),
+        )
+
+        with patch(
+            "app.services.container_state.runtime_snapshot.get",
+            new=AsyncMock(return_value=index),
+        ) as snapshot:
+            web = await store.get("web")
+            db = await store.get("db")
+            ghost = await store.get("ghost")
+
+        assert snapshot.await_count == 1
+        assert web is not None
+        assert db is not None
+        assert web.running is True
+        assert web.health == "healthy"
+        assert db.running is False
+        assert db.exit_code == 137
+        assert ghost is None
+
+    @pytest.mark.asyncio
+    async def test_live_store_serves_old_entries(self):
+        store = ContainerStateStore()
+        await store.apply_event(container_event("start"))
+        cached = store.peek("web")
+        assert cached is not None
+        cached.updated_at -= 3600
+        store.set_live(True)
+
+        with patch("app.services.container_state.runtime_snapshot.get") as snapshot:
+            state = await store.get("web")
+
+        snapshot.assert_not_called()
+        assert state is not None
+        assert state.running is True
+
+    @pytest.mark.asyncio
+    async def test_detail_inspected_once_until_next_event(self):
+        store = ContainerStateStore()
+        store.set_live(True)
+        await store.apply_event(container_event("die", exitCode="1"))
+
+        with patch(
+            "app.services.container_state.docker_engine.inspect_container",
+            new=AsyncMock(return_value=inspect_attrs(running=False, exit_code=1)),
+        ) as inspect:
+            first = await store.get("web", detail=True)
+            await store.get("web", detail=True)
+            await store.apply_event(container_event("start"))
+            await store.apply_event(container_event("die", exitCode="1"))
+            await store.get("web", detail=True)
+
+        assert inspect.await_count == 2
+        assert first is not None
+        assert first.restart_count == 2
+        assert first.finished_at == "2026-10-16T10:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_restart_policy_cached_until_recreated(self):
+        store = ContainerStateStore()
+
+        with patch(
+            "app.services.container_state.docker_engine.inspect_container",
+            new=AsyncMock(return_value=inspect_attrs(running=True, policy="always")),
+        ) as inspect:
+            assert await store.restart_policy("web") == "always"
+            await store.apply_event(container_event("die", exitCode="0"))
+            assert await store.restart_policy("web") == "always"
+            await store.apply_event(container_event("destroy"))
+            await store.apply_event(container_event("create"))
+            await store.restart_policy("web")
+
+        assert inspect.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_inspect_not_found_marks_missing(self):
+        store = ContainerStateStore()
+        await store.apply_event(container_event("start"))
+
+        with patch(
+            "app.services.container_state.docker_engine.inspect_container",
+            new=AsyncMock(side_effect=DockerNotFoundError("gone", status_code=404)),
+        ):
+            assert await store.inspect("web") is None
+
+        state = store.peek("web")
+        assert state is not None
+        assert state.missing is True
+
+
+class TestSubscribers:
+    """Transition notifications."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_transitions_notify(self):
+        store = ContainerStateStore()
+        subscriber = AsyncMock()
+        await store.apply_event(container_event("start", name="web"))
+        await store.apply_event(container_event("start", name="db"))
+        store.subscribe(subscriber)
+
+        await store.apply_snapshot(listing(("web", "exited", "Exited (1) 1 second ago")))
+
+        actions = {(call.args[0].name, call.args[1]) for call in subscriber.await_args_list}
+        assert actions == {("web", "die"), ("db", "destroy")}
+        state = store.peek("db")
+        assert state is not None
+        assert state.missing is True
+
+    @pytest.mark.asyncio
+    async def test_events_win_over_older_snapshot(self):
+        store = ContainerStateStore()
+        index = listing(("web", "exited", "Exited (1) 1 second ago"))
+        await store.apply_event(container_event("start"))
+
+        await store.apply_snapshot(index)
+
+        state = store.peek("web")
+        assert state is not None
+        assert state.running is True
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_stop_others(self):
+        store = ContainerStateStore()
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        healthy = AsyncMock()
+        store.subscribe(failing)
+        store.subscribe(healthy)
+        store.subscribe(healthy)
+
+        await store.apply_event(container_event("destroy"))
+
+        healthy.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribed_not_called(self):
+        store = ContainerStateStore()
+        subscriber = AsyncMock()
+        store.subscribe(subscriber)
+        store.unsubscribe(subscriber)
+
+        await store.apply_event(container_event("die", exitCode="0"))
+
+        subscriber.assert_not_awaited()
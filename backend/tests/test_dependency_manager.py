@@ -5,6 +5,7 @@ Tests container dependency management and update ordering:
 - Circular dependency detection
 - Dependency graph caching
 - Update order calculation
+- Dependency levels for concurrent update waves
 - Dependency validation
 - Forward/reverse dependency management
 - Cache eviction and clearing
@@ -234,6 +235,47 @@ class TestGetUpdateOrder:
         assert result == ["api", "db"] or result == ["db", "api"]
 
 
+class TestGetUpdateLevels:
+    """Test suite for get_update_levels() method."""
+
+    async def test_groups_independent_containers_into_levels(self, db, make_container):
+        """Test containers only depending on earlier levels share a level."""
+        # db, cache <- api <- web; worker <- db
+        containers = [
+            make_container(name="db", image="postgres", current_tag="16"),
+            make_container(name="cache", image="redis", current_tag="7"),
+            make_container(
+                name="api", image="node", current_tag="18", dependencies=["db", "cache"]
+            ),
+            make_container(name="worker", image="python", current_tag="3", dependencies=["db"]),
+            make_container(name="web", image="nginx", current_tag="1", dependencies=["api"]),
+        ]
+        db.add_all(containers)
+        await db.commit()
+
+        result = await DependencyManager.get_update_levels(
+            db, ["web", "worker", "api", "cache", "db"]
+        )
+
+        assert result == [["cache", "db"], ["api", "worker"], ["web"]]
+
+    async def test_returns_empty_for_empty_list(self, db):
+        """Test returns no levels for empty input."""
+        assert await DependencyManager.get_update_levels(db, []) == []
+
+    async def test_falls_back_to_sequential_levels_on_cycle(self, db, make_container):
+        """Test a cycle puts every container in its own level, in original order."""
+        container_a = make_container(name="a", image="alpine", current_tag="3", dependencies=["b"])
+        container_b = make_container(name="b", image="busybox", current_tag="1", dependencies=["a"])
+        container_c = make_container(name="c", image="caddy", current_tag="2")
+        db.add_all([container_a, container_b, container_c])
+        await db.commit()
+
+        result = await DependencyManager.get_update_levels(db, ["c", "a", "b"])
+
+        assert result == [["c"], ["a"], ["b"]]
+
+
 class TestTopologicalSort:
     """Test suite for _topological_sort() method."""
 
@@ -311,6 +353,33 @@ class TestTopologicalSort:
         assert result1 == result2 == result3
 
 
+class TestTopologicalLevels:
+    """Test suite for _topological_levels() method."""
+
+    def test_levels_diamond_dependency(self):
+        """Test both branches of a diamond share a level."""
+        dependencies = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}}
+
+        result = DependencyManager._topological_levels(dependencies)
+
+        assert result == [["a"], ["b", "c"], ["d"]]
+
+    def test_raises_on_circular_dependency(self):
+        """Test raises ValueError for circular dependencies."""
+        dependencies = {"a": {"b"}, "b": {"a"}, "c": set()}
+
+        with pytest.raises(ValueError, match="Circular dependency"):
+            DependencyManager._topological_levels(dependencies)
+
+    def test_does_not_mutate_input(self):
+        """Test leaves the caller's graph untouched."""
+        dependencies = {"a": set(), "b": {"a"}}
+
+        DependencyManager._topological_levels(dependencies)
+
+        assert dependencies == {"a": set(), "b": {"a"}}
+
+
 class TestGenerateCacheKey:
     """Test suite for _generate_cache_key() method."""
 
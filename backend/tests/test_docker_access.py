@@ -16,12 +16,14 @@ import pytest
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from app.models.container import Container
+from app.services.container_state import ContainerRuntimeState
 from app.services.docker_access import (
     _normalize_url,
     docker_subprocess_env,
     resolve_docker_url,
     resolve_docker_url_sync,
 )
+from app.services.docker_engine import DockerEngineError
 
 
 class TestResolveDockerUrl:
@@ -113,9 +115,8 @@ class TestContainerMonitorConnectionError:
         from app.services.container_monitor import ContainerMonitorService
 
         monitor = ContainerMonitorService.__new__(ContainerMonitorService)
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = RequestsConnectionError("Connection refused")
-        monitor.client = mock_client
+        monitor.states = MagicMock()
+        monitor.states.get = AsyncMock(side_effect=DockerEngineError("Connection refused"))
 
         result = await monitor.get_container_state("test-container")
 
@@ -137,14 +138,11 @@ class TestContainerMonitorConnectionError:
         retry", and logged that the container "exited with code None" 2,507
         times without ever reporting that it did not exist.
         """
-        from docker.errors import NotFound
-
         from app.services.container_monitor import ContainerMonitorService
 
         monitor = ContainerMonitorService.__new__(ContainerMonitorService)
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = NotFound("no such container")
-        monitor.client = mock_client
+        monitor.states = MagicMock()
+        monitor.states.get = AsyncMock(return_value=None)
 
         result = await monitor.get_container_state("glances")
 
@@ -158,12 +156,10 @@ class TestContainerMonitorConnectionError:
         from app.services.container_monitor import ContainerMonitorService
 
         monitor = ContainerMonitorService.__new__(ContainerMonitorService)
-        container = MagicMock()
-        container.attrs = {"State": {"Status": "exited", "Running": False, "ExitCode": 127}}
-        container.reload = MagicMock()
-        mock_client = MagicMock()
-        mock_client.containers.get.return_value = container
-        monitor.client = mock_client
+        monitor.states = MagicMock()
+        monitor.states.get = AsyncMock(
+            return_value=ContainerRuntimeState(name="glances", status="exited", exit_code=127)
+        )
 
         result = await monitor.get_container_state("glances")
 
@@ -194,22 +190,6 @@ class TestContainerMonitorConnectionError:
             "no_exit_code",
         )
 
-    def test_reconnect_creates_new_client(self):
-        """reconnect() should create a fresh Docker client."""
-        from app.services.container_monitor import ContainerMonitorService
-
-        monitor = ContainerMonitorService.__new__(ContainerMonitorService)
-        old_client = MagicMock()
-        monitor.client = old_client
-
-        with patch("app.services.container_monitor.make_docker_client") as mock_make:
-            mock_make.return_value = MagicMock()
-            monitor.reconnect()
-
-        old_client.close.assert_called_once()
-        mock_make.assert_called_once()
-        assert monitor.client is not old_client
-
 
 class TestSchedulerExceptionHandling:
     """Test that scheduler methods handle Docker connection errors."""
@@ -248,14 +228,13 @@ class TestScannerConnectionError:
 
     @pytest.mark.asyncio
     async def test_scanner_connection_error_returns_empty(self):
-        """ConnectionError from docker_client.containers.get → returns [] without raising."""
+        """Unreachable Engine API on inspect → returns [] without raising."""
         from app.services.http_server_scanner import HttpServerScanner
 
         scanner = HttpServerScanner.__new__(HttpServerScanner)
         scanner.timeout = MagicMock()
-        mock_client = MagicMock()
-        mock_client.containers.get.side_effect = RequestsConnectionError("proxy down")
-        scanner.docker_client = mock_client
+        scanner.engine = MagicMock()
+        scanner.engine.inspect_container = AsyncMock(side_effect=DockerEngineError("proxy down"))
 
         result = await scanner.scan_container_http_servers("test-container")
 
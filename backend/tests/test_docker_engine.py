@@ -0,0 +1,164 @@
+"""Tests for the shared Docker Engine API client (app/services/docker_engine.py).
+
+Tests:
+- Demultiplexing framed stdout/stderr streams
+- HTTP status mapping to DockerNotFoundError / DockerEngineError
+- exec_run create/start/inspect sequence
+- Separate stream pool, replaced with the one-shot pool on endpoint change
+"""
+
+import json
+import struct
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.docker_engine import (
+    DockerEngineClient,
+    DockerEngineError,
+    DockerNotFoundError,
+    demux_stream,
+)
+
+DOCKER_URL = "tcp://proxy:2375"
+
+
+def frame(stream_type: int, payload: bytes) -> bytes:
+    """Build one multiplexed stream frame."""
+    return struct.pack(">BxxxI", stream_type, len(payload)) + payload
+
+
+def make_engine(handler) -> DockerEngineClient:
+    """Engine client whose pooled connection is served by ``handler``."""
+    engine = DockerEngineClient()
+    engine._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://proxy:2375"
+    )
+    engine._base_url = DOCKER_URL
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def _docker_url():
+    with patch("app.services.docker_engine.resolve_docker_url", AsyncMock(return_value=DOCKER_URL)):
+        yield
+
+
+class TestDemuxStream:
+    """Multiplexed log/exec output parsing."""
+
+    def test_joins_frames(self):
+        data = frame(1, b"hello\n") + frame(2, b"oops\n") + frame(1, b"bye\n")
+
+        assert demux_stream(data) == b"hello\noops\nbye\n"
+
+    def test_raw_tty_output_unchanged(self):
+        assert demux_stream(b"plain tty output\n") == b"plain tty output\n"
+
+    def test_empty(self):
+        assert demux_stream(b"") == b""
+
+
+class TestDockerEngineClient:
+    """Request routing and error mapping."""
+
+    @pytest.mark.asyncio
+    async def test_not_found_maps_to_docker_not_found(self):
+        def handler(request):
+            return httpx.Response(404, json={"message": "No such container: ghost"})
+
+        engine = make_engine(handler)
+
+        with pytest.raises(DockerNotFoundError, match="No such container"):
+            await engine.inspect_container("ghost")
+        await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_maps_to_engine_error(self):
+        def handler(request):
+            raise httpx.ConnectError("proxy down")
+
+        engine = make_engine(handler)
+
+        with pytest.raises(DockerEngineError) as exc_info:
+            await engine.version()
+        assert not isinstance(exc_info.value, DockerNotFoundError)
+        await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_container_logs_demuxed(self):
+        seen = {}
+
+        def handler(request):
+            seen["path"] = request.url.path
+            seen["tail"] = request.url.params["tail"]
+            return httpx.Response(200, content=frame(1, b"line 1\n") + frame(2, b"line 2\n"))
+
+        engine = make_engine(handler)
+
+        logs = await engine.container_logs("web-1", tail=50)
+
+        assert logs == b"line 1\nline 2\n"
+        assert seen == {"path": "/containers/web-1/logs", "tail": "50"}
+        await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_exec_run(self):
+        calls = []
+
+        def handler(request):
+            calls.append((request.method, request.url.path))
+            if request.url.path.endswith("/exec"):
+                assert json.loads(request.content)["Cmd"] == ["nginx", "-v"]
+                return httpx.Response(201, json={"Id": "e1"})
+            if request.url.path == "/exec/e1/start":
+                return httpx.Response(200, content=frame(2, b"nginx version: nginx/1.27.0\n"))
+            return httpx.Response(200, json={"ExitCode": 0})
+
+        engine = make_engine(handler)
+
+        result = await engine.exec_run("web-1", ["nginx", "-v"])
+
+        assert result.exit_code == 0
+        assert result.output == b"nginx version: nginx/1.27.0\n"
+        assert calls == [
+            ("POST", "/containers/web-1/exec"),
+            ("POST", "/exec/e1/start"),
+            ("GET", "/exec/e1/json"),
+        ]
+        await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_events_stream_decoded(self):
+        seen = {}
+
+        def handler(request):
+            seen["filters"] = json.loads(request.url.params["filters"])
+            body = b'{"Action":"die","Actor":{"Attributes":{"name":"web"}}}\n\n{"Action":"start"}\n'
+            return httpx.Response(200, content=body)
+
+        engine = make_engine(handler)
+
+        events = [event async for event in engine.events({"type": ["container"]})]
+
+        assert [event["Action"] for event in events] == ["die", "start"]
+        assert seen["filters"] == {"type": ["container"]}
+        await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_pool_is_separate_and_follows_endpoint(self):
+        engine = DockerEngineClient()
+
+        one_shot = await engine._http()
+        streams = await engine.stream_client()
+        assert streams is not one_shot
+        assert streams is await engine.stream_client()
+
+        moved = await engine.stream_client(base_url="tcp://other-proxy:2375")
+
+        assert moved is not streams
+        assert streams.is_closed
+        assert one_shot.is_closed
+        await engine.aclose()
+        assert moved.is_closed
@@ -0,0 +1,252 @@
+"""Tests for Engine API stats streaming (app/services/docker_engine_stats.py).
+
+Tests:
+- CPU%/memory/network/block I/O computed from raw Engine API counters
+- Streams reporting per container, with missing containers isolated
+- Container listing over the Engine API
+- More open streams than httpx's default pool size
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.services.docker_engine import DockerEngineClient
+from app.services.docker_engine_stats import DockerEngineStats, engine_stats_to_metrics
+
+DOCKER_URL = "unix:///var/run/docker.sock"
+
+
+def make_sample(total_usage, system_usage, pre_total=0, pre_system=0, **overrides):
+    """Build a raw Engine API stats sample (cgroup v2 shape)."""
+    sample = {
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": total_usage},
+            "system_cpu_usage": system_usage,
+            "online_cpus": 4,
+        },
+        "precpu_stats": {
+            "cpu_usage": {"total_usage": pre_total},
+            "system_cpu_usage": pre_system,
+        },
+        "memory_stats": {
+            "usage": 300 * 1024 * 1024,
+            "limit": 1024 * 1024 * 1024,
+            "stats": {"inactive_file": 44 * 1024 * 1024},
+        },
+        "networks": {
+            "eth0": {"rx_bytes": 1000, "tx_bytes": 200},
+            "eth1": {"rx_bytes": 24, "tx_bytes": 56},
+        },
+        "blkio_stats": {
+            "io_service_bytes_recursive": [
+                {"major": 8, "minor": 0, "op": "read", "value": 4096},
+                {"major": 8, "minor": 0, "op": "write", "value": 8192},
+            ]
+        },
+        "pids_stats": {"current": 7},
+    }
+    sample.update(overrides)
+    return sample
+
+
+def make_engine(handler) -> DockerEngineStats:
+    """DockerEngineStats on an Engine client whose pools are an httpx MockTransport."""
+    client = DockerEngineClient()
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://docker"
+    )
+    client._stream_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://docker"
+    )
+    client._base_url = DOCKER_URL
+    return DockerEngineStats(client)
+
+
+class TestEngineStatsToMetrics:
+    """Raw counter conversion."""
+
+    def test_computes_docker_cli_values(self):
+        metrics = engine_stats_to_metrics(
+            make_sample(total_usage=1_500, system_usage=20_000, pre_total=1_000, pre_system=10_000)
+        )
+
+        assert metrics is not None
+        # 500 / 10_000 * 4 CPUs * 100
+        assert metrics["cpu_percent"] == 20.0
+        assert metrics["memory_usage"] == 256 * 1024 * 1024
+        assert metrics["memory_limit"] == 1024 * 1024 * 1024
+        assert metrics["memory_percent"] == 25.0
+        assert metrics["network_rx"] == 1024
+        assert metrics["network_tx"] == 256
+        assert metrics["block_read"] == 4096
+        assert metrics["block_write"] == 8192
+        assert metrics["pids"] == 7
+
+    def test_first_frame_needs_a_baseline(self):
+        first = make_sample(total_usage=1_000, system_usage=10_000)
+
+        assert engine_stats_to_metrics(first) is None
+
+        second = make_sample(total_usage=1_250, system_usage=20_000)
+        metrics = engine_stats_to_metrics(second, previous=first)
+        assert metrics is not None
+        assert metrics["cpu_percent"] == 10.0
+
+    def test_cgroup_v1_cache_is_excluded(self):
+        sample = make_sample(total_usage=1, system_usage=2, pre_total=1, pre_system=1)
+        sample["memory_stats"]["stats"] = {"total_inactive_file": 100 * 1024 * 1024}
+
+        metrics = engine_stats_to_metrics(sample)
+        assert metrics is not None
+        assert metrics["memory_usage"] == 200 * 1024 * 1024
+        assert metrics["cpu_percent"] == 0.0
+
+
+class TestDockerEngineStats:
+    """Streams and listing over a mocked Engine API."""
+
+    @pytest.mark.asyncio
+    async def test_list_running_strips_slash(self):
+        def handler(request):
+            assert request.url.path == "/containers/json"
+            return httpx.Response(
+                200, json=[{"Names": ["/alpha"]}, {"Names": ["/beta", "/gamma/link"]}]
+            )
+
+        engine = make_engine(handler)
+        try:
+            assert await engine.list_running(DOCKER_URL) == {"alpha", "beta"}
+        finally:
+            await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_list_running_returns_none_when_unreachable(self):
+        def handler(request):
+            raise httpx.ConnectError("no socket", request=request)
+
+        engine = make_engine(handler)
+        try:
+            assert await engine.list_running(DOCKER_URL) is None
+        finally:
+            await engine.aclose()
+
+    @pytest.mark.asyncio
+    async def test_missing_container_does_not_affect_others(self):
+        frames = [
+            make_sample(total_usage=1_000, system_usage=10_000),
+            make_sample(total_usage=1_500, system_usage=20_000),
+        ]
+        body = "\n".join(json.dumps(frame) for frame in frames) + "\n"
+
+        def handler(request):
+            assert request.url.params["stream"] == "true"
+            if request.url.path == "/containers/gone/stats":
+                return httpx.Response(404, json={"message": "No such container: gone"})
+            return httpx.Response(200, content=body.encode())
+
+        engine = make_engine(handler)
+        try:
+            stats = await engine.sample(DOCKER_URL, ["alpha", "gone"])
+        finally:
+            await engine.aclose()
+
+        assert set(stats) == {"alpha"}
+        assert stats["alpha"]["cpu_percent"] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_streams_restart_when_endpoint_changes(self):
+        frames = [
+            make_sample(total_usage=1_000, system_usage=10_000),
+            make_sample(total_usage=1_500, system_usage=20_000),
+        ]
+        body = "".join(json.dumps(frame) + "\n" for frame in frames).encode()
+        opened: list[str] = []
+
+        def open_stream(host: str):
+            async def stream():
+                yield body
+                await asyncio.Event().wait()  # held open until cancelled
+
+            def handler(request):
+                opened.append(host)
+                return httpx.Response(200, content=stream())
+
+            return handler
+
+        engine = make_engine(open_stream("docker"))
+        moved = httpx.AsyncClient(
+            transport=httpx.MockTransport(open_stream("other-proxy")), base_url="http://docker"
+        )
+        try:
+            first = await engine.sample(DOCKER_URL, ["alpha"])
+            old_task = engine._streams["alpha"].task
+            with patch.object(engine._engine, "stream_client", AsyncMock(return_value=moved)):
+                second = await engine.sample("tcp://other-proxy:2375", ["alpha"])
+            await asyncio.sleep(0)
+        finally:
+            await engine.aclose()
+            await moved.aclose()
+
+        assert set(first) == set(second) == {"alpha"}
+        assert opened == ["docker", "other-proxy"]
+        assert old_task is not None and old_task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_more_streams_than_default_pool_size(self):
+        """Streams for 150 containers stay open and listing still answers."""
+        names = [f"app{i}" for i in range(150)]
+        frames = [
+            make_sample(total_usage=1_000, system_usage=10_000),
+            make_sample(total_usage=1_500, system_usage=20_000),
+        ]
+        body = "".join(json.dumps(frame) + "\n" for frame in frames).encode()
+
+        async def daemon(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            """Minimal Engine API: container list, and stats streams held open."""
+            try:
+                while request := await reader.readuntil(b"\r\n\r\n"):
+                    path = request.split(b" ", 2)[1].decode()
+                    if path.startswith("/containers/json"):
+                        listing = json.dumps([{"Names": [f"/{n}"]} for n in names]).encode()
+                        writer.write(
+                            b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                            b"Content-Length: %d\r\n\r\n%s" % (len(listing), listing)
+                        )
+                        await writer.drain()
+                        continue
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Transfer-Encoding: chunked\r\n\r\n%x\r\n%s\r\n" % (len(body), body)
+                    )
+                    await writer.drain()
+                    await reader.read()  # hold the stream until the client hangs up
+                    return
+            except asyncio.IncompleteReadError, ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            socket_path = os.path.join(tmpdir, "docker.sock")
+            server = await asyncio.start_unix_server(daemon, path=socket_path)
+            client = DockerEngineClient()
+            engine = DockerEngineStats(client)
+            try:
+                stats = await engine.sample(f"unix://{socket_path}", names)
+                running = await engine.list_running(f"unix://{socket_path}")
+            finally:
+                await engine.aclose()
+                await client.aclose()
+                server.close()
+                with contextlib.suppress(Exception):
+                    await server.wait_closed()
+
+        assert set(stats) == set(names)
+        assert running == set(names)
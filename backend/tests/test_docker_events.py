@@ -0,0 +1,77 @@
+"""Tests for Docker event consumption (app/services/docker_events.py).
+
+Tests:
+- Feeding stream events into the container state store
+- Live flag while the stream is open
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.services.container_state import container_states
+from app.services.docker_engine import DockerEngineError
+from app.services.docker_events import WATCHED_ACTIONS, DockerEventWatcher
+
+
+def container_event(action: str, name: str = "web", **attributes) -> dict:
+    """Engine API container event for ``name``."""
+    return {
+        "Type": "container",
+        "Action": action,
+        "Actor": {"ID": "abc123", "Attributes": {"name": name, **attributes}},
+        "time": 1760600000,
+    }
+
+
+class TestDockerEventWatcher:
+    """Stream consumption."""
+
+    @pytest.mark.asyncio
+    async def test_run_feeds_store_and_tracks_live(self):
+        watcher = DockerEventWatcher()
+        observed = {}
+
+        async def fake_events(filters, since=None, on_open=None):
+            observed["filters"] = filters
+            assert on_open is not None
+            on_open()
+            observed["live"] = container_states.live
+            yield container_event("die", exitCode="1")
+            raise DockerEngineError("stream closed")
+
+        with (
+            patch("app.services.docker_events.docker_engine.events", new=fake_events),
+            patch("app.services.docker_events.asyncio.sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await watcher._run()
+
+        assert observed["live"] is True
+        assert observed["filters"]["event"] == list(WATCHED_ACTIONS)
+        assert container_states.live is False
+        state = container_states.peek("web")
+        assert state is not None
+        assert state.exit_code == 1
+        assert watcher._since == 1760600000
+
+    @pytest.mark.asyncio
+    async def test_reconnect_resumes_before_last_event(self):
+        watcher = DockerEventWatcher()
+        watcher._since = 1760600000
+        observed = {}
+
+        async def fake_events(filters, since=None, on_open=None):
+            observed["since"] = since
+            return
+            yield
+
+        with (
+            patch("app.services.docker_events.docker_engine.events", new=fake_events),
+            patch("app.services.docker_events.asyncio.sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await watcher._run()
+
+        assert observed["since"] == 1760599999
@@ -0,0 +1,104 @@
+"""Tests for the Docker runtime snapshot index (app/services/docker_runtime_index.py).
+
+Tests:
+- Parsing container listing entries
+- Label and name lookups
+- Snapshot reuse within the TTL and forced refresh
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.services.docker_runtime_index import (
+    DockerRuntimeSnapshot,
+    RuntimeContainer,
+    RuntimeIndex,
+)
+
+LISTING = [
+    {
+        "Id": "a1",
+        "Names": ["/immich-redis-1"],
+        "Image": "redis:7",
+        "State": "running",
+        "Labels": {
+            "com.docker.compose.project": "immich",
+            "com.docker.compose.service": "redis",
+        },
+    },
+    {
+        "Id": "b2",
+        "Names": ["/nextcloud-redis-1"],
+        "Image": "redis:7",
+        "State": "exited",
+        "Labels": {
+            "com.docker.compose.project": "nextcloud",
+            "com.docker.compose.service": "redis",
+        },
+    },
+    {"Id": "c3", "Names": ["/standalone"], "Image": "busybox", "State": "running", "Labels": None},
+]
+
+
+class TestRuntimeIndex:
+    """Lookups over one listing."""
+
+    def test_from_listing(self):
+        container = RuntimeContainer.from_listing(LISTING[0])
+
+        assert container.name == "immich-redis-1"
+        assert container.project == "immich"
+        assert container.service == "redis"
+        assert container.state == "running"
+
+    def test_lookups(self):
+        index = RuntimeIndex([RuntimeContainer.from_listing(entry) for entry in LISTING])
+
+        assert [c.name for c in index.by_service("redis")] == [
+            "immich-redis-1",
+            "nextcloud-redis-1",
+        ]
+        assert [c.name for c in index.by_project_service("nextcloud", "redis")] == [
+            "nextcloud-redis-1"
+        ]
+        assert index.by_project_service("other", "redis") == []
+        standalone = index.by_name("/standalone")
+        assert standalone is not None
+        assert standalone.id == "c3"
+        assert index.by_service("standalone") == []
+
+
+class TestDockerRuntimeSnapshot:
+    """Shared snapshot caching."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_within_ttl(self):
+        snapshot = DockerRuntimeSnapshot()
+        containers = [RuntimeContainer.from_listing(entry) for entry in LISTING]
+
+        with patch(
+            "app.services.docker_runtime_index.list_runtime_containers",
+            return_value=containers,
+        ) as listing:
+            first = await snapshot.get()
+            second = await snapshot.get()
+            forced = await snapshot.get(max_age=0)
+
+        assert first is second
+        assert forced is not first
+        assert listing.call_count == 2
+        assert len(first.by_service("redis")) == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_new_listing(self):
+        snapshot = DockerRuntimeSnapshot()
+
+        with patch(
+            "app.services.docker_runtime_index.list_runtime_containers", return_value=[]
+        ) as listing:
+            await snapshot.get()
+            snapshot.invalidate()
+            await snapshot.get()
+
+        assert listing.call_count == 2
@@ -10,13 +10,14 @@ Covers:
 - Project scanner stale-removal by composite identity
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import select
 
 from app.models.container import Container
 from app.services.compose_parser import ComposeParser
+from app.services.docker_runtime_index import RuntimeContainer, RuntimeIndex
 
 # ── Discovery: name disambiguation ─────────────────────────────────
 
@@ -252,14 +253,20 @@ class TestSyncCompositeKey:
 class TestResolveRuntimeInfo:
     """Test label-based docker_name and compose_project resolution."""
 
+    @staticmethod
+    def _runtime(name: str, project: str, service: str = "redis") -> RuntimeContainer:
+        return RuntimeContainer(
+            id=name,
+            name=name,
+            labels={
+                "com.docker.compose.project": project,
+                "com.docker.compose.service": service,
+            },
+        )
+
     def test_single_match_populates_docker_name(self):
         """Unambiguous label match sets docker_name."""
-        mock_container = MagicMock()
-        mock_container.name = "/immich-redis-1"
-        mock_container.labels = {"com.docker.compose.project": "immich"}
-
-        mock_client = MagicMock()
-        mock_client.containers.list.return_value = [mock_container]
+        index = RuntimeIndex([self._runtime("immich-redis-1", "immich")])
 
         container = Container(
             name="immich-redis",
@@ -270,25 +277,21 @@ class TestResolveRuntimeInfo:
             registry="docker.io",
         )
 
-        ComposeParser._resolve_runtime_info(mock_client, container)
+        ComposeParser._resolve_runtime_info(index, container)
 
         assert container.docker_name == "immich-redis-1"
         assert container.compose_project == "immich"
 
     def test_multi_match_service_only_skips(self):
-        """Ambiguous service-only filter leaves docker_name NULL."""
-        match1 = MagicMock()
-        match1.name = "/immich-redis-1"
-        match1.labels = {"com.docker.compose.project": "immich"}
-
-        match2 = MagicMock()
-        match2.name = "/nextcloud-redis-1"
-        match2.labels = {"com.docker.compose.project": "nextcloud"}
-
-        mock_client = MagicMock()
-        # First call (project-qualified): no matches
-        # Second call (service-only): multiple matches
-        mock_client.containers.list.side_effect = [[], [match1, match2]]
+        """Ambiguous service-only match leaves docker_name NULL."""
+        # No project-qualified match (inferred project "redis"), two
+        # service-only matches
+        index = RuntimeIndex(
+            [
+                self._runtime("immich-redis-1", "immich"),
+                self._runtime("nextcloud-redis-1", "nextcloud"),
+            ]
+        )
 
         container = Container(
             name="redis",
@@ -299,19 +302,37 @@ class TestResolveRuntimeInfo:
             registry="docker.io",
         )
 
-        ComposeParser._resolve_runtime_info(mock_client, container)
+        ComposeParser._resolve_runtime_info(index, container)
 
         # Should NOT pick one arbitrarily
         assert container.docker_name is None
 
+    def test_project_match_wins_over_ambiguous_service(self):
+        """The project-qualified match resolves a service shared across projects."""
+        index = RuntimeIndex(
+            [
+                self._runtime("immich-redis-1", "immich"),
+                self._runtime("nextcloud-redis-1", "nextcloud"),
+            ]
+        )
+
+        container = Container(
+            name="nextcloud-redis",
+            service_name="redis",
+            compose_file="/compose/nextcloud/compose.yaml",
+            image="redis",
+            current_tag="7",
+            registry="docker.io",
+        )
+
+        ComposeParser._resolve_runtime_info(index, container)
+
+        assert container.docker_name == "nextcloud-redis-1"
+        assert container.compose_project == "nextcloud"
+
     def test_docker_name_refreshes_on_recreate(self):
         """docker_name updates when runtime container is recreated."""
-        mock_container = MagicMock()
-        mock_container.name = "/immich-redis-2"  # New replica number
-        mock_container.labels = {"com.docker.compose.project": "immich"}
-
-        mock_client = MagicMock()
-        mock_client.containers.list.return_value = [mock_container]
+        index = RuntimeIndex([self._runtime("immich-redis-2", "immich")])  # New replica number
 
         container = Container(
             name="immich-redis",
@@ -324,7 +345,7 @@ class TestResolveRuntimeInfo:
             compose_project="immich",
         )
 
-        ComposeParser._resolve_runtime_info(mock_client, container)
+        ComposeParser._resolve_runtime_info(index, container)
 
         assert container.docker_name == "immich-redis-2"
 
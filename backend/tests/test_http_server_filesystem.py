@@ -12,16 +12,10 @@ import pytest
 
 @pytest.fixture
 def scanner():
-    """Create an HttpServerScanner with mocked Docker client."""
-    from unittest.mock import MagicMock, patch
+    """Create an HttpServerScanner (filesystem detection never calls Docker)."""
+    from app.services.http_server_scanner import HttpServerScanner
 
-    with patch(
-        "app.services.http_server_scanner.make_docker_client",
-        return_value=MagicMock(),
-    ):
-        from app.services.http_server_scanner import HttpServerScanner
-
-        return HttpServerScanner()
+    return HttpServerScanner()
 
 
 @pytest.fixture
@@ -0,0 +1,141 @@
+"""Tests for compressed metrics chunks (app/services/metrics_chunks.py).
+
+Tests:
+- Codec round trip and version check
+- Hourly chunking: one row per container per closed hour
+- Reads merging stored chunks with buffered samples
+- History and rollups over chunked samples
+"""
+
+import zlib
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.metrics_chunk import MetricsChunk
+from app.services.metrics_chunks import (
+    MetricsChunkStore,
+    decode_chunk,
+    encode_chunk,
+    to_epoch_ms,
+)
+from app.services.metrics_rollup import MetricsRollupService
+
+START = datetime(2026, 10, 16, 11, 0, tzinfo=UTC)
+
+
+def metrics(i: int) -> dict:
+    """Collector-shaped metrics dict for sample ``i``."""
+    return {
+        "cpu_percent": 1.5 * i,
+        "memory_usage": 100_000 + i,
+        "memory_limit": 1_000_000,
+        "memory_percent": 10.0 + i / 10,
+        "network_rx": 5_000 * i,
+        "network_tx": 700 * i,
+        "block_read": 0,
+        "block_write": 4096 * i,
+        "pids": 4,
+    }
+
+
+def fill(store: MetricsChunkStore, container_id: int, count: int, step=timedelta(minutes=5)):
+    for i in range(count):
+        store.append(container_id, START + i * step, metrics(i))
+
+
+class TestCodec:
+    """Blob layout."""
+
+    def test_round_trip(self):
+        columns = {
+            "collected_at": [to_epoch_ms(START + timedelta(minutes=5 * i)) for i in range(12)]
+        }
+        for name in metrics(0):
+            columns[name] = [metrics(i)[name] for i in range(12)]
+
+        decoded = decode_chunk(encode_chunk(columns))
+
+        assert decoded == columns
+
+    def test_rejects_unknown_version(self):
+        with pytest.raises(ValueError, match="version"):
+            decode_chunk(zlib.compress(b"\x09\x00\x00\x00\x00"))
+
+
+class TestMetricsChunkStore:
+    """Buffering, flushing and reads against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_closed_hours_only(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        store = MetricsChunkStore()
+        # 11:00 → 12:05: the 11:00 hour is closed, 12:00 is open
+        fill(store, container.id, 14)
+
+        assert await store.flush(db) == 1
+        chunk = (await db.execute(select(MetricsChunk))).scalar_one()
+        assert chunk.samples == 12
+        assert decode_chunk(chunk.data)["cpu_percent"][-1] == 16.5
+
+        # Nothing closed since; open hour written only on request
+        assert await store.flush(db) == 0
+        assert await store.flush(db, include_open=True) == 1
+        assert (await db.execute(select(func.count()).select_from(MetricsChunk))).scalar() == 2
+
+    @pytest.mark.asyncio
+    async def test_read_merges_stored_and_buffered(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        store = MetricsChunkStore()
+        fill(store, container.id, 14)
+        await store.flush(db)
+
+        columns = await store.read(db, START + timedelta(minutes=50))
+
+        # 11:50, 11:55 from the stored chunk; 12:00, 12:05 from memory
+        assert columns[container.id]["cpu_percent"] == [15.0, 16.5, 18.0, 19.5]
+        assert await store.oldest(db) == START.replace(tzinfo=None)
+
+    @pytest.mark.asyncio
+    async def test_prune_drops_old_chunks(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        store = MetricsChunkStore()
+        fill(store, container.id, 14)
+        await store.flush(db, include_open=True)
+
+        deleted = await store.prune(db, START + timedelta(hours=1))
+        await db.commit()
+
+        assert deleted == 1
+        remaining = (await db.execute(select(MetricsChunk))).scalar_one()
+        assert remaining.samples == 2
+
+
+class TestChunkedHistory:
+    """History and rollups read chunked samples like metrics_history rows."""
+
+    @pytest.mark.asyncio
+    async def test_history_and_rollup(self, db, make_container):
+        from app.services.metrics_chunks import metrics_chunk_store
+
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        fill(metrics_chunk_store, container.id, 14)
+        await metrics_chunk_store.flush(db)
+        now = START + timedelta(hours=1, minutes=7)
+
+        points = await MetricsRollupService.history(db, container.id, timedelta(hours=1), now=now)
+        assert [p["cpu_percent"] for p in points[:2]] == [3.0, 4.5]
+        assert points[0]["timestamp"] == "2026-10-16T11:10:00"
+        assert points[-1]["network_rx"] == 65_000
+
+        written = await MetricsRollupService.rollup(db, now=now)
+        assert written["1h"] == 1
@@ -4,12 +4,14 @@ The collector previously held a DB session across slow per-container docker
 calls (~91s for 43 containers), blocking every other API request that needed
 a session. The session-not-held tests below assert the new three-phase design.
 
-It also has a batched fast-path (one ``docker ps`` + one ``docker stats c1 c2 …``)
-and a per-container concurrent fallback path. Tests cover both.
+It reads the Engine API stats streams first, then falls back to a batched
+CLI path (one ``docker ps`` + one ``docker stats c1 c2 …``) and a per-container
+concurrent path. Tests cover all three.
 """
 
 import asyncio
-from unittest.mock import patch
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -62,6 +64,116 @@ def session_lifecycle_tracker(db):
         yield events, tracker
 
 
+@pytest.fixture(autouse=True)
+def engine_api_unavailable():
+    """Default the Engine API path to unreachable so the CLI paths run.
+
+    Engine API tests patch ``docker_engine_stats`` themselves.
+    """
+    with patch(
+        "app.services.metrics_collector.docker_engine_stats.list_running",
+        new=AsyncMock(return_value=None),
+    ):
+        yield
+
+
+# ─── Engine API path ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_engine_path_reads_stream_samples(db, session_lifecycle_tracker, make_container):
+    """Running containers get their stream sample; no CLI call is made."""
+    db.add(make_container(name="alpha"))
+    db.add(make_container(name="beta"))
+    db.add(make_container(name="stopped"))
+    await db.commit()
+
+    sample = AsyncMock(return_value={"alpha": dict(_STATS)})
+    batched = AsyncMock()
+    with (
+        patch(
+            "app.services.metrics_collector.docker_engine_stats.list_running",
+            new=AsyncMock(return_value={"alpha", "beta"}),
+        ),
+        patch("app.services.metrics_collector.docker_engine_stats.sample", new=sample),
+        patch(
+            "app.services.metrics_collector.docker_stats_service.get_batched_stats",
+            new=batched,
+        ),
+    ):
+        result = await metrics_collector.collect_all_metrics()
+
+    # beta has no sample yet: only beta is an error, alpha is still stored.
+    assert result == {"collected": 1, "skipped": 1, "errors": 1}
+    assert sample.await_args is not None
+    assert set(sample.await_args.args[1]) == {"alpha", "beta"}
+    batched.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_engine_path_disabled_by_setting(db, session_lifecycle_tracker, make_container):
+    """metrics_engine_api=false goes straight to the CLI path."""
+    from app.services.settings_service import SettingsService
+
+    await SettingsService.set(db, "metrics_engine_api", "false")
+    db.add(make_container(name="alpha"))
+    await db.commit()
+
+    list_running = AsyncMock(return_value={"alpha"})
+    with (
+        patch(
+            "app.services.metrics_collector.docker_engine_stats.list_running",
+            new=list_running,
+        ),
+        patch(
+            "app.services.metrics_collector.docker_stats_service.list_running_container_names",
+            new=AsyncMock(return_value={"alpha"}),
+        ),
+        patch(
+            "app.services.metrics_collector.docker_stats_service.get_batched_stats",
+            new=AsyncMock(return_value={"alpha": dict(_STATS)}),
+        ),
+    ):
+        result = await metrics_collector.collect_all_metrics()
+
+    assert result["collected"] == 1
+    list_running.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_chunk_storage_buffers_instead_of_inserting_rows(
+    db, session_lifecycle_tracker, make_container
+):
+    """metrics_storage=chunks appends to the chunk store, not metrics_history."""
+    from sqlalchemy import func, select
+
+    from app.models.metrics_history import MetricsHistory
+    from app.services.metrics_chunks import metrics_chunk_store
+    from app.services.settings_service import SettingsService
+
+    await SettingsService.set(db, "metrics_storage", "chunks")
+    container = make_container(name="alpha")
+    db.add(container)
+    await db.commit()
+
+    with (
+        patch(
+            "app.services.metrics_collector.docker_stats_service.list_running_container_names",
+            new=AsyncMock(return_value={"alpha"}),
+        ),
+        patch(
+            "app.services.metrics_collector.docker_stats_service.get_batched_stats",
+            new=AsyncMock(return_value={"alpha": dict(_STATS)}),
+        ),
+    ):
+        result = await metrics_collector.collect_all_metrics()
+
+    assert result["collected"] == 1
+    assert (await db.execute(select(func.count()).select_from(MetricsHistory))).scalar() == 0
+    buffered = await metrics_chunk_store.read(db, datetime(2000, 1, 1, tzinfo=UTC))
+    assert buffered[container.id]["memory_usage"] == [100]
+
+
 # ─── batched fast-path ───────────────────────────────────────────────────────
 
 
@@ -0,0 +1,155 @@
+"""Tests for metrics rollup tiers (app/services/metrics_rollup.py).
+
+Tests:
+- Bucket aggregation (min/avg/max/p95, last value for counters)
+- Incremental rollup of closed buckets only
+- Tier selection and history points served from rollups
+- Per-tier retention
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.metrics_history import MetricsHistory
+from app.models.metrics_rollup import MetricsRollup
+from app.services.metrics_rollup import (
+    MetricsRollupService,
+    aggregate_samples,
+    floor_time,
+    select_tier,
+)
+
+NOW = datetime(2026, 10, 16, 12, 7, tzinfo=UTC)
+
+
+def sample(cpu: float, memory: int, network_rx: int = 0) -> dict:
+    """Raw sample values as read from metrics_history."""
+    return {
+        "cpu_percent": cpu,
+        "memory_usage": memory,
+        "memory_limit": 1000,
+        "memory_percent": memory / 10,
+        "network_rx": network_rx,
+        "network_tx": 0,
+        "block_read": 0,
+        "block_write": 0,
+        "pids": 4,
+    }
+
+
+async def add_samples(db, container_id: int, start: datetime, count: int, step: timedelta):
+    """Insert ``count`` raw samples with cpu_percent 1..count."""
+    for i in range(count):
+        values = sample(cpu=float(i + 1), memory=100 * (i + 1), network_rx=10 * i)
+        db.add(MetricsHistory(container_id=container_id, collected_at=start + i * step, **values))
+    await db.commit()
+
+
+class TestAggregation:
+    """Pure bucket math."""
+
+    def test_aggregate_samples(self):
+        samples = [sample(cpu=float(v), memory=v * 10, network_rx=v) for v in range(1, 21)]
+
+        row = aggregate_samples(samples)
+
+        assert row["samples"] == 20
+        assert row["cpu_percent_min"] == 1.0
+        assert row["cpu_percent_avg"] == 10.5
+        assert row["cpu_percent_max"] == 20.0
+        assert row["cpu_percent_p95"] == 19.0
+        assert row["memory_usage_avg"] == 105
+        # Cumulative counters keep the last reading
+        assert row["network_rx"] == 20
+
+    def test_floor_time_is_utc_aligned(self):
+        assert floor_time(NOW, timedelta(minutes=15)) == datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+        assert floor_time(NOW, timedelta(days=1)) == datetime(2026, 10, 16, tzinfo=UTC)
+        # Naive values from SQLite are UTC
+        assert floor_time(NOW.replace(tzinfo=None), timedelta(hours=1)).hour == 12
+
+    def test_select_tier(self):
+        assert select_tier(timedelta(hours=24)) is None
+        for period, name in [(7, "15m"), (30, "1h"), (365, "1d")]:
+            tier = select_tier(timedelta(days=period))
+            assert tier is not None
+            assert tier.name == name
+
+
+class TestRollup:
+    """Incremental maintenance against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_rolls_only_closed_buckets(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        # 11:00 → 12:05, one sample every 5 minutes (14 samples)
+        await add_samples(
+            db, container.id, datetime(2026, 10, 16, 11, 0, tzinfo=UTC), 14, timedelta(minutes=5)
+        )
+
+        written = await MetricsRollupService.rollup(db, now=NOW)
+
+        # 11:00-12:00 closed: four 15m buckets, one 1h bucket; the day is open.
+        assert written == {"15m": 4, "1h": 1, "1d": 0}
+        hour = (
+            await db.execute(select(MetricsRollup).where(MetricsRollup.tier == "1h"))
+        ).scalar_one()
+        assert hour.samples == 12
+        assert hour.cpu_percent_max == 12.0
+
+        # Nothing new closed: a second run writes nothing
+        assert await MetricsRollupService.rollup(db, now=NOW) == {"15m": 0, "1h": 0, "1d": 0}
+
+        # Once 12:00-12:15 closes, only that bucket is added
+        later = await MetricsRollupService.rollup(db, now=NOW + timedelta(minutes=10))
+        assert later["15m"] == 1
+
+    @pytest.mark.asyncio
+    async def test_history_uses_rollup_tier_with_raw_tail(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        await add_samples(
+            db, container.id, datetime(2026, 10, 16, 11, 0, tzinfo=UTC), 14, timedelta(minutes=5)
+        )
+        await MetricsRollupService.rollup(db, now=NOW)
+
+        points = await MetricsRollupService.history(db, container.id, timedelta(days=7), now=NOW)
+
+        # Four 15m buckets, then the two raw samples of the open bucket
+        assert len(points) == 6
+        assert points[0]["cpu_percent"] == 2.0
+        assert points[0]["cpu_percent_max"] == 3.0
+        assert "cpu_percent_max" not in points[-1]
+        assert points[-1]["cpu_percent"] == 14.0
+
+    @pytest.mark.asyncio
+    async def test_history_falls_back_to_raw_before_first_rollup(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        await add_samples(db, container.id, NOW - timedelta(days=2), 3, timedelta(hours=1))
+
+        points = await MetricsRollupService.history(db, container.id, timedelta(days=30), now=NOW)
+
+        assert [p["cpu_percent"] for p in points] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_prune_applies_tier_retention(self, db, make_container):
+        container = make_container(name="alpha")
+        db.add(container)
+        await db.commit()
+        await add_samples(db, container.id, NOW - timedelta(days=100), 1, timedelta(hours=1))
+        await MetricsRollupService.rollup(db, now=NOW)
+
+        await MetricsRollupService.prune(db, retention_days=365, now=NOW)
+
+        tiers = (
+            await db.execute(select(MetricsRollup.tier, func.count()).group_by(MetricsRollup.tier))
+        ).all()
+        # 100-day-old buckets outlived the 15m (30d) and 1h (90d) tiers
+        assert dict(tiers) == {"1d": 1}
@@ -0,0 +1,121 @@
+"""Tests for the database-derived Prometheus gauges (app/services/metrics.py).
+
+Tests:
+- All gauges computed from grouped queries
+- Cached snapshot served until expiry or an invalidating event
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.models.history import UpdateHistory
+from app.models.update import Update
+from app.services.metrics import DatabaseMetricsCollector
+
+
+def samples(collector: DatabaseMetricsCollector) -> dict:
+    """Flatten collected families into {(name, labels): value}."""
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in collector.collect()
+        for sample in family.samples
+    }
+
+
+async def seed(db, make_container):
+    """Three containers, two updates and two history rows."""
+    a = make_container(name="a", policy="auto", registry="docker.io", update_available=True)
+    b = make_container(name="b", policy="monitor", registry="docker.io")
+    c = make_container(name="c", policy="monitor", registry="ghcr.io", update_available=True)
+    db.add_all([a, b, c])
+    await db.commit()
+
+    def update(container, status):
+        return Update(
+            container_id=container.id,
+            container_name=container.name,
+            from_tag="1",
+            to_tag="2",
+            registry=container.registry,
+            reason_type="feature",
+            status=status,
+        )
+
+    def history(container, status, error_message=None):
+        return UpdateHistory(
+            container_id=container.id,
+            container_name=container.name,
+            from_tag="1",
+            to_tag="2",
+            status=status,
+            error_message=error_message,
+            created_at=datetime.now(UTC),
+        )
+
+    db.add_all(
+        [
+            update(a, "pending"),
+            update(c, "approved"),
+            history(a, "success"),
+            history(b, "failed", "Health check failed after update"),
+        ]
+    )
+    await db.commit()
+
+
+class TestDatabaseMetricsCollector:
+    """Gauge values and caching."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_computes_all_gauges(self, db, make_container):
+        await seed(db, make_container)
+        collector = DatabaseMetricsCollector()
+
+        await collector.refresh(db)
+        values = samples(collector)
+
+        assert values[("tidewatch_containers_total", ())] == 3
+        assert values[("tidewatch_containers_with_updates_available", ())] == 2
+        assert values[("tidewatch_containers_by_policy", (("policy", "monitor"),))] == 2
+        assert values[("tidewatch_containers_by_policy", (("policy", "disabled"),))] == 0
+        assert values[("tidewatch_containers_by_registry", (("registry", "docker.io"),))] == 2
+        assert values[("tidewatch_updates_pending", ())] == 1
+        assert values[("tidewatch_updates_rejected", ())] == 0
+        assert values[("tidewatch_update_history_success", ())] == 1
+        assert values[("tidewatch_update_history_failed", ())] == 1
+        assert values[("tidewatch_health_check_failures_24h", ())] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_until_event(self, db, make_container):
+        await seed(db, make_container)
+        collector = DatabaseMetricsCollector()
+        collector.MIN_REFRESH_INTERVAL = 0
+        await collector.ensure_fresh(db, ttl=300)
+
+        db.add(make_container(name="d"))
+        await db.commit()
+
+        # Within the TTL and no event: cached value is served
+        await collector.ensure_fresh(db, ttl=300)
+        assert samples(collector)[("tidewatch_containers_total", ())] == 3
+
+        # Unrelated events do not invalidate
+        collector.handle_event({"type": "update-progress"})
+        await collector.ensure_fresh(db, ttl=300)
+        assert samples(collector)[("tidewatch_containers_total", ())] == 3
+
+        collector.handle_event({"type": "check-job-completed"})
+        await collector.ensure_fresh(db, ttl=300)
+        assert samples(collector)[("tidewatch_containers_total", ())] == 4
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_is_refreshed(self, db, make_container):
+        collector = DatabaseMetricsCollector()
+        await collector.ensure_fresh(db, ttl=300)
+        db.add(make_container(name="a"))
+        await db.commit()
+
+        await collector.ensure_fresh(db, ttl=0)
+
+        assert samples(collector)[("tidewatch_containers_total", ())] == 1
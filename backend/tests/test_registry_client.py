@@ -196,7 +196,7 @@ class TestTagCache:
         import time
 
         time.sleep(0.001)
-        cache._cache["dockerhub:nginx"]["expires_at"] = datetime.now(UTC) - timedelta(seconds=1)
+        cache._cache["dockerhub:nginx"].expires_at = datetime.now(UTC) - timedelta(seconds=1)
 
         # Should return None (expired)
         assert cache.get("dockerhub:nginx") is None
@@ -230,8 +230,8 @@ class TestTagCache:
 
         # Manually expire two entries
         now = datetime.now(UTC)
-        cache._cache["stale1"]["expires_at"] = now - timedelta(minutes=1)
-        cache._cache["stale2"]["expires_at"] = now - timedelta(minutes=1)
+        cache._cache["stale1"].expires_at = now - timedelta(minutes=1)
+        cache._cache["stale2"].expires_at = now - timedelta(minutes=1)
 
         # Cleanup
         removed_count = cache.cleanup_expired()
@@ -247,7 +247,7 @@ class TestTagCache:
         cache.set("test", ["1.0.0"])
 
         entry = cache._cache["test"]
-        expires_at = entry["expires_at"]
+        expires_at = entry.expires_at
 
         # Should expire approximately 30 minutes from now
         now = datetime.now(UTC)
@@ -1286,10 +1286,14 @@ class TestLSCRLinuxServerUpdateEndToEnd:
 # ---------------------------------------------------------------------------
 
 
-def _hub_page(tags: list[str], next_url: str | None = None) -> MagicMock:
+def _hub_page(tags: list[str], next_url: str | None = None, count: int | None = None) -> MagicMock:
     """Build a mock httpx Response for a Docker Hub tag-list page."""
-    body = {"results": [{"name": t} for t in tags], "next": next_url}
+    body: dict = {"results": [{"name": t} for t in tags], "next": next_url}
+    if count is not None:
+        body["count"] = count
     resp = MagicMock()
+    resp.status_code = 200
+    resp.headers = {}
     resp.raise_for_status = MagicMock()
     resp.json = MagicMock(return_value=body)
     return resp
@@ -1637,3 +1641,434 @@ class TestPaginationOriginConfinement:
         assert "EVIL" not in tags
         assert mock_get.call_count == 1
         await client.close()
+
+
+def _tag_response(status_code=200, tags=None, headers=None, body_key="tags"):
+    """Build a mock registry tag-list response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    if body_key == "results":
+        response.json.return_value = {"results": [{"name": t} for t in tags or []], "next": None}
+    else:
+        response.json.return_value = {"tags": tags or []}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestConditionalTagRevalidation:
+    """get_all_tags revalidates expired listings with If-None-Match (304 short-circuit)."""
+
+    @staticmethod
+    def _expire(key):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache._cache[key].expires_at = datetime.now(UTC) - timedelta(minutes=1)
+
+    def test_tag_cache_keeps_expired_entries_with_validators(self):
+        cache = TagCache(ttl_minutes=15)
+        cache.set("ghcr:o/i", ["1.0.0"], etag='"abc"')
+        cache.set("ghcr:o/plain", ["1.0.0"])
+        for key in ("ghcr:o/i", "ghcr:o/plain"):
+            cache._cache[key].expires_at = datetime.now(UTC) - timedelta(minutes=1)
+
+        assert cache.get("ghcr:o/i") is None
+        validators = cache.get_validators("ghcr:o/i")
+        assert validators is not None
+        assert validators.etag == '"abc"'
+        assert cache.get("ghcr:o/plain") is None
+        assert cache.get_validators("ghcr:o/plain") is None
+        assert cache.cleanup_expired() == 0
+        assert cache.touch("ghcr:o/i") is True
+        assert cache.get("ghcr:o/i") == ["1.0.0"]
+
+    @pytest.mark.asyncio
+    async def test_ghcr_304_reuses_cached_tags(self):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = GHCRClient()
+        first = _tag_response(tags=["1.0.0", "1.1.0"], headers={"ETag": '"v1"'})
+        not_modified = _tag_response(status_code=304)
+
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "get", side_effect=[first, not_modified]) as mock_get,
+        ):
+            assert await client.get_all_tags("owner/image") == ["1.0.0", "1.1.0"]
+            self._expire("ghcr:owner/image")
+            assert await client.get_all_tags("owner/image") == ["1.0.0", "1.1.0"]
+
+        sent = mock_get.call_args_list[1].kwargs["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["Authorization"] == "Bearer tok"
+        not_modified.json.assert_not_called()
+        # The 304 restarted the L1 TTL.
+        assert _tag_cache.get("ghcr:owner/image") == ["1.0.0", "1.1.0"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_lscr_200_replaces_listing_and_validator(self):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = LSCRClient()
+        first = _tag_response(tags=["1.0.0"], headers={"ETag": '"v1"'})
+        changed = _tag_response(tags=["1.0.0", "2.0.0"], headers={"ETag": '"v2"'})
+
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "get", side_effect=[first, changed]),
+        ):
+            await client.get_all_tags("linuxserver/plex")
+            self._expire("lscr:linuxserver/plex")
+            assert await client.get_all_tags("linuxserver/plex") == ["1.0.0", "2.0.0"]
+
+        validators = _tag_cache.get_validators("lscr:linuxserver/plex")
+        assert validators is not None
+        assert validators.etag == '"v2"'
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_paginated_v2_listing_does_not_keep_page_one_validator(self):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = GHCRClient()
+        page1 = _tag_response(
+            tags=["1.0.0"],
+            headers={"ETag": '"p1"', "Link": '</v2/o/i/tags/list?last=1.0.0>; rel="next"'},
+        )
+        page2 = _tag_response(tags=["2.0.0"])
+
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "get", side_effect=[page1, page2]),
+        ):
+            await client.get_all_tags("o/i")
+
+        assert _tag_cache.get_validators("ghcr:o/i") is None
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_dockerhub_conditional_on_first_page(self):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = DockerHubClient()
+        first = _tag_response(
+            tags=["1.0.0"],
+            headers={"Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"},
+            body_key="results",
+        )
+        not_modified = _tag_response(status_code=304)
+
+        with patch.object(client.client, "get", side_effect=[first, not_modified]) as mock_get:
+            await client.get_all_tags("nginx")
+            self._expire("dockerhub:library/nginx")
+            assert await client.get_all_tags("nginx") == ["1.0.0"]
+
+        sent = mock_get.call_args_list[1].kwargs["headers"]
+        assert sent["If-Modified-Since"] == "Tue, 01 Jul 2025 00:00:00 GMT"
+        await client.close()
+
+    @staticmethod
+    async def _seed_l2(db_engine, fetched_at):
+        import importlib
+
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        from app.services.persistent_tag_cache import PersistentTagCache
+
+        sessions = async_sessionmaker(db_engine, expire_on_commit=False)
+        migration = importlib.import_module("app.migrations.059_tag_cache_table")
+        async with sessions() as session:
+            await migration.upgrade(session)
+            await PersistentTagCache(session).upsert(
+                "gcr", "cadvisor/cadvisor", tags=["v0.49.1"], etag='"e1"', last_modified=None
+            )
+            await session.execute(
+                text("UPDATE tag_cache_entries SET fetched_at = :ts"),
+                {"ts": fetched_at.isoformat()},
+            )
+            await session.commit()
+        return sessions
+
+    @pytest.mark.asyncio
+    async def test_fresh_persistent_entry_is_served_without_request(self, db_engine):
+        """Read-through: an L2 row inside the TTL fills L1 with no registry call."""
+        from app.services.registry_client import GCRClient, _tag_cache
+
+        sessions = await self._seed_l2(db_engine, datetime.now(UTC) - timedelta(minutes=1))
+        _tag_cache.clear()
+        client = GCRClient()
+        client._tag_store_sessions = sessions
+
+        with patch.object(client.client, "get") as mock_get:
+            tags = await client.get_all_tags("cadvisor/cadvisor")
+
+        assert tags == ["v0.49.1"]
+        mock_get.assert_not_called()
+        assert _tag_cache.get("gcr:cadvisor/cadvisor") == ["v0.49.1"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_persistent_entry_revalidates_after_restart(self, db_engine):
+        """A stale L2 row supplies validators when L1 is empty; a 304 touches it."""
+        from app.services.persistent_tag_cache import PersistentTagCache
+        from app.services.registry_client import GCRClient, _tag_cache
+
+        stale_at = datetime.now(UTC) - timedelta(hours=2)
+        sessions = await self._seed_l2(db_engine, stale_at)
+        _tag_cache.clear()
+        client = GCRClient()
+        client._tag_store_sessions = sessions
+        not_modified = _tag_response(status_code=304)
+
+        with patch.object(client.client, "get", return_value=not_modified) as mock_get:
+            tags = await client.get_all_tags("cadvisor/cadvisor")
+
+        assert tags == ["v0.49.1"]
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"e1"'
+        assert _tag_cache.get("gcr:cadvisor/cadvisor") == ["v0.49.1"]
+        async with sessions() as session:
+            listing = await PersistentTagCache(session).get("gcr", "cadvisor/cadvisor")
+        assert listing is not None
+        assert listing.fetched_at > stale_at
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_all_tags_share_one_fetch(self):
+        import asyncio
+
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = LSCRClient()
+        calls = 0
+
+        async def slow_get(url, **kwargs):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return _tag_response(tags=["1.0.0"])
+
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "get", side_effect=slow_get),
+        ):
+            results = await asyncio.gather(
+                *(client.get_all_tags("linuxserver/plex") for _ in range(5))
+            )
+
+        assert results == [["1.0.0"]] * 5
+        assert calls == 1
+        await client.close()
+
+
+class TestDockerHubParallelPagination:
+    """Page-count driven concurrent pagination and semver early exit."""
+
+    @pytest.mark.asyncio
+    async def test_remaining_pages_fetched_concurrently_in_order(self):
+        import asyncio
+
+        from app.services.registry_client import _tag_cache
+        from app.services.registry_rate_limiter import RegistryRateLimiter
+
+        _tag_cache.clear()
+        client = DockerHubClient()
+        limiter = RegistryRateLimiter()
+        client._rate_limiter = limiter
+        in_flight = peak = 0
+        next_url = "https://hub.docker.com/v2/repositories/library/nginx/tags?page=2"
+
+        async def fake_get(url, **kwargs):
+            nonlocal in_flight, peak
+            if "&page=" not in url:
+                return _hub_page([f"p1-{i}" for i in range(100)], count=350, next_url=next_url)
+            page = int(url.rsplit("=", 1)[1])
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages answer first; results must still be in page order.
+            await asyncio.sleep(0.01 * (5 - page))
+            in_flight -= 1
+            return _hub_page([f"p{page}-0"])
+
+        with patch.object(client.client, "get", side_effect=fake_get) as mock_get:
+            tags = await client.get_all_tags("nginx")
+
+        assert mock_get.call_count == 4
+        assert tags[100:] == ["p2-0", "p3-0", "p4-0"]
+        # Bounded by Docker Hub's concurrency budget on the limiter.
+        assert peak == limiter.fanout_budget("dockerhub") == 2
+        assert limiter.get_metrics()["dockerhub"]["total_requests"] == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_page_failure_raises_registry_error(self):
+        import httpx
+
+        from app.services.registry_client import RegistryCheckError, _tag_cache
+
+        _tag_cache.clear()
+        client = DockerHubClient()
+        failing = MagicMock()
+        failing.status_code = 502
+        failing.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "bad gateway", request=MagicMock(), response=failing
+        )
+
+        async def fake_get(url, **kwargs):
+            if "&page=3" in url:
+                return failing
+            if "&page=" in url:
+                return _hub_page(["x"])
+            return _hub_page(["1.0.0"], count=300, next_url="https://hub.docker.com/v2/next")
+
+        with patch.object(client.client, "get", side_effect=fake_get):
+            with pytest.raises(RegistryCheckError) as exc_info:
+                await client.get_all_tags("nginx")
+
+        assert exc_info.value.status_code == 502
+        assert "dockerhub:library/nginx" not in _tag_cache
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_serial_mode_follows_next_links(self):
+        from app.services.registry_client import _tag_cache
+
+        _tag_cache.clear()
+        client = DockerHubClient()
+        client.parallel_pagination = False
+        page1 = _hub_page(
+            ["1.0.0"], count=200, next_url="https://hub.docker.com/v2/repositories/x/tags?page=2"
+        )
+        page2 = _hub_page(["0.9.0"])
+
+        with patch.object(client.client, "get", side_effect=[page1, page2]) as mock_get:
+            tags = await client.get_all_tags("nginx")
+
+        assert tags == ["1.0.0", "0.9.0"]
+        assert mock_get.call_args_list[1].args[0].endswith("?page=2")
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_semver_scan_fetches_capped_pages_concurrently(self):
+        client = DockerHubClient()
+        urls: list[str] = []
+
+        async def fake_get(url, **kwargs):
+            urls.append(url)
+            if "&page=" not in url:
+                return _hub_page(["1.2.3"], count=5000, next_url="https://hub.docker.com/v2/n")
+            page = int(url.rsplit("=", 1)[1])
+            return _hub_page([f"1.2.{page + 2}"])
+
+        with patch.object(client.client, "get", side_effect=fake_get):
+            result = await client._get_semver_update("nginx", "1.2.3", "patch")
+
+        assert len(urls) == DockerHubClient.SEMVER_SCAN_MAX_PAGES
+        assert result == "1.2.7"
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_semver_early_exit_stops_after_current_tag_page(self):
+        client = DockerHubClient()
+        client.semver_early_exit = True
+        page1 = _hub_page(
+            ["1.2.5", "1.2.4"], count=500, next_url="https://hub.docker.com/v2/repo/tags?page=2"
+        )
+        page2 = _hub_page(["1.2.3", "1.2.2"], next_url="https://hub.docker.com/v2/repo/tags?page=3")
+        page3 = _hub_page(["1.2.1"])
+
+        with patch.object(client.client, "get", side_effect=[page1, page2, page3]) as mock_get:
+            result = await client._get_semver_update("nginx", "1.2.3", "patch")
+
+        assert result == "1.2.5"
+        assert mock_get.call_count == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_semver_early_exit_keeps_scanning_past_repushed_current_tag(self):
+        client = DockerHubClient()
+        client.semver_early_exit = True
+        # 1.2.3 was re-pushed after 1.2.4 shipped, so it is listed ahead of it
+        page1 = _hub_page(
+            ["1.2.3", "1.2.4"], count=500, next_url="https://hub.docker.com/v2/repo/tags?page=2"
+        )
+        page2 = _hub_page(["1.2.6"])
+
+        with patch.object(client.client, "get", side_effect=[page1, page2]) as mock_get:
+            result = await client._get_semver_update("nginx", "1.2.3", "patch")
+
+        assert result == "1.2.6"
+        assert mock_get.call_count == 2
+        await client.close()
+
+
+class TestChangeProbes:
+    """Listing markers and manifest digests for the incremental check mode."""
+
+    @pytest.mark.asyncio
+    async def test_docker_hub_listing_marker_reads_newest_tag(self):
+        client = DockerHubClient()
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json.return_value = {
+            "results": [{"name": "1.27.2", "last_updated": "2026-10-01T12:00:00Z"}]
+        }
+
+        with patch.object(client.client, "get", return_value=response) as mock_get:
+            marker = await client.get_listing_marker("nginx")
+
+        assert marker == "1.27.2@2026-10-01T12:00:00Z"
+        url = mock_get.call_args.args[0]
+        assert "library/nginx" in url
+        assert "page_size=1" in url and "ordering=last_updated" in url
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_ghcr_manifest_digest_uses_head(self):
+        client = GHCRClient()
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.headers = {"Docker-Content-Digest": "sha256:abc"}
+
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "head", AsyncMock(return_value=response)) as mock_head,
+            patch.object(client.client, "get", AsyncMock()) as mock_get,
+        ):
+            digest = await client.get_manifest_digest("owner/app", "latest")
+
+        assert digest == "sha256:abc"
+        mock_get.assert_not_called()
+        headers = mock_head.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "Bearer tok"
+        assert "image.index" in headers["Accept"]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_manifest_head_failure_returns_none(self):
+        import httpx
+
+        client = GHCRClient()
+        with (
+            patch.object(client, "_get_bearer_token", AsyncMock(return_value="tok")),
+            patch.object(client.client, "head", AsyncMock(side_effect=httpx.ConnectError("down"))),
+        ):
+            assert await client.get_manifest_digest("owner/app", "latest") is None
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_default_listing_marker_fingerprints_tags(self):
+        from app.services.version_index import fingerprint
+
+        client = GHCRClient()
+        with patch.object(client, "get_all_tags", AsyncMock(return_value=["1.0.0", "1.0.1"])):
+            marker = await client.get_listing_marker("owner/app")
+
+        assert marker == fingerprint(["1.0.0", "1.0.1"])
+        await client.close()
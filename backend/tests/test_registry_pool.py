@@ -0,0 +1,165 @@
+"""Tests for the shared registry connection pool (app/services/registry_pool.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.registry_client import DockerHubClient, GHCRClient, LSCRClient
+from app.services.registry_pool import (
+    DEFAULT_POOL_LIMITS,
+    PooledRegistryHTTPClient,
+    RegistryConnectionPool,
+    RegistryPoolLimits,
+    _env_pool_limits,
+)
+
+
+class TestRegistryConnectionPool:
+    """Pool lifecycle and per-registry client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_same_registry_reuses_client(self):
+        pool = RegistryConnectionPool(limits={})
+        first = pool.get_client("ghcr")
+        second = pool.get_client("GHCR")
+        assert first is second
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_different_registries_get_separate_clients(self):
+        pool = RegistryConnectionPool(limits={})
+        assert pool.get_client("ghcr") is not pool.get_client("dockerhub")
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_and_recreates_on_next_use(self):
+        pool = RegistryConnectionPool(limits={})
+        client = pool.get_client("quay")
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.get_client("quay") is not client
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_configure_replaces_limits_and_drops_client(self):
+        pool = RegistryConnectionPool(limits={})
+        client = pool.get_client("gcr")
+        pool.configure("gcr", RegistryPoolLimits(max_connections=2, max_keepalive_connections=1))
+        assert pool.limits_for("gcr").max_connections == 2
+        assert pool.get_client("gcr") is not client
+        await pool.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_configure_closes_dropped_client_after_grace(self):
+        pool = RegistryConnectionPool(limits={"gcr": RegistryPoolLimits(timeout=0.01)})
+        client = pool.get_client("gcr")
+        pool.configure("gcr", RegistryPoolLimits())
+
+        # Still usable by in-flight requests until the old timeout elapses
+        assert not client.is_closed
+        await asyncio.sleep(0.05)
+
+        assert client.is_closed
+        await pool.aclose()
+
+    def test_client_from_finished_loop_is_kept_for_aclose(self):
+        pool = RegistryConnectionPool(limits={})
+
+        async def borrow():
+            return pool.get_client("quay")
+
+        loop = asyncio.new_event_loop()
+        try:
+            stale = loop.run_until_complete(borrow())
+
+            # A new loop gets a fresh client instead of the stale one
+            assert asyncio.run(borrow()) is not stale
+            assert not stale.is_closed
+
+            loop.run_until_complete(pool.aclose())
+            assert stale.is_closed
+        finally:
+            loop.close()
+
+    def test_unknown_registry_uses_default_limits(self):
+        pool = RegistryConnectionPool(limits={})
+        assert pool.limits_for("example.com") == DEFAULT_POOL_LIMITS
+
+    def test_env_override_sets_max_connections(self, monkeypatch):
+        monkeypatch.setenv("TIDEWATCH_REGISTRY_POOL_LIMITS", "dockerhub=2, ghcr=40, bogus")
+        limits = _env_pool_limits()
+        assert limits["dockerhub"].max_connections == 2
+        assert limits["dockerhub"].max_keepalive_connections <= 2
+        assert limits["ghcr"].max_connections == 40
+
+
+class TestPooledRegistryHTTPClient:
+    """Credential injection on the borrowed view."""
+
+    @pytest.mark.asyncio
+    async def test_merges_view_headers_and_auth_into_request(self):
+        shared = MagicMock()
+        shared.get = AsyncMock(return_value=MagicMock())
+        pool = MagicMock()
+        pool.get_client.return_value = shared
+
+        view = PooledRegistryHTTPClient(
+            pool, "dockerhub", headers={"Authorization": "Bearer abc"}, auth=("u", "p")
+        )
+        await view.get("https://hub.docker.com/v2/x", headers={"Accept": "application/json"})
+
+        _, kwargs = shared.get.call_args
+        assert kwargs["headers"]["Authorization"] == "Bearer abc"
+        assert kwargs["headers"]["Accept"] == "application/json"
+        assert kwargs["auth"] == ("u", "p")
+
+    @pytest.mark.asyncio
+    async def test_per_request_headers_override_view_headers(self):
+        shared = MagicMock()
+        shared.get = AsyncMock(return_value=MagicMock())
+        pool = MagicMock()
+        pool.get_client.return_value = shared
+
+        view = PooledRegistryHTTPClient(pool, "ghcr", headers={"Authorization": "Bearer old"})
+        await view.get("https://ghcr.io/v2/x", headers={"Authorization": "Bearer new"})
+
+        _, kwargs = shared.get.call_args
+        assert kwargs["headers"]["Authorization"] == "Bearer new"
+
+    @pytest.mark.asyncio
+    async def test_registry_clients_share_one_pooled_client(self):
+        """Two registry clients for the same registry borrow the same connection pool."""
+        pool = RegistryConnectionPool(limits={})
+        with patch("app.services.registry_client.get_registry_pool", return_value=pool):
+            a = LSCRClient()
+            b = LSCRClient()
+        assert a.client._pool is b.client._pool
+        assert pool.get_client(a._registry_name) is pool.get_client(b._registry_name)
+        await a.close()
+        # Releasing one borrower must not close the shared client.
+        assert not pool.get_client("lscr").is_closed
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_ghcr_token_request_passes_basic_auth_per_request(self):
+        client = GHCRClient(username="octo", token="pat")
+        response = MagicMock()
+        response.json.return_value = {"token": "bearer"}
+        response.raise_for_status = MagicMock()
+
+        with patch.object(client.client, "get", AsyncMock(return_value=response)) as mock_get:
+            token = await client._get_bearer_token("octo/app")
+
+        assert token == "bearer"
+        assert mock_get.call_args.kwargs["auth"] is not None
+        # Credentials are never stored on the borrowed view.
+        assert client.client.auth is None
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_dockerhub_close_is_release_not_shutdown(self):
+        client = DockerHubClient()
+        await client.close()
+        assert client.client.is_closed
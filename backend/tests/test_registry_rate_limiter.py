@@ -0,0 +1,177 @@
+"""Tests for adaptive registry budgets (app/services/registry_rate_limiter.py).
+
+Tests the header-driven budget layer of RegistryRateLimiter:
+- Parsing Docker Hub ratelimit-* / x-ratelimit-* and Retry-After headers
+- Waiting out short blocks, failing fast on long ones
+- Restoring and persisting budgets across limiter instances
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import text
+
+from app.services.registry_rate_limiter import (
+    RateLimitedRequest,
+    RegistryBudget,
+    RegistryBudgetExhaustedError,
+    RegistryRateLimiter,
+)
+
+
+def make_response(status_code=200, headers=None):
+    """Create a response stand-in with lowercase header lookup."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {k.lower(): v for k, v in (headers or {}).items()}
+    return response
+
+
+class TestObserveResponse:
+    """Rate-limit header parsing."""
+
+    def test_docker_hub_registry_headers(self):
+        limiter = RegistryRateLimiter()
+        before = time.time()
+        limiter.observe_response(
+            "docker.io",
+            make_response(
+                headers={"RateLimit-Limit": "200;w=21600", "RateLimit-Remaining": "76;w=21600"}
+            ),
+        )
+
+        budget = limiter.budgets()["dockerhub"]
+        assert budget.remaining == 76
+        assert budget.limit == 200
+        # No reset header: the window length bounds the reset.
+        assert budget.reset_at is not None
+        assert before + 21600 <= budget.reset_at <= time.time() + 21600
+
+    def test_hub_api_epoch_reset(self):
+        limiter = RegistryRateLimiter()
+        reset = int(time.time()) + 120
+        limiter.observe_response(
+            "dockerhub",
+            make_response(headers={"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": str(reset)}),
+        )
+
+        budget = limiter.budgets()["dockerhub"]
+        assert budget.remaining == 3
+        assert budget.reset_at == reset
+
+    def test_retry_after_on_429_blocks_registry(self):
+        limiter = RegistryRateLimiter()
+        before = time.time()
+        limiter.observe_response("ghcr.io", make_response(429, {"Retry-After": "30"}))
+
+        blocked_until = limiter.budgets()["ghcr"].blocked_until
+        assert blocked_until is not None
+        assert before + 30 <= blocked_until <= time.time() + 30
+
+    def test_429_without_retry_after_uses_default_pause(self):
+        limiter = RegistryRateLimiter()
+        limiter.observe_response("ghcr", make_response(429))
+
+        blocked_until = limiter.budgets()["ghcr"].blocked_until
+        assert blocked_until is not None
+        assert blocked_until > time.time()
+
+    def test_responses_without_headers_are_ignored(self):
+        limiter = RegistryRateLimiter()
+        limiter.observe_response("ghcr", make_response(200))
+        limiter.observe_response("ghcr", make_response(503))
+
+        assert limiter.budgets() == {}
+
+
+class TestBudgetGate:
+    """acquire() against a reported budget."""
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_fails_fast(self):
+        limiter = RegistryRateLimiter()
+        reset = time.time() + 3600
+        limiter.restore_budgets({"dockerhub": RegistryBudget(remaining=0, reset_at=reset)})
+
+        with pytest.raises(RegistryBudgetExhaustedError) as exc_info:
+            async with RateLimitedRequest(limiter, "dockerhub"):
+                pass
+
+        assert exc_info.value.retry_at == reset
+        # Nothing was counted against the registry.
+        assert limiter.get_metrics() == {}
+
+    @pytest.mark.asyncio
+    async def test_short_block_is_waited_out(self):
+        limiter = RegistryRateLimiter()
+        limiter.restore_budgets({"ghcr": RegistryBudget(blocked_until=time.time() + 0.05)})
+
+        async with RateLimitedRequest(limiter, "ghcr") as ctx:
+            pass
+
+        assert ctx.wait_time > 0
+        assert limiter.get_metrics()["ghcr"]["wait_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_requests_spend_known_budget(self):
+        limiter = RegistryRateLimiter(budget_reserve=1)
+        limiter.restore_budgets({"ghcr": RegistryBudget(remaining=2, reset_at=time.time() + 3600)})
+
+        async with RateLimitedRequest(limiter, "ghcr"):
+            pass
+
+        assert limiter.budgets()["ghcr"].remaining == 1
+        # The reserve is kept: the next request is refused.
+        with pytest.raises(RegistryBudgetExhaustedError):
+            await limiter.acquire("ghcr")
+
+    def test_fanout_budget_shrinks_with_remaining_quota(self):
+        limiter = RegistryRateLimiter()
+        assert limiter.fanout_budget("ghcr") == 10
+
+        limiter.restore_budgets({"ghcr": RegistryBudget(remaining=3, reset_at=time.time() + 3600)})
+        assert limiter.fanout_budget("ghcr") == 3
+
+    def test_restore_drops_expired_budgets(self):
+        limiter = RegistryRateLimiter()
+        limiter.restore_budgets(
+            {
+                "dockerhub": RegistryBudget(remaining=0, reset_at=time.time() - 1),
+                "ghcr": RegistryBudget(blocked_until=time.time() + 60),
+            }
+        )
+
+        assert set(limiter.budgets()) == {"ghcr"}
+
+
+class TestBudgetPersistence:
+    """Budgets survive a new limiter via registry_rate_limit_state."""
+
+    @pytest.mark.asyncio
+    async def test_flush_then_load_round_trip(self, db, mock_async_session_local):
+        from importlib import import_module
+
+        migration = import_module("app.migrations.065_registry_rate_limit_state")
+        await migration.upgrade(db)
+        await db.commit()
+
+        reset = int(time.time()) + 900
+        first = RegistryRateLimiter(sessions=mock_async_session_local)
+        first.observe_response(
+            "dockerhub",
+            make_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}),
+        )
+        await first.flush_budgets()
+
+        row = (await db.execute(text("SELECT remaining FROM registry_rate_limit_state"))).fetchone()
+        assert row[0] == 0
+
+        second = RegistryRateLimiter(sessions=mock_async_session_local)
+        await second.load_budgets()
+
+        budget = second.budgets()["dockerhub"]
+        assert budget.remaining == 0
+        assert budget.reset_at == pytest.approx(reset)
+        with pytest.raises(RegistryBudgetExhaustedError):
+            await second.acquire("dockerhub")
@@ -0,0 +1,158 @@
+"""Tests for the registry bearer-token cache (app/services/registry_token_cache.py)."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.registry_client import GHCRClient, LSCRClient
+from app.services.registry_token_cache import RegistryTokenCache
+
+
+def _fetcher(*results):
+    """Build an AsyncMock fetch() returning each result in turn."""
+    return AsyncMock(side_effect=list(results))
+
+
+class TestRegistryTokenCache:
+    """Hit/miss, expiry and single-flight behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_served_from_cache(self):
+        cache = RegistryTokenCache()
+        fetch = _fetcher(("tok", 300))
+
+        assert await cache.get_or_fetch("ghcr", "octo/app", "pull", fetch) == "tok"
+        assert await cache.get_or_fetch("GHCR", "octo/app", "pull", fetch) == "tok"
+        assert fetch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_scope_and_principal_are_part_of_the_key(self):
+        cache = RegistryTokenCache()
+        fetch = _fetcher(("anon", 300), ("user", 300), ("push", 300))
+
+        assert await cache.get_or_fetch("ghcr", "octo/app", "pull", fetch) == "anon"
+        assert await cache.get_or_fetch("ghcr", "octo/app", "pull", fetch, principal="octo") == (
+            "user"
+        )
+        assert await cache.get_or_fetch("ghcr", "octo/app", "push", fetch) == "push"
+        assert len(cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_refreshes_ahead_of_expiry(self):
+        cache = RegistryTokenCache(refresh_ahead_seconds=30)
+        fetch = _fetcher(("old", 300), ("new", 300))
+
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=1000.0):
+            assert await cache.get_or_fetch("lscr", "linuxserver/plex", "pull", fetch) == "old"
+        # 275s later the token is still valid but inside the refresh-ahead window.
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=1275.0):
+            assert await cache.get_or_fetch("lscr", "linuxserver/plex", "pull", fetch) == "new"
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_expires_in_defaults_to_sixty_seconds(self):
+        cache = RegistryTokenCache()
+        fetch = _fetcher(("tok", None), ("tok2", None))
+
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=0.0):
+            await cache.get_or_fetch("ghcr", "a/b", "pull", fetch)
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=29.0):
+            assert await cache.get_or_fetch("ghcr", "a/b", "pull", fetch) == "tok"
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=31.0):
+            assert await cache.get_or_fetch("ghcr", "a/b", "pull", fetch) == "tok2"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_reuses_unexpired_token(self):
+        cache = RegistryTokenCache(refresh_ahead_seconds=30)
+        fetch = _fetcher(("tok", 100), None, None)
+
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=0.0):
+            await cache.get_or_fetch("ghcr", "a/b", "pull", fetch)
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=80.0):
+            assert await cache.get_or_fetch("ghcr", "a/b", "pull", fetch) == "tok"
+        with patch("app.services.registry_token_cache.time.monotonic", return_value=120.0):
+            assert await cache.get_or_fetch("ghcr", "a/b", "pull", fetch) is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        cache = RegistryTokenCache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "tok", 300
+
+        tokens = await asyncio.gather(
+            *(cache.get_or_fetch("ghcr", "octo/app", "pull", fetch) for _ in range(10))
+        )
+        assert tokens == ["tok"] * 10
+        assert calls == 1
+        assert cache._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_locks_are_dropped_once_refreshes_finish(self):
+        cache = RegistryTokenCache()
+        fetch = AsyncMock(return_value=("tok", 300))
+        failing = AsyncMock(side_effect=RuntimeError("token endpoint down"))
+
+        for i in range(50):
+            await cache.get_or_fetch("ghcr", f"octo/app{i}", "pull", fetch)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch("ghcr", "octo/broken", "pull", failing)
+
+        assert len(cache) == 50
+        assert cache._locks == {}
+        assert cache._lock_users == {}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self):
+        cache = RegistryTokenCache()
+        fetch = _fetcher(("one", 300), ("two", 300))
+
+        await cache.get_or_fetch("ghcr", "octo/app", "pull", fetch, principal="octo")
+        cache.invalidate("ghcr", "octo/app", "pull", principal="octo")
+        assert await cache.get_or_fetch("ghcr", "octo/app", "pull", fetch, principal="octo") == (
+            "two"
+        )
+
+
+class TestRegistryClientTokenReuse:
+    """GHCR/LSCR clients reuse tokens through the process-global cache."""
+
+    @pytest.mark.asyncio
+    async def test_ghcr_reuses_token_across_client_instances(self):
+        fetch = AsyncMock(return_value=("bearer", 300))
+        with patch.object(GHCRClient, "_fetch_bearer_token", fetch):
+            first = GHCRClient(username="octo", token="pat")
+            second = GHCRClient(username="octo", token="pat")
+            assert await first._get_bearer_token("octo/app") == "bearer"
+            assert await second._get_bearer_token("octo/app") == "bearer"
+        assert fetch.await_count == 1
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_ghcr_anonymous_and_authenticated_tokens_do_not_mix(self):
+        fetch = AsyncMock(side_effect=[("anon", 300), ("authed", 300)])
+        with patch.object(GHCRClient, "_fetch_bearer_token", fetch):
+            anonymous = GHCRClient()
+            authed = GHCRClient(username="octo", token="pat")
+            assert await anonymous._get_bearer_token("octo/app") == "anon"
+            assert await authed._get_bearer_token("octo/app") == "authed"
+        await anonymous.close()
+        await authed.close()
+
+    @pytest.mark.asyncio
+    async def test_lscr_token_cached_per_repository(self):
+        fetch = AsyncMock(side_effect=[("plex", 300), ("sonarr", 300)])
+        with patch.object(LSCRClient, "_fetch_bearer_token", fetch):
+            client = LSCRClient()
+            assert await client._get_bearer_token("linuxserver/plex") == "plex"
+            assert await client._get_bearer_token("linuxserver/plex") == "plex"
+            assert await client._get_bearer_token("linuxserver/sonarr") == "sonarr"
+        assert fetch.await_count == 2
+        await client.close()
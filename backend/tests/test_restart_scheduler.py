@@ -1149,3 +1149,105 @@ class TestRestartSchedulerEdgeCases:
         # Check misfire_grace_time
         call_args = scheduler.add_job.call_args[1]
         assert call_args["misfire_grace_time"] == 60
+
+
+class TestEventDrivenRestart:
+    """Docker events drive restart decisions; polling is the safety net."""
+
+    async def test_die_event_queues_decision(self, restart_scheduler, scheduler):
+        """A die event queues one settled decision per container."""
+        from app.services.container_state import ContainerRuntimeState
+
+        await restart_scheduler._on_container_event(ContainerRuntimeState(name="web"), "die")
+
+        call_args = scheduler.add_job.call_args[1]
+        assert call_args["id"] == "restart_event_web"
+        assert call_args["args"] == ["web"]
+        assert call_args["replace_existing"] is True
+
+    async def test_subscribes_to_state_store(self, restart_scheduler, mock_settings, db):
+        """Enabled event handling subscribes to store transitions; stopping unsubscribes."""
+        from app.services.container_state import container_states
+
+        await restart_scheduler.start_monitoring(db)
+        assert restart_scheduler._on_container_event in container_states._subscribers
+
+        restart_scheduler.stop_monitoring()
+        assert restart_scheduler._on_container_event not in container_states._subscribers
+
+    async def test_non_trigger_events_ignored(self, restart_scheduler, scheduler):
+        """start/health events only update the state table."""
+        from app.services.container_state import ContainerRuntimeState
+
+        state = ContainerRuntimeState(name="web")
+        await restart_scheduler._on_container_event(state, "start")
+        await restart_scheduler._on_container_event(state, "health_status")
+
+        scheduler.add_job.assert_not_called()
+
+    async def test_event_decision_uses_event_state(
+        self,
+        restart_scheduler,
+        db,
+        make_container,
+        mock_restart_service,
+        mock_container_monitor,
+        mock_async_session,
+        scheduler,
+        mock_event_bus,
+    ):
+        """The decision reads the event-fed state instead of inspecting."""
+        from app.services.container_state import container_states
+
+        container = make_container(
+            name="Web (frontend)", image="nginx", current_tag="latest", auto_restart_enabled=True
+        )
+        container.docker_name = "web"
+        db.add(container)
+        await db.commit()
+
+        state = ContainerRestartState(
+            container_id=container.id,
+            success_window_seconds=300,
+            container_name=container.name,
+            enabled=True,
+            max_attempts=5,
+            consecutive_failures=0,
+        )
+        mock_restart_service.get_or_create_restart_state.return_value = state
+        mock_container_monitor.should_retry_restart.return_value = (True, "oom_killed")
+        await container_states.apply_event(
+            {"Type": "container", "Action": "oom", "Actor": {"Attributes": {"name": "web"}}}
+        )
+        await container_states.apply_event(
+            {
+                "Type": "container",
+                "Action": "die",
+                "Actor": {"Attributes": {"name": "web", "exitCode": "137"}},
+            }
+        )
+
+        await restart_scheduler._handle_container_event("web")
+
+        mock_container_monitor.get_container_state.assert_not_awaited()
+        mock_container_monitor.should_retry_restart.assert_awaited_once_with(
+            137, True, missing=False
+        )
+        assert scheduler.add_job.call_args[1]["id"] == f"restart_{container.id}_1"
+
+    async def test_poll_tick_skips_while_events_flow(self, restart_scheduler):
+        """The sweep only runs every reconcile interval while events are connected."""
+        from app.services.container_state import container_states
+
+        restart_scheduler._events_enabled = True
+        restart_scheduler._reconcile_interval = 300
+        restart_scheduler._monitor_loop = AsyncMock()
+
+        container_states.set_live(True)
+        await restart_scheduler._poll_tick()
+        await restart_scheduler._poll_tick()
+        assert restart_scheduler._monitor_loop.await_count == 1
+
+        container_states.set_live(False)
+        await restart_scheduler._poll_tick()
+        assert restart_scheduler._monitor_loop.await_count == 2
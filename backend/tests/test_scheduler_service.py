@@ -4,13 +4,14 @@ Tests background job scheduling and execution:
 - Scheduler lifecycle (start/stop/reload)
 - Job registration and cron scheduling
 - Update check job execution
-- Auto-apply job with dependency ordering
+- Auto-apply job with dependency ordering and concurrent waves
 - Metrics collection and cleanup jobs
 - Dockerfile dependencies check job
 - Docker cleanup job
 - Manual triggering and status reporting
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
@@ -294,6 +295,14 @@ class TestJobRegistration:
         assert job is not None
         assert job.name == "Container Metrics Collection"
 
+    async def test_registers_metrics_rollup_job(self, scheduler_instance, mock_settings):
+        """Test registers metrics rollup job."""
+        await scheduler_instance.start()
+
+        job = scheduler_instance.scheduler.get_job("metrics_rollup")
+        assert job is not None
+        assert job.name == "Container Metrics Rollup"
+
     async def test_registers_metrics_cleanup_job(self, scheduler_instance, mock_settings):
         """Test registers metrics cleanup job."""
         await scheduler_instance.start()
@@ -647,17 +656,23 @@ class TestAutoApplyJob:
         db.add_all([db_update, api_update])
         await db.commit()
 
+        applied = []
+
+        async def apply_update(db_s, update_id, triggered_by="user"):
+            applied.append(update_id)
+            return {"success": True}
+
         with patch("app.services.dependency_manager.DependencyManager") as mock_dm:
-            # Mock dependency order: database before api
-            mock_dm.get_update_order = AsyncMock(return_value=["database", "api"])
+            # Mock dependency levels: database before api
+            mock_dm.get_update_levels = AsyncMock(return_value=[["database"], ["api"]])
 
             with patch("app.services.update_engine.UpdateEngine") as mock_engine:
-                mock_engine.apply_update = AsyncMock(return_value={"success": True})
+                mock_engine.apply_update = AsyncMock(side_effect=apply_update)
 
                 await scheduler_instance._run_auto_apply()
 
-                # Should have called get_update_order
-                mock_dm.get_update_order.assert_awaited_once()
+                mock_dm.get_update_levels.assert_awaited_once()
+                assert applied == [db_update.id, api_update.id]
 
     async def test_handles_dependency_ordering_failure(
         self, scheduler_instance, mock_settings, db, make_container, make_update
@@ -682,7 +697,7 @@ class TestAutoApplyJob:
 
         with patch("app.services.dependency_manager.DependencyManager") as mock_dm:
             # Mock ordering failure
-            mock_dm.get_update_order.side_effect = ValueError("Cycle detected")
+            mock_dm.get_update_levels.side_effect = ValueError("Cycle detected")
 
             with patch("app.services.update_engine.UpdateEngine") as mock_engine:
                 mock_engine.apply_update = AsyncMock(return_value={"success": True})
@@ -735,6 +750,234 @@ class TestAutoApplyJob:
 
             assert mock_engine.apply_update.await_count == 2
 
+    async def test_applies_independent_updates_concurrently(
+        self, scheduler_instance, mock_settings, db, make_container, make_update
+    ):
+        """Test a dependency level runs concurrently, bounded by parallelism."""
+        mock_settings.get_bool.side_effect = lambda db_s, key, default=False: {
+            "auto_update_enabled": True,
+        }.get(key, default)
+        mock_settings._get_int_values["auto_update_parallelism"] = 2
+
+        for name in ("app1", "app2", "app3"):
+            container = make_container(
+                name=name, image="myapp", policy="auto", compose_file=f"/compose/{name}/compose.yml"
+            )
+            db.add(container)
+            await db.commit()
+            db.add(
+                make_update(
+                    container_id=container.id,
+                    container_name=name,
+                    status="approved",
+                    approved_by="system",
+                )
+            )
+        await db.commit()
+
+        in_flight = 0
+        peak = 0
+
+        async def apply_update(db_s, update_id, triggered_by="user"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True}
+
+        with patch("app.services.update_engine.UpdateEngine") as mock_engine:
+            mock_engine.apply_update = AsyncMock(side_effect=apply_update)
+
+            await scheduler_instance._run_auto_apply()
+
+        assert mock_engine.apply_update.await_count == 3
+        assert peak == 2
+
+    async def test_serializes_updates_of_same_compose_project(
+        self, scheduler_instance, mock_settings, db, make_container, make_update
+    ):
+        """Test updates sharing a compose project never overlap."""
+        mock_settings.get_bool.side_effect = lambda db_s, key, default=False: {
+            "auto_update_enabled": True,
+        }.get(key, default)
+        mock_settings._get_int_values["auto_update_parallelism"] = 3
+
+        for name in ("web", "worker"):
+            container = make_container(
+                name=name,
+                image="myapp",
+                policy="auto",
+                compose_file="/compose/stack/compose.yml",
+                compose_project="stack",
+            )
+            db.add(container)
+            await db.commit()
+            db.add(
+                make_update(
+                    container_id=container.id,
+                    container_name=name,
+                    status="approved",
+                    approved_by="system",
+                )
+            )
+        await db.commit()
+
+        in_flight = 0
+        peak = 0
+
+        async def apply_update(db_s, update_id, triggered_by="user"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True}
+
+        with patch("app.services.update_engine.UpdateEngine") as mock_engine:
+            mock_engine.apply_update = AsyncMock(side_effect=apply_update)
+
+            await scheduler_instance._run_auto_apply()
+
+        assert mock_engine.apply_update.await_count == 2
+        assert peak == 1
+
+    async def test_publishes_aggregate_progress(
+        self, scheduler_instance, mock_settings, db, make_container, make_update
+    ):
+        """Test publishes run start, per-update progress and completion events."""
+        mock_settings.get_bool.side_effect = lambda db_s, key, default=False: {
+            "auto_update_enabled": True,
+        }.get(key, default)
+
+        for name in ("app1", "app2"):
+            container = make_container(name=name, image="myapp", policy="auto")
+            db.add(container)
+            await db.commit()
+            db.add(
+                make_update(
+                    container_id=container.id,
+                    container_name=name,
+                    status="approved",
+                    approved_by="system",
+                )
+            )
+        await db.commit()
+
+        with (
+            patch("app.services.update_engine.UpdateEngine") as mock_engine,
+            patch("app.services.event_bus.event_bus.publish", new=AsyncMock()) as publish,
+        ):
+            mock_engine.apply_update = AsyncMock(
+                side_effect=[{"success": True}, {"success": False, "message": "unhealthy"}]
+            )
+
+            await scheduler_instance._run_auto_apply()
+
+        events = [call.args[0] for call in publish.await_args_list]
+        assert [e["type"] for e in events] == [
+            "auto-apply-started",
+            "auto-apply-progress",
+            "auto-apply-progress",
+            "auto-apply-completed",
+        ]
+        assert events[0]["total_count"] == 2
+        assert events[2]["completed_count"] == 2
+        assert events[-1]["applied"] == 1
+        assert events[-1]["failed"] == 1
+
+    async def test_defaults_to_one_update_at_a_time(
+        self, scheduler_instance, mock_settings, db, make_container, make_update
+    ):
+        """Test independent updates run one at a time unless parallelism is raised."""
+        mock_settings.get_bool.side_effect = lambda db_s, key, default=False: {
+            "auto_update_enabled": True,
+        }.get(key, default)
+
+        for name in ("app1", "app2"):
+            container = make_container(
+                name=name, image="myapp", policy="auto", compose_file=f"/compose/{name}/compose.yml"
+            )
+            db.add(container)
+            await db.commit()
+            db.add(
+                make_update(
+                    container_id=container.id,
+                    container_name=name,
+                    status="approved",
+                    approved_by="system",
+                )
+            )
+        await db.commit()
+
+        in_flight = 0
+        peak = 0
+
+        async def apply_update(db_s, update_id, triggered_by="user"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True}
+
+        with patch("app.services.update_engine.UpdateEngine") as mock_engine:
+            mock_engine.apply_update = AsyncMock(side_effect=apply_update)
+
+            await scheduler_instance._run_auto_apply()
+
+        assert mock_engine.apply_update.await_count == 2
+        assert peak == 1
+
+    async def test_raising_update_does_not_stop_later_levels(self, scheduler_instance):
+        """Test an unexpected error fails one update and the run still completes."""
+        first = MagicMock(id=1, container_name="db")
+        sibling = MagicMock(id=2, container_name="cache")
+        dependent = MagicMock(id=3, container_name="web")
+
+        async def apply_auto_update(update):
+            if update is first:
+                raise RuntimeError("docker went away")
+            return True
+
+        with (
+            patch.object(
+                scheduler_instance,
+                "_apply_auto_update",
+                new=AsyncMock(side_effect=apply_auto_update),
+            ) as apply,
+            patch("app.services.event_bus.event_bus.publish", new=AsyncMock()) as publish,
+        ):
+            applied, failed = await scheduler_instance._apply_update_waves(
+                [[first, sibling], [dependent]], {}, parallelism=2
+            )
+
+        assert (applied, failed) == (2, 1)
+        assert apply.await_count == 3
+        completed = publish.await_args_list[-1].args[0]
+        assert completed["type"] == "auto-apply-completed"
+        assert completed["applied"] == 2
+        assert completed["failed"] == 1
+
+    def test_project_key_falls_back_without_compose_file(self, make_container):
+        """Test the project key never derives from a missing compose file."""
+        assert (
+            SchedulerService._project_key(
+                make_container(name="stack-web", compose_file="/compose/stack/compose.yml")
+            )
+            == "stack"
+        )
+        assert (
+            SchedulerService._project_key(make_container(name="orphan", compose_file=""))
+            == "container:orphan"
+        )
+        assert (
+            SchedulerService._project_key(
+                make_container(name="web", compose_file="", compose_project="stack")
+            )
+            == "stack"
+        )
+
     async def test_handles_database_error_during_auto_apply(
         self, scheduler_instance, mock_settings
     ):
@@ -5,6 +5,8 @@ encrypted flag set instead of silently flipping it back to False (which had stor
 plaintext and undone migrations 022/024).
 """
 
+from unittest.mock import patch
+
 from sqlalchemy import select
 
 from app.models.setting import Setting
@@ -44,3 +46,43 @@ class TestSetEncryption:
         assert row.encrypted is True
         assert row.value.startswith("gAAAAA")
         assert await SettingsService.get(db, "oidc_client_secret") == "second-secret-value"
+
+
+class TestSnapshotCache:
+    async def test_reads_after_first_do_not_query(self, db):
+        await SettingsService.set(db, "check_enabled", "true")
+        await SettingsService.get(db, "check_enabled")
+
+        with patch.object(db, "execute", wraps=db.execute) as execute:
+            assert await SettingsService.get_bool(db, "check_enabled") is True
+            assert await SettingsService.get(db, "missing_key", default="x") == "x"
+            assert await SettingsService.get(db, "oidc_client_secret") is None
+
+        execute.assert_not_called()
+
+    async def test_set_invalidates_snapshot(self, db):
+        await SettingsService.set(db, "notification_retry_delay", "2.0")
+        assert await SettingsService.get_float(db, "notification_retry_delay") == 2.0
+
+        await SettingsService.set(db, "notification_retry_delay", "0.5")
+        assert await SettingsService.get_float(db, "notification_retry_delay") == 0.5
+
+    async def test_encrypted_value_is_cached_decrypted(self, db):
+        await SettingsService.set(db, "ghcr_token", "ghp_cached")
+        assert await SettingsService.get(db, "ghcr_token") == "ghp_cached"
+
+        with patch("app.services.settings_service.get_encryption_service") as encryption_service:
+            assert await SettingsService.get(db, "ghcr_token") == "ghp_cached"
+
+        encryption_service.assert_not_called()
+
+    async def test_change_listener_receives_written_key(self, db):
+        changed: list[frozenset[str]] = []
+        listener = changed.append
+        SettingsService.add_change_listener(listener)
+        try:
+            await SettingsService.set(db, "ghcr_username", "octocat")
+        finally:
+            SettingsService._listeners.remove(listener)
+
+        assert changed == [frozenset({"ghcr_username"})]
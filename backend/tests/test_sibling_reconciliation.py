@@ -47,6 +47,7 @@ class FakeFetchResponse:
     fetch_duration_ms: float = 0.0
     calver_blocked_tag: str | None = None
     error: str | None = None
+    deferred_until: float | None = None
 
 
 def _make_container(
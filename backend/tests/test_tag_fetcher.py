@@ -8,13 +8,14 @@ Tests the registry tag fetching layer:
 - Docker Hub tag fetch optimization (Fix 7)
 """
 
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.models.container import Container
 from app.services.check_run_context import CheckRunContext, ImageCheckKey, TagFetchResult
-from app.services.registry_rate_limiter import RegistryRateLimiter
+from app.services.registry_rate_limiter import RegistryBudget, RegistryRateLimiter
 from app.services.tag_fetcher import FetchTagsRequest, TagFetcher
 
 
@@ -121,6 +122,20 @@ class TestErrorHandling:
         assert "Connection refused" in response.error
         assert response.latest_tag is None
 
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_defers_instead_of_failing(self, mock_db, rate_limiter):
+        """A spent registry budget is a deferral carrying retry_at, not an error."""
+        reset = time.time() + 3600
+        rate_limiter.restore_budgets({"ghcr": RegistryBudget(remaining=0, reset_at=reset)})
+
+        with patch("app.services.tag_fetcher.RegistryClientFactory.get_client") as get_client:
+            response = await TagFetcher(mock_db, rate_limiter).fetch_tags(make_request())
+
+        get_client.assert_not_called()
+        assert response.error is None
+        assert response.deferred_until == reset
+        assert response.latest_tag is None
+
 
 class TestPrereleaseResolution:
     """Test tri-state prerelease resolution (Fix 5)."""
@@ -379,3 +394,35 @@ class TestImageCheckKeyVersionTrack:
             include_prereleases=False,
         )
         assert key_default == self._key(None)
+
+
+class TestProbeImage:
+    """Cheap change probe used by the incremental check mode."""
+
+    @pytest.mark.asyncio
+    async def test_probe_reads_listing_marker_and_digest(self, mock_db, rate_limiter):
+        mock_client = AsyncMock()
+        mock_client.get_listing_marker = AsyncMock(return_value="marker")
+        mock_client.get_manifest_digest = AsyncMock(return_value="sha256:abc")
+
+        with patch(
+            "app.services.tag_fetcher.RegistryClientFactory.get_client",
+            return_value=mock_client,
+        ):
+            probe = await TagFetcher(mock_db, rate_limiter).probe_image("ghcr.io", "org/app", "1.0")
+
+        assert probe.listing == "marker"
+        assert probe.digest == "sha256:abc"
+        assert probe.complete
+        mock_client.get_manifest_digest.assert_awaited_once_with("org/app", "1.0")
+        mock_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_probe_failure_is_incomplete(self, mock_db, rate_limiter):
+        with patch(
+            "app.services.tag_fetcher.RegistryClientFactory.get_client",
+            side_effect=RuntimeError("boom"),
+        ):
+            probe = await TagFetcher(mock_db, rate_limiter).probe_image("ghcr.io", "org/app", "1.0")
+
+        assert not probe.complete
@@ -0,0 +1,197 @@
+"""Tests for the unified two-tier cache (app/services/tiered_cache.py)."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.tiered_cache import CacheEntry, TieredCache, get_cache_stats
+
+
+class _Clock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+def _cache(clock=None, **kwargs):
+    kwargs.setdefault("max_entries", 10)
+    kwargs.setdefault("ttl", timedelta(minutes=5))
+    return TieredCache("test", clock=clock or _Clock(), register=False, **kwargs)
+
+
+class _MemoryBackend:
+    """In-memory L2 double."""
+
+    def __init__(self):
+        self.entries: dict = {}
+        self.reads = 0
+
+    async def get(self, key):
+        self.reads += 1
+        return self.entries.get(key)
+
+    async def set(self, key, entry):
+        self.entries[key] = entry
+
+
+class TestL1:
+    """LRU bound, TTL and validator retention."""
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = _cache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a becomes most recent
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.stats.evictions == {"capacity": 1}
+
+    def test_expired_entry_without_validator_is_dropped(self):
+        clock = _Clock()
+        cache = _cache(clock)
+        cache.set("a", 1)
+        clock.advance(minutes=6)
+
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_expired_entry_with_validator_is_retained_for_revalidation(self):
+        clock = _Clock()
+        cache = _cache(clock, revalidate_window=timedelta(hours=1))
+        cache.set("a", 1, etag='"x"')
+        clock.advance(minutes=6)
+
+        assert cache.get("a") is None
+        entry = cache.get_entry("a")
+        assert entry is not None
+        assert entry.etag == '"x"'
+        assert cache.touch("a") is True
+        assert cache.get("a") == 1
+
+        clock.advance(hours=2)
+        assert cache.cleanup_expired() == 1
+        assert cache.get_entry("a") is None
+
+    def test_stats_and_registry(self):
+        cache = TieredCache("stats-test", max_entries=4, ttl=timedelta(minutes=1))
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = get_cache_stats()["stats-test"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+
+class TestGetOrLoad:
+    """Read-through with L2 and single-flight loading."""
+
+    @pytest.mark.asyncio
+    async def test_loader_result_is_cached(self):
+        cache = _cache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            return "v"
+
+        assert await cache.get_or_load("k", load) == "v"
+        assert await cache.get_or_load("k", load) == "v"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self):
+        cache = _cache()
+
+        async def load():
+            return None
+
+        assert await cache.get_or_load("k", load) is None
+        assert "k" not in cache
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        cache = _cache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "v"
+
+        results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(8)))
+        assert results == ["v"] * 8
+        assert calls == 1
+        assert cache.stats.coalesced == 7
+
+    @pytest.mark.asyncio
+    async def test_loader_error_reaches_every_waiter_and_is_not_cached(self):
+        cache = _cache()
+
+        async def load():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("registry down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_load("k", load) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "k" not in cache
+        assert not cache._inflight
+
+    @pytest.mark.asyncio
+    async def test_fresh_l2_entry_skips_loader(self):
+        clock = _Clock()
+        cache = _cache(clock)
+        backend = _MemoryBackend()
+        backend.entries["k"] = cache.make_entry("stored")
+
+        async def load():
+            raise AssertionError("loader must not run")
+
+        assert await cache.get_or_load("k", load, l2=backend) == "stored"
+        assert cache.get("k") == "stored"
+        assert cache.stats.l2_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_l2_entry_is_promoted_then_loaded(self):
+        clock = _Clock()
+        cache = _cache(clock, revalidate_window=timedelta(hours=1))
+        backend = _MemoryBackend()
+        backend.entries["k"] = cache.make_entry(
+            "old", etag='"e"', stored_at=clock.now - timedelta(minutes=10)
+        )
+        seen: list[CacheEntry | None] = []
+
+        async def load():
+            seen.append(cache.get_entry("k"))
+            return "new"
+
+        assert await cache.get_or_load("k", load, l2=backend) == "new"
+        # The loader could see the stale entry's validator.
+        assert seen[0] is not None
+        assert seen[0].etag == '"e"'
+        assert backend.entries["k"].value == "new"
+
+    @pytest.mark.asyncio
+    async def test_fill_false_leaves_caching_to_loader(self):
+        cache = _cache()
+
+        async def load():
+            return "partial"
+
+        assert await cache.get_or_load("k", load, fill=False) == "partial"
+        assert "k" not in cache
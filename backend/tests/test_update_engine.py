@@ -19,6 +19,8 @@ import pytest
 
 from app.models.container import Container
 from app.models.history import UpdateHistory
+from app.services.container_state import ContainerRuntimeState
+from app.services.docker_runtime_index import RuntimeContainer, RuntimeIndex
 from app.services.update_engine import UpdateEngine
 from app.utils.validators import ValidationError
 
@@ -838,16 +840,18 @@ class TestHealthCheckValidation:
             health_check_method="docker",
         )
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"running", b""))
-        mock_process.returncode = 0
-
-        async def mock_wait_for(coro, timeout):
-            return await coro
+        state = ContainerRuntimeState(name="sonarr", status="running", running=True)
 
         with (
-            patch("asyncio.create_subprocess_exec", return_value=mock_process),
-            patch("asyncio.wait_for", side_effect=mock_wait_for),
+            patch.object(
+                UpdateEngine,
+                "_resolve_container_runtime_name",
+                new=AsyncMock(return_value="sonarr"),
+            ),
+            patch(
+                "app.services.update_engine.container_states.get",
+                new=AsyncMock(return_value=state),
+            ),
         ):
             result = await UpdateEngine._check_container_runtime(container)
 
@@ -867,21 +871,98 @@ class TestHealthCheckValidation:
             health_check_method="docker",
         )
 
-        mock_process = AsyncMock()
-        mock_process.communicate = AsyncMock(return_value=(b"exited", b""))
-        mock_process.returncode = 0
-
-        async def mock_wait_for(coro, timeout):
-            return await coro
+        state = ContainerRuntimeState(name="sonarr", status="exited", exit_code=1)
 
         with (
-            patch("asyncio.create_subprocess_exec", return_value=mock_process),
-            patch("asyncio.wait_for", side_effect=mock_wait_for),
+            patch.object(
+                UpdateEngine,
+                "_resolve_container_runtime_name",
+                new=AsyncMock(return_value="sonarr"),
+            ),
+            patch(
+                "app.services.update_engine.container_states.get",
+                new=AsyncMock(return_value=state),
+            ),
         ):
             result = await UpdateEngine._check_container_runtime(container)
 
             assert result["success"] is False
             assert "exited" in result["error"]
+            assert result["fatal"] is True
+
+    @pytest.mark.asyncio
+    async def test_runtime_name_resolved_from_snapshot(self):
+        """Compose project + service labels win over a same-named service elsewhere."""
+        container = Container(
+            name="redis",
+            image="redis",
+            current_tag="7",
+            registry="docker.io",
+            compose_file="/compose/nextcloud/docker-compose.yml",
+            service_name="redis",
+        )
+        index = RuntimeIndex(
+            [
+                RuntimeContainer(
+                    id="a1",
+                    name="immich-redis-1",
+                    labels={
+                        "com.docker.compose.project": "immich",
+                        "com.docker.compose.service": "redis",
+                    },
+                ),
+                RuntimeContainer(
+                    id="b2",
+                    name="nextcloud-redis-1",
+                    labels={
+                        "com.docker.compose.project": "nextcloud",
+                        "com.docker.compose.service": "redis",
+                    },
+                ),
+            ]
+        )
+
+        with patch(
+            "app.services.update_engine.runtime_snapshot.get", new=AsyncMock(return_value=index)
+        ):
+            assert await UpdateEngine._resolve_container_runtime_name(container) == (
+                "nextcloud-redis-1"
+            )
+
+    @pytest.mark.asyncio
+    async def test_compose_project_resolved_from_snapshot(self):
+        """Missing compose_project/docker_name are filled from the runtime index."""
+        container = Container(
+            name="redis",
+            image="redis",
+            current_tag="7",
+            registry="docker.io",
+            compose_file="/compose/nextcloud/docker-compose.yml",
+            service_name="redis",
+        )
+        index = RuntimeIndex(
+            [
+                RuntimeContainer(
+                    id="b2",
+                    name="nextcloud-redis-1",
+                    labels={
+                        "com.docker.compose.project": "nextcloud",
+                        "com.docker.compose.service": "redis",
+                    },
+                ),
+            ]
+        )
+        db = AsyncMock()
+
+        with patch(
+            "app.services.update_engine.runtime_snapshot.get", new=AsyncMock(return_value=index)
+        ) as mock_get:
+            await UpdateEngine._ensure_compose_project(db, container)
+
+        mock_get.assert_awaited_once_with(db)
+        assert container.compose_project == "nextcloud"
+        assert container.docker_name == "nextcloud-redis-1"
+        db.commit.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_health_check_validates_container_name(self, make_update):
@@ -0,0 +1,190 @@
+"""Tests for the pre-parsed version index (app/services/version_index.py).
+
+The index must select exactly what the linear ``_compare_versions`` +
+``_is_better_version`` scan selects; most tests here compare both paths.
+"""
+
+import itertools
+
+import pytest
+
+from app.services.registry_client import GHCRClient, is_prerelease_tag
+from app.services.version_index import (
+    VersionIndex,
+    fingerprint,
+    get_version_index,
+    get_version_index_cache,
+)
+
+TAGS = [
+    "latest",
+    "1.2.3",
+    "1.2.4",
+    "v1.2.5",
+    "1.2.5",
+    "1.3.0",
+    "1.3.1-rc1",
+    "1.10.0",
+    "1.9.9",
+    "2.0.0",
+    "2.0.0rc1",
+    "3.1.0",
+    "5.0.0",
+    "1.2.6-alpine",
+    "1.3.0-alpine",
+    "1.2.6-arm64",
+    "arm64v8-1.2.7",
+    "1.2.8-amd64",
+    "1.2.9-windowsservercore",
+    "4.0.17.2952",
+    "4.0.17.2967",
+    "4.1.0.100-ls12",
+    "4.1.1.101-ls13",
+    "2024.01.15",
+    "2024.02.01",
+    "20260224.0.42919",
+    "nightly-4.0.17-ls131",
+    "develop-4.2.0.200-ls14",
+    "1.2.10.dev1",
+    "not-a-version",
+]
+
+CURRENT_TAGS = [
+    "1.2.3",
+    "v1.2.3",
+    "1.2.6-arm64",
+    "1.2.5-alpine",
+    "4.0.17.2952",
+    "4.1.0.100-ls12",
+    "2024.01.15",
+    "1.9.9",
+    "2.0.0",
+    "latest",
+]
+
+
+def _linear_select(client, tags, current_tag, scope, normalize_ls, include_prereleases, **kwargs):
+    """The pre-index selection loop, kept as the reference."""
+    version_tags = [t for t in tags if t.lower() != "latest" and client._parse_semver(t)]
+    if not include_prereleases:
+        version_tags = [t for t in version_tags if not is_prerelease_tag(t)]
+    variant = client._extract_variant_suffix(current_tag, normalize_ls=normalize_ls)
+    version_tags = [
+        t
+        for t in version_tags
+        if client._extract_variant_suffix(t, normalize_ls=normalize_ls) == variant
+    ]
+    majors = {p[0] for t in tags if (p := client._parse_semver(t)) is not None}
+    best = None
+    for tag in version_tags:
+        if client._compare_versions(current_tag, tag, scope, available_majors=majors, **kwargs):
+            if best is None or client._is_better_version(tag, best):
+                best = tag
+    return best
+
+
+@pytest.fixture
+def client():
+    return GHCRClient()
+
+
+class TestEquivalence:
+    """Index selection matches the linear comparator scan."""
+
+    @pytest.mark.parametrize("current_tag", CURRENT_TAGS)
+    def test_matches_linear_scan(self, client, current_tag):
+        combos = itertools.product(
+            ("patch", "minor", "major"),
+            (False, True),
+            (None, "semver", "calver"),
+            (None, 1, 2, 4),
+            (False, True),
+        )
+        for scope, prereleases, track, anchor, normalize_ls in combos:
+            client._best_cross_scheme_rejected = None
+            expected = _linear_select(
+                client,
+                TAGS,
+                current_tag,
+                scope,
+                normalize_ls,
+                prereleases,
+                version_track=track,
+                stable_anchor_major=anchor,
+            )
+            expected_rejected = client._best_cross_scheme_rejected
+
+            client._best_cross_scheme_rejected = None
+            actual = client._select_latest_tag(
+                TAGS,
+                current_tag,
+                scope,
+                normalize_ls=normalize_ls,
+                include_prereleases=prereleases,
+                version_track=track,
+                stable_anchor_major=anchor,
+            )
+            combo = (scope, prereleases, track, anchor, normalize_ls)
+            assert actual == expected, combo
+            assert client._best_cross_scheme_rejected == expected_rejected, combo
+
+    def test_equal_versions_keep_first_listed_tag(self, client):
+        assert (
+            client._select_latest_tag(
+                ["1.0.0", "v1.0.1", "1.0.1"], "1.0.0", "patch", normalize_ls=False
+            )
+            == "v1.0.1"
+        )
+        assert (
+            client._select_latest_tag(
+                ["1.0.0", "1.0.1", "v1.0.1"], "1.0.0", "patch", normalize_ls=False
+            )
+            == "1.0.1"
+        )
+
+    def test_continuity_stops_at_first_missing_major(self, client):
+        tags = ["3.0.0", "4.0.0", "5.0.0", "7.0.0", "8.0.0"]
+        assert client._select_latest_tag(tags, "3.0.0", "major", normalize_ls=False) == "5.0.0"
+        assert client._last_candidate_majors_seen == {3, 4, 5, 7, 8}
+
+
+class TestIndex:
+    """Index construction and caching."""
+
+    def test_parses_each_tag_list_once(self, client):
+        get_version_index_cache().clear()
+        calls = 0
+
+        def describe(tag, position):
+            nonlocal calls
+            calls += 1
+            return client._index_tag(tag, position, False)
+
+        tags = ["1.0.0", "1.0.1", "1.1.0"]
+        first = get_version_index(tags, describe)
+        again = get_version_index(list(tags), describe)
+
+        assert first is again
+        assert calls == 3
+
+        get_version_index(tags + ["1.1.1"], describe)
+        assert calls == 7
+
+    def test_parse_options_are_part_of_the_key(self, client):
+        tags = ["1.0.0-ls1", "1.0.1-ls2"]
+        plain = get_version_index(tags, lambda t, p: client._index_tag(t, p, False), False)
+        ls = get_version_index(tags, lambda t, p: client._index_tag(t, p, True), True)
+        assert plain is not ls
+
+    def test_malformed_tag_is_skipped(self, client):
+        def describe(tag, position):
+            if tag == "boom":
+                raise ValueError(tag)
+            return client._index_tag(tag, position, False)
+
+        index = VersionIndex.build(["1.0.0", "boom", "1.0.1"], describe)
+        assert index.size == 2
+
+    def test_fingerprint_is_order_sensitive(self):
+        assert fingerprint(["a", "b"]) != fingerprint(["b", "a"])
+        assert fingerprint(["ab"]) != fingerprint(["a", "b"])
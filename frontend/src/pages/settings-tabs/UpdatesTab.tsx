@@ -308,6 +308,27 @@ export default function UpdatesTab({ settings, saving, updateSetting, handleText
                   Maximum number of updates to auto-apply per run (rate limiting)
                 </p>
               </div>
+
+              <div>
+                <div className="flex items-center justify-between mb-2">
+                  <label className="block text-sm font-medium text-tide-text">
+                    Parallel Updates
+                  </label>
+                  <span className="text-sm text-tide-text-muted">{String(settings.auto_update_parallelism || 1)}</span>
+                </div>
+                <input
+                  type="range"
+                  min="1"
+                  max="10"
+                  value={String(Number(settings.auto_update_parallelism || 1))}
+                  onChange={(e) => updateSetting('auto_update_parallelism', parseInt(e.target.value))}
+                  disabled={saving}
+                  className="w-full h-2 bg-tide-bg rounded-lg appearance-none cursor-pointer accent-teal-500"
+                />
+                <p className="text-xs text-tide-text-muted mt-1">
+                  Independent updates applied at once; dependents wait for their dependencies and one compose project updates at a time
+                </p>
+              </div>
             </div>
           </div>
 
@@ -31,6 +31,9 @@ export interface paths {
         /**
          * Get Analytics Summary
          * @description Return aggregated analytics for the dashboard.
+         *
+         *     Reads the ``update_history_daily`` aggregates (one row per day), so the
+         *     cost does not grow with the number of history entries in the period.
          */
         get: operations["get_analytics_summary_api_v1_analytics_summary_get"];
         put?: never;
@@ -859,6 +862,40 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/containers/metrics/summary": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Get Metrics Summary
+         * @description Latest metrics and a sparkline for many containers in one response.
+         *
+         *     Replaces one ``/{id}/metrics`` + ``/{id}/metrics/history`` pair per
+         *     dashboard card. Sparklines end at the last metrics collection, so the
+         *     response only changes when a cycle stores new samples (or the container
+         *     set changes); its ``ETag`` lets polling clients revalidate with
+         *     ``If-None-Match`` and get ``304 Not Modified`` in between.
+         *
+         *     Args:
+         *         container_id: Container IDs to include (all containers when omitted)
+         *         period: Sparkline span (1h, 6h, 24h)
+         *         points: Number of sparkline buckets (2-120)
+         *
+         *     Returns:
+         *         Dict with the sparkline bucket timestamps and one entry per container
+         */
+        get: operations["get_metrics_summary_api_v1_containers_metrics_summary_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/containers/my-projects/dependency-summary": {
         parameters: {
             query?: never;
@@ -1478,9 +1515,13 @@ export interface paths {
          * Get Container Metrics History
          * @description Get historical metrics for a container.
          *
+         *     Periods up to 24h return raw samples; longer periods are served from the
+         *     rollup tiers (15-minute for 7d, hourly for 30d/90d, daily for 1y) with
+         *     bucket averages plus ``*_max``/``*_p95`` fields.
+         *
          *     Args:
          *         container_id: Container ID
-         *         period: Time period (1h, 6h, 24h, 7d, 30d)
+         *         period: Time period (1h, 6h, 24h, 7d, 30d, 90d, 1y)
          *
          *     Returns:
          *         List of historical metrics data points
@@ -2012,6 +2053,10 @@ export interface paths {
         /**
          * Stream Events
          * @description Server-sent events stream for live update notifications.
+         *
+         *     Each event carries an SSE ``id``; browsers resend the last one in the
+         *     ``Last-Event-ID`` header on reconnect, and events published since then
+         *     (within the bus replay window) are delivered first.
          */
         get: operations["stream_events_api_v1_events_stream_get"];
         put?: never;
@@ -2022,6 +2067,93 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/export/history": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export History
+         * @description Stream update history as CSV or NDJSON, oldest first.
+         *
+         *     Args:
+         *         container_id: Optional filter by container
+         *         start: Optional lower bound on ``started_at``
+         *         end: Optional upper bound on ``started_at``
+         *         format: Output format (csv, ndjson)
+         *
+         *     Returns:
+         *         Streaming download of every matching history row
+         */
+        get: operations["export_history_api_v1_export_history_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/export/metrics": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Metrics
+         * @description Stream raw container metrics as CSV or NDJSON.
+         *
+         *     Args:
+         *         container_id: Optional filter by container
+         *         start: Optional lower bound on ``collected_at``
+         *         end: Optional upper bound on ``collected_at``
+         *         format: Output format (csv, ndjson)
+         *
+         *     Returns:
+         *         Streaming download of every matching raw sample
+         */
+        get: operations["export_metrics_api_v1_export_metrics_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
+    "/api/v1/export/restarts": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        /**
+         * Export Restarts
+         * @description Stream restart logs as CSV or NDJSON, oldest first.
+         *
+         *     Args:
+         *         container_id: Optional filter by container
+         *         start: Optional lower bound on ``executed_at``
+         *         end: Optional upper bound on ``executed_at``
+         *         format: Output format (csv, ndjson)
+         *
+         *     Returns:
+         *         Streaming download of every matching restart log row
+         */
+        get: operations["export_restarts_api_v1_export_restarts_get"];
+        put?: never;
+        post?: never;
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/history/": {
         parameters: {
             query?: never;
@@ -2033,11 +2165,15 @@ export interface paths {
          * List History
          * @description List unified history (updates + restarts + drift) with pagination.
          *
+         *     Events are merged and ordered in SQL; when more events follow, the
+         *     ``X-Next-Cursor`` response header carries the cursor of the next page.
+         *
          *     Args:
          *         container_id: Optional filter by container (drift excluded when set)
          *         status: Optional filter by status. Use "detected" for drift-only.
          *         start_date: Optional filter by start date (ISO format)
          *         end_date: Optional filter by end date (ISO format)
+         *         cursor: Cursor from a previous page's ``X-Next-Cursor`` header
          *         skip: Number of records to skip (default: 0)
          *         limit: Maximum number of records to return (default: 50, max: 500)
          *
@@ -5673,7 +5809,10 @@ export interface operations {
     };
     get_analytics_summary_api_v1_analytics_summary_get: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description Days to summarize */
+                period_days?: number;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -5689,6 +5828,15 @@ export interface operations {
                     "application/json": components["schemas"]["AnalyticsSummary"];
                 };
             };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     cancel_setup_api_v1_auth_cancel_setup_post: {
@@ -6627,6 +6775,43 @@ export interface operations {
             };
         };
     };
+    get_metrics_summary_api_v1_containers_metrics_summary_get: {
+        parameters: {
+            query?: {
+                /** @description Containers to include (repeatable; default: all) */
+                container_id?: number[] | null;
+                period?: string;
+                /** @description Sparkline buckets */
+                points?: number;
+            };
+            header?: {
+                "if-none-match"?: string | null;
+            };
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_dependency_summary_api_v1_containers_my_projects_dependency_summary_get: {
         parameters: {
             query?: never;
@@ -8266,6 +8451,45 @@ export interface operations {
     stream_events_api_v1_events_stream_get: {
         parameters: {
             query?: never;
+            header?: {
+                "Last-Event-ID"?: string | null;
+            };
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_history_api_v1_export_history_get: {
+        parameters: {
+            query?: {
+                container_id?: number | null;
+                /** @description Updates started at or after (ISO format) */
+                start?: string | null;
+                /** @description Updates started at or before (ISO format) */
+                end?: string | null;
+                /** @description csv or ndjson */
+                format?: string;
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -8281,6 +8505,89 @@ export interface operations {
                     "application/json": unknown;
                 };
             };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_metrics_api_v1_export_metrics_get: {
+        parameters: {
+            query?: {
+                container_id?: number | null;
+                /** @description Samples collected at or after (ISO format) */
+                start?: string | null;
+                /** @description Samples collected at or before (ISO format) */
+                end?: string | null;
+                /** @description csv or ndjson */
+                format?: string;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
+    export_restarts_api_v1_export_restarts_get: {
+        parameters: {
+            query?: {
+                container_id?: number | null;
+                /** @description Restarts executed at or after (ISO format) */
+                start?: string | null;
+                /** @description Restarts executed at or before (ISO format) */
+                end?: string | null;
+                /** @description csv or ndjson */
+                format?: string;
+            };
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
         };
     };
     list_history_api_v1_history__get: {
@@ -8293,7 +8600,9 @@ export interface operations {
                 start_date?: string | null;
                 /** @description Filter by end date (ISO format) */
                 end_date?: string | null;
-                /** @description Number of records to skip */
+                /** @description Continue after this cursor (X-Next-Cursor) */
+                cursor?: string | null;
+                /** @description Number of records to skip (ignored with cursor) */
                 skip?: number;
                 /** @description Maximum number of records to return */
                 limit?: number;